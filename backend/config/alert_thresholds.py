@@ -27,8 +27,8 @@ SYSTEM_THRESHOLDS: Dict[str, Dict[str, int]] = {
         'critical': 90,     # %
     },
     'backend_restart': {
-        'warning': 50,      # 횟수/일
-        'critical': 100,    # 횟수/일
+        'warning': 10,      # 재시작 이벤트/일 (호스트별 1분 안의 워커 시작은 1건, 배포 포함)
+        'critical': 20,     # 재시작 이벤트/일
     }
 }
 
@@ -0,0 +1,85 @@
+"""
+지표 API 결과 캐시 설정
+
+지표 카드와 목록 API 페이지('table:*'), 대시보드 Alert('alerts')의 TTL(초)과 stale-while-revalidate 허용 시간(초)을 정의합니다.
+운영 중 이 파일을 수정하고 서버 재시작하면 즉시 반영됨
+
+환경변수:
+    METRICS_CACHE_BACKEND: 'memory'(기본) 또는 'redis' (gunicorn 워커 간 공유)
+    REDIS_URL: redis 백엔드 사용 시 접속 URL (기본 redis://localhost:6379/0)
+
+사용 예시:
+    >>> from config.cache_settings import get_cache_ttl, get_stale_ttl
+    >>> get_cache_ttl('academy-status')  # 300초
+    >>> get_stale_ttl('system-health')  # 0초 (stale 응답 없음)
+"""
+
+from typing import Dict
+
+
+# 카드별 캐시 TTL (초)
+METRICS_CACHE_TTL: Dict[str, int] = {
+    'academy-status': 300,      # 월간/30일 집계 - 천천히 변함
+    'student-stats': 300,
+    'report-activity': 300,
+    'engagement': 120,          # DAU 포함
+    'content-generation': 300,
+    'parent-reach': 300,
+    'ai-efficiency': 300,
+    'onboarding-funnel': 600,
+    'monetization': 600,
+    'cost-breakdown': 3600,     # 월 단위 수동 입력 데이터
+    'system-health': 30,        # 5분 평균 리소스
+    'api-status': 60,
+    'cohorts': 600,             # cron이 매시간 갱신하는 요약 테이블
+    # 목록 API 페이지 (routes/admin/tables.py, 쿼리 인자별 캐시)
+    'table:at-risk': 120,
+    'table:active': 120,
+    'table:onboarding': 120,
+    'table:heavy-users': 120,
+    'alerts': 30,               # 리소스 Alert 포함 - system-health와 같은 주기
+}
+
+# TTL 만료 후에도 이 시간(초) 동안은 이전 값을 즉시 응답하고 백그라운드에서 갱신
+METRICS_CACHE_STALE: Dict[str, int] = {
+    'academy-status': 600,
+    'student-stats': 600,
+    'report-activity': 600,
+    'engagement': 120,
+    'content-generation': 600,
+    'parent-reach': 600,
+    'ai-efficiency': 600,
+    'onboarding-funnel': 1200,
+    'monetization': 1200,
+    'cost-breakdown': 3600,
+    'system-health': 0,         # 리소스 지표는 오래된 값 응답 금지
+    'api-status': 0,
+    'cohorts': 1800,
+    'alerts': 0,                # 해소된 Alert를 계속 보여주지 않도록 stale 응답 금지
+}
+
+
+def get_cache_ttl(card: str) -> int:
+    """
+    카드별 캐시 TTL(초) 가져오기
+
+    Args:
+        card: 카드 키 (예: 'academy-status')
+
+    Returns:
+        int: TTL (초). 기본값 60초
+    """
+    return METRICS_CACHE_TTL.get(card, 60)
+
+
+def get_stale_ttl(card: str) -> int:
+    """
+    카드별 stale-while-revalidate 허용 시간(초) 가져오기
+
+    Args:
+        card: 카드 키
+
+    Returns:
+        int: 허용 시간 (초). 기본값 0 (stale 응답 없음)
+    """
+    return METRICS_CACHE_STALE.get(card, 0)
@@ -3,17 +3,65 @@
 
 주요 사용자 액션을 자동으로 로깅합니다.
 
+로그는 요청 스레드에서 DB에 쓰지 않고 BatchWriter 큐에 넣은 뒤 백그라운드에서
+배치로 기록합니다 (utils/batch_writer.py).
+
+환경변수:
+    ACTIVITY_LOG_ASYNC: '0'이면 요청 스레드에서 바로 INSERT (기본 '1')
+    ACTIVITY_LOG_QUEUE_SIZE: 큐 최대 길이 (기본 10000)
+    ACTIVITY_LOG_BATCH_SIZE: 배치당 최대 행 수 (기본 200)
+    ACTIVITY_LOG_FLUSH_INTERVAL: 최대 기록 지연 (초, 기본 1.0)
+
+DB에 쓰지 못한 로그는 이벤트 spool(utils/event_spool.py)에 보관되고,
+scripts/replay_spool.py가 DB 복구 후 event_key 기준으로 중복 없이 다시 적재합니다.
+
+기록된 배치는 학원별 통계(academy_stats, utils/academy_stats.py)와 일별 활성 학원
+비트맵(daily_active_academies, utils/activity_bitmaps.py)에도 바로 반영됩니다.
+
 사용 예시:
     >>> from middleware.activity_logger import log_activity
     >>> log_activity('login')
     >>> log_activity('create_report', {'report_id': 123, 'ai_generated': True})
+    >>> flush_activity_logs()  # 큐에 있는 로그 즉시 기록
 """
 
 import os
+import sys
 import json
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.academy_stats import record_activity_rows
+from utils.activity_bitmaps import record_active_days
+from utils.batch_writer import BatchWriter
+from utils.db_pool import db_cursor
+from utils.event_spool import SPOOL_TABLES, get_event_spool, new_event_key
+
+
+ACTIVITY_COLUMNS = SPOOL_TABLES['activity_logs']
+
+INSERT_ACTIVITY_SQL = f"""
+    INSERT INTO activity_logs
+    ({', '.join(ACTIVITY_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(ACTIVITY_COLUMNS))})
+"""
+
+
+def _write_activity_rows(rows) -> None:
+    """
+    활동 로그 INSERT 후 academy_stats / 일별 활성 학원 비트맵 증분 반영
+
+    통계 반영은 별도 트랜잭션이라 실패해도 로그 기록은 유지됩니다 (보정/재생성 작업이 복구).
+    """
+    with db_cursor(dictionary=False, commit=True) as cursor:
+        cursor.executemany(INSERT_ACTIVITY_SQL, rows)
+    records = [dict(zip(ACTIVITY_COLUMNS, row)) for row in rows]
+    record_activity_rows(records)
+    record_active_days(records)
+
 
 class ActivityLogger:
     """활동 로그 저장 클래스"""
@@ -36,22 +84,22 @@ class ActivityLogger:
         'send_alimtalk',
     ]
 
-    def __init__(self):
-        pass
-
-    def _get_db_connection(self):
-        """데이터베이스 연결"""
-        try:
-            import mysql.connector
-            return mysql.connector.connect(
-                host=os.getenv('DB_HOST', 'localhost'),
-                user=os.getenv('DB_USER', 'root'),
-                password=os.getenv('DB_PASSWORD', ''),
-                database=os.getenv('DB_NAME', 'tutornote')
+    def __init__(self, async_write: Optional[bool] = None):
+        if async_write is None:
+            async_write = os.getenv('ACTIVITY_LOG_ASYNC', '1') != '0'
+
+        self.writer: Optional[BatchWriter] = None
+        if async_write:
+            self.writer = BatchWriter(
+                'activity_logs',
+                INSERT_ACTIVITY_SQL,
+                max_queue=int(os.getenv('ACTIVITY_LOG_QUEUE_SIZE', '10000')),
+                batch_size=int(os.getenv('ACTIVITY_LOG_BATCH_SIZE', '200')),
+                flush_interval=float(os.getenv('ACTIVITY_LOG_FLUSH_INTERVAL', '1.0')),
+                columns=ACTIVITY_COLUMNS,
+                spool=get_event_spool(),
+                write_batch=_write_activity_rows
             )
-        except Exception as e:
-            print(f"[ActivityLogger] DB connection failed: {e}")
-            return None
 
     def _get_request_info(self) -> Dict[str, str]:
         """
@@ -127,7 +175,7 @@ class ActivityLogger:
             user_agent: User-Agent (None이면 자동 추출)
 
         Returns:
-            bool: 저장 성공 여부
+            bool: 저장 성공 여부 (비동기 모드에서는 큐에 들어갔는지 여부)
         """
         try:
             # 컨텍스트 자동 추출
@@ -147,28 +195,31 @@ class ActivityLogger:
                 ip_address = ip_address or req_info['ip_address']
                 user_agent = user_agent or req_info['user_agent']
 
-            # DB 저장
-            conn = self._get_db_connection()
-            if not conn:
-                return False
-
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO activity_logs
-                (academy_id, user_id, action_type, action_detail, ip_address, user_agent)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (
+            # 발생 시각은 큐에 넣는 시점 기준 (배치 기록 지연과 무관)
+            row = (
+                new_event_key(),
                 academy_id,
                 user_id,
                 action_type,
                 json.dumps(action_detail) if action_detail else None,
                 ip_address,
-                user_agent
-            ))
+                user_agent,
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            )
+
+            if self.writer is not None:
+                if not self.writer.submit(row):
+                    print(f"[ActivityLogger] Dropped: {action_type} for academy {academy_id} (queue full)")
+                    return False
+                return True
 
-            conn.commit()
-            cursor.close()
-            conn.close()
+            # 동기 모드: DB 저장 (실패 시 spool에 보관)
+            try:
+                _write_activity_rows([row])
+            except Exception as e:
+                print(f"[ActivityLogger] DB write failed, spooling {action_type}: {e}")
+                get_event_spool().append('activity_logs', dict(zip(ACTIVITY_COLUMNS, row)))
+                return True
 
             print(f"[ActivityLogger] Logged: {action_type} for academy {academy_id}")
             return True
@@ -217,6 +268,25 @@ def log_activity(
     )
 
 
+def flush_activity_logs(timeout: float = 5.0) -> bool:
+    """
+    큐에 쌓인 활동 로그를 즉시 기록 (테스트, 배치 작업 종료 전 등)
+
+    Returns:
+        bool: timeout 안에 모두 기록되었으면 True (동기 모드는 항상 True)
+    """
+    if _logger.writer is None:
+        return True
+    return _logger.writer.flush(timeout)
+
+
+def get_activity_writer_stats() -> Dict[str, Any]:
+    """비동기 작성기 통계 (큐 길이, drop/spool 수 등)"""
+    if _logger.writer is None:
+        return {'async': False}
+    return dict(_logger.writer.stats(), **{'async': True})
+
+
 def get_activity_stats(academy_id: int, days: int = 30) -> Dict:
     """
     학원별 활동 통계 조회
@@ -228,27 +298,21 @@ def get_activity_stats(academy_id: int, days: int = 30) -> Dict:
     Returns:
         dict: 활동 통계
     """
-    conn = _logger._get_db_connection()
-    if not conn:
-        return {}
-
     try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT
-                action_type,
-                COUNT(*) as count,
-                MAX(created_at) as last_activity
-            FROM activity_logs
-            WHERE academy_id = %s
-            AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            GROUP BY action_type
-            ORDER BY count DESC
-        """, (academy_id, days))
-
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with db_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    action_type,
+                    COUNT(*) as count,
+                    MAX(created_at) as last_activity
+                FROM activity_logs
+                WHERE academy_id = %s
+                AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                GROUP BY action_type
+                ORDER BY count DESC
+            """, (academy_id, days))
+
+            results = cursor.fetchall()
 
         return {
             'by_action': {r['action_type']: r['count'] for r in results},
@@ -275,27 +339,21 @@ def get_recent_activities(academy_id: int, limit: int = 10) -> list:
     Returns:
         list: 최근 활동 목록
     """
-    conn = _logger._get_db_connection()
-    if not conn:
-        return []
-
     try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT
-                id,
-                action_type,
-                action_detail,
-                created_at
-            FROM activity_logs
-            WHERE academy_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s
-        """, (academy_id, limit))
-
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with db_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    id,
+                    action_type,
+                    action_detail,
+                    created_at
+                FROM activity_logs
+                WHERE academy_id = %s
+                ORDER BY created_at DESC
+                LIMIT %s
+            """, (academy_id, limit))
+
+            results = cursor.fetchall()
 
         return results
 
@@ -0,0 +1,52 @@
+-- ============================================================
+-- TutorNote Master Admin - 지표 롤업 테이블
+-- 003_create_rollup_tables.sql
+--
+-- 생성 테이블: 3개
+-- 1. daily_academy_activity - 일별 학원 활동 요약 (activity_logs)
+-- 2. daily_report_counts - 일별 학생 리포트 요약 (progress_records)
+-- 3. rollup_watermarks - 원본 테이블별 처리 위치 (마지막 id)
+--
+-- 롤업은 scripts/rollup_metrics.py가 유지합니다.
+--   최초 1회: python3 scripts/rollup_metrics.py --backfill 2025-01
+--   이후 5분마다: python3 scripts/rollup_metrics.py
+--   매일 1회: python3 scripts/rollup_metrics.py --refresh (전월 1일 ~ 오늘 재집계)
+--
+-- 실행: mysql -u root -p tutornote < 003_create_rollup_tables.sql
+-- ============================================================
+
+-- 1. daily_academy_activity (일별 학원 활동 요약)
+CREATE TABLE IF NOT EXISTS daily_academy_activity (
+  activity_date DATE NOT NULL,
+  academy_id INT NOT NULL,
+  action_count INT NOT NULL DEFAULT 0 COMMENT '전체 활동 수',
+  share_count INT NOT NULL DEFAULT 0 COMMENT 'share_kakaotalk 수',
+  first_activity_at DATETIME COMMENT '해당 일 첫 활동 시각',
+  last_activity_at DATETIME COMMENT '해당 일 마지막 활동 시각',
+  PRIMARY KEY (activity_date, academy_id),
+  INDEX idx_academy_date (academy_id, activity_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 2. daily_report_counts (일별 학생 리포트 요약, is_deleted = 0 만 집계)
+CREATE TABLE IF NOT EXISTS daily_report_counts (
+  report_date DATE NOT NULL,
+  student_id INT NOT NULL,
+  academy_id INT COMMENT '집계 시점 students.academy_id',
+  report_count INT NOT NULL DEFAULT 0,
+  card_news_count INT NOT NULL DEFAULT 0,
+  ai_report_count INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (report_date, student_id),
+  INDEX idx_academy_date (academy_id, report_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 3. rollup_watermarks (원본 테이블별 처리 위치)
+CREATE TABLE IF NOT EXISTS rollup_watermarks (
+  source_table VARCHAR(64) PRIMARY KEY,
+  last_id BIGINT NOT NULL DEFAULT 0 COMMENT '롤업에 반영된 마지막 원본 id',
+  covered_from DATE COMMENT '이 날짜부터 현재까지 롤업이 원본을 모두 반영함',
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '마지막 롤업 실행 시각'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ 롤업 테이블 3개 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ('daily_academy_activity', 'daily_report_counts', 'rollup_watermarks');
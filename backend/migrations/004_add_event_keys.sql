@@ -0,0 +1,58 @@
+-- ============================================================
+-- TutorNote Master Admin - spool replay 멱등 키
+-- 004_add_event_keys.sql
+--
+-- 수정 테이블: activity_logs, api_usage_logs
+-- 추가 컬럼: event_key (이벤트 고유 키, UNIQUE)
+--
+-- DB 장애 중 로컬 spool에 보관된 이벤트를 scripts/replay_spool.py가
+-- INSERT IGNORE로 재적재할 때 이미 들어간 이벤트는 건너뛰도록 합니다.
+-- 기존 행은 NULL (UNIQUE 인덱스는 NULL 중복을 허용)
+--
+-- 실행: mysql -u root -p tutornote < 004_add_event_keys.sql
+-- ============================================================
+
+DELIMITER //
+
+CREATE PROCEDURE add_event_key_if_not_exists()
+BEGIN
+    -- activity_logs.event_key
+    IF NOT EXISTS (
+        SELECT * FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'activity_logs'
+        AND COLUMN_NAME = 'event_key'
+    ) THEN
+        ALTER TABLE activity_logs
+        ADD COLUMN event_key CHAR(32) NULL COMMENT '이벤트 고유 키 (spool replay 중복 방지)',
+        ADD UNIQUE INDEX uk_event_key (event_key);
+    END IF;
+
+    -- api_usage_logs.event_key
+    IF NOT EXISTS (
+        SELECT * FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'api_usage_logs'
+        AND COLUMN_NAME = 'event_key'
+    ) THEN
+        ALTER TABLE api_usage_logs
+        ADD COLUMN event_key CHAR(32) NULL COMMENT '이벤트 고유 키 (spool replay 중복 방지)',
+        ADD UNIQUE INDEX uk_event_key (event_key);
+    END IF;
+END//
+
+DELIMITER ;
+
+-- 프로시저 실행
+CALL add_event_key_if_not_exists();
+
+-- 프로시저 삭제 (정리)
+DROP PROCEDURE IF EXISTS add_event_key_if_not_exists;
+
+-- 결과 확인
+SELECT '✅ event_key 컬럼 추가 완료!' AS message;
+SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = DATABASE()
+AND TABLE_NAME IN ('activity_logs', 'api_usage_logs')
+AND COLUMN_NAME = 'event_key';
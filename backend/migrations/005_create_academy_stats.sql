@@ -0,0 +1,34 @@
+-- ============================================================
+-- TutorNote Master Admin - 학원별 통계 테이블
+-- 005_create_academy_stats.sql
+--
+-- 생성 테이블: academy_stats (학원당 1행)
+--
+-- 학생 수 / 리포트 수 / 공유 수 / 마지막 활동 시각을 학원별로 유지합니다.
+--   - 활동 로그 기록 시 증분 반영 (utils/academy_stats.py, ActivityLogger)
+--   - scripts/reconcile_academy_stats.py가 원본 테이블 기준으로 주기적 보정
+--     최초 1회: python3 scripts/reconcile_academy_stats.py
+--
+-- 실행: mysql -u root -p tutornote < 005_create_academy_stats.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS academy_stats (
+  academy_id INT PRIMARY KEY,
+  student_count INT NOT NULL DEFAULT 0 COMMENT '학생 수 (is_deleted = 0)',
+  report_count INT NOT NULL DEFAULT 0 COMMENT '전체 리포트 수 (is_deleted = 0)',
+  month_start DATE NOT NULL COMMENT 'monthly_reports 집계 월 (1일)',
+  monthly_reports INT NOT NULL DEFAULT 0 COMMENT 'month_start 월의 리포트 수',
+  share_count INT NOT NULL DEFAULT 0 COMMENT 'share_kakaotalk 누적 수',
+  first_student_at DATETIME COMMENT '첫 학생 등록 시각',
+  first_report_at DATETIME COMMENT '첫 리포트 작성 시각',
+  first_share_at DATETIME COMMENT '첫 카카오톡 공유 시각',
+  last_activity_at DATETIME COMMENT '마지막 활동 시각 (activity_logs)',
+  reconciled_at DATETIME COMMENT '마지막 보정 시각',
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX idx_last_activity (last_activity_at),
+  INDEX idx_month_reports (month_start, monthly_reports)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ academy_stats 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'academy_stats';
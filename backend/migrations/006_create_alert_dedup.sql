@@ -0,0 +1,22 @@
+-- ============================================================
+-- TutorNote Master Admin - Alert 중복 발송 방지 기록
+-- 006_create_alert_dedup.sql
+--
+-- 생성 테이블: alert_dedup (Alert 키별 마지막 발송 시각)
+--
+-- ALERT_DEDUP_BACKEND=mysql 일 때 utils/alert_deduplicator.py가 사용합니다.
+-- 여러 서버/워커/cron 실행이 같은 cooldown 기록을 공유합니다.
+--
+-- 실행: mysql -u root -p tutornote < 006_create_alert_dedup.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS alert_dedup (
+  alert_key VARCHAR(191) PRIMARY KEY COMMENT 'Alert 고유 키 (예: cpu_critical_92)',
+  last_sent_at DATETIME(6) NOT NULL COMMENT '마지막 발송 시각',
+  claim_token CHAR(32) NOT NULL COMMENT '마지막으로 발송 권한을 얻은 호출의 토큰',
+  INDEX idx_last_sent (last_sent_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ alert_dedup 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'alert_dedup';
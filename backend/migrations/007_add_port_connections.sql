@@ -0,0 +1,46 @@
+-- ============================================================
+-- TutorNote Master Admin - 포트별 연결 수
+-- 007_add_port_connections.sql
+--
+-- 수정 테이블: system_health_logs
+-- 추가 컬럼: backend_connections, mysql_connections, nginx_connections
+--
+-- scripts/health_check.py가 /proc/net/tcp의 ESTABLISHED 연결을
+-- 로컬 포트별로 집계해 기록합니다 (utils/net_counters.py).
+-- 기존 행과 집계할 수 없는 환경의 행은 NULL
+--
+-- 실행: mysql -u root -p tutornote < 007_add_port_connections.sql
+-- ============================================================
+
+DELIMITER //
+
+CREATE PROCEDURE add_port_connections_if_not_exists()
+BEGIN
+    IF NOT EXISTS (
+        SELECT * FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'system_health_logs'
+        AND COLUMN_NAME = 'backend_connections'
+    ) THEN
+        ALTER TABLE system_health_logs
+        ADD COLUMN backend_connections INT NULL COMMENT 'Backend(Flask) 포트 ESTABLISHED 연결 수' AFTER active_connections,
+        ADD COLUMN mysql_connections INT NULL COMMENT 'MySQL 포트 ESTABLISHED 연결 수' AFTER backend_connections,
+        ADD COLUMN nginx_connections INT NULL COMMENT 'nginx(80/443) 포트 ESTABLISHED 연결 수' AFTER mysql_connections;
+    END IF;
+END//
+
+DELIMITER ;
+
+-- 프로시저 실행
+CALL add_port_connections_if_not_exists();
+
+-- 프로시저 삭제 (정리)
+DROP PROCEDURE IF EXISTS add_port_connections_if_not_exists;
+
+-- 결과 확인
+SELECT '✅ 포트별 연결 수 컬럼 추가 완료!' AS message;
+SELECT COLUMN_NAME, DATA_TYPE
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = DATABASE()
+AND TABLE_NAME = 'system_health_logs'
+AND COLUMN_NAME LIKE '%\_connections';
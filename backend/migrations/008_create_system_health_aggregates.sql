@@ -0,0 +1,43 @@
+-- ============================================================
+-- TutorNote Master Admin - 시스템 헬스 다운샘플 집계
+-- 008_create_system_health_aggregates.sql
+--
+-- 생성 테이블: system_health_aggregates (1분/1시간 버킷별 min/avg/max/p95)
+--
+-- 헬스체크 데몬(scripts/health_check.py --daemon)은 1초 샘플을 메모리 링 버퍼에만
+-- 두고 이 테이블에 1분/1시간 집계만 기록합니다 (utils/health_aggregates.py).
+-- 리소스 Alert 윈도우와 system-health 카드는 최근 몇 분의 1분 집계를 읽습니다.
+-- (재시작 횟수는 process_lifecycle_events - migrations/009)
+--
+-- 보관 기간: 1분 2일, 1시간 400일 (HEALTH_AGG_RETENTION_1M_DAYS / _1H_DAYS)
+--
+-- 실행: mysql -u root -p tutornote < 008_create_system_health_aggregates.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS system_health_aggregates (
+  resolution ENUM('1m', '1h') NOT NULL COMMENT '버킷 해상도',
+  bucket_start DATETIME NOT NULL COMMENT '버킷 시작 시각',
+  samples INT NOT NULL COMMENT '버킷 내 샘플 수',
+  cpu_min DECIMAL(5, 2) NULL COMMENT 'CPU 사용률 min (%)',
+  cpu_avg DECIMAL(5, 2) NULL COMMENT 'CPU 사용률 avg (%)',
+  cpu_max DECIMAL(5, 2) NULL COMMENT 'CPU 사용률 max (%)',
+  cpu_p95 DECIMAL(5, 2) NULL COMMENT 'CPU 사용률 p95 (%)',
+  ram_min DECIMAL(5, 2) NULL COMMENT 'RAM 사용률 min (%)',
+  ram_avg DECIMAL(5, 2) NULL COMMENT 'RAM 사용률 avg (%)',
+  ram_max DECIMAL(5, 2) NULL COMMENT 'RAM 사용률 max (%)',
+  ram_p95 DECIMAL(5, 2) NULL COMMENT 'RAM 사용률 p95 (%)',
+  disk_min DECIMAL(5, 2) NULL COMMENT 'DISK 사용률 min (%)',
+  disk_avg DECIMAL(5, 2) NULL COMMENT 'DISK 사용률 avg (%)',
+  disk_max DECIMAL(5, 2) NULL COMMENT 'DISK 사용률 max (%)',
+  disk_p95 DECIMAL(5, 2) NULL COMMENT 'DISK 사용률 p95 (%)',
+  active_connections_max INT NULL COMMENT '전체 ESTABLISHED 연결 수 최대',
+  backend_connections_max INT NULL COMMENT 'backend ESTABLISHED 연결 수 최대',
+  mysql_connections_max INT NULL COMMENT 'mysql ESTABLISHED 연결 수 최대',
+  nginx_connections_max INT NULL COMMENT 'nginx ESTABLISHED 연결 수 최대',
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (resolution, bucket_start)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ system_health_aggregates 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'system_health_aggregates';
@@ -0,0 +1,30 @@
+-- ============================================================
+-- TutorNote Master Admin - 프로세스 생명주기 기록
+-- 009_create_process_lifecycle_events.sql
+--
+-- 생성 테이블: process_lifecycle_events (프로세스 시작/정상 종료 이벤트)
+--
+-- Backend와 헬스체크 데몬이 시작 시 start, 정상 종료 시 stop을 기록합니다
+-- (utils/process_lifecycle.py). 재시작 Alert와 system-health 카드의 재시작 횟수는
+-- 인덱스 범위 COUNT로, api-status 카드의 uptime은 마지막 start 시각으로 계산합니다.
+--
+-- 실행: mysql -u root -p tutornote < 009_create_process_lifecycle_events.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS process_lifecycle_events (
+  id BIGINT PRIMARY KEY AUTO_INCREMENT,
+  process_name VARCHAR(50) NOT NULL COMMENT 'backend / health_daemon',
+  event_type ENUM('start', 'stop') NOT NULL,
+  hostname VARCHAR(100) NOT NULL,
+  pid INT NOT NULL,
+  started_at DATETIME(3) NOT NULL COMMENT '프로세스 시작 시각',
+  boot_time DATETIME NULL COMMENT '서버 부팅 시각 (서버 재부팅과 프로세스 재시작 구분)',
+  version VARCHAR(64) NULL COMMENT 'APP_VERSION 또는 git short SHA',
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  INDEX idx_process_event_created (process_name, event_type, created_at),
+  INDEX idx_process_event_started (process_name, event_type, started_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ process_lifecycle_events 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'process_lifecycle_events';
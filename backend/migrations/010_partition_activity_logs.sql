@@ -0,0 +1,88 @@
+-- ============================================================
+-- TutorNote Master Admin - activity_logs 월별 파티셔닝
+-- 010_partition_activity_logs.sql
+--
+-- 수정 테이블: activity_logs
+--
+-- created_at 기준 월별 RANGE 파티션으로 바꿉니다. 거의 모든 지표 쿼리가
+-- created_at 범위 조건을 가지므로 필요한 달의 파티션만 읽고(partition pruning),
+-- 보관 기간이 지난 달은 DELETE 대신 파티션 단위로 보관/삭제합니다.
+--
+-- - 파티션 키는 모든 UNIQUE 키에 포함되어야 하므로
+--   PRIMARY KEY (id) → (id, created_at), uk_event_key (event_key) → (event_key, created_at)
+--   (spool replay 행은 원래 created_at을 그대로 가지므로 INSERT IGNORE 중복 방지는 유지)
+-- - 파티션: 가장 오래된 행의 달 ~ 3개월 뒤까지 p<YYYYMM>, 그 이후는 p_future (MAXVALUE)
+-- - 이후 파티션 추가/보관은 scripts/manage_partitions.py (utils/partition_manager.py)
+--
+-- 테이블 전체를 다시 쓰므로 행 수가 많으면 트래픽이 적은 시간에 실행하세요.
+-- 이미 파티셔닝된 경우 아무것도 하지 않습니다.
+--
+-- 실행: mysql -u root -p tutornote < 010_partition_activity_logs.sql
+-- ============================================================
+
+DELIMITER //
+
+CREATE PROCEDURE partition_activity_logs_if_needed()
+BEGIN
+    DECLARE first_month DATE;
+    DECLARE last_month DATE;
+    DECLARE month_cursor DATE;
+    DECLARE partitions_sql TEXT DEFAULT '';
+
+    IF NOT EXISTS (
+        SELECT * FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'activity_logs'
+        AND PARTITION_NAME IS NOT NULL
+    ) THEN
+        -- 파티션 키(created_at)를 PRIMARY / UNIQUE 키에 포함
+        ALTER TABLE activity_logs
+        MODIFY created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        DROP PRIMARY KEY,
+        ADD PRIMARY KEY (id, created_at),
+        DROP INDEX uk_event_key,
+        ADD UNIQUE INDEX uk_event_key (event_key, created_at);
+
+        -- 월별 파티션 정의 생성
+        SELECT CAST(DATE_FORMAT(COALESCE(MIN(created_at), NOW()), '%Y-%m-01') AS DATE)
+        INTO first_month
+        FROM activity_logs;
+
+        SET last_month = CAST(DATE_FORMAT(NOW() + INTERVAL 3 MONTH, '%Y-%m-01') AS DATE);
+        SET month_cursor = first_month;
+
+        WHILE month_cursor <= last_month DO
+            SET partitions_sql = CONCAT(
+                partitions_sql,
+                'PARTITION p', DATE_FORMAT(month_cursor, '%Y%m'),
+                ' VALUES LESS THAN (UNIX_TIMESTAMP(''', month_cursor + INTERVAL 1 MONTH, ' 00:00:00'')), '
+            );
+            SET month_cursor = month_cursor + INTERVAL 1 MONTH;
+        END WHILE;
+
+        SET @partition_sql = CONCAT(
+            'ALTER TABLE activity_logs PARTITION BY RANGE (UNIX_TIMESTAMP(created_at)) (',
+            partitions_sql,
+            'PARTITION p_future VALUES LESS THAN MAXVALUE)'
+        );
+        PREPARE stmt FROM @partition_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END//
+
+DELIMITER ;
+
+-- 프로시저 실행
+CALL partition_activity_logs_if_needed();
+
+-- 프로시저 삭제 (정리)
+DROP PROCEDURE IF EXISTS partition_activity_logs_if_needed;
+
+-- 결과 확인
+SELECT '✅ activity_logs 월별 파티셔닝 완료!' AS message;
+SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS
+FROM information_schema.PARTITIONS
+WHERE TABLE_SCHEMA = DATABASE()
+AND TABLE_NAME = 'activity_logs'
+ORDER BY PARTITION_ORDINAL_POSITION;
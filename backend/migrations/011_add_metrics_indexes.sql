@@ -0,0 +1,110 @@
+-- ============================================================
+-- TutorNote Master Admin - 지표/Alert 쿼리용 복합·커버링 인덱스
+-- 011_add_metrics_indexes.sql
+--
+-- routes/admin/metrics.py, tables.py, alerts.py, utils/alert_checker.py의
+-- 쿼리가 테이블 전체를 읽지 않도록 WHERE 범위 + 집계 컬럼을 담은 인덱스를 추가합니다.
+-- 새 인덱스가 기존 단일 컬럼 인덱스를 접두어로 포함하면 기존 인덱스는 삭제합니다
+-- (새 인덱스를 먼저 만든 뒤 삭제하므로 인덱스가 없는 구간은 없음).
+--
+-- activity_logs
+--   idx_created_cover (created_at, academy_id, action_type)    ← idx_created_at 대체
+--     7일 활성/DAU/MAU/이번 달 공유 수
+--   idx_action_created (action_type, created_at, academy_id)   ← idx_action_type 대체
+--     퍼널 공유 단계 (action_type = 'share_kakaotalk' + 기간)
+-- report_views
+--   idx_viewer_created (viewer_type, created_at)               이번 달 학부모 열람 수
+--   idx_created_report (created_at, report_id)                 ← idx_created_at 대체, 7일 열람률 Alert
+-- api_usage_logs
+--   idx_created_status (created_at, status)                    ← idx_created_at 대체, API 에러율 Alert
+-- api_health_checks
+--   idx_created_api (created_at, api_name, status, response_time_ms)  ← idx_created_at 대체
+-- progress_records
+--   idx_deleted_created (is_deleted, created_at, student_id, card_news_generated, ai_generated)
+--     이번 달/전월 리포트·카드뉴스·AI 리포트, 헤비 유저, 7일 열람률 Alert 분모
+-- students
+--   idx_deleted_cover (is_deleted, created_at, academy_id, consent_status)  학생 통계
+-- academies
+--   idx_deleted_created (is_deleted, created_at)               가입 통계, 신규 학원 퍼널
+--   idx_status (status)                                        무활동 학원 Alert
+--
+-- 검증: tests/test_query_plans.py (EXPLAIN에 전체 스캔이 없는지 확인)
+--
+-- 실행: mysql -u root -p tutornote < 011_add_metrics_indexes.sql
+-- ============================================================
+
+DELIMITER //
+
+CREATE PROCEDURE add_index_if_not_exists(IN tbl VARCHAR(64), IN idx VARCHAR(64), IN cols VARCHAR(255))
+BEGIN
+    IF NOT EXISTS (
+        SELECT * FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = tbl
+        AND INDEX_NAME = idx
+    ) THEN
+        SET @index_sql = CONCAT('ALTER TABLE ', tbl, ' ADD INDEX ', idx, ' (', cols, ')');
+        PREPARE stmt FROM @index_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END//
+
+CREATE PROCEDURE drop_index_if_exists(IN tbl VARCHAR(64), IN idx VARCHAR(64))
+BEGIN
+    IF EXISTS (
+        SELECT * FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = tbl
+        AND INDEX_NAME = idx
+    ) THEN
+        SET @index_sql = CONCAT('ALTER TABLE ', tbl, ' DROP INDEX ', idx);
+        PREPARE stmt FROM @index_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END//
+
+DELIMITER ;
+
+-- activity_logs
+CALL add_index_if_not_exists('activity_logs', 'idx_created_cover', 'created_at, academy_id, action_type');
+CALL drop_index_if_exists('activity_logs', 'idx_created_at');
+CALL add_index_if_not_exists('activity_logs', 'idx_action_created', 'action_type, created_at, academy_id');
+CALL drop_index_if_exists('activity_logs', 'idx_action_type');
+
+-- report_views
+CALL add_index_if_not_exists('report_views', 'idx_viewer_created', 'viewer_type, created_at');
+CALL add_index_if_not_exists('report_views', 'idx_created_report', 'created_at, report_id');
+CALL drop_index_if_exists('report_views', 'idx_created_at');
+
+-- api_usage_logs
+CALL add_index_if_not_exists('api_usage_logs', 'idx_created_status', 'created_at, status');
+CALL drop_index_if_exists('api_usage_logs', 'idx_created_at');
+
+-- api_health_checks
+CALL add_index_if_not_exists('api_health_checks', 'idx_created_api', 'created_at, api_name, status, response_time_ms');
+CALL drop_index_if_exists('api_health_checks', 'idx_created_at');
+
+-- progress_records / students / academies (기존 인덱스는 유지)
+CALL add_index_if_not_exists('progress_records', 'idx_deleted_created',
+    'is_deleted, created_at, student_id, card_news_generated, ai_generated');
+CALL add_index_if_not_exists('students', 'idx_deleted_cover', 'is_deleted, created_at, academy_id, consent_status');
+CALL add_index_if_not_exists('academies', 'idx_deleted_created', 'is_deleted, created_at');
+CALL add_index_if_not_exists('academies', 'idx_status', 'status');
+
+-- 프로시저 삭제 (정리)
+DROP PROCEDURE IF EXISTS add_index_if_not_exists;
+DROP PROCEDURE IF EXISTS drop_index_if_exists;
+
+-- 통계 갱신
+ANALYZE TABLE activity_logs, report_views, api_usage_logs, api_health_checks, progress_records, students, academies;
+
+-- 결과 확인
+SELECT '✅ 지표/Alert 인덱스 추가 완료!' AS message;
+SELECT TABLE_NAME, INDEX_NAME, GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX) AS columns
+FROM information_schema.STATISTICS
+WHERE TABLE_SCHEMA = DATABASE()
+AND INDEX_NAME IN ('idx_created_cover', 'idx_action_created', 'idx_viewer_created', 'idx_created_report',
+                   'idx_created_status', 'idx_created_api', 'idx_deleted_created', 'idx_deleted_cover', 'idx_status')
+GROUP BY TABLE_NAME, INDEX_NAME;
@@ -0,0 +1,28 @@
+-- ============================================================
+-- TutorNote Master Admin - 일별 활성 학원 비트맵
+-- 012_create_daily_active_academies.sql
+--
+-- 생성 테이블: daily_active_academies (일별 활성 학원 id 비트맵)
+--
+-- 하루에 1행, 그날 활동 로그가 있는 학원 id를 비트 위치로 표시한 비트맵입니다
+-- (비트 i = 학원 id i, little-endian). 활동 로그가 기록될 때 증분으로 OR하고
+-- (utils/activity_bitmaps.py), scripts/rebuild_activity_bitmaps.py가 activity_logs
+-- 기준으로 다시 만들어 rebuilt_at을 기록합니다.
+-- DAU / 7일 / MAU / 임의 기간 활성 학원 수는 기간 내 비트맵 OR 후 popcount로 계산합니다.
+--
+-- 최초 적재: python3 scripts/rebuild_activity_bitmaps.py --days 62
+--
+-- 실행: mysql -u root -p tutornote < 012_create_daily_active_academies.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS daily_active_academies (
+  activity_date DATE PRIMARY KEY,
+  bitmap MEDIUMBLOB NOT NULL COMMENT '활성 학원 id 비트맵 (비트 i = 학원 id i, little-endian)',
+  academy_count INT NOT NULL DEFAULT 0 COMMENT '비트맵 popcount (활성 학원 수)',
+  rebuilt_at DATETIME NULL COMMENT 'activity_logs 기준 마지막 재생성 시각 (NULL이면 증분만 반영)',
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ daily_active_academies 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'daily_active_academies';
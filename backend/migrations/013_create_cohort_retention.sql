@@ -0,0 +1,31 @@
+-- ============================================================
+-- TutorNote Master Admin - 가입 코호트 리텐션
+-- 013_create_cohort_retention.sql
+--
+-- 생성 테이블: cohort_retention (가입 기간 × 활동 기간별 활동 학원 수)
+--
+-- 가입 주/월 코호트마다, 가입 후 period_index번째 기간에 활동한 학원 수를 저장합니다.
+-- 일별 활성 학원 비트맵(daily_active_academies)과 코호트 학원 비트맵의 AND로
+-- 계산하므로 activity_logs는 읽지 않습니다 (utils/cohort_retention.py).
+-- /api/admin/metrics/cohorts가 PK 범위로 읽습니다.
+--
+-- 최초 적재 (일별 비트맵이 코호트 기간을 덮은 뒤):
+--   python3 scripts/rebuild_activity_bitmaps.py --days 366
+--   python3 scripts/refresh_cohorts.py --full
+--
+-- 실행: mysql -u root -p tutornote < 013_create_cohort_retention.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS cohort_retention (
+  granularity ENUM('week', 'month') NOT NULL COMMENT '코호트/기간 단위 (주는 월요일 시작)',
+  cohort_start DATE NOT NULL COMMENT '가입 기간 시작일',
+  period_index INT NOT NULL COMMENT '가입 후 몇 번째 기간인지 (0 = 가입 기간)',
+  cohort_size INT NOT NULL COMMENT '코호트 학원 수 (계산 시점, 삭제 학원 제외)',
+  active_count INT NOT NULL COMMENT '해당 기간에 활동한 코호트 학원 수',
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (granularity, cohort_start, period_index)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ cohort_retention 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'cohort_retention';
@@ -0,0 +1,48 @@
+-- ============================================================
+-- TutorNote Master Admin - 고객 건강도 점수
+-- 014_create_customer_health_scores.sql
+--
+-- 생성 테이블: customer_health_scores (학원당 1행, 최신 점수)
+--
+-- Phase 3 스펙(docs/PHASE3_AI_INTELLIGENCE_SPEC.md 4.4)의 점수 컬럼을 따르되,
+-- 대시보드가 인덱스로 바로 읽을 수 있도록 학원당 최신 1행만 유지합니다.
+--   - scripts/update_health_scores.py가 매시간 전체 학원을 한 번에 계산해 upsert
+--     (utils/customer_health.py)
+--   - previous_score: 전날까지의 마지막 점수, score_change: 그 대비 변화
+--   - risk_level / inactive_days: 이탈 위험 학원 목록(7일 이상 무활동)용
+--     (/api/admin/tables/at-risk-academies가 idx_risk로 읽음)
+--
+-- 최초 적재: python3 scripts/update_health_scores.py
+--
+-- 실행: mysql -u root -p tutornote < 014_create_customer_health_scores.sql
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS customer_health_scores (
+  academy_id INT PRIMARY KEY,
+
+  -- 점수 (각 100점 만점)
+  total_score DECIMAL(5,2) NOT NULL,
+  activity_score DECIMAL(5,2) NOT NULL COMMENT '활동성 (30%)',
+  engagement_score DECIMAL(5,2) NOT NULL COMMENT '참여도 (30%)',
+  performance_score DECIMAL(5,2) NOT NULL COMMENT '성과 (20%)',
+  growth_score DECIMAL(5,2) NOT NULL COMMENT '성장성 (20%)',
+
+  -- 상태
+  status ENUM('champion', 'healthy', 'at_risk', 'critical') NOT NULL,
+  risk_level ENUM('critical', 'warning', 'caution') NULL COMMENT '이탈 위험 수준 (7일 이상 무활동만, 아니면 NULL)',
+  inactive_days INT NOT NULL DEFAULT 0 COMMENT '계산 시점 무활동 일수',
+
+  -- 변화 추적
+  previous_score DECIMAL(5,2) NULL COMMENT '전날까지의 마지막 점수',
+  score_change DECIMAL(5,2) NULL COMMENT 'total_score - previous_score',
+
+  -- 타임스탬프
+  calculated_at DATETIME NOT NULL,
+
+  INDEX idx_status_score (status, total_score),
+  INDEX idx_risk (risk_level, inactive_days)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 완료 메시지
+SELECT '✅ customer_health_scores 테이블 생성 완료!' AS message;
+SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'customer_health_scores';
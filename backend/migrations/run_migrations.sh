@@ -41,7 +41,7 @@ else
 fi
 
 # 1. DB 백업
-echo -e "${YELLOW}[1/3] DB 백업 중...${NC}"
+echo -e "${YELLOW}[1/15] DB 백업 중...${NC}"
 BACKUP_FILE="${BACKUP_DIR}/backup_before_phase1_$(date +%Y%m%d_%H%M%S).sql"
 ${MYSQLDUMP_CMD} ${DB_NAME} > "${BACKUP_FILE}" 2>/dev/null || {
     echo -e "${RED}❌ DB 백업 실패${NC}"
@@ -51,7 +51,7 @@ echo -e "${GREEN}✓ DB 백업 완료: ${BACKUP_FILE}${NC}"
 
 # 2. 트래킹 테이블 생성
 echo ""
-echo -e "${YELLOW}[2/3] 트래킹 테이블 생성 중...${NC}"
+echo -e "${YELLOW}[2/15] 트래킹 테이블 생성 중...${NC}"
 ${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/001_create_tracking_tables.sql" 2>/dev/null || {
     echo -e "${RED}❌ 트래킹 테이블 생성 실패${NC}"
     exit 1
@@ -60,12 +60,120 @@ echo -e "${GREEN}✓ 트래킹 테이블 6개 생성 완료${NC}"
 
 # 3. progress_records 테이블 수정
 echo ""
-echo -e "${YELLOW}[3/3] progress_records 테이블 수정 중...${NC}"
+echo -e "${YELLOW}[3/15] progress_records 테이블 수정 중...${NC}"
 ${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/002_alter_progress_records.sql" 2>/dev/null || {
     echo -e "${YELLOW}⚠️  progress_records 테이블 수정 스킵 (이미 존재하거나 테이블 없음)${NC}"
 }
 echo -e "${GREEN}✓ progress_records 컬럼 추가 완료${NC}"
 
+# 4. 지표 롤업 테이블 생성
+echo ""
+echo -e "${YELLOW}[4/15] 지표 롤업 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/003_create_rollup_tables.sql" 2>/dev/null || {
+    echo -e "${RED}❌ 롤업 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ 롤업 테이블 3개 생성 완료 (백필: python3 scripts/rollup_metrics.py --backfill YYYY-MM)${NC}"
+
+# 5. spool replay 멱등 키 추가
+echo ""
+echo -e "${YELLOW}[5/15] event_key 컬럼 추가 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/004_add_event_keys.sql" 2>/dev/null || {
+    echo -e "${RED}❌ event_key 컬럼 추가 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ activity_logs / api_usage_logs event_key 추가 완료${NC}"
+
+# 6. 학원별 통계 테이블 생성
+echo ""
+echo -e "${YELLOW}[6/15] 학원별 통계 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/005_create_academy_stats.sql" 2>/dev/null || {
+    echo -e "${RED}❌ academy_stats 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ academy_stats 생성 완료 (초기 적재: python3 scripts/reconcile_academy_stats.py)${NC}"
+
+# 7. Alert 중복 발송 방지 기록
+echo ""
+echo -e "${YELLOW}[7/15] alert_dedup 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/006_create_alert_dedup.sql" 2>/dev/null || {
+    echo -e "${RED}❌ alert_dedup 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ alert_dedup 생성 완료 (ALERT_DEDUP_BACKEND=mysql 일 때 사용)${NC}"
+
+# 8. 포트별 연결 수 컬럼 추가
+echo ""
+echo -e "${YELLOW}[8/15] system_health_logs 포트별 연결 수 컬럼 추가 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/007_add_port_connections.sql" 2>/dev/null || {
+    echo -e "${RED}❌ 포트별 연결 수 컬럼 추가 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ backend/mysql/nginx_connections 추가 완료${NC}"
+
+# 9. 시스템 헬스 다운샘플 집계 테이블 생성
+echo ""
+echo -e "${YELLOW}[9/15] system_health_aggregates 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/008_create_system_health_aggregates.sql" 2>/dev/null || {
+    echo -e "${RED}❌ system_health_aggregates 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ system_health_aggregates 생성 완료 (1분/1시간 집계)${NC}"
+
+# 10. 프로세스 생명주기 기록 테이블 생성
+echo ""
+echo -e "${YELLOW}[10/15] process_lifecycle_events 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/009_create_process_lifecycle_events.sql" 2>/dev/null || {
+    echo -e "${RED}❌ process_lifecycle_events 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ process_lifecycle_events 생성 완료 (재시작 횟수 / uptime)${NC}"
+
+# 11. activity_logs 월별 파티셔닝
+echo ""
+echo -e "${YELLOW}[11/15] activity_logs 월별 파티셔닝 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/010_partition_activity_logs.sql" 2>/dev/null || {
+    echo -e "${RED}❌ activity_logs 파티셔닝 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ activity_logs 파티셔닝 완료 (이후 파티션은 scripts/manage_partitions.py)${NC}"
+
+# 12. 지표/Alert 쿼리 인덱스 추가
+echo ""
+echo -e "${YELLOW}[12/15] 지표/Alert 쿼리 인덱스 추가 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/011_add_metrics_indexes.sql" 2>/dev/null || {
+    echo -e "${RED}❌ 지표/Alert 인덱스 추가 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ 복합/커버링 인덱스 추가 완료 (검증: tests/test_query_plans.py)${NC}"
+
+# 13. 일별 활성 학원 비트맵
+echo ""
+echo -e "${YELLOW}[13/15] daily_active_academies 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/012_create_daily_active_academies.sql" 2>/dev/null || {
+    echo -e "${RED}❌ daily_active_academies 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ daily_active_academies 생성 완료 (최초 적재: python3 scripts/rebuild_activity_bitmaps.py --days 62)${NC}"
+
+# 14. 가입 코호트 리텐션
+echo ""
+echo -e "${YELLOW}[14/15] cohort_retention 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/013_create_cohort_retention.sql" 2>/dev/null || {
+    echo -e "${RED}❌ cohort_retention 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ cohort_retention 생성 완료 (최초 적재: python3 scripts/refresh_cohorts.py --full)${NC}"
+
+# 15. 고객 건강도 점수
+echo ""
+echo -e "${YELLOW}[15/15] customer_health_scores 테이블 생성 중...${NC}"
+${MYSQL_CMD} ${DB_NAME} < "${MIGRATION_DIR}/014_create_customer_health_scores.sql" 2>/dev/null || {
+    echo -e "${RED}❌ customer_health_scores 테이블 생성 실패${NC}"
+    exit 1
+}
+echo -e "${GREEN}✓ customer_health_scores 생성 완료 (최초 적재: python3 scripts/update_health_scores.py)${NC}"
+
 # 결과 확인
 echo ""
 echo -e "${GREEN}╔════════════════════════════════════════════════════════════╗${NC}"
@@ -6,20 +6,30 @@ Phase 2에서 추가된 Blueprints:
 - metrics_bp: 12개 핵심 지표 API
 - tables_bp: 3개 테이블 섹션 API
 - reports_bp: 학부모 열람 추적 API
+- exports_bp: 학원 목록 / 활동 로그 CSV·NDJSON 스트리밍 export
 """
 
 from routes.admin.alerts import alerts_bp, register_alerts_routes
 from routes.admin.metrics import metrics_bp, register_metrics_routes
 from routes.admin.tables import tables_bp, register_tables_routes
 from routes.admin.reports import reports_bp, register_reports_routes
+from routes.admin.exports import exports_bp, register_exports_routes
+from utils.process_lifecycle import install_start_hook
 
 
 def register_all_admin_routes(app):
-    """모든 Admin Blueprint 등록"""
+    """
+    모든 Admin Blueprint 등록 + Backend 워커 시작 기록 훅 (재시작 횟수 / uptime용)
+
+    시작 기록은 등록 시점(--preload면 master)이 아니라 워커마다 fork 이후에 남깁니다.
+    (gunicorn은 post_fork 훅 - utils/process_lifecycle.py)
+    """
     register_alerts_routes(app)
     register_metrics_routes(app)
     register_tables_routes(app)
     register_reports_routes(app)
+    register_exports_routes(app)
+    install_start_hook(app, 'backend')
 
 
 __all__ = [
@@ -27,9 +37,11 @@ __all__ = [
     'metrics_bp',
     'tables_bp',
     'reports_bp',
+    'exports_bp',
     'register_all_admin_routes',
     'register_alerts_routes',
     'register_metrics_routes',
     'register_tables_routes',
     'register_reports_routes',
+    'register_exports_routes',
 ]
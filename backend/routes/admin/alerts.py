@@ -5,341 +5,89 @@ Critical Alerts API 엔드포인트
 
 API:
     GET /api/admin/dashboard/alerts - 현재 활성 Alert 목록 조회
+
+체크 함수와 메시지 포맷은 utils/alert_checker.py의 것을 그대로 사용하며,
+run_alert_checks로 동시에 실행됩니다. 제한 시간을 넘긴 체크는 'unknown',
+조회에 실패한 체크(DB 장애 등)는 'error'로 checks 목록에 표시됩니다.
+
+체크 결과는 config/cache_settings.py의 'alerts' TTL 동안 캐시되고, 저장할 때
+Alert 내용과 체크 상태로 만든 버전(created_at / duration_ms 제외)을 ETag로 보냅니다.
+캐시에 있으면 체크를 다시 실행하지 않고, If-None-Match가 같으면 직렬화 없이 304를
+반환합니다. 'unknown' / 'error' 체크가 있는 결과는 캐시하지 않습니다. ?refresh=1 로 캐시 무시.
 """
 
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from flask import Blueprint, jsonify
+from typing import List, Dict, Any
+from flask import Blueprint, jsonify, request
 
 # 프로젝트 루트 설정
 import sys
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PROJECT_ROOT)
 
-from config.alert_thresholds import get_threshold
+from utils.alert_checker import (
+    check_api_error_rate_alert,
+    check_cpu_alert,
+    check_disk_alert,
+    check_inactive_academy_alert,
+    check_ram_alert,
+    format_alert_message,
+    run_alert_checks,
+)
+from utils.http_cache import conditional_json, payload_version
+from utils.result_cache import create_result_cache, remaining_ttl
+from config.cache_settings import get_cache_ttl
 
 alerts_bp = Blueprint('alerts', __name__)
 
+# 체크 결과 캐시 (METRICS_CACHE_BACKEND=redis면 워커 간 공유)
+alerts_cache = create_result_cache('alerts')
+ALERTS_CACHE_KEY = 'alerts'
 
-def get_db_connection():
-    """데이터베이스 연결"""
-    try:
-        import mysql.connector
-        return mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', ''),
-            database=os.getenv('DB_NAME', 'tutornote')
-        )
-    except Exception as e:
-        print(f"[Alerts API] DB connection failed: {e}")
-        return None
-
-
-def check_cpu_alert() -> Optional[Dict]:
-    """CPU 사용률 Alert 체크 (최근 5분 평균)"""
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT AVG(cpu_usage) as avg_cpu
-            FROM system_health_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """)
-        result = cursor.fetchone()
-        avg_cpu = float(result['avg_cpu']) if result and result['avg_cpu'] else 0
-
-        cursor.close()
-        conn.close()
-
-        cpu_warning = get_threshold('system', 'cpu', 'warning')
-        cpu_critical = get_threshold('system', 'cpu', 'critical')
-
-        if avg_cpu > cpu_critical:
-            return {
-                'severity': 'critical',
-                'type': 'cpu_usage',
-                'value': avg_cpu,
-                'threshold': cpu_critical
-            }
-        elif avg_cpu > cpu_warning:
-            return {
-                'severity': 'warning',
-                'type': 'cpu_usage',
-                'value': avg_cpu,
-                'threshold': cpu_warning
-            }
-
-    except Exception as e:
-        print(f"[Alerts API] CPU check error: {e}")
-
-    return None
-
-
-def check_ram_alert() -> Optional[Dict]:
-    """RAM 사용률 Alert 체크 (최근 5분 평균)"""
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT AVG(ram_usage) as avg_ram
-            FROM system_health_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """)
-        result = cursor.fetchone()
-        avg_ram = float(result['avg_ram']) if result and result['avg_ram'] else 0
-
-        cursor.close()
-        conn.close()
 
-        ram_warning = get_threshold('system', 'ram', 'warning')
-        ram_critical = get_threshold('system', 'ram', 'critical')
-
-        if avg_ram > ram_critical:
-            return {
-                'severity': 'critical',
-                'type': 'ram_usage',
-                'value': avg_ram,
-                'threshold': ram_critical
-            }
-        elif avg_ram > ram_warning:
-            return {
-                'severity': 'warning',
-                'type': 'ram_usage',
-                'value': avg_ram,
-                'threshold': ram_warning
-            }
-
-    except Exception as e:
-        print(f"[Alerts API] RAM check error: {e}")
-
-    return None
-
-
-def check_disk_alert() -> Optional[Dict]:
-    """Disk 사용률 Alert 체크 (최근 5분 평균)"""
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT AVG(disk_usage) as avg_disk
-            FROM system_health_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """)
-        result = cursor.fetchone()
-        avg_disk = float(result['avg_disk']) if result and result['avg_disk'] else 0
-
-        cursor.close()
-        conn.close()
-
-        disk_warning = get_threshold('system', 'disk', 'warning')
-        disk_critical = get_threshold('system', 'disk', 'critical')
-
-        if avg_disk > disk_critical:
-            return {
-                'severity': 'critical',
-                'type': 'disk_usage',
-                'value': avg_disk,
-                'threshold': disk_critical
-            }
-        elif avg_disk > disk_warning:
-            return {
-                'severity': 'warning',
-                'type': 'disk_usage',
-                'value': avg_disk,
-                'threshold': disk_warning
-            }
-
-    except Exception as e:
-        print(f"[Alerts API] Disk check error: {e}")
-
-    return None
-
-
-def check_inactive_academy_alert() -> Optional[Dict]:
-    """무활동 학원 Alert 체크"""
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
+# 대시보드 Alert 체크 함수 목록
+ALERT_CHECKS = [
+    check_cpu_alert,
+    check_ram_alert,
+    check_disk_alert,
+    check_inactive_academy_alert,
+    check_api_error_rate_alert,
+]
 
-        inactive_days_critical = get_threshold('business', 'inactive_days', 'critical')
-        inactive_days_warning = get_threshold('business', 'inactive_days', 'warning')
 
-        # 30일 이상 무활동 학원 수 (Critical)
-        cursor.execute("""
-            SELECT COUNT(DISTINCT a.id) as count
-            FROM academies a
-            LEFT JOIN (
-                SELECT academy_id, MAX(created_at) as last_activity
-                FROM activity_logs
-                GROUP BY academy_id
-            ) al ON a.id = al.academy_id
-            WHERE a.status = 'active'
-            AND (al.last_activity IS NULL
-                 OR al.last_activity < DATE_SUB(NOW(), INTERVAL %s DAY))
-        """, (inactive_days_critical,))
+def run_dashboard_checks() -> Dict[str, Any]:
+    """대시보드 Alert 체크 동시 실행 (alerts, checks, duration_ms)"""
+    return run_alert_checks(ALERT_CHECKS, formatter=format_alert_message)
 
-        result = cursor.fetchone()
-        inactive_count = result['count'] if result else 0
-
-        cursor.close()
-        conn.close()
-
-        if inactive_count > 0:
-            return {
-                'severity': 'critical',
-                'type': 'inactive_academy',
-                'value': inactive_count,
-                'threshold': inactive_days_critical
-            }
-
-    except Exception as e:
-        print(f"[Alerts API] Inactive academy check error: {e}")
-
-    return None
-
-
-def check_api_error_rate_alert() -> Optional[Dict]:
-    """API 에러율 Alert 체크"""
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 최근 1시간 API 에러율
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as errors
-            FROM api_usage_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 1 HOUR)
-        """)
-        result = cursor.fetchone()
-
-        cursor.close()
-        conn.close()
-
-        if result and result['total'] and result['total'] > 0:
-            total = result['total']
-            errors = result['errors'] or 0
-            error_rate = (errors / total) * 100
-
-            api_error_warning = get_threshold('system', 'api_error_rate', 'warning')
-            api_error_critical = get_threshold('system', 'api_error_rate', 'critical')
-
-            if error_rate > api_error_critical:
-                return {
-                    'severity': 'critical',
-                    'type': 'api_error_rate',
-                    'value': error_rate,
-                    'threshold': api_error_critical
-                }
-            elif error_rate > api_error_warning:
-                return {
-                    'severity': 'warning',
-                    'type': 'api_error_rate',
-                    'value': error_rate,
-                    'threshold': api_error_warning
-                }
-
-    except Exception as e:
-        print(f"[Alerts API] API error rate check error: {e}")
-
-    return None
 
+def get_all_alerts() -> List[Dict]:
+    """모든 Alert 체크 및 수집 (Critical 먼저 정렬)"""
+    return run_dashboard_checks()['alerts']
 
-def format_alert_message(alert: Dict) -> Dict:
-    """Alert 데이터를 UI용 메시지로 변환"""
-    type_messages = {
-        'cpu_usage': {
-            'title': f"CPU 사용률 {'위험' if alert['severity'] == 'critical' else '주의'}: {alert['value']:.1f}%",
-            'description': f"현재 CPU 사용률이 {alert['value']:.1f}%입니다. 시스템 성능 저하 위험.",
-            'action': "Backend 재시작 또는 프로세스 확인이 필요합니다."
-        },
-        'ram_usage': {
-            'title': f"RAM 사용률 {'위험' if alert['severity'] == 'critical' else '주의'}: {alert['value']:.1f}%",
-            'description': f"현재 RAM 사용률이 {alert['value']:.1f}%입니다. 메모리 부족 위험.",
-            'action': "메모리 누수 확인 또는 서버 재시작이 필요합니다."
-        },
-        'disk_usage': {
-            'title': f"디스크 공간 {'부족' if alert['severity'] == 'critical' else '주의'}: {alert['value']:.1f}%",
-            'description': f"현재 디스크 사용률이 {alert['value']:.1f}%입니다.",
-            'action': "로그 파일 정리 또는 디스크 확장이 필요합니다."
-        },
-        'inactive_academy': {
-            'title': f"무활동 학원 감지: {int(alert['value'])}개",
-            'description': f"{int(alert['threshold'])}일 이상 활동이 없는 학원이 {int(alert['value'])}개 있습니다.",
-            'action': "고객 이탈 방지를 위한 연락이 필요합니다."
-        },
-        'api_error_rate': {
-            'title': f"API 에러율 {'위험' if alert['severity'] == 'critical' else '주의'}: {alert['value']:.1f}%",
-            'description': f"최근 1시간 API 에러율이 {alert['value']:.1f}%입니다.",
-            'action': "API 서버 상태 확인 및 에러 로그 분석이 필요합니다."
-        },
-    }
 
-    msg = type_messages.get(alert['type'], {
-        'title': f"알 수 없는 Alert: {alert['type']}",
-        'description': f"값: {alert['value']}",
-        'action': '확인이 필요합니다.'
+def alerts_version(result: Dict[str, Any]) -> str:
+    """Alert 상태 버전 (요청마다 바뀌는 created_at / duration_ms 제외)"""
+    return payload_version({
+        'alerts': [{k: v for k, v in alert.items() if k != 'created_at'} for alert in result['alerts']],
+        'checks': [(check['name'], check['status']) for check in result['checks']],
     })
 
+
+def compute_alerts_entry() -> Dict[str, Any]:
+    """체크 실행 → 캐시 값 (응답 payload, ETag 버전, 모든 체크 완료 여부)"""
+    result = run_dashboard_checks()
     return {
-        'id': f"{alert['type']}_{alert['value']:.1f}".replace('.', '_'),
-        'severity': alert['severity'],
-        'type': alert['type'],
-        'title': msg['title'],
-        'description': msg['description'],
-        'action': msg['action'],
-        'value': alert['value'],
-        'threshold': alert['threshold'],
-        'created_at': datetime.now().isoformat()
+        'payload': {
+            'alerts': result['alerts'],
+            'total_count': len(result['alerts']),
+            'checks': result['checks'],
+            'duration_ms': result['duration_ms']
+        },
+        'version': alerts_version(result),
+        'complete': all(check['status'] in ('ok', 'alert') for check in result['checks']),
     }
 
 
-def get_all_alerts() -> List[Dict]:
-    """모든 Alert 체크 및 수집"""
-    alerts = []
-
-    # 각 Alert 체크 함수 실행
-    checks = [
-        check_cpu_alert,
-        check_ram_alert,
-        check_disk_alert,
-        check_inactive_academy_alert,
-        check_api_error_rate_alert,
-    ]
-
-    for check_fn in checks:
-        try:
-            alert = check_fn()
-            if alert:
-                formatted = format_alert_message(alert)
-                alerts.append(formatted)
-        except Exception as e:
-            print(f"[Alerts API] Check function error: {e}")
-
-    # Critical Alert를 먼저 정렬
-    alerts.sort(key=lambda x: (0 if x['severity'] == 'critical' else 1, x['type']))
-
-    return alerts
-
-
 @alerts_bp.route('/api/admin/dashboard/alerts', methods=['GET'])
 def get_alerts():
     """
@@ -348,16 +96,27 @@ def get_alerts():
     Returns:
         JSON: {
             "alerts": [...],
-            "total_count": int
+            "total_count": int,
+            "checks": [{"name": str, "status": "ok|alert|unknown|error", "duration_ms": float}],
+            "duration_ms": float
         }
     """
     try:
-        alerts = get_all_alerts()
+        if request.args.get('refresh') in ('1', 'true'):
+            alerts_cache.invalidate(ALERTS_CACHE_KEY)
 
-        return jsonify({
-            'alerts': alerts,
-            'total_count': len(alerts)
-        })
+        ttl = get_cache_ttl(ALERTS_CACHE_KEY)
+        entry = alerts_cache.get_or_compute_entry(ALERTS_CACHE_KEY, compute_alerts_entry, ttl=ttl)
+        value = entry['value']
+
+        if value['complete']:
+            max_age = remaining_ttl(entry, ttl)
+        else:
+            # 시간 초과 / 실패한 체크가 있으면 다음 폴링에서 바로 다시 실행
+            alerts_cache.invalidate(ALERTS_CACHE_KEY)
+            max_age = 0
+
+        return conditional_json(value['payload'], value['version'], max_age=max_age)
 
     except Exception as e:
         print(f"[Alerts API] Error: {e}")
@@ -0,0 +1,200 @@
+"""
+Export API 엔드포인트
+
+대시보드 학원 목록과 활동 로그 원본을 CSV / NDJSON으로 스트리밍합니다.
+결과를 모아 JSON으로 만드는 목록 API와 달리, 전용 연결의 unbuffered 커서에서
+읽는 만큼 바로 chunked transfer로 내보내므로 행 수와 무관하게 메모리가 일정합니다.
+(utils/export_stream.py)
+
+API:
+    GET /api/admin/exports/at-risk - 이탈 위험 학원
+    GET /api/admin/exports/active - 활성 학원 상세
+    GET /api/admin/exports/heavy-users - 헤비유저 학원
+    GET /api/admin/exports/onboarding - 온보딩 퍼널 (최근 30일 신규 학원)
+    GET /api/admin/exports/activity-logs - 활동 로그 원본 (기간 필수)
+
+공통 Query:
+    format: csv(기본) / ndjson
+    목록 export는 같은 이름의 목록 API 필터를 그대로 받습니다 (limit / cursor 없음, 전체 행).
+
+환경변수:
+    EXPORT_MAX_CONCURRENT: 동시에 실행할 수 있는 export 수 (기본 2, 초과 시 429)
+    EXPORT_MAX_DAYS: activity-logs 최대 기간 (일, 기본 93)
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta
+from flask import Blueprint, Response, jsonify, request
+
+import sys
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from routes.admin.tables import (
+    ACTIVE_ROWS, ACTIVE_WINDOWS,
+    FUNNEL_ROWS, FUNNEL_WINDOWS, HEAVY_USER_ROWS, HEAVY_USER_WINDOWS,
+    active_filters, annotate_active_row, annotate_funnel_row,
+    at_risk_filters, at_risk_rows, funnel_filters, heavy_user_filters,
+)
+from utils.db_pool import db_cursor
+from utils.export_stream import EXPORT_FORMATS, ExportError, check_format, stream_query
+from utils.pagination import PaginationError, order_clause
+from utils.time_windows import get_time_windows
+
+
+exports_bp = Blueprint('exports', __name__)
+
+EXPORT_MAX_CONCURRENT = int(os.getenv('EXPORT_MAX_CONCURRENT', '2'))
+EXPORT_MAX_DAYS = int(os.getenv('EXPORT_MAX_DAYS', '93'))
+
+_export_slots = threading.BoundedSemaphore(EXPORT_MAX_CONCURRENT)
+
+# export 이름 → (목록 쿼리, 기간 경계, 필터 함수, 정렬 키, 파생 컬럼)
+# 정렬은 목록 API와 같은 순서 (routes/admin/tables.py)
+# 목록 쿼리가 함수면 요청마다 (쿼리, 기간 경계)를 고름 (기간 경계 자리는 None)
+TABLE_EXPORTS = {
+    'at-risk': (at_risk_rows, None, at_risk_filters, 't.inactive_days', None),
+    'active': (ACTIVE_ROWS, ACTIVE_WINDOWS, active_filters, 't.monthly_reports', annotate_active_row),
+    'heavy-users': (HEAVY_USER_ROWS, HEAVY_USER_WINDOWS, heavy_user_filters, 't.monthly_reports', None),
+    'onboarding': (FUNNEL_ROWS, FUNNEL_WINDOWS, funnel_filters, 't.signup_date', annotate_funnel_row),
+}
+
+# created_at 범위 + 인덱스 순서 (idx_created_cover / idx_academy_created) 로 읽어 정렬 비용 없음
+ACTIVITY_LOG_ROWS = """
+    SELECT id, academy_id, user_id, action_type, action_detail, ip_address, user_agent, created_at
+    FROM activity_logs
+    WHERE created_at >= %s
+    AND created_at < %s
+"""
+
+
+def _parse_date(name: str, default=None):
+    """'YYYY-MM-DD' 인자 → datetime (0시)"""
+    value = request.args.get(name)
+    if value is None or value == '':
+        if default is None:
+            raise ExportError(f"{name} is required (YYYY-MM-DD)")
+        return default
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ExportError(f"invalid {name}: {value} (expected YYYY-MM-DD)")
+
+
+def _stream_response(name: str, fmt: str, sql: str, params: list, transform=None):
+    """
+    export 응답 (동시 실행 수 제한)
+
+    슬롯은 응답이 닫힐 때(전송 완료 또는 클라이언트 중단) 반납합니다.
+    """
+    if not _export_slots.acquire(blocking=False):
+        return jsonify({'error': f'too many concurrent exports (max {EXPORT_MAX_CONCURRENT})'}), 429
+
+    def generate():
+        try:
+            yield from stream_query(sql, params, fmt, transform=transform)
+        except Exception as e:
+            # 헤더는 이미 전송되었으므로 연결을 끊어 클라이언트가 불완전한 파일임을 알게 함
+            print(f"[Exports API] {name} export aborted: {e}")
+            raise
+
+    filename = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+    response = Response(generate(), content_type=EXPORT_FORMATS[fmt], headers={
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Cache-Control': 'no-store',
+        'X-Accel-Buffering': 'no',  # nginx가 응답을 모으지 않고 바로 전달
+    })
+    response.call_on_close(_export_slots.release)
+    return response
+
+
+# =============================================================================
+# 학원 목록 export
+# =============================================================================
+@exports_bp.route('/api/admin/exports/<name>', methods=['GET'])
+def export_table(name):
+    """
+    학원 목록 export (목록 API와 같은 필터 / 정렬, 전체 행)
+
+    Query:
+        format: csv / ndjson
+        (목록 API 필터: risk_level, min_inactive_days, recommended_plan, min_reports, status)
+    """
+    if name not in TABLE_EXPORTS:
+        return jsonify({'error': f"unknown export: {name} (allowed: {', '.join(TABLE_EXPORTS)}, activity-logs)"}), 404
+
+    try:
+        fmt = check_format(request.args.get('format'))
+        rows_sql, window_names, filters, key_column, transform = TABLE_EXPORTS[name]
+        conditions, params = filters()
+        windows = get_time_windows()
+        if callable(rows_sql):
+            with db_cursor() as cursor:
+                rows_sql, window_names = rows_sql(cursor, windows)
+        sql = f"""
+            SELECT * FROM ({rows_sql}) t
+            WHERE {' AND '.join(conditions) or '1 = 1'}
+            ORDER BY {order_clause(key_column, descending=True)}
+        """
+        return _stream_response(name, fmt, sql, windows.values(*window_names) + params, transform)
+
+    except (ExportError, PaginationError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        print(f"[Exports API] {name} export error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+# =============================================================================
+# 활동 로그 export
+# =============================================================================
+@exports_bp.route('/api/admin/exports/activity-logs', methods=['GET'])
+def export_activity_logs():
+    """
+    활동 로그 원본 export (created_at 순)
+
+    Query:
+        start: 시작일 (YYYY-MM-DD, 필수)
+        end: 마지막 날 (YYYY-MM-DD, 포함, 기본 오늘)
+        academy_id: 학원 id
+        action_type: 액션 타입
+        format: csv / ndjson
+    """
+    try:
+        fmt = check_format(request.args.get('format'))
+        start = _parse_date('start')
+        end = _parse_date('end', default=get_time_windows().today) + timedelta(days=1)
+        if end <= start:
+            raise ExportError("end must not be before start")
+        if (end - start).days > EXPORT_MAX_DAYS:
+            raise ExportError(f"date range too long: {(end - start).days} days (max {EXPORT_MAX_DAYS})")
+
+        conditions, params = [], [start, end]
+        academy_id = request.args.get('academy_id')
+        if academy_id:
+            if not academy_id.isdigit():
+                raise ExportError(f"invalid academy_id: {academy_id}")
+            conditions.append("AND academy_id = %s")
+            params.append(int(academy_id))
+        action_type = request.args.get('action_type')
+        if action_type:
+            conditions.append("AND action_type = %s")
+            params.append(action_type)
+
+        sql = f"{ACTIVITY_LOG_ROWS} {' '.join(conditions)} ORDER BY created_at"
+        return _stream_response('activity-logs', fmt, sql, params)
+
+    except ExportError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        print(f"[Exports API] activity-logs export error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+# Blueprint 등록용 함수
+def register_exports_routes(app):
+    """Flask 앱에 exports Blueprint 등록"""
+    app.register_blueprint(exports_bp)
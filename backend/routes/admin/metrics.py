@@ -16,784 +16,1028 @@ API:
     GET /api/admin/metrics/cost-breakdown - 비용 현황
     GET /api/admin/metrics/system-health - 시스템 건강
     GET /api/admin/metrics/api-status - API 상태
+    GET /api/admin/metrics/snapshot - 12개 지표 일괄 조회 (카드별 키)
+    GET /api/admin/metrics/cohorts - 가입 코호트 리텐션 행렬 (주/월)
+    GET /api/admin/metrics/db-pool - DB 커넥션 풀 통계
+    GET /api/admin/metrics/cache-stats - 결과 캐시 hit/miss 통계
+
+구조:
+    각 카드는 공유 스캔(_scan_*)의 결과로 만들어집니다. 스캔은 테이블 하나를
+    한 번 훑어 여러 카드가 필요로 하는 집계를 함께 계산하며, MetricScans가
+    요청 단위로 결과를 재사용합니다. 개별 카드 엔드포인트와 snapshot은 같은
+    빌더를 사용하므로 응답 형태가 동일합니다.
+
+롤업:
+    activity/reports/heavy_users/funnel 스캔은 일별 롤업 테이블
+    (utils/metrics_rollup.py)이 신선하면 롤업 + 워터마크 이후 원본(tail)을
+    읽고, 그렇지 않으면 원본 테이블을 스캔합니다. inactivity 스캔은 학원별
+    마지막 활동 시각을 academy_stats(utils/academy_stats.py)에서 읽습니다.
+    DAU/7일/MAU는 일별 활성 학원 비트맵(utils/activity_bitmaps.py)이 기간을
+    덮으면 비트맵 OR/popcount로, 그렇지 않으면 activity 스캔으로 계산합니다.
+
+캐시:
+    카드 결과는 config/cache_settings.py의 카드별 TTL 동안 캐시됩니다.
+    동시 miss는 한 번만 계산되고, TTL이 지난 값은 stale 허용 시간 동안
+    즉시 응답한 뒤 백그라운드에서 갱신합니다. ?refresh=1 로 캐시 무시.
+
+조건부 요청:
+    카드 / 스냅샷 / 코호트 응답은 캐시 항목 버전을 ETag로, 남은 TTL을
+    Cache-Control max-age로 보냅니다. If-None-Match가 같으면 직렬화 없이 304를
+    반환하고, 큰 응답은 gzip으로 압축합니다. (utils/http_cache.py)
 """
 
 import os
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Dict, Any
-from flask import Blueprint, jsonify
+from typing import Dict, Any, Callable, Optional
+from flask import Blueprint, jsonify, request
 
 import sys
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PROJECT_ROOT)
 
+from utils.activity_bitmaps import load_daily_bitmaps
+from utils.cohort_retention import CohortError, get_retention_matrix, resolve_periods
+from utils.db_pool import db_cursor, get_pool_stats
+from utils.http_cache import combine_versions, conditional_json
+from utils.metrics_rollup import get_fresh_watermarks
+from utils.process_lifecycle import get_restart_stats, uptime_hours
+from utils.resource_window import get_resource_window
+from utils.result_cache import create_result_cache, remaining_ttl
+from utils.time_windows import TimeWindows, get_time_windows
+from config.cache_settings import get_cache_ttl, get_stale_ttl
+
 
 metrics_bp = Blueprint('metrics', __name__)
 
+# 카드 결과 캐시 (METRICS_CACHE_BACKEND=redis 면 워커 간 공유)
+metrics_cache = create_result_cache('metrics')
 
-def get_db_connection():
-    """데이터베이스 연결"""
-    try:
-        import mysql.connector
-        return mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', ''),
-            database=os.getenv('DB_NAME', 'tutornote')
-        )
-    except Exception as e:
-        print(f"[Metrics API] DB connection failed: {e}")
-        return None
+
+def _trend(growth_rate: float) -> str:
+    return 'up' if growth_rate > 0 else ('down' if growth_rate < 0 else 'stable')
 
 
 # =============================================================================
-# Card 1-1: 학원 현황
+# 공유 스캔 (테이블별 1회 집계)
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/academy-status', methods=['GET'])
-def get_academy_status():
-    """학원 현황 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 전체 학원 수
-        cursor.execute("""
-            SELECT COUNT(*) as total
-            FROM academies
-            WHERE is_deleted = 0
-        """)
-        total = cursor.fetchone()['total']
-
-        # 활성 학원 (최근 7일 내 활동)
-        cursor.execute("""
-            SELECT COUNT(DISTINCT academy_id) as active
-            FROM activity_logs
-            WHERE created_at >= NOW() - INTERVAL 7 DAY
-        """)
-        active = cursor.fetchone()['active']
-
-        # 신규 학원 (30일)
-        cursor.execute("""
-            SELECT COUNT(*) as new_signups
-            FROM academies
-            WHERE created_at >= NOW() - INTERVAL 30 DAY
-            AND is_deleted = 0
-        """)
-        new_signups = cursor.fetchone()['new_signups']
-
-        # 이탈 학원 (30일 이상 무활동)
-        cursor.execute("""
-            SELECT COUNT(*) as churned
-            FROM academies a
-            WHERE a.is_deleted = 0
-            AND NOT EXISTS (
-                SELECT 1 FROM activity_logs al
-                WHERE al.academy_id = a.id
-                AND al.created_at >= NOW() - INTERVAL 30 DAY
-            )
-        """)
-        churned = cursor.fetchone()['churned']
-
-        # 성장률 (전월 대비)
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN created_at >= DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as current_month,
-                COUNT(CASE WHEN created_at >= DATE_FORMAT(NOW() - INTERVAL 1 MONTH, '%Y-%m-01')
-                           AND created_at < DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as last_month
-            FROM academies
-            WHERE is_deleted = 0
-        """)
-        growth = cursor.fetchone()
-        current_month = growth['current_month'] or 0
-        last_month = growth['last_month'] or 0
-        growth_rate = ((current_month - last_month) / last_month * 100) if last_month > 0 else 0
-
-        cursor.close()
-        conn.close()
-
-        trend = 'up' if growth_rate > 0 else ('down' if growth_rate < 0 else 'stable')
-
-        return jsonify({
-            'total': total,
-            'active': active,
-            'new_signups': new_signups,
-            'churned': churned,
-            'growth_rate': round(growth_rate, 1),
-            'trend': trend
-        })
+def _scan_academies(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """academies: 전체/신규(30일)/이번 달/전월 가입 수 (전체 수가 필요해 is_deleted 커버링 인덱스 전체)"""
+    cursor.execute("""
+        SELECT
+            COUNT(*) as total,
+            COUNT(CASE WHEN created_at >= %(days_30_ago)s THEN 1 END) as new_signups,
+            COUNT(CASE WHEN created_at >= %(month_start)s THEN 1 END) as current_month,
+            COUNT(CASE WHEN created_at >= %(prev_month_start)s
+                       AND created_at < %(month_start)s THEN 1 END) as last_month
+        FROM academies
+        WHERE is_deleted = 0
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_students(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """students: 전체/이번 달/전월/학원 수/보호자 동의 수"""
+    cursor.execute("""
+        SELECT
+            COUNT(*) as total,
+            COUNT(CASE WHEN created_at >= %(month_start)s THEN 1 END) as this_month,
+            COUNT(CASE WHEN created_at >= %(prev_month_start)s
+                       AND created_at < %(month_start)s THEN 1 END) as last_month,
+            COUNT(DISTINCT academy_id) as academy_count,
+            COUNT(CASE WHEN consent_status = 'approved' THEN 1 END) as consent_approved
+        FROM students
+        WHERE is_deleted = 0
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_activity(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """activity_logs: 7일 활성/DAU/MAU/이번 달 공유 수 (필요 구간만 스캔, 기간은 모두 달력 기준)"""
+    cursor.execute("""
+        SELECT
+            COUNT(DISTINCT CASE WHEN created_at >= %(week_start)s THEN academy_id END) as active_7d,
+            COUNT(DISTINCT CASE WHEN created_at >= %(today)s THEN academy_id END) as dau,
+            COUNT(DISTINCT CASE WHEN created_at >= %(month_start)s THEN academy_id END) as mau,
+            COUNT(CASE WHEN action_type = 'share_kakaotalk'
+                       AND created_at >= %(month_start)s THEN 1 END) as shares_month
+        FROM activity_logs
+        WHERE created_at >= %(recent_start)s
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_active_academies(cursor, windows: TimeWindows) -> Optional[Dict[str, Any]]:
+    """daily_active_academies: DAU/7일(WAU)/MAU (비트맵 OR + popcount, 기간이 덮이지 않으면 None)"""
+    params = windows.params()
+    today = params['today_date']
+    bitmaps = load_daily_bitmaps(cursor, params['recent_start_date'], today)
+    if bitmaps is None:
+        return None
 
-    except Exception as e:
-        print(f"[Metrics API] Academy status error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return {
+        'dau': bitmaps.count(today),
+        'active_7d': bitmaps.count(params['week_start_date'], today),
+        'mau': bitmaps.count(params['month_start_date'], today),
+    }
+
+
+def _scan_inactivity(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """academies × academy_stats: 30일/7일 무활동 학원 수 (학원당 1행 조인)"""
+    cursor.execute("""
+        SELECT
+            COUNT(CASE WHEN st.last_activity_at IS NULL
+                       OR st.last_activity_at < %(days_30_ago)s THEN 1 END) as churned,
+            COUNT(CASE WHEN st.last_activity_at IS NULL
+                       OR st.last_activity_at < %(week_ago)s THEN 1 END) as at_risk
+        FROM academies a
+        LEFT JOIN academy_stats st ON st.academy_id = a.id
+        WHERE a.is_deleted = 0
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_reports(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """
+    progress_records (이번 달 + 전월): 리포트/카드뉴스/AI 리포트 집계
+
+    이번 달 카드뉴스 / AI 리포트 수는 개별 카드 쿼리(JOIN students)와 같게
+    학생 행이 있는 리포트만 셉니다 (s.id IS NOT NULL). 나머지 수는 students와 무관.
+    """
+    cursor.execute("""
+        SELECT
+            COUNT(CASE WHEN pr.created_at >= %(month_start)s THEN 1 END) as this_month,
+            COUNT(CASE WHEN pr.created_at < %(month_start)s THEN 1 END) as last_month,
+            COUNT(DISTINCT CASE WHEN pr.created_at >= %(month_start)s
+                                THEN pr.student_id END) as students_this_month,
+            COUNT(CASE WHEN pr.card_news_generated = 1 AND s.id IS NOT NULL
+                       AND pr.created_at >= %(month_start)s THEN 1 END) as card_news_this_month,
+            COUNT(CASE WHEN pr.card_news_generated = 1
+                       AND pr.created_at < %(month_start)s THEN 1 END) as card_news_last_month,
+            COUNT(DISTINCT CASE WHEN pr.card_news_generated = 1
+                                AND pr.created_at >= %(month_start)s
+                                THEN s.academy_id END) as card_news_academies,
+            COUNT(CASE WHEN pr.ai_generated = 1 AND s.id IS NOT NULL
+                       AND pr.created_at >= %(month_start)s THEN 1 END) as ai_reports,
+            COUNT(DISTINCT CASE WHEN pr.ai_generated = 1
+                                AND pr.created_at >= %(month_start)s
+                                THEN s.academy_id END) as ai_academies
+        FROM progress_records pr
+        LEFT JOIN students s ON pr.student_id = s.id
+        WHERE pr.is_deleted = 0
+        AND pr.created_at >= %(prev_month_start)s
+        AND pr.created_at < %(next_month_start)s
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_heavy_users(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """이번 달 리포트 20건 이상 학원 수"""
+    cursor.execute("""
+        SELECT COUNT(*) as heavy_users
+        FROM (
+            SELECT s.academy_id
+            FROM progress_records pr
+            JOIN students s ON pr.student_id = s.id
+            WHERE pr.is_deleted = 0
+            AND pr.created_at >= %(month_start)s
+            AND pr.created_at < %(next_month_start)s
+            GROUP BY s.academy_id
+            HAVING COUNT(*) >= 20
+        ) heavy
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_parent_views(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """report_views: 이번 달 학부모 열람 수"""
+    cursor.execute("""
+        SELECT COUNT(*) as views
+        FROM report_views
+        WHERE viewer_type = 'parent'
+        AND created_at >= %(month_start)s
+        AND created_at < %(next_month_start)s
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_funnel(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """
+    최근 30일 신규 학원 전환 퍼널
+
+    가입 30일 이내 학원의 공유는 모두 최근 30일 안에 있으므로 activity_logs는
+    그 구간의 파티션만 읽음
+    """
+    cursor.execute("""
+        SELECT
+            COUNT(DISTINCT a.id) as total_signups,
+            COUNT(DISTINCT CASE WHEN s.id IS NOT NULL THEN a.id END) as has_students,
+            COUNT(DISTINCT CASE WHEN pr.id IS NOT NULL THEN a.id END) as created_report,
+            COUNT(DISTINCT CASE WHEN al.action_type = 'share_kakaotalk' THEN a.id END) as shared_kakaotalk
+        FROM academies a
+        LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
+        LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
+        LEFT JOIN activity_logs al ON a.id = al.academy_id AND al.action_type = 'share_kakaotalk'
+            AND al.created_at >= %(days_30_ago)s
+        WHERE a.created_at >= %(days_30_ago)s
+        AND a.is_deleted = 0
+    """, windows.params())
+    return cursor.fetchone()
+
+
+def _scan_costs(cursor, windows: TimeWindows) -> Dict[str, float]:
+    """operational_costs: 이번 달 항목별 비용"""
+    cursor.execute("""
+        SELECT
+            cost_type,
+            SUM(amount) as cost
+        FROM operational_costs
+        WHERE billing_month = %(month_start_date)s
+        GROUP BY cost_type
+    """, windows.params())
+    return {row['cost_type']: float(row['cost']) for row in cursor.fetchall()}
+
+
+def _scan_resources(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """system_health_aggregates: 최근 5분 리소스 사용량 (Alert 체크와 공유하는 윈도우 캐시)"""
+    return get_resource_window(cursor)
+
+
+def _scan_restarts(cursor, windows: TimeWindows) -> Dict[str, Any]:
+    """process_lifecycle_events: Backend 재시작 이벤트 수 (일주일간) + 마지막 시작 시각"""
+    return get_restart_stats(cursor, hours=24 * 7)
+
+
+def _scan_api_health(cursor, windows: TimeWindows) -> list:
+    """api_health_checks: API별 최근 1시간 상태"""
+    cursor.execute("""
+        SELECT
+            api_name,
+            AVG(response_time_ms) as avg_response_time,
+            COUNT(CASE WHEN status = 'success' THEN 1 END) as success_count,
+            COUNT(*) as total_count
+        FROM api_health_checks
+        WHERE created_at >= %(hour_ago)s
+        GROUP BY api_name
+    """, windows.params())
+    return cursor.fetchall()
 
 
 # =============================================================================
-# Card 1-2: 학생 현황
+# 롤업 기반 스캔 (롤업 + 워터마크 이후 원본 tail, 결과 형태는 원본 스캔과 동일)
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/student-stats', methods=['GET'])
-def get_student_stats():
-    """학생 현황 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _rollup_params(windows: TimeWindows, watermarks: Dict[str, int]) -> Dict[str, Any]:
+    """기간 경계 + 원본별 워터마크 (%(activity_logs)s, %(progress_records)s)"""
+    return dict(windows.params(), **watermarks)
+
+
+def _scan_activity_rollup(cursor, watermarks: Dict[str, int], windows: TimeWindows) -> Dict[str, Any]:
+    """daily_academy_activity + activity_logs tail: 7일 활성/DAU/MAU/이번 달 공유 수"""
+    cursor.execute("""
+        SELECT
+            COUNT(DISTINCT CASE WHEN t.day >= %(week_start_date)s THEN t.academy_id END) as active_7d,
+            COUNT(DISTINCT CASE WHEN t.day >= %(today_date)s THEN t.academy_id END) as dau,
+            COUNT(DISTINCT CASE WHEN t.day >= %(month_start_date)s THEN t.academy_id END) as mau,
+            COALESCE(SUM(CASE WHEN t.day >= %(month_start_date)s THEN t.shares END), 0) as shares_month
+        FROM (
+            SELECT activity_date as day, academy_id, share_count as shares
+            FROM daily_academy_activity
+            WHERE activity_date >= %(recent_start_date)s
+            UNION ALL
+            SELECT DATE(created_at), academy_id, action_type = 'share_kakaotalk'
+            FROM activity_logs
+            WHERE id > %(activity_logs)s
+            AND created_at >= %(recent_start)s
+        ) t
+    """, _rollup_params(windows, watermarks))
+    return cursor.fetchone()
+
+
+_REPORT_ROLLUP_ROWS = """
+    SELECT report_date as day, student_id, academy_id,
+           report_count as reports, card_news_count as card_news, ai_report_count as ai_reports
+    FROM daily_report_counts
+    WHERE report_date >= %(prev_month_start_date)s
+    AND report_date < %(next_month_start_date)s
+    UNION ALL
+    SELECT DATE(pr.created_at), pr.student_id, s.academy_id,
+           1, pr.card_news_generated = 1, pr.ai_generated = 1
+    FROM progress_records pr
+    LEFT JOIN students s ON pr.student_id = s.id
+    WHERE pr.id > %(progress_records)s
+    AND pr.created_at >= %(prev_month_start)s
+    AND pr.created_at < %(next_month_start)s
+    AND pr.is_deleted = 0
+"""
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 총 학생 수
-        cursor.execute("""
-            SELECT COUNT(*) as total
-            FROM students
-            WHERE is_deleted = 0
-        """)
-        total = cursor.fetchone()['total']
-
-        # 이번 달 / 전월 신규 학생
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN created_at >= DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as this_month,
-                COUNT(CASE WHEN created_at >= DATE_FORMAT(NOW() - INTERVAL 1 MONTH, '%Y-%m-01')
-                           AND created_at < DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as last_month
-            FROM students
-            WHERE is_deleted = 0
-        """)
-        monthly = cursor.fetchone()
-        this_month = monthly['this_month'] or 0
-        last_month = monthly['last_month'] or 0
-        monthly_growth = this_month - last_month
-        growth_rate = ((this_month - last_month) / last_month * 100) if last_month > 0 else 0
-
-        # 학원당 평균 학생 수
-        cursor.execute("""
-            SELECT
-                COUNT(*) as student_count,
-                COUNT(DISTINCT academy_id) as academy_count
-            FROM students
-            WHERE is_deleted = 0
-        """)
-        avg_data = cursor.fetchone()
-        student_count = avg_data['student_count'] or 0
-        academy_count = avg_data['academy_count'] or 1
-        avg_per_academy = round(student_count / academy_count, 1)
-
-        cursor.close()
-        conn.close()
-
-        trend = 'up' if growth_rate > 0 else ('down' if growth_rate < 0 else 'stable')
-
-        return jsonify({
-            'total': total,
-            'this_month': this_month,
-            'last_month': last_month,
-            'monthly_growth': monthly_growth,
-            'growth_rate': round(growth_rate, 1),
-            'avg_per_academy': avg_per_academy,
-            'trend': trend
-        })
 
-    except Exception as e:
-        print(f"[Metrics API] Student stats error: {e}")
-        return jsonify({'error': str(e)}), 500
+def _scan_reports_rollup(cursor, watermarks: Dict[str, int], windows: TimeWindows) -> Dict[str, Any]:
+    """
+    daily_report_counts + progress_records tail (이번 달 + 전월)
+
+    _scan_reports와 같게 이번 달 카드뉴스 / AI 리포트 수는 학생 행이 있는 리포트만
+    (academy_id IS NOT NULL - 롤업과 tail 모두 students LEFT JOIN의 academy_id)
+    """
+    cursor.execute(f"""
+        SELECT
+            COALESCE(SUM(CASE WHEN t.day >= %(month_start_date)s THEN t.reports END), 0) as this_month,
+            COALESCE(SUM(CASE WHEN t.day < %(month_start_date)s THEN t.reports END), 0) as last_month,
+            COUNT(DISTINCT CASE WHEN t.day >= %(month_start_date)s
+                                THEN t.student_id END) as students_this_month,
+            COALESCE(SUM(CASE WHEN t.day >= %(month_start_date)s AND t.academy_id IS NOT NULL
+                              THEN t.card_news END), 0) as card_news_this_month,
+            COALESCE(SUM(CASE WHEN t.day < %(month_start_date)s THEN t.card_news END), 0) as card_news_last_month,
+            COUNT(DISTINCT CASE WHEN t.card_news > 0 AND t.day >= %(month_start_date)s
+                                THEN t.academy_id END) as card_news_academies,
+            COALESCE(SUM(CASE WHEN t.day >= %(month_start_date)s AND t.academy_id IS NOT NULL
+                              THEN t.ai_reports END), 0) as ai_reports,
+            COUNT(DISTINCT CASE WHEN t.ai_reports > 0 AND t.day >= %(month_start_date)s
+                                THEN t.academy_id END) as ai_academies
+        FROM ({_REPORT_ROLLUP_ROWS}) t
+    """, _rollup_params(windows, watermarks))
+    return cursor.fetchone()
+
+
+def _scan_heavy_users_rollup(cursor, watermarks: Dict[str, int], windows: TimeWindows) -> Dict[str, Any]:
+    """롤업 기준 이번 달 리포트 20건 이상 학원 수"""
+    cursor.execute(f"""
+        SELECT COUNT(*) as heavy_users
+        FROM (
+            SELECT t.academy_id
+            FROM ({_REPORT_ROLLUP_ROWS}) t
+            WHERE t.day >= %(month_start_date)s
+            AND t.academy_id IS NOT NULL
+            GROUP BY t.academy_id
+            HAVING SUM(t.reports) >= 20
+        ) heavy
+    """, _rollup_params(windows, watermarks))
+    return cursor.fetchone()
+
+
+def _scan_funnel_rollup(cursor, watermarks: Dict[str, int], windows: TimeWindows) -> Dict[str, Any]:
+    """
+    최근 30일 신규 학원 전환 퍼널 (리포트/공유 단계는 롤업 + tail, tail도 최근 30일 파티션만)
+
+    필터는 _scan_funnel과 같음: 삭제되지 않은 학원, 리포트는 삭제되지 않은 학생의
+    삭제되지 않은 리포트만. daily_report_counts는 학생 삭제 여부를 모르므로 students와 조인.
+    """
+    cursor.execute("""
+        SELECT
+            COUNT(*) as total_signups,
+            COUNT(CASE WHEN EXISTS (
+                SELECT 1 FROM students s WHERE s.academy_id = a.id AND s.is_deleted = 0
+            ) THEN 1 END) as has_students,
+            COUNT(CASE WHEN a.id IN (
+                SELECT s.academy_id FROM daily_report_counts d
+                JOIN students s ON d.student_id = s.id AND s.is_deleted = 0
+                WHERE d.report_date >= %(days_31_start_date)s
+                UNION
+                SELECT s.academy_id FROM progress_records pr
+                JOIN students s ON pr.student_id = s.id AND s.is_deleted = 0
+                WHERE pr.id > %(progress_records)s AND pr.is_deleted = 0
+            ) THEN 1 END) as created_report,
+            COUNT(CASE WHEN a.id IN (
+                SELECT academy_id FROM daily_academy_activity
+                WHERE activity_date >= %(days_31_start_date)s
+                AND share_count > 0
+                UNION
+                SELECT academy_id FROM activity_logs
+                WHERE id > %(activity_logs)s AND action_type = 'share_kakaotalk'
+                AND created_at >= %(days_30_ago)s
+            ) THEN 1 END) as shared_kakaotalk
+        FROM academies a
+        WHERE a.created_at >= %(days_30_ago)s
+        AND a.is_deleted = 0
+    """, _rollup_params(windows, watermarks))
+    return cursor.fetchone()
+
+
+# 롤업으로 대체 가능한 스캔: 이름 → (필요한 원본 테이블, 롤업 스캔)
+ROLLUP_SCANS: Dict[str, tuple] = {
+    'activity': (('activity_logs',), _scan_activity_rollup),
+    'reports': (('progress_records',), _scan_reports_rollup),
+    'heavy_users': (('progress_records',), _scan_heavy_users_rollup),
+    'funnel': (('activity_logs', 'progress_records'), _scan_funnel_rollup),
+}
+
+
+SCANS: Dict[str, Callable] = {
+    'academies': _scan_academies,
+    'students': _scan_students,
+    'activity': _scan_activity,
+    'active_academies': _scan_active_academies,
+    'inactivity': _scan_inactivity,
+    'reports': _scan_reports,
+    'heavy_users': _scan_heavy_users,
+    'parent_views': _scan_parent_views,
+    'funnel': _scan_funnel,
+    'costs': _scan_costs,
+    'resources': _scan_resources,
+    'restarts': _scan_restarts,
+    'api_health': _scan_api_health,
+}
+
+
+class MetricScans:
+    """
+    요청 단위 공유 스캔 캐시
+
+    같은 스캔을 여러 카드가 요청하면 첫 번째 결과를 재사용합니다.
+    기간 경계(utils/time_windows.py)는 생성 시 한 번 계산해 모든 스캔에 바인드 파라미터로 넘깁니다.
+    (예: MAU는 engagement와 monetization이 함께 사용)
+    롤업이 신선하면 ROLLUP_SCANS의 롤업 스캔을 사용합니다.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.windows = get_time_windows()
+        self._results: Dict[str, Any] = {}
+        self._watermarks = None
+
+    def watermarks(self) -> Dict[str, int]:
+        """신선한 롤업 워터마크 (요청당 1회 조회)"""
+        if self._watermarks is None:
+            self._watermarks = get_fresh_watermarks(self.cursor)
+        return self._watermarks
+
+    def get(self, name: str) -> Any:
+        if name not in self._results:
+            rollup = ROLLUP_SCANS.get(name)
+            if rollup and all(source in self.watermarks() for source in rollup[0]):
+                self._results[name] = rollup[1](self.cursor, self.watermarks(), self.windows)
+            else:
+                self._results[name] = SCANS[name](self.cursor, self.windows)
+        return self._results[name]
+
+
+def _active_academies(scans: MetricScans) -> Dict[str, Any]:
+    """DAU/7일/MAU - 비트맵이 기간을 덮으면 비트맵, 아니면 activity 스캔"""
+    return scans.get('active_academies') or scans.get('activity')
 
 
 # =============================================================================
-# Card 1-3: 리포트 활동
+# Card 1-1: 학원 현황
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/report-activity', methods=['GET'])
-def get_report_activity():
-    """리포트 활동 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_academy_status(scans: MetricScans) -> Dict[str, Any]:
+    academies = scans.get('academies')
+    current_month = academies['current_month'] or 0
+    last_month = academies['last_month'] or 0
+    growth_rate = ((current_month - last_month) / last_month * 100) if last_month > 0 else 0
+
+    return {
+        'total': academies['total'],
+        'active': _active_academies(scans)['active_7d'],
+        'new_signups': academies['new_signups'],
+        'churned': scans.get('inactivity')['churned'],
+        'growth_rate': round(growth_rate, 1),
+        'trend': _trend(growth_rate)
+    }
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 이번 달 / 전월 리포트 수
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN created_at >= DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as this_month,
-                COUNT(CASE WHEN created_at >= DATE_FORMAT(NOW() - INTERVAL 1 MONTH, '%Y-%m-01')
-                           AND created_at < DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as last_month
-            FROM progress_records
-            WHERE is_deleted = 0
-        """)
-        monthly = cursor.fetchone()
-        this_month = monthly['this_month'] or 0
-        last_month = monthly['last_month'] or 0
-        monthly_growth = this_month - last_month
-        growth_rate = ((this_month - last_month) / last_month * 100) if last_month > 0 else 0
-
-        # 학생당 평균 리포트 수 (이번 달)
-        cursor.execute("""
-            SELECT
-                COUNT(*) as report_count,
-                COUNT(DISTINCT student_id) as student_count
-            FROM progress_records
-            WHERE created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-            AND is_deleted = 0
-        """)
-        avg_data = cursor.fetchone()
-        report_count = avg_data['report_count'] or 0
-        student_count = avg_data['student_count'] or 1
-        avg_per_student = round(report_count / student_count, 1) if student_count > 0 else 0
-
-        cursor.close()
-        conn.close()
-
-        trend = 'up' if growth_rate > 0 else ('down' if growth_rate < 0 else 'stable')
-
-        return jsonify({
-            'this_month': this_month,
-            'last_month': last_month,
-            'monthly_growth': monthly_growth,
-            'growth_rate': round(growth_rate, 1),
-            'avg_per_student': avg_per_student,
-            'trend': trend
-        })
 
-    except Exception as e:
-        print(f"[Metrics API] Report activity error: {e}")
-        return jsonify({'error': str(e)}), 500
+# =============================================================================
+# Card 1-2: 학생 현황
+# =============================================================================
+def _build_student_stats(scans: MetricScans) -> Dict[str, Any]:
+    students = scans.get('students')
+    this_month = students['this_month'] or 0
+    last_month = students['last_month'] or 0
+    monthly_growth = this_month - last_month
+    growth_rate = ((this_month - last_month) / last_month * 100) if last_month > 0 else 0
+
+    # 학원당 평균 학생 수
+    student_count = students['total'] or 0
+    academy_count = students['academy_count'] or 1
+    avg_per_academy = round(student_count / academy_count, 1)
+
+    return {
+        'total': students['total'],
+        'this_month': this_month,
+        'last_month': last_month,
+        'monthly_growth': monthly_growth,
+        'growth_rate': round(growth_rate, 1),
+        'avg_per_academy': avg_per_academy,
+        'trend': _trend(growth_rate)
+    }
 
 
 # =============================================================================
-# Card 1-4: 활성도 지표
+# Card 1-3: 리포트 활동
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/engagement', methods=['GET'])
-def get_engagement():
-    """활성도 지표 (DAU/MAU/고착도)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_report_activity(scans: MetricScans) -> Dict[str, Any]:
+    reports = scans.get('reports')
+    this_month = reports['this_month'] or 0
+    last_month = reports['last_month'] or 0
+    monthly_growth = this_month - last_month
+    growth_rate = ((this_month - last_month) / last_month * 100) if last_month > 0 else 0
+
+    # 학생당 평균 리포트 수 (이번 달)
+    student_count = reports['students_this_month'] or 1
+    avg_per_student = round(this_month / student_count, 1) if student_count > 0 else 0
+
+    return {
+        'this_month': this_month,
+        'last_month': last_month,
+        'monthly_growth': monthly_growth,
+        'growth_rate': round(growth_rate, 1),
+        'avg_per_student': avg_per_student,
+        'trend': _trend(growth_rate)
+    }
 
-    try:
-        cursor = conn.cursor(dictionary=True)
 
-        # DAU (Daily Active Users)
-        cursor.execute("""
-            SELECT COUNT(DISTINCT academy_id) as dau
-            FROM activity_logs
-            WHERE DATE(created_at) = CURDATE()
-        """)
-        dau = cursor.fetchone()['dau'] or 0
+# =============================================================================
+# Card 1-4: 활성도 지표
+# =============================================================================
+def _build_engagement(scans: MetricScans) -> Dict[str, Any]:
+    active = _active_academies(scans)
+    dau = active['dau'] or 0
+    mau = active['mau'] or 0
 
-        # MAU (Monthly Active Users)
-        cursor.execute("""
-            SELECT COUNT(DISTINCT academy_id) as mau
-            FROM activity_logs
-            WHERE created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-        """)
-        mau = cursor.fetchone()['mau'] or 0
-
-        # 고착도 (Stickiness) = DAU / MAU
-        stickiness = round((dau / mau * 100), 1) if mau > 0 else 0
-
-        # 이탈 위험 학원 (7일 이상 무활동)
-        cursor.execute("""
-            SELECT COUNT(*) as at_risk
-            FROM academies a
-            WHERE a.is_deleted = 0
-            AND NOT EXISTS (
-                SELECT 1 FROM activity_logs al
-                WHERE al.academy_id = a.id
-                AND al.created_at >= NOW() - INTERVAL 7 DAY
-            )
-        """)
-        at_risk = cursor.fetchone()['at_risk'] or 0
-
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'dau': dau,
-            'mau': mau,
-            'stickiness': stickiness,
-            'at_risk': at_risk,
-            'target_stickiness': 60  # 목표 고착도
-        })
+    # 고착도 (Stickiness) = DAU / MAU
+    stickiness = round((dau / mau * 100), 1) if mau > 0 else 0
 
-    except Exception as e:
-        print(f"[Metrics API] Engagement error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return {
+        'dau': dau,
+        'wau': active['active_7d'] or 0,
+        'mau': mau,
+        'stickiness': stickiness,
+        'at_risk': scans.get('inactivity')['at_risk'] or 0,
+        'target_stickiness': 60  # 목표 고착도
+    }
 
 
 # =============================================================================
 # Card 2-1: 콘텐츠 생성 (카드뉴스)
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/content-generation', methods=['GET'])
-def get_content_generation():
-    """콘텐츠 생성 지표 (카드뉴스)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_content_generation(scans: MetricScans) -> Dict[str, Any]:
+    reports = scans.get('reports')
+    card_news_count = reports['card_news_this_month'] or 0
+    academy_count = reports['card_news_academies'] or 1
+    avg_per_academy = round(card_news_count / academy_count, 1) if academy_count > 0 else 0
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 카드뉴스 생성 수 (이번 달)
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN card_news_generated = 1 THEN 1 END) as card_news_count,
-                COUNT(DISTINCT CASE WHEN card_news_generated = 1 THEN academy_id END) as academy_count
-            FROM progress_records pr
-            JOIN students s ON pr.student_id = s.id
-            WHERE pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-            AND pr.is_deleted = 0
-        """)
-        result = cursor.fetchone()
-        card_news_count = result['card_news_count'] or 0
-        academy_count = result['academy_count'] or 1
-        avg_per_academy = round(card_news_count / academy_count, 1) if academy_count > 0 else 0
-
-        # 전월 대비
-        cursor.execute("""
-            SELECT COUNT(*) as last_month
-            FROM progress_records
-            WHERE card_news_generated = 1
-            AND created_at >= DATE_FORMAT(NOW() - INTERVAL 1 MONTH, '%Y-%m-01')
-            AND created_at < DATE_FORMAT(NOW(), '%Y-%m-01')
-            AND is_deleted = 0
-        """)
-        last_month = cursor.fetchone()['last_month'] or 0
-        growth_rate = ((card_news_count - last_month) / last_month * 100) if last_month > 0 else 0
-
-        cursor.close()
-        conn.close()
-
-        trend = 'up' if growth_rate > 0 else ('down' if growth_rate < 0 else 'stable')
-
-        return jsonify({
-            'card_news_count': card_news_count,
-            'avg_per_academy': avg_per_academy,
-            'last_month': last_month,
-            'growth_rate': round(growth_rate, 1),
-            'trend': trend
-        })
+    # 전월 대비
+    last_month = reports['card_news_last_month'] or 0
+    growth_rate = ((card_news_count - last_month) / last_month * 100) if last_month > 0 else 0
 
-    except Exception as e:
-        print(f"[Metrics API] Content generation error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return {
+        'card_news_count': card_news_count,
+        'avg_per_academy': avg_per_academy,
+        'last_month': last_month,
+        'growth_rate': round(growth_rate, 1),
+        'trend': _trend(growth_rate)
+    }
 
 
 # =============================================================================
 # Card 2-2: 학부모 도달
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/parent-reach', methods=['GET'])
-def get_parent_reach():
-    """학부모 도달 지표 (공유/열람/열람률)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_parent_reach(scans: MetricScans) -> Dict[str, Any]:
+    shares = scans.get('activity')['shares_month'] or 0
+    views = scans.get('parent_views')['views'] or 0
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 리포트 공유 수 (이번 달)
-        cursor.execute("""
-            SELECT COUNT(*) as shares
-            FROM activity_logs
-            WHERE action_type = 'share_kakaotalk'
-            AND created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-        """)
-        shares = cursor.fetchone()['shares'] or 0
-
-        # 학부모 열람 수 (이번 달)
-        cursor.execute("""
-            SELECT COUNT(*) as views
-            FROM report_views
-            WHERE viewer_type = 'parent'
-            AND created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-        """)
-        views = cursor.fetchone()['views'] or 0
-
-        # 열람률
-        view_rate = round((views / shares * 100), 1) if shares > 0 else 0
-
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'shares': shares,
-            'views': views,
-            'view_rate': view_rate,
-            'target_rate': 60  # 목표 열람률
-        })
+    # 열람률
+    view_rate = round((views / shares * 100), 1) if shares > 0 else 0
 
-    except Exception as e:
-        print(f"[Metrics API] Parent reach error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return {
+        'shares': shares,
+        'views': views,
+        'view_rate': view_rate,
+        'target_rate': 60  # 목표 열람률
+    }
 
 
 # =============================================================================
 # Card 2-3: AI 효율성
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/ai-efficiency', methods=['GET'])
-def get_ai_efficiency():
-    """AI 효율성 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_ai_efficiency(scans: MetricScans) -> Dict[str, Any]:
+    reports = scans.get('reports')
+    ai_reports = reports['ai_reports'] or 0
+    academy_count = reports['ai_academies'] or 1
 
-    try:
-        cursor = conn.cursor(dictionary=True)
+    # 시간 절감 계산 (수동 90분 → AI 9분)
+    hours_saved = round(ai_reports * ((90 - 9) / 60), 1)
 
-        # AI로 생성된 리포트 수 (이번 달)
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN ai_generated = 1 THEN 1 END) as ai_reports,
-                COUNT(DISTINCT CASE WHEN ai_generated = 1 THEN s.academy_id END) as academy_count
-            FROM progress_records pr
-            JOIN students s ON pr.student_id = s.id
-            WHERE pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-            AND pr.is_deleted = 0
-        """)
-        result = cursor.fetchone()
-        ai_reports = result['ai_reports'] or 0
-        academy_count = result['academy_count'] or 1
-
-        # 시간 절감 계산 (수동 90분 → AI 9분)
-        hours_saved = round(ai_reports * ((90 - 9) / 60), 1)
-
-        # 학원당 평균
-        avg_per_academy = round(ai_reports / academy_count, 1) if academy_count > 0 else 0
-
-        # 보호자 동의 완료율
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN consent_status = 'approved' THEN 1 END) as approved,
-                COUNT(*) as total
-            FROM students
-            WHERE is_deleted = 0
-        """)
-        consent = cursor.fetchone()
-        approved = consent['approved'] or 0
-        total = consent['total'] or 1
-        consent_rate = round((approved / total * 100), 1) if total > 0 else 0
-
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'ai_reports': ai_reports,
-            'hours_saved': hours_saved,
-            'avg_per_academy': avg_per_academy,
-            'consent_rate': consent_rate
-        })
+    # 학원당 평균
+    avg_per_academy = round(ai_reports / academy_count, 1) if academy_count > 0 else 0
 
-    except Exception as e:
-        print(f"[Metrics API] AI efficiency error: {e}")
-        return jsonify({'error': str(e)}), 500
+    # 보호자 동의 완료율
+    students = scans.get('students')
+    approved = students['consent_approved'] or 0
+    total = students['total'] or 1
+    consent_rate = round((approved / total * 100), 1) if total > 0 else 0
+
+    return {
+        'ai_reports': ai_reports,
+        'hours_saved': hours_saved,
+        'avg_per_academy': avg_per_academy,
+        'consent_rate': consent_rate
+    }
 
 
 # =============================================================================
 # Card 2-4: 전환 퍼널
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/onboarding-funnel', methods=['GET'])
-def get_onboarding_funnel():
-    """온보딩 퍼널 분석 (최근 30일)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_onboarding_funnel(scans: MetricScans) -> Dict[str, Any]:
+    result = scans.get('funnel')
+    total = result['total_signups'] or 0
+    has_students = result['has_students'] or 0
+    created_report = result['created_report'] or 0
+    shared = result['shared_kakaotalk'] or 0
+
+    # 전환율 계산
+    return {
+        'funnel': {
+            'signups': total,
+            'has_students': has_students,
+            'created_report': created_report,
+            'shared_kakaotalk': shared
+        },
+        'conversion_rates': {
+            'signup_to_student': round((has_students / total * 100), 1) if total > 0 else 0,
+            'student_to_report': round((created_report / has_students * 100), 1) if has_students > 0 else 0,
+            'report_to_share': round((shared / created_report * 100), 1) if created_report > 0 else 0,
+            'overall': round((shared / total * 100), 1) if total > 0 else 0
+        }
+    }
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 신규 학원 전환 퍼널
-        cursor.execute("""
-            SELECT
-                COUNT(DISTINCT a.id) as total_signups,
-                COUNT(DISTINCT CASE WHEN s.id IS NOT NULL THEN a.id END) as has_students,
-                COUNT(DISTINCT CASE WHEN pr.id IS NOT NULL THEN a.id END) as created_report,
-                COUNT(DISTINCT CASE WHEN al.action_type = 'share_kakaotalk' THEN a.id END) as shared_kakaotalk
-            FROM academies a
-            LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
-            LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
-            LEFT JOIN activity_logs al ON a.id = al.academy_id AND al.action_type = 'share_kakaotalk'
-            WHERE a.created_at >= NOW() - INTERVAL 30 DAY
-            AND a.is_deleted = 0
-        """)
-
-        result = cursor.fetchone()
-        total = result['total_signups'] or 0
-        has_students = result['has_students'] or 0
-        created_report = result['created_report'] or 0
-        shared = result['shared_kakaotalk'] or 0
-
-        cursor.close()
-        conn.close()
-
-        # 전환율 계산
-        return jsonify({
-            'funnel': {
-                'signups': total,
-                'has_students': has_students,
-                'created_report': created_report,
-                'shared_kakaotalk': shared
-            },
-            'conversion_rates': {
-                'signup_to_student': round((has_students / total * 100), 1) if total > 0 else 0,
-                'student_to_report': round((created_report / has_students * 100), 1) if has_students > 0 else 0,
-                'report_to_share': round((shared / created_report * 100), 1) if created_report > 0 else 0,
-                'overall': round((shared / total * 100), 1) if total > 0 else 0
-            }
-        })
 
-    except Exception as e:
-        print(f"[Metrics API] Onboarding funnel error: {e}")
-        return jsonify({'error': str(e)}), 500
+# =============================================================================
+# Card 3-1: 수익화 준비
+# =============================================================================
+def _build_monetization(scans: MetricScans) -> Dict[str, Any]:
+    heavy_users = scans.get('heavy_users')['heavy_users'] or 0
+    mau = _active_academies(scans)['mau'] or 0
+
+    # 헤비유저 비율
+    heavy_user_rate = round((heavy_users / mau * 100), 1) if mau > 0 else 0
+
+    # 예상 MRR (Standard 플랜 ₩24,900 가정)
+    estimated_mrr = mau * 24900
+
+    return {
+        'heavy_users': heavy_users,
+        'mau': mau,
+        'heavy_user_rate': heavy_user_rate,
+        'estimated_mrr': estimated_mrr,
+        'plan_price': 24900
+    }
 
 
 # =============================================================================
-# Card 3-1: 수익화 준비
+# Card 3-2: 비용 현황
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/monetization', methods=['GET'])
-def get_monetization():
-    """수익화 준비 지표 (헤비유저/MRR)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_cost_breakdown(scans: MetricScans) -> Dict[str, Any]:
+    costs_by_type = scans.get('costs')
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 헤비유저 (월 20건 이상 리포트)
-        cursor.execute("""
-            SELECT COUNT(DISTINCT academy_id) as heavy_users
-            FROM (
-                SELECT s.academy_id, COUNT(*) as report_count
-                FROM progress_records pr
-                JOIN students s ON pr.student_id = s.id
-                WHERE pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-                AND pr.is_deleted = 0
-                GROUP BY s.academy_id
-                HAVING COUNT(*) >= 20
-            ) heavy
-        """)
-        heavy_users = cursor.fetchone()['heavy_users'] or 0
-
-        # MAU
-        cursor.execute("""
-            SELECT COUNT(DISTINCT academy_id) as mau
-            FROM activity_logs
-            WHERE created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-        """)
-        mau = cursor.fetchone()['mau'] or 0
+    # 총 비용
+    total = sum(costs_by_type.values())
 
-        # 헤비유저 비율
-        heavy_user_rate = round((heavy_users / mau * 100), 1) if mau > 0 else 0
+    # 학원당 평균 비용
+    academy_count = scans.get('academies')['total'] or 1
+    cost_per_academy = round(total / academy_count, 0)
 
-        # 예상 MRR (Standard 플랜 ₩24,900 가정)
-        estimated_mrr = mau * 24900
+    # 손익분기점 (Standard ₩24,900 기준)
+    breakeven = int(total / 24900) + 1 if total > 0 else 0
 
-        cursor.close()
-        conn.close()
+    return {
+        'total': total,
+        'alimtalk': costs_by_type.get('alimtalk', 0),
+        'claude': costs_by_type.get('claude_api', 0),
+        'server': costs_by_type.get('server', 0),
+        'domain': costs_by_type.get('domain', 0),
+        'other': costs_by_type.get('other', 0),
+        'cost_per_academy': cost_per_academy,
+        'breakeven_academies': breakeven
+    }
 
-        return jsonify({
-            'heavy_users': heavy_users,
-            'mau': mau,
-            'heavy_user_rate': heavy_user_rate,
-            'estimated_mrr': estimated_mrr,
-            'plan_price': 24900
-        })
 
-    except Exception as e:
-        print(f"[Metrics API] Monetization error: {e}")
-        return jsonify({'error': str(e)}), 500
+# =============================================================================
+# Card 3-3: 시스템 건강
+# =============================================================================
+def _build_system_health(scans: MetricScans) -> Dict[str, Any]:
+    window = scans.get('resources')
+    cpu = round(window['cpu']['avg'], 1) if window['cpu']['avg'] else 0
+    ram = round(window['ram']['avg'], 1) if window['ram']['avg'] else 0
+    disk = round(window['disk']['avg'], 1) if window['disk']['avg'] else 0
+
+    restart_count = scans.get('restarts')['restart_count'] or 0
+
+    # 상태 판정
+    cpu_status = 'critical' if cpu > 90 else ('warning' if cpu > 80 else 'normal')
+    ram_status = 'critical' if ram > 90 else ('warning' if ram > 80 else 'normal')
+    disk_status = 'critical' if disk > 90 else ('warning' if disk > 80 else 'normal')
+
+    return {
+        'cpu': cpu,
+        'ram': ram,
+        'disk': disk,
+        'cpu_status': cpu_status,
+        'ram_status': ram_status,
+        'disk_status': disk_status,
+        'restart_count': restart_count,
+        'target_cpu': 60,
+        'cpu_p95': window['cpu']['p95'],
+        'cpu_max': window['cpu']['max'],
+        'ram_p95': window['ram']['p95'],
+        'ram_max': window['ram']['max'],
+        'samples': window['samples']
+    }
 
 
 # =============================================================================
-# Card 3-2: 비용 현황
+# Card 3-4: API 상태
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/cost-breakdown', methods=['GET'])
-def get_cost_breakdown():
-    """비용 현황 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+def _build_api_status(scans: MetricScans) -> Dict[str, Any]:
+    api_stats = {}
+    for row in scans.get('api_health'):
+        api_name = row['api_name']
+        total = row['total_count'] or 0
+        success = row['success_count'] or 0
+        success_rate = round((success / total * 100), 1) if total > 0 else 100
 
+        # 상태 판정
+        if success_rate >= 99:
+            status = 'healthy'
+        elif success_rate >= 95:
+            status = 'warning'
+        else:
+            status = 'critical'
+
+        api_stats[api_name] = {
+            'status': status,
+            'response_time': round(float(row['avg_response_time']), 0) if row['avg_response_time'] else 0,
+            'success_rate': success_rate
+        }
+
+    # 기본값 설정 (데이터가 없는 경우)
+    if 'claude' not in api_stats:
+        api_stats['claude'] = {'status': 'healthy', 'response_time': 0, 'success_rate': 100}
+    if 'kakao' not in api_stats:
+        api_stats['kakao'] = {'status': 'healthy', 'response_time': 0, 'success_rate': 100}
+
+    return {
+        'claude': api_stats.get('claude'),
+        'kakao': api_stats.get('kakao'),
+        'uptime_hours': uptime_hours(scans.get('restarts')['last_started_at'])
+    }
+
+
+# 카드 키 → 빌더 (snapshot 응답 순서)
+CARD_BUILDERS: Dict[str, Callable[[MetricScans], Dict[str, Any]]] = {
+    'academy-status': _build_academy_status,
+    'student-stats': _build_student_stats,
+    'report-activity': _build_report_activity,
+    'engagement': _build_engagement,
+    'content-generation': _build_content_generation,
+    'parent-reach': _build_parent_reach,
+    'ai-efficiency': _build_ai_efficiency,
+    'onboarding-funnel': _build_onboarding_funnel,
+    'monetization': _build_monetization,
+    'cost-breakdown': _build_cost_breakdown,
+    'system-health': _build_system_health,
+    'api-status': _build_api_status,
+}
+
+
+def _compute_card(card: str) -> Dict[str, Any]:
+    """카드 하나를 자체 연결로 계산 (캐시 miss/백그라운드 갱신용)"""
+    with db_cursor() as cursor:
+        return CARD_BUILDERS[card](MetricScans(cursor))
+
+
+def _force_refresh() -> bool:
+    return request.args.get('refresh') in ('1', 'true')
+
+
+def _entry_response(entry: Dict[str, Any], cache_key: str):
+    """캐시 항목 → 조건부 응답 (ETag = 항목 버전, max-age = 남은 TTL)"""
+    ttl = get_cache_ttl(cache_key)
+    return conditional_json(entry['value'], entry['version'],
+                            max_age=remaining_ttl(entry, ttl), stale=get_stale_ttl(cache_key))
+
+
+def _card_response(card: str):
+    """단일 카드 응답 (캐시 경유, 조건부 요청 지원)"""
     try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 이번 달 비용 항목별 집계
-        cursor.execute("""
-            SELECT
-                cost_type,
-                SUM(amount) as cost
-            FROM operational_costs
-            WHERE billing_month = DATE_FORMAT(NOW(), '%Y-%m-01')
-            GROUP BY cost_type
-        """)
-        costs_by_type = {row['cost_type']: float(row['cost']) for row in cursor.fetchall()}
-
-        # 총 비용
-        total = sum(costs_by_type.values())
-
-        # 학원당 평균 비용
-        cursor.execute("""
-            SELECT COUNT(*) as academy_count
-            FROM academies
-            WHERE is_deleted = 0
-        """)
-        academy_count = cursor.fetchone()['academy_count'] or 1
-        cost_per_academy = round(total / academy_count, 0)
-
-        # 손익분기점 (Standard ₩24,900 기준)
-        breakeven = int(total / 24900) + 1 if total > 0 else 0
-
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'total': total,
-            'alimtalk': costs_by_type.get('alimtalk', 0),
-            'claude': costs_by_type.get('claude_api', 0),
-            'server': costs_by_type.get('server', 0),
-            'domain': costs_by_type.get('domain', 0),
-            'other': costs_by_type.get('other', 0),
-            'cost_per_academy': cost_per_academy,
-            'breakeven_academies': breakeven
-        })
+        if _force_refresh():
+            metrics_cache.invalidate(card)
+        entry = metrics_cache.get_or_compute_entry(
+            card,
+            lambda: _compute_card(card),
+            ttl=get_cache_ttl(card),
+            stale_ttl=get_stale_ttl(card)
+        )
+        return _entry_response(entry, card)
 
     except Exception as e:
-        print(f"[Metrics API] Cost breakdown error: {e}")
+        print(f"[Metrics API] {card} error: {e}")
         return jsonify({'error': str(e)}), 500
 
 
-# =============================================================================
-# Card 3-3: 시스템 건강
-# =============================================================================
+@metrics_bp.route('/api/admin/metrics/academy-status', methods=['GET'])
+def get_academy_status():
+    """학원 현황 지표"""
+    return _card_response('academy-status')
+
+
+@metrics_bp.route('/api/admin/metrics/student-stats', methods=['GET'])
+def get_student_stats():
+    """학생 현황 지표"""
+    return _card_response('student-stats')
+
+
+@metrics_bp.route('/api/admin/metrics/report-activity', methods=['GET'])
+def get_report_activity():
+    """리포트 활동 지표"""
+    return _card_response('report-activity')
+
+
+@metrics_bp.route('/api/admin/metrics/engagement', methods=['GET'])
+def get_engagement():
+    """활성도 지표 (DAU/MAU/고착도)"""
+    return _card_response('engagement')
+
+
+@metrics_bp.route('/api/admin/metrics/content-generation', methods=['GET'])
+def get_content_generation():
+    """콘텐츠 생성 지표 (카드뉴스)"""
+    return _card_response('content-generation')
+
+
+@metrics_bp.route('/api/admin/metrics/parent-reach', methods=['GET'])
+def get_parent_reach():
+    """학부모 도달 지표 (공유/열람/열람률)"""
+    return _card_response('parent-reach')
+
+
+@metrics_bp.route('/api/admin/metrics/ai-efficiency', methods=['GET'])
+def get_ai_efficiency():
+    """AI 효율성 지표"""
+    return _card_response('ai-efficiency')
+
+
+@metrics_bp.route('/api/admin/metrics/onboarding-funnel', methods=['GET'])
+def get_onboarding_funnel():
+    """온보딩 퍼널 분석 (최근 30일)"""
+    return _card_response('onboarding-funnel')
+
+
+@metrics_bp.route('/api/admin/metrics/monetization', methods=['GET'])
+def get_monetization():
+    """수익화 준비 지표 (헤비유저/MRR)"""
+    return _card_response('monetization')
+
+
+@metrics_bp.route('/api/admin/metrics/cost-breakdown', methods=['GET'])
+def get_cost_breakdown():
+    """비용 현황 지표"""
+    return _card_response('cost-breakdown')
+
+
 @metrics_bp.route('/api/admin/metrics/system-health', methods=['GET'])
 def get_system_health():
     """시스템 건강 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+    return _card_response('system-health')
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 최근 5분 평균 리소스 사용량
-        cursor.execute("""
-            SELECT
-                AVG(cpu_usage) as cpu,
-                AVG(ram_usage) as ram,
-                AVG(disk_usage) as disk
-            FROM system_health_logs
-            WHERE created_at >= NOW() - INTERVAL 5 MINUTE
-        """)
-        result = cursor.fetchone()
-        cpu = round(float(result['cpu']), 1) if result['cpu'] else 0
-        ram = round(float(result['ram']), 1) if result['ram'] else 0
-        disk = round(float(result['disk']), 1) if result['disk'] else 0
-
-        # Backend 재시작 횟수 (일주일간 - 10분 이상 갭 = 재시작으로 간주)
-        cursor.execute("""
-            SELECT COUNT(*) as restart_count
-            FROM (
-                SELECT
-                    created_at,
-                    LAG(created_at) OVER (ORDER BY created_at) as prev_time
-                FROM system_health_logs
-                WHERE created_at >= NOW() - INTERVAL 7 DAY
-            ) t
-            WHERE TIMESTAMPDIFF(MINUTE, prev_time, created_at) > 10
-        """)
-        restart_count = cursor.fetchone()['restart_count'] or 0
-
-        cursor.close()
-        conn.close()
 
-        # 상태 판정
-        cpu_status = 'critical' if cpu > 90 else ('warning' if cpu > 80 else 'normal')
-        ram_status = 'critical' if ram > 90 else ('warning' if ram > 80 else 'normal')
-        disk_status = 'critical' if disk > 90 else ('warning' if disk > 80 else 'normal')
-
-        return jsonify({
-            'cpu': cpu,
-            'ram': ram,
-            'disk': disk,
-            'cpu_status': cpu_status,
-            'ram_status': ram_status,
-            'disk_status': disk_status,
-            'restart_count': restart_count,
-            'target_cpu': 60
-        })
-
-    except Exception as e:
-        print(f"[Metrics API] System health error: {e}")
-        return jsonify({'error': str(e)}), 500
+@metrics_bp.route('/api/admin/metrics/api-status', methods=['GET'])
+def get_api_status():
+    """API 상태 지표"""
+    return _card_response('api-status')
 
 
 # =============================================================================
-# Card 3-4: API 상태
+# 대시보드 스냅샷: 12개 카드 일괄 조회
 # =============================================================================
-@metrics_bp.route('/api/admin/metrics/api-status', methods=['GET'])
-def get_api_status():
-    """API 상태 지표"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+@metrics_bp.route('/api/admin/metrics/snapshot', methods=['GET'])
+def get_metrics_snapshot():
+    """
+    12개 지표 카드를 한 번의 요청으로 계산
+
+    하나의 연결에서 공유 스캔을 재사용하므로 개별 호출 12번(약 30개 쿼리) 대신
+    테이블별 1회 집계(12개 이하 쿼리)로 끝납니다. 한 카드가 실패해도 나머지
+    카드는 반환되며, 실패한 카드 자리에는 {'error': ...}가 들어갑니다.
+    캐시에 있는 카드는 DB를 건드리지 않고, miss가 난 카드만 계산합니다.
+    ETag는 카드 버전을 합친 값이고 max-age는 카드 중 가장 짧은 남은 TTL입니다.
+    실패한 카드가 있으면 캐시하지 않습니다 (no-store).
+
+    Query:
+        cards: 쉼표로 구분한 카드 키 (선택, 기본 전체)
+        refresh: 1이면 캐시를 무시하고 다시 계산
+
+    Returns:
+        JSON: {"academy-status": {...}, "student-stats": {...}, ...}
+    """
+    requested = request.args.get('cards')
+    if requested:
+        cards = [c.strip() for c in requested.split(',') if c.strip() in CARD_BUILDERS]
+    else:
+        cards = list(CARD_BUILDERS)
 
     try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 각 API별 최근 1시간 상태
-        cursor.execute("""
-            SELECT
-                api_name,
-                AVG(response_time_ms) as avg_response_time,
-                COUNT(CASE WHEN status = 'success' THEN 1 END) as success_count,
-                COUNT(*) as total_count
-            FROM api_health_checks
-            WHERE created_at >= NOW() - INTERVAL 1 HOUR
-            GROUP BY api_name
-        """)
-
-        api_stats = {}
-        for row in cursor.fetchall():
-            api_name = row['api_name']
-            total = row['total_count'] or 0
-            success = row['success_count'] or 0
-            success_rate = round((success / total * 100), 1) if total > 0 else 100
-
-            # 상태 판정
-            if success_rate >= 99:
-                status = 'healthy'
-            elif success_rate >= 95:
-                status = 'warning'
-            else:
-                status = 'critical'
+        snapshot: Dict[str, Any] = {}
+        versions, max_ages = [], []
+        with ExitStack() as stack:
+            shared: Dict[str, MetricScans] = {}
+
+            def compute(card: str) -> Dict[str, Any]:
+                # 캐시 miss가 난 카드끼리만 연결 하나와 공유 스캔을 함께 사용
+                if 'scans' not in shared:
+                    shared['scans'] = MetricScans(stack.enter_context(db_cursor()))
+                return CARD_BUILDERS[card](shared['scans'])
+
+            for card in cards:
+                try:
+                    if _force_refresh():
+                        metrics_cache.invalidate(card)
+                    entry = metrics_cache.get_or_compute_entry(
+                        card,
+                        lambda c=card: compute(c),
+                        ttl=get_cache_ttl(card),
+                        stale_ttl=get_stale_ttl(card),
+                        refresh=lambda c=card: _compute_card(c)
+                    )
+                    snapshot[card] = entry['value']
+                    versions.append(f"{card}:{entry['version']}")
+                    max_ages.append(remaining_ttl(entry, get_cache_ttl(card)))
+                except Exception as e:
+                    print(f"[Metrics API] Snapshot {card} error: {e}")
+                    snapshot[card] = {'error': str(e)}
+
+        if len(versions) < len(cards):
+            response = jsonify(snapshot)
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+        return conditional_json(snapshot, combine_versions(versions), max_age=min(max_ages, default=0))
 
-            api_stats[api_name] = {
-                'status': status,
-                'response_time': round(float(row['avg_response_time']), 0) if row['avg_response_time'] else 0,
-                'success_rate': success_rate
-            }
+    except Exception as e:
+        print(f"[Metrics API] Snapshot error: {e}")
+        return jsonify({'error': str(e)}), 500
 
-        # 기본값 설정 (데이터가 없는 경우)
-        if 'claude' not in api_stats:
-            api_stats['claude'] = {'status': 'healthy', 'response_time': 0, 'success_rate': 100}
-        if 'kakao' not in api_stats:
-            api_stats['kakao'] = {'status': 'healthy', 'response_time': 0, 'success_rate': 100}
 
-        cursor.close()
-        conn.close()
+# =============================================================================
+# 가입 코호트 리텐션
+# =============================================================================
+@metrics_bp.route('/api/admin/metrics/cohorts', methods=['GET'])
+def get_cohorts():
+    """
+    가입 코호트 × 활동 기간 리텐션 행렬
+
+    cohort_retention 요약 테이블(utils/cohort_retention.py, cron 갱신)을 읽으므로
+    비용은 코호트 수 × 기간 수에 비례합니다.
+
+    Query:
+        granularity: week(기본, 월요일 시작) / month
+        periods: 최근 코호트 수 (기본/최대 COHORT_WEEKS 또는 COHORT_MONTHS)
+        refresh: 1이면 캐시를 무시하고 다시 조회
+
+    Returns:
+        JSON: {"granularity": "week", "periods": 26,
+               "cohorts": [{"cohort_start": "2025-03-03", "size": 12,
+                            "active": [12, 9, ...], "retention": [100.0, 75.0, ...]}, ...],
+               "updated_at": "..."}
+    """
+    granularity = request.args.get('granularity', 'week')
+    try:
+        periods = resolve_periods(granularity, request.args.get('periods', type=int))
+        key = f"cohorts:{granularity}:{periods}"
+        if _force_refresh():
+            metrics_cache.invalidate(key)
+
+        def compute() -> Dict[str, Any]:
+            with db_cursor() as cursor:
+                return get_retention_matrix(cursor, granularity, periods)
+
+        entry = metrics_cache.get_or_compute_entry(
+            key,
+            compute,
+            ttl=get_cache_ttl('cohorts'),
+            stale_ttl=get_stale_ttl('cohorts')
+        )
+        return _entry_response(entry, 'cohorts')
 
-        return jsonify({
-            'claude': api_stats.get('claude'),
-            'kakao': api_stats.get('kakao'),
-            'uptime_hours': 24 * 99  # 가정: 99일 가동
-        })
+    except CohortError as e:
+        return jsonify({'error': str(e)}), 400
 
     except Exception as e:
-        print(f"[Metrics API] API status error: {e}")
+        print(f"[Metrics API] Cohorts error: {e}")
         return jsonify({'error': str(e)}), 500
 
 
+# =============================================================================
+# 운영: DB 커넥션 풀 통계
+# =============================================================================
+@metrics_bp.route('/api/admin/metrics/db-pool', methods=['GET'])
+def get_db_pool_stats():
+    """DB 커넥션 풀 통계 (대기 시간, 체크아웃 횟수 - 풀 크기 산정용)"""
+    return jsonify(get_pool_stats())
+
+
+@metrics_bp.route('/api/admin/metrics/cache-stats', methods=['GET'])
+def get_cache_stats():
+    """카드 결과 캐시 통계 (카드별 hit/stale/miss/합류 횟수)"""
+    return jsonify(metrics_cache.stats())
+
+
 # Blueprint 등록용 함수
 def register_metrics_routes(app):
     """Flask 앱에 metrics Blueprint 등록"""
@@ -7,33 +7,351 @@ API:
     GET /api/admin/tables/at-risk-academies - 이탈 위험 학원
     GET /api/admin/tables/active-academies - 활성 학원 상세
     GET /api/admin/tables/onboarding-funnel - 온보딩 퍼널 분석
+    GET /api/admin/tables/heavy-users - 헤비유저 학원
+
+페이지네이션 (모든 목록 공통):
+    limit: 페이지 크기 (기본 50, 최대 200)
+    cursor: 이전 응답의 next_cursor (정렬 키 + id 기반 keyset)
+    응답: academies, total_count(이번 페이지 행 수), next_cursor, has_more
+
+캐시 / 조건부 요청:
+    목록 페이지는 같은 쿼리 인자별로 config/cache_settings.py의 TTL('table:*') 동안
+    캐시되고, 저장 시점에 계산한 항목 버전을 ETag로, 남은 TTL을 max-age로 보냅니다.
+    If-None-Match가 같으면 목록 쿼리도 직렬화도 없이 304를 반환합니다.
+    ?refresh=1 로 캐시 무시. (utils/result_cache.py, utils/http_cache.py)
+
+환경변수:
+    HEALTH_SCORE_MAX_AGE_MINUTES: 이탈 위험 목록이 customer_health_scores를 쓰는 최대 점수 나이
+        (분, 기본 120 - 매시간 배치를 한 번 놓쳐도 사용, 더 오래되면 academy_stats로 계산)
 """
 
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
 from flask import Blueprint, jsonify, request
 
 import sys
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PROJECT_ROOT)
 
+from utils.customer_health import RISK_LEVEL_MIN_DAYS
+from utils.db_pool import db_cursor
+from utils.http_cache import conditional_json
+from utils.pagination import PaginationError, get_page_params, keyset_clause, order_clause, build_page
+from utils.result_cache import create_result_cache, remaining_ttl
+from utils.time_windows import get_time_windows
+from config.cache_settings import get_cache_ttl, get_stale_ttl
+
 
 tables_bp = Blueprint('tables', __name__)
 
+# 목록 페이지 캐시 (METRICS_CACHE_BACKEND=redis면 워커 간 공유)
+tables_cache = create_result_cache('tables')
+
+HEALTH_SCORE_MAX_AGE_MINUTES = int(os.getenv('HEALTH_SCORE_MAX_AGE_MINUTES', '120'))
+
+
+# 필터 값 → (최소, 최대) 범위 (None은 제한 없음)
+PLAN_REPORTS = {
+    'Pro': (50, None),
+    'Standard': (20, 49),
+    'Free': (None, 19),
+}
+
+FUNNEL_STATUS = {
+    'completed': 't.shared_kakaotalk = 1',
+    'report_created': 't.shared_kakaotalk = 0 AND t.created_report = 1',
+    'student_added': 't.shared_kakaotalk = 0 AND t.created_report = 0 AND t.has_students = 1',
+    'signup_only': 't.shared_kakaotalk = 0 AND t.created_report = 0 AND t.has_students = 0',
+}
+
 
-def get_db_connection():
-    """데이터베이스 연결"""
+def _range_filter(column: str, bounds, conditions: list, params: list) -> None:
+    """(최소, 최대) 범위를 SQL 조건으로 추가"""
+    low, high = bounds
+    if low is not None:
+        conditions.append(f"{column} >= %s")
+        params.append(low)
+    if high is not None:
+        conditions.append(f"{column} <= %s")
+        params.append(high)
+
+
+def _choice_arg(name: str, choices: dict):
+    """허용된 값만 받는 필터 인자 (없으면 None)"""
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
+    if value not in choices:
+        raise PaginationError(f"invalid {name}: {value} (allowed: {', '.join(choices)})")
+    return value
+
+
+def _int_arg(name: str):
+    """정수 필터 인자 (없으면 None)"""
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
     try:
-        import mysql.connector
-        return mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', ''),
-            database=os.getenv('DB_NAME', 'tutornote')
-        )
+        return int(value)
+    except ValueError:
+        raise PaginationError(f"invalid {name}: {value}")
+
+
+def _page_payload(rows: list, next_cursor, has_more: bool, **extra) -> dict:
+    return {
+        'academies': rows,
+        'total_count': len(rows),
+        'next_cursor': next_cursor,
+        'has_more': has_more,
+        **extra
+    }
+
+
+def _cached_page(name: str, compute):
+    """
+    목록 페이지 응답 (캐시 경유, ETag = 캐시 항목 버전)
+
+    캐시 키는 목록 이름 + 정렬한 쿼리 인자(refresh 제외)입니다. 캐시에 있으면 DB를
+    읽지 않고, If-None-Match가 항목 버전과 같으면 페이로드를 직렬화하지 않습니다.
+
+    Args:
+        name: cache_settings 키 (예: 'table:at-risk')
+        compute: 페이지 페이로드를 만드는 함수 (캐시 miss일 때만 호출)
+    """
+    args = sorted((k, v) for k, v in request.args.items(multi=True) if k != 'refresh')
+    key = f"{name}?{urlencode(args)}"
+    if request.args.get('refresh') in ('1', 'true'):
+        tables_cache.invalidate(key)
+
+    ttl = get_cache_ttl(name)
+    entry = tables_cache.get_or_compute_entry(key, compute, ttl=ttl, stale_ttl=get_stale_ttl(name))
+    return conditional_json(entry['value'], entry['version'], max_age=remaining_ttl(entry, ttl))
+
+
+# =============================================================================
+# 학원별 목록 쿼리
+#
+# 학생 수 / 리포트 수 / 공유 수 / 마지막 활동 시각은 학원당 1행인 academy_stats
+# (utils/academy_stats.py)에서 PK로 읽습니다. 자식 테이블을 GROUP BY 하지 않으므로
+# 비용은 학원 수에만 비례합니다. (비교: scripts/benchmark_tables.py)
+#
+# 기간 경계는 %s 파라미터이며, 각 쿼리의 *_WINDOWS가 순서대로 채울
+# utils/time_windows.py 경계 이름입니다. (get_time_windows().values(*AT_RISK_WINDOWS))
+# =============================================================================
+# 이번 달 리포트 수 (month_start가 지난 달이면 아직 이번 달 리포트가 없는 것)
+MONTHLY_REPORTS = "CASE WHEN st.month_start = %s THEN st.monthly_reports ELSE 0 END"
+
+# 이탈 위험 수준 / 무활동 일수 / 건강도 점수는 매시간 배치(utils/customer_health.py)가
+# 계산한 customer_health_scores를 idx_risk로 읽습니다.
+AT_RISK_ROWS = """
+    SELECT
+        a.id,
+        a.name as academy_name,
+        a.owner_name,
+        a.phone,
+        COALESCE(st.student_count, 0) as student_count,
+        COALESCE(st.report_count, 0) as report_count,
+        st.last_activity_at as last_activity,
+        h.inactive_days,
+        h.risk_level,
+        h.total_score as health_score,
+        h.status as health_status,
+        h.score_change,
+        a.created_at as signup_date
+    FROM customer_health_scores h
+    JOIN academies a ON a.id = h.academy_id
+    LEFT JOIN academy_stats st ON st.academy_id = a.id
+    WHERE h.risk_level IS NOT NULL
+    AND a.is_deleted = 0
+"""
+AT_RISK_WINDOWS = ()
+
+# 점수가 아직 없거나(update_health_scores.py 최초 실행 전) 오래된 경우: academy_stats에서
+# 같은 기준(7일 이상 무활동, 무활동 일수로 수준 구분)으로 바로 계산 (건강도 컬럼은 NULL)
+AT_RISK_STATS_ROWS = f"""
+    SELECT
+        r.id, r.academy_name, r.owner_name, r.phone,
+        r.student_count, r.report_count, r.last_activity, r.inactive_days,
+        CASE
+            WHEN r.inactive_days >= {RISK_LEVEL_MIN_DAYS['critical']} THEN 'critical'
+            WHEN r.inactive_days >= {RISK_LEVEL_MIN_DAYS['warning']} THEN 'warning'
+            ELSE 'caution'
+        END as risk_level,
+        NULL as health_score,
+        NULL as health_status,
+        NULL as score_change,
+        r.signup_date
+    FROM (
+        SELECT
+            a.id,
+            a.name as academy_name,
+            a.owner_name,
+            a.phone,
+            COALESCE(st.student_count, 0) as student_count,
+            COALESCE(st.report_count, 0) as report_count,
+            st.last_activity_at as last_activity,
+            DATEDIFF(%s, COALESCE(st.last_activity_at, a.created_at)) as inactive_days,
+            a.created_at as signup_date
+        FROM academies a
+        LEFT JOIN academy_stats st ON st.academy_id = a.id
+        WHERE a.is_deleted = 0
+        AND (st.last_activity_at IS NULL OR st.last_activity_at < %s)
+    ) r
+"""
+AT_RISK_STATS_WINDOWS = ('now', 'week_ago')
+
+ACTIVE_ROWS = f"""
+    SELECT
+        a.id,
+        a.name as academy_name,
+        a.owner_name,
+        a.phone,
+        st.student_count,
+        {MONTHLY_REPORTS} as monthly_reports,
+        st.share_count as total_shares,
+        st.last_activity_at as last_activity,
+        a.created_at as signup_date
+    FROM academy_stats st
+    JOIN academies a ON a.id = st.academy_id
+    WHERE st.last_activity_at >= %s
+    AND a.is_deleted = 0
+"""
+ACTIVE_WINDOWS = ('month_start_date', 'week_ago')
+
+HEAVY_USER_ROWS = """
+    SELECT
+        a.id,
+        a.name as academy_name,
+        a.owner_name,
+        st.student_count,
+        st.monthly_reports,
+        st.share_count as total_shares,
+        a.created_at as signup_date
+    FROM academy_stats st
+    JOIN academies a ON a.id = st.academy_id
+    WHERE st.month_start = %s
+    AND st.monthly_reports > 0
+    AND a.is_deleted = 0
+"""
+HEAVY_USER_WINDOWS = ('month_start_date',)
+
+FUNNEL_ROWS = """
+    SELECT
+        a.id,
+        a.name as academy_name,
+        a.owner_name,
+        a.created_at as signup_date,
+        CASE WHEN st.student_count > 0 THEN 1 ELSE 0 END as has_students,
+        COALESCE(st.student_count, 0) as student_count,
+        CASE WHEN st.report_count > 0 THEN 1 ELSE 0 END as created_report,
+        COALESCE(st.report_count, 0) as report_count,
+        CASE WHEN st.share_count > 0 THEN 1 ELSE 0 END as shared_kakaotalk,
+        st.first_student_at as first_student_date,
+        st.first_report_at as first_report_date,
+        st.first_share_at as first_share_date
+    FROM academies a
+    LEFT JOIN academy_stats st ON st.academy_id = a.id
+    WHERE a.created_at >= %s
+    AND a.is_deleted = 0
+"""
+FUNNEL_WINDOWS = ('days_30_ago',)
+
+
+# =============================================================================
+# 목록 필터 / 파생 컬럼 (목록 API와 routes/admin/exports.py 공용)
+# =============================================================================
+def at_risk_rows(cursor, windows):
+    """
+    이탈 위험 목록 쿼리 선택 → (목록 쿼리, 기간 경계 이름)
+
+    배치는 매번 전체 학원 행을 같은 calculated_at으로 갱신하므로 아무 행 하나로
+    마지막 계산 시각을 확인합니다. 점수가 없거나 HEALTH_SCORE_MAX_AGE_MINUTES보다
+    오래됐으면 academy_stats 기준 쿼리를 사용합니다. 점수 테이블이 없으면(마이그레이션 014 전)
+    조회 실패도 같은 대체 경로로 처리합니다.
+    """
+    try:
+        cursor.execute("SELECT calculated_at FROM customer_health_scores LIMIT 1")
+        row = cursor.fetchone()
     except Exception as e:
-        print(f"[Tables API] DB connection failed: {e}")
-        return None
+        print(f"[Tables API] Health score lookup failed, using academy_stats: {e}")
+        return AT_RISK_STATS_ROWS, AT_RISK_STATS_WINDOWS
+
+    if row and row['calculated_at'] >= windows.now - timedelta(minutes=HEALTH_SCORE_MAX_AGE_MINUTES):
+        return AT_RISK_ROWS, AT_RISK_WINDOWS
+    return AT_RISK_STATS_ROWS, AT_RISK_STATS_WINDOWS
+
+
+def at_risk_filters():
+    """이탈 위험 학원 필터 인자 → (SQL 조건, 파라미터)"""
+    conditions, params = [], []
+    risk_level = _choice_arg('risk_level', RISK_LEVEL_MIN_DAYS)
+    if risk_level:
+        conditions.append("t.risk_level = %s")
+        params.append(risk_level)
+    min_inactive_days = _int_arg('min_inactive_days')
+    if min_inactive_days is not None:
+        _range_filter('t.inactive_days', (min_inactive_days, None), conditions, params)
+    return conditions, params
+
+
+def active_filters():
+    """활성 학원 필터 인자 → (SQL 조건, 파라미터)"""
+    conditions, params = [], []
+    plan = _choice_arg('recommended_plan', PLAN_REPORTS)
+    if plan:
+        _range_filter('t.monthly_reports', PLAN_REPORTS[plan], conditions, params)
+    return conditions, params
+
+
+def funnel_filters():
+    """온보딩 퍼널 필터 인자 → (SQL 조건, 파라미터)"""
+    conditions = []
+    status = _choice_arg('status', FUNNEL_STATUS)
+    if status:
+        conditions.append(FUNNEL_STATUS[status])
+    return conditions, []
+
+
+def heavy_user_filters():
+    """헤비유저 필터 인자 → (SQL 조건, 파라미터)"""
+    conditions, params = [], []
+    min_reports = max(_int_arg('min_reports') or 20, 20)
+    _range_filter('t.monthly_reports', (min_reports, None), conditions, params)
+    plan = _choice_arg('recommended_plan', PLAN_REPORTS)
+    if plan:
+        _range_filter('t.monthly_reports', PLAN_REPORTS[plan], conditions, params)
+    return conditions, params
+
+
+def annotate_active_row(row: dict) -> dict:
+    """헤비유저 여부(월 20건 이상) / 플랜 추천 추가"""
+    monthly_reports = row['monthly_reports'] or 0
+    row['is_heavy_user'] = monthly_reports >= 20
+    if monthly_reports >= 50:
+        row['recommended_plan'] = 'Pro'
+    elif monthly_reports >= 20:
+        row['recommended_plan'] = 'Standard'
+    else:
+        row['recommended_plan'] = 'Free'
+    return row
+
+
+def annotate_funnel_row(row: dict) -> dict:
+    """퍼널 현재 단계 / 상태 추가"""
+    if row['shared_kakaotalk']:
+        row['current_step'] = 4
+        row['status'] = 'completed'
+    elif row['created_report']:
+        row['current_step'] = 3
+        row['status'] = 'report_created'
+    elif row['has_students']:
+        row['current_step'] = 2
+        row['status'] = 'student_added'
+    else:
+        row['current_step'] = 1
+        row['status'] = 'signup_only'
+    return row
 
 
 # =============================================================================
@@ -41,51 +359,53 @@ def get_db_connection():
 # =============================================================================
 @tables_bp.route('/api/admin/tables/at-risk-academies', methods=['GET'])
 def get_at_risk_academies():
-    """이탈 위험 학원 목록 (7일 이상 무활동)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
-
+    """
+    이탈 위험 학원 목록 (7일 이상 무활동, 무활동 기간 긴 순)
+
+    위험 수준 / 무활동 일수 / 건강도 점수(health_score, health_status, score_change)는
+    매시간 갱신되는 customer_health_scores 기준입니다. 점수가 없거나 오래됐으면
+    academy_stats로 계산하며 이때 건강도 컬럼은 null입니다. (at_risk_rows)
+
+    Query:
+        risk_level: critical(21일+) / warning(14~20일) / caution(7~13일)
+        min_inactive_days: 최소 무활동 일수
+        limit, cursor: 페이지네이션
+    """
     try:
-        cursor = conn.cursor(dictionary=True)
+        limit, page_cursor = get_page_params()
+        conditions, params = at_risk_filters()
+        keyset, keyset_params = keyset_clause('t.inactive_days', page_cursor, descending=True)
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        return _cached_page('table:at-risk', lambda: _at_risk_page(limit, conditions, params))
+
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        print(f"[Tables API] At-risk academies error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+def _at_risk_page(limit: int, conditions: list, params: list) -> dict:
+    windows = get_time_windows()
+    with db_cursor() as cursor:
+        rows_sql, window_names = at_risk_rows(cursor, windows)
+        window_params = windows.values(*window_names)
+        cursor.execute(f"""
+            SELECT * FROM ({rows_sql}) t
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {order_clause('t.inactive_days', descending=True)}
+            LIMIT %s
+        """, window_params + params + [limit + 1])
+
+        results, next_cursor, has_more = build_page(cursor.fetchall(), limit, 'inactive_days')
 
-        cursor.execute("""
-            SELECT
-                a.id,
-                a.name as academy_name,
-                a.owner_name,
-                a.phone,
-                COUNT(DISTINCT s.id) as student_count,
-                COUNT(DISTINCT pr.id) as report_count,
-                MAX(al.created_at) as last_activity,
-                DATEDIFF(NOW(), COALESCE(MAX(al.created_at), a.created_at)) as inactive_days,
-                a.created_at as signup_date
-            FROM academies a
-            LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
-            LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
-            LEFT JOIN activity_logs al ON a.id = al.academy_id
-            WHERE a.is_deleted = 0
-            AND NOT EXISTS (
-                SELECT 1 FROM activity_logs al2
-                WHERE al2.academy_id = a.id
-                AND al2.created_at >= NOW() - INTERVAL 7 DAY
-            )
-            GROUP BY a.id
-            ORDER BY inactive_days DESC
-            LIMIT 50
-        """)
-
-        results = cursor.fetchall()
-
-        # 위험 수준 판정
         for row in results:
-            days = row['inactive_days'] or 0
-            if days >= 21:
-                row['risk_level'] = 'critical'
-            elif days >= 14:
-                row['risk_level'] = 'warning'
-            else:
-                row['risk_level'] = 'caution'
+            if row['health_score'] is not None:
+                row['health_score'] = float(row['health_score'])
+            if row['score_change'] is not None:
+                row['score_change'] = float(row['score_change'])
 
             # datetime 변환
             if row['last_activity']:
@@ -93,17 +413,7 @@ def get_at_risk_academies():
             if row['signup_date']:
                 row['signup_date'] = row['signup_date'].isoformat()
 
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'academies': results,
-            'total_count': len(results)
-        })
-
-    except Exception as e:
-        print(f"[Tables API] At-risk academies error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return _page_payload(results, next_cursor, has_more)
 
 
 # =============================================================================
@@ -111,56 +421,44 @@ def get_at_risk_academies():
 # =============================================================================
 @tables_bp.route('/api/admin/tables/active-academies', methods=['GET'])
 def get_active_academies():
-    """활성 학원 상세 목록"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+    """
+    활성 학원 상세 목록 (이번 달 리포트 많은 순)
 
+    Query:
+        recommended_plan: Pro(50건+) / Standard(20~49건) / Free(20건 미만)
+        limit, cursor: 페이지네이션
+    """
     try:
-        cursor = conn.cursor(dictionary=True)
+        limit, page_cursor = get_page_params()
+        conditions, params = active_filters()
+        keyset, keyset_params = keyset_clause('t.monthly_reports', page_cursor, descending=True)
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        return _cached_page('table:active', lambda: _active_page(limit, conditions, params))
 
-        cursor.execute("""
-            SELECT
-                a.id,
-                a.name as academy_name,
-                a.owner_name,
-                a.phone,
-                COUNT(DISTINCT s.id) as student_count,
-                COUNT(DISTINCT CASE WHEN pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01') THEN pr.id END) as monthly_reports,
-                COUNT(DISTINCT CASE WHEN al.action_type = 'share_kakaotalk' THEN al.id END) as total_shares,
-                MAX(al.created_at) as last_activity,
-                a.created_at as signup_date
-            FROM academies a
-            JOIN (
-                SELECT DISTINCT academy_id
-                FROM activity_logs
-                WHERE created_at >= NOW() - INTERVAL 7 DAY
-            ) active ON a.id = active.academy_id
-            LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
-            LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
-            LEFT JOIN activity_logs al ON a.id = al.academy_id
-            WHERE a.is_deleted = 0
-            GROUP BY a.id
-            ORDER BY monthly_reports DESC
-            LIMIT 50
-        """)
-
-        results = cursor.fetchall()
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        print(f"[Tables API] Active academies error: {e}")
+        return jsonify({'error': str(e)}), 500
 
-        # 헤비유저 및 플랜 추천 판정
-        for row in results:
-            monthly_reports = row['monthly_reports'] or 0
 
-            # 헤비유저 판정 (월 20건 이상)
-            row['is_heavy_user'] = monthly_reports >= 20
+def _active_page(limit: int, conditions: list, params: list) -> dict:
+    window_params = get_time_windows().values(*ACTIVE_WINDOWS)
+    with db_cursor() as cursor:
+        cursor.execute(f"""
+            SELECT * FROM ({ACTIVE_ROWS}) t
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {order_clause('t.monthly_reports', descending=True)}
+            LIMIT %s
+        """, window_params + params + [limit + 1])
 
-            # 플랜 추천
-            if monthly_reports >= 50:
-                row['recommended_plan'] = 'Pro'
-            elif monthly_reports >= 20:
-                row['recommended_plan'] = 'Standard'
-            else:
-                row['recommended_plan'] = 'Free'
+        results, next_cursor, has_more = build_page(cursor.fetchall(), limit, 'monthly_reports')
+
+        # 헤비유저 및 플랜 추천 판정
+        for row in results:
+            annotate_active_row(row)
 
             # datetime 변환
             if row['last_activity']:
@@ -168,17 +466,7 @@ def get_active_academies():
             if row['signup_date']:
                 row['signup_date'] = row['signup_date'].isoformat()
 
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'academies': results,
-            'total_count': len(results)
-        })
-
-    except Exception as e:
-        print(f"[Tables API] Active academies error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return _page_payload(results, next_cursor, has_more)
 
 
 # =============================================================================
@@ -186,89 +474,82 @@ def get_active_academies():
 # =============================================================================
 @tables_bp.route('/api/admin/tables/onboarding-funnel', methods=['GET'])
 def get_onboarding_funnel_table():
-    """온보딩 퍼널 분석 테이블 (최근 30일 신규 학원)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
+    """
+    온보딩 퍼널 분석 테이블 (최근 30일 신규 학원, 최근 가입 순)
+
+    funnel_summary / conversion_rates는 페이지와 무관하게 30일 전체 기준입니다.
 
+    Query:
+        status: signup_only / student_added / report_created / completed
+        limit, cursor: 페이지네이션
+    """
     try:
-        cursor = conn.cursor(dictionary=True)
+        limit, page_cursor = get_page_params()
+        conditions, params = funnel_filters()
+        keyset, keyset_params = keyset_clause('t.signup_date', page_cursor, descending=True)
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        return _cached_page('table:onboarding', lambda: _funnel_page(limit, conditions, params))
+
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        print(f"[Tables API] Onboarding funnel error: {e}")
+        return jsonify({'error': str(e)}), 500
 
-        # 신규 학원별 퍼널 진행 상황
-        cursor.execute("""
+
+def _funnel_page(limit: int, conditions: list, params: list) -> dict:
+    window_params = get_time_windows().values(*FUNNEL_WINDOWS)
+    with db_cursor() as cursor:
+        # 신규 학원별 퍼널 진행 상황 (페이지)
+        cursor.execute(f"""
+            SELECT * FROM ({FUNNEL_ROWS}) t
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {order_clause('t.signup_date', descending=True)}
+            LIMIT %s
+        """, window_params + params + [limit + 1])
+
+        results, next_cursor, has_more = build_page(cursor.fetchall(), limit, 'signup_date')
+
+        # 퍼널 요약 통계 (30일 전체)
+        cursor.execute(f"""
             SELECT
-                a.id,
-                a.name as academy_name,
-                a.owner_name,
-                a.created_at as signup_date,
-                CASE WHEN s.id IS NOT NULL THEN 1 ELSE 0 END as has_students,
-                COUNT(DISTINCT s.id) as student_count,
-                CASE WHEN pr.id IS NOT NULL THEN 1 ELSE 0 END as created_report,
-                COUNT(DISTINCT pr.id) as report_count,
-                CASE WHEN al.id IS NOT NULL THEN 1 ELSE 0 END as shared_kakaotalk,
-                MIN(s.created_at) as first_student_date,
-                MIN(pr.created_at) as first_report_date,
-                MIN(CASE WHEN al.action_type = 'share_kakaotalk' THEN al.created_at END) as first_share_date
-            FROM academies a
-            LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
-            LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
-            LEFT JOIN activity_logs al ON a.id = al.academy_id AND al.action_type = 'share_kakaotalk'
-            WHERE a.created_at >= NOW() - INTERVAL 30 DAY
-            AND a.is_deleted = 0
-            GROUP BY a.id
-            ORDER BY a.created_at DESC
-        """)
-
-        results = cursor.fetchall()
+                COUNT(*) as signup,
+                COALESCE(SUM(t.has_students), 0) as student_added,
+                COALESCE(SUM(t.created_report), 0) as report_created,
+                COALESCE(SUM(t.shared_kakaotalk), 0) as shared
+            FROM ({FUNNEL_ROWS}) t
+        """, window_params)
+        summary = cursor.fetchone()
 
         # 퍼널 단계 판정
         for row in results:
-            # 현재 단계 결정
-            if row['shared_kakaotalk']:
-                row['current_step'] = 4
-                row['status'] = 'completed'
-            elif row['created_report']:
-                row['current_step'] = 3
-                row['status'] = 'report_created'
-            elif row['has_students']:
-                row['current_step'] = 2
-                row['status'] = 'student_added'
-            else:
-                row['current_step'] = 1
-                row['status'] = 'signup_only'
+            annotate_funnel_row(row)
 
             # datetime 변환
             for field in ['signup_date', 'first_student_date', 'first_report_date', 'first_share_date']:
                 if row[field]:
                     row[field] = row[field].isoformat()
 
-        cursor.close()
-        conn.close()
-
-        # 퍼널 요약 통계
-        total = len(results)
-        step_counts = {
-            'signup': total,
-            'student_added': sum(1 for r in results if r['has_students']),
-            'report_created': sum(1 for r in results if r['created_report']),
-            'shared': sum(1 for r in results if r['shared_kakaotalk'])
+    total = int(summary['signup'] or 0)
+    step_counts = {
+        'signup': total,
+        'student_added': int(summary['student_added']),
+        'report_created': int(summary['report_created']),
+        'shared': int(summary['shared'])
+    }
+
+    return _page_payload(
+        results, next_cursor, has_more,
+        funnel_summary=step_counts,
+        conversion_rates={
+            'signup_to_student': round((step_counts['student_added'] / total * 100), 1) if total > 0 else 0,
+            'student_to_report': round((step_counts['report_created'] / step_counts['student_added'] * 100), 1) if step_counts['student_added'] > 0 else 0,
+            'report_to_share': round((step_counts['shared'] / step_counts['report_created'] * 100), 1) if step_counts['report_created'] > 0 else 0,
+            'overall': round((step_counts['shared'] / total * 100), 1) if total > 0 else 0
         }
-
-        return jsonify({
-            'academies': results,
-            'total_count': total,
-            'funnel_summary': step_counts,
-            'conversion_rates': {
-                'signup_to_student': round((step_counts['student_added'] / total * 100), 1) if total > 0 else 0,
-                'student_to_report': round((step_counts['report_created'] / step_counts['student_added'] * 100), 1) if step_counts['student_added'] > 0 else 0,
-                'report_to_share': round((step_counts['shared'] / step_counts['report_created'] * 100), 1) if step_counts['report_created'] > 0 else 0,
-                'overall': round((step_counts['shared'] / total * 100), 1) if total > 0 else 0
-            }
-        })
-
-    except Exception as e:
-        print(f"[Tables API] Onboarding funnel error: {e}")
-        return jsonify({'error': str(e)}), 500
+    )
 
 
 # =============================================================================
@@ -276,52 +557,47 @@ def get_onboarding_funnel_table():
 # =============================================================================
 @tables_bp.route('/api/admin/tables/heavy-users', methods=['GET'])
 def get_heavy_users():
-    """헤비유저 학원 목록 (월 20건 이상)"""
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'error': 'DB connection failed'}), 500
-
+    """
+    헤비유저 학원 목록 (월 20건 이상, 이번 달 리포트 많은 순)
+
+    Query:
+        min_reports: 최소 이번 달 리포트 수 (기본/최소 20)
+        recommended_plan: Pro(50건+) / Standard(20~49건)
+        limit, cursor: 페이지네이션
+    """
     try:
-        cursor = conn.cursor(dictionary=True)
+        limit, page_cursor = get_page_params()
+        conditions, params = heavy_user_filters()
+        keyset, keyset_params = keyset_clause('t.monthly_reports', page_cursor, descending=True)
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        return _cached_page('table:heavy-users', lambda: _heavy_user_page(limit, conditions, params))
 
-        cursor.execute("""
-            SELECT
-                a.id,
-                a.name as academy_name,
-                a.owner_name,
-                COUNT(DISTINCT s.id) as student_count,
-                COUNT(DISTINCT pr.id) as monthly_reports,
-                COUNT(DISTINCT CASE WHEN al.action_type = 'share_kakaotalk' THEN al.id END) as total_shares,
-                a.created_at as signup_date
-            FROM academies a
-            JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
-            JOIN progress_records pr ON s.id = pr.student_id
-                AND pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
-                AND pr.is_deleted = 0
-            LEFT JOIN activity_logs al ON a.id = al.academy_id
-            WHERE a.is_deleted = 0
-            GROUP BY a.id
-            HAVING COUNT(DISTINCT pr.id) >= 20
-            ORDER BY monthly_reports DESC
-        """)
-
-        results = cursor.fetchall()
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        print(f"[Tables API] Heavy users error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+def _heavy_user_page(limit: int, conditions: list, params: list) -> dict:
+    window_params = get_time_windows().values(*HEAVY_USER_WINDOWS)
+    with db_cursor() as cursor:
+        cursor.execute(f"""
+            SELECT * FROM ({HEAVY_USER_ROWS}) t
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {order_clause('t.monthly_reports', descending=True)}
+            LIMIT %s
+        """, window_params + params + [limit + 1])
+
+        results, next_cursor, has_more = build_page(cursor.fetchall(), limit, 'monthly_reports')
 
         for row in results:
             if row['signup_date']:
                 row['signup_date'] = row['signup_date'].isoformat()
 
-        cursor.close()
-        conn.close()
-
-        return jsonify({
-            'academies': results,
-            'total_count': len(results)
-        })
-
-    except Exception as e:
-        print(f"[Tables API] Heavy users error: {e}")
-        return jsonify({'error': str(e)}), 500
+    return _page_payload(results, next_cursor, has_more)
 
 
 # Blueprint 등록용 함수
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+텔레메트리 테이블 보관 기간 정리 스크립트
+
+보관 기간이 지난 system_health_logs / api_health_checks / api_usage_logs /
+report_views 행을 압축 CSV로 내보낸 뒤 작은 배치로 삭제합니다. (utils/retention.py)
+
+실행 방법:
+    python3 scripts/apply_retention.py
+    python3 scripts/apply_retention.py --table system_health_logs
+    python3 scripts/apply_retention.py --dry-run
+
+Crontab 설정:
+    45 3 * * * /usr/bin/python3 /path/to/backend/scripts/apply_retention.py >> /var/log/tutornote/apply_retention.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.retention import RETENTION_POLICIES, run_retention
+
+
+def format_bytes(size: int) -> str:
+    """바이트 → 사람이 읽기 쉬운 단위"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f}{unit}" if unit != 'B' else f"{size}B"
+        size /= 1024
+
+
+def main():
+    """보관 기간 정리 실행"""
+    parser = argparse.ArgumentParser(description='텔레메트리 테이블 보관 기간 정리')
+    parser.add_argument('--table', action='append', choices=sorted(RETENTION_POLICIES),
+                        help='대상 테이블 (여러 번 지정 가능, 기본: 전체)')
+    parser.add_argument('--dry-run', action='store_true', help='삭제 없이 대상 행 수만 출력')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[{timestamp}] 보관 기간 정리 시작{' (dry-run)' if args.dry_run else ''}...")
+
+    start = time.monotonic()
+    failed = False
+    total_rows = total_reclaimed = 0
+    for table, result in run_retention(args.table, dry_run=args.dry_run).items():
+        if 'error' in result:
+            print(f"  ❌ {table}: {result['error']}")
+            failed = True
+            continue
+
+        total_rows += result['rows_deleted']
+        total_reclaimed += result['bytes_reclaimed']
+        line = (f"  {table}: {result['cutoff']:%Y-%m-%d %H:%M} 이전 {result['rows_deleted']}행"
+                f" ({result['batches']}개 배치), 회수 추정 {format_bytes(result['bytes_reclaimed'])}")
+        if result['archive_path']:
+            line += f", 보관 {result['archive_path']} ({format_bytes(result['archive_bytes'])})"
+        print(line)
+
+    print(f"  합계: {total_rows}행, 회수 추정 {format_bytes(total_reclaimed)} "
+          f"({time.monotonic() - start:.1f}초)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
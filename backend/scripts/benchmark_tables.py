@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+대시보드 학원 목록 쿼리 벤치마크
+
+별도 스키마(기본 tutornote_bench)에 합성 데이터를 만들고,
+students × progress_records × activity_logs를 한꺼번에 JOIN한 뒤
+COUNT(DISTINCT)로 되돌리던 기존 쿼리와 routes/admin/tables.py의
+academy_stats 기반 쿼리의 실행 시간을 비교합니다. 두 쿼리의 결과가
+같은지도 함께 확인합니다. academy_stats와 customer_health_scores(at-risk)는
+데이터 생성 후 보정/점수 배치(utils/academy_stats.py, utils/customer_health.py)로
+채우며, 그 소요 시간도 함께 출력합니다. (점수 배치에 numpy 필요)
+
+기존 쿼리는 학원마다 (리포트 수 × 활동 수)만큼 행이 불어나므로
+데이터가 커지면 급격히 느려집니다. --legacy-timeout을 넘기면 중단하고 timeout으로 표시합니다.
+
+실행 방법:
+    python3 scripts/benchmark_tables.py
+    python3 scripts/benchmark_tables.py --academies 50 --reports 3000 --activity 10000
+    python3 scripts/benchmark_tables.py --reuse        # 이전에 만든 데이터로 다시 측정
+    python3 scripts/benchmark_tables.py --drop         # 측정 후 스키마 삭제
+
+접속 정보는 DB_HOST / DB_USER / DB_PASSWORD 환경 변수를 사용합니다 (스키마 생성 권한 필요).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import mysql.connector
+
+from routes.admin.tables import (
+    ACTIVE_ROWS, ACTIVE_WINDOWS, AT_RISK_ROWS, AT_RISK_WINDOWS,
+    FUNNEL_ROWS, FUNNEL_WINDOWS, HEAVY_USER_ROWS, HEAVY_USER_WINDOWS,
+)
+from utils.academy_stats import reconcile_range
+from utils.customer_health import score_academies
+from utils.time_windows import get_time_windows
+
+MIGRATIONS = [
+    os.path.join(PROJECT_ROOT, 'migrations', '005_create_academy_stats.sql'),
+    os.path.join(PROJECT_ROOT, 'migrations', '014_create_customer_health_scores.sql'),
+]
+
+
+SCHEMA = """
+CREATE TABLE academies (
+  id INT PRIMARY KEY AUTO_INCREMENT,
+  name VARCHAR(100) NOT NULL,
+  owner_name VARCHAR(50),
+  phone VARCHAR(20),
+  is_deleted TINYINT(1) DEFAULT 0,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB;
+
+CREATE TABLE students (
+  id INT PRIMARY KEY AUTO_INCREMENT,
+  academy_id INT NOT NULL,
+  is_deleted TINYINT(1) DEFAULT 0,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  INDEX idx_academy_id (academy_id)
+) ENGINE=InnoDB;
+
+CREATE TABLE progress_records (
+  id INT PRIMARY KEY AUTO_INCREMENT,
+  student_id INT NOT NULL,
+  is_deleted TINYINT(1) DEFAULT 0,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  INDEX idx_student_id (student_id),
+  INDEX idx_created_at (created_at)
+) ENGINE=InnoDB;
+
+CREATE TABLE activity_logs (
+  id BIGINT PRIMARY KEY AUTO_INCREMENT,
+  academy_id INT NOT NULL,
+  action_type VARCHAR(50) NOT NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  INDEX idx_academy_id (academy_id),
+  INDEX idx_created_at (created_at),
+  INDEX idx_action_type (action_type),
+  INDEX idx_academy_created (academy_id, created_at)
+) ENGINE=InnoDB
+"""
+
+# 선집계로 바꾸기 전 쿼리 (비교 기준)
+LEGACY_QUERIES = {
+    'at-risk': """
+        SELECT
+            a.id,
+            COUNT(DISTINCT s.id) as student_count,
+            COUNT(DISTINCT pr.id) as report_count,
+            MAX(al.created_at) as last_activity,
+            DATEDIFF(NOW(), COALESCE(MAX(al.created_at), a.created_at)) as inactive_days
+        FROM academies a
+        LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
+        LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
+        LEFT JOIN activity_logs al ON a.id = al.academy_id
+        WHERE a.is_deleted = 0
+        AND NOT EXISTS (
+            SELECT 1 FROM activity_logs al2
+            WHERE al2.academy_id = a.id
+            AND al2.created_at >= NOW() - INTERVAL 7 DAY
+        )
+        GROUP BY a.id
+    """,
+    'active': """
+        SELECT
+            a.id,
+            COUNT(DISTINCT s.id) as student_count,
+            COUNT(DISTINCT CASE WHEN pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01') THEN pr.id END) as monthly_reports,
+            COUNT(DISTINCT CASE WHEN al.action_type = 'share_kakaotalk' THEN al.id END) as total_shares,
+            MAX(al.created_at) as last_activity
+        FROM academies a
+        JOIN (
+            SELECT DISTINCT academy_id
+            FROM activity_logs
+            WHERE created_at >= NOW() - INTERVAL 7 DAY
+        ) active ON a.id = active.academy_id
+        LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
+        LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
+        LEFT JOIN activity_logs al ON a.id = al.academy_id
+        WHERE a.is_deleted = 0
+        GROUP BY a.id
+    """,
+    'onboarding': """
+        SELECT
+            a.id,
+            COUNT(DISTINCT s.id) as student_count,
+            COUNT(DISTINCT pr.id) as report_count,
+            MIN(s.created_at) as first_student_date,
+            MIN(pr.created_at) as first_report_date,
+            MIN(CASE WHEN al.action_type = 'share_kakaotalk' THEN al.created_at END) as first_share_date
+        FROM academies a
+        LEFT JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
+        LEFT JOIN progress_records pr ON s.id = pr.student_id AND pr.is_deleted = 0
+        LEFT JOIN activity_logs al ON a.id = al.academy_id AND al.action_type = 'share_kakaotalk'
+        WHERE a.created_at >= NOW() - INTERVAL 30 DAY
+        AND a.is_deleted = 0
+        GROUP BY a.id
+    """,
+    'heavy-users': """
+        SELECT
+            a.id,
+            COUNT(DISTINCT s.id) as student_count,
+            COUNT(DISTINCT pr.id) as monthly_reports,
+            COUNT(DISTINCT CASE WHEN al.action_type = 'share_kakaotalk' THEN al.id END) as total_shares
+        FROM academies a
+        JOIN students s ON a.id = s.academy_id AND s.is_deleted = 0
+        JOIN progress_records pr ON s.id = pr.student_id
+            AND pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
+            AND pr.is_deleted = 0
+        LEFT JOIN activity_logs al ON a.id = al.academy_id
+        WHERE a.is_deleted = 0
+        GROUP BY a.id
+    """,
+}
+
+# (쿼리, 기간 경계 파라미터 이름)
+CURRENT_QUERIES = {
+    'at-risk': (AT_RISK_ROWS, AT_RISK_WINDOWS),
+    'active': (ACTIVE_ROWS, ACTIVE_WINDOWS),
+    'onboarding': (FUNNEL_ROWS, FUNNEL_WINDOWS),
+    'heavy-users': (HEAVY_USER_ROWS, HEAVY_USER_WINDOWS),
+}
+
+# 결과 비교에 쓰는 컬럼 (두 쿼리에 공통)
+COMPARE_FIELDS = {
+    'at-risk': ('student_count', 'report_count', 'last_activity', 'inactive_days'),
+    'active': ('student_count', 'monthly_reports', 'total_shares', 'last_activity'),
+    'onboarding': ('student_count', 'report_count', 'first_student_date', 'first_report_date', 'first_share_date'),
+    'heavy-users': ('student_count', 'monthly_reports', 'total_shares'),
+}
+
+
+def connect(database=None):
+    """벤치마크용 연결 (앱 풀과 분리)"""
+    return mysql.connector.connect(
+        host=os.getenv('DB_HOST', 'localhost'),
+        user=os.getenv('DB_USER', 'root'),
+        password=os.getenv('DB_PASSWORD', ''),
+        database=database
+    )
+
+
+def insert_chunked(cursor, sql, rows, chunk=5000):
+    for i in range(0, len(rows), chunk):
+        cursor.executemany(sql, rows[i:i + chunk])
+
+
+def build_dataset(conn, args):
+    """
+    합성 데이터 생성
+
+    - 학원의 절반은 최근 7일 활동이 없음 (at-risk 대상)
+    - 학원의 1/4은 최근 30일 이내 가입 (onboarding 대상)
+    - 리포트/활동 시각은 최근 90일에 분포, 활동의 10%는 카카오톡 공유
+    """
+    rng = random.Random(args.seed)
+    now = datetime.now()
+    cursor = conn.cursor()
+
+    for statement in SCHEMA.split(';'):
+        if statement.strip():
+            cursor.execute(statement)
+
+    # academy_stats / customer_health_scores는 마이그레이션 정의를 그대로 사용
+    for path in MIGRATIONS:
+        with open(path, encoding='utf-8') as f:
+            for statement in f.read().split(';'):
+                body = '\n'.join(line for line in statement.splitlines() if not line.startswith('--')).strip()
+                if body.startswith('CREATE TABLE'):
+                    cursor.execute(body)
+
+    academies = []
+    for i in range(args.academies):
+        signup_days = rng.randint(1, 29) if i % 4 == 0 else rng.randint(31, 365)
+        academies.append((f"학원 {i + 1}", f"원장 {i + 1}", '010-0000-0000', now - timedelta(days=signup_days)))
+    insert_chunked(cursor, "INSERT INTO academies (name, owner_name, phone, created_at) VALUES (%s, %s, %s, %s)", academies)
+    conn.commit()
+
+    cursor.execute("SELECT id FROM academies ORDER BY id")
+    academy_ids = [row[0] for row in cursor.fetchall()]
+
+    def random_time(max_days, min_days=0):
+        return now - timedelta(days=rng.uniform(min_days, max_days))
+
+    for index, academy_id in enumerate(academy_ids):
+        inactive = index % 2 == 1
+
+        students = [(academy_id, 1 if rng.random() < 0.05 else 0, random_time(90)) for _ in range(args.students)]
+        insert_chunked(cursor, "INSERT INTO students (academy_id, is_deleted, created_at) VALUES (%s, %s, %s)", students)
+        cursor.execute("SELECT id FROM students WHERE academy_id = %s", (academy_id,))
+        student_ids = [row[0] for row in cursor.fetchall()]
+
+        reports = [
+            (rng.choice(student_ids), 1 if rng.random() < 0.02 else 0, random_time(90))
+            for _ in range(args.reports)
+        ]
+        insert_chunked(cursor, "INSERT INTO progress_records (student_id, is_deleted, created_at) VALUES (%s, %s, %s)", reports)
+
+        min_days = 8 if inactive else 0
+        activity = [
+            (academy_id, 'share_kakaotalk' if rng.random() < 0.1 else 'login', random_time(90, min_days))
+            for _ in range(args.activity)
+        ]
+        insert_chunked(cursor, "INSERT INTO activity_logs (academy_id, action_type, created_at) VALUES (%s, %s, %s)", activity)
+        conn.commit()
+
+        print(f"  학원 {index + 1}/{len(academy_ids)} 생성 완료", end='\r')
+
+    print()
+    cursor.execute("ANALYZE TABLE academies, students, progress_records, activity_logs")
+    cursor.fetchall()
+    cursor.close()
+
+
+def time_query(conn, sql, repeat, timeout_ms=0, params=None):
+    """
+    쿼리 실행 시간 측정
+
+    Returns:
+        tuple: (최소 실행 시간(초) 또는 None(timeout), {academy_id: row})
+    """
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute("SET SESSION max_execution_time = %s", (timeout_ms,))
+
+    best = None
+    rows = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            cursor.execute(sql, params)
+            fetched = cursor.fetchall()
+        except mysql.connector.Error as e:
+            print(f"    중단: {e.msg}")
+            cursor.close()
+            return None, {}
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        rows = {row['id']: row for row in fetched}
+
+    cursor.execute("SET SESSION max_execution_time = 0")
+    cursor.close()
+    return best, rows
+
+
+def mismatches(name, legacy_rows, current_rows):
+    """두 결과의 공통 컬럼이 다른 학원 id 목록"""
+    if set(legacy_rows) != set(current_rows):
+        return sorted(set(legacy_rows) ^ set(current_rows))
+
+    fields = COMPARE_FIELDS[name]
+    return [
+        academy_id for academy_id, row in legacy_rows.items()
+        if any(row[f] != current_rows[academy_id][f] for f in fields)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='학원 목록 쿼리 벤치마크')
+    parser.add_argument('--schema', default='tutornote_bench', help='벤치마크 스키마 이름')
+    parser.add_argument('--academies', type=int, default=20, help='학원 수')
+    parser.add_argument('--students', type=int, default=50, help='학원당 학생 수')
+    parser.add_argument('--reports', type=int, default=2000, help='학원당 리포트 수')
+    parser.add_argument('--activity', type=int, default=5000, help='학원당 활동 로그 수')
+    parser.add_argument('--repeat', type=int, default=3, help='쿼리당 반복 횟수 (최소값 사용)')
+    parser.add_argument('--legacy-timeout', type=int, default=120, help='기존 쿼리 최대 실행 시간(초)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--reuse', action='store_true', help='기존 스키마의 데이터를 그대로 사용')
+    parser.add_argument('--drop', action='store_true', help='측정 후 스키마 삭제')
+    args = parser.parse_args()
+
+    conn = connect()
+    cursor = conn.cursor()
+    if not args.reuse:
+        print(f"합성 데이터 생성: 학원 {args.academies}개 × (학생 {args.students}, "
+              f"리포트 {args.reports}, 활동 {args.activity})")
+        cursor.execute(f"DROP DATABASE IF EXISTS `{args.schema}`")
+        cursor.execute(f"CREATE DATABASE `{args.schema}`")
+    cursor.execute(f"USE `{args.schema}`")
+    cursor.close()
+
+    if not args.reuse:
+        build_dataset(conn, args)
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM academies")
+    max_id = cursor.fetchone()[0]
+    start = time.perf_counter()
+    reconcile_range(cursor, 0, max_id)
+    conn.commit()
+    cursor.close()
+    print(f"academy_stats 보정: {time.perf_counter() - start:.3f}초 (학원 {max_id}개, cron 주기 작업)")
+
+    cursor = conn.cursor(dictionary=True)
+    start = time.perf_counter()
+    score_academies(cursor)
+    conn.commit()
+    cursor.close()
+    print(f"건강도 점수 계산: {time.perf_counter() - start:.3f}초 (at-risk 목록, cron 주기 작업)")
+
+    print()
+    print(f"{'쿼리':<12} {'기존(초)':>10} {'stats(초)':>10} {'배수':>8}  결과")
+    print('-' * 56)
+
+    failed = False
+    for name, legacy_sql in LEGACY_QUERIES.items():
+        legacy_time, legacy_rows = time_query(conn, legacy_sql, args.repeat, args.legacy_timeout * 1000)
+        current_sql, window_names = CURRENT_QUERIES[name]
+        current_time, current_rows = time_query(conn, current_sql, args.repeat,
+                                                params=get_time_windows().values(*window_names))
+
+        if legacy_time is None:
+            legacy_label, ratio, check = 'timeout', '-', '비교 생략'
+        else:
+            diff = mismatches(name, legacy_rows, current_rows)
+            failed = failed or bool(diff)
+            legacy_label = f"{legacy_time:.3f}"
+            ratio = f"{legacy_time / current_time:.1f}x" if current_time else '-'
+            check = f"{len(current_rows)}행 일치" if not diff else f"불일치 {diff[:5]}"
+
+        print(f"{name:<12} {legacy_label:>10} {current_time:>10.3f} {ratio:>8}  {check}")
+
+    if args.drop:
+        cursor = conn.cursor()
+        cursor.execute(f"DROP DATABASE `{args.schema}`")
+        cursor.close()
+    conn.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,14 +5,31 @@
 5분마다 실행되어 시스템 상태를 수집하고 Critical Alert를 체크합니다.
 
 실행 방법:
-    python3 scripts/health_check.py
+    python3 scripts/health_check.py                 # 1회 실행 (cron)
+    python3 scripts/health_check.py --daemon        # 상주 실행 (HEALTH_SAMPLE_INTERVAL초마다 샘플링)
+    python3 scripts/health_check.py --daemon --interval 5
 
 Crontab 설정:
     */5 * * * * /usr/bin/python3 /path/to/backend/scripts/health_check.py >> /var/log/tutornote/health_check.log 2>&1
+
+데몬 모드 (utils/health_daemon.py):
+    - 1초 샘플은 메모리 링 버퍼에만 보관, DB에는 1분/1시간 집계만 기록 (system_health_aggregates)
+    - CPU 사용률은 tick 사이 구간으로 계산 (1초 블로킹 없음)
+    - 연결 수는 HEALTH_CONNECTIONS_INTERVAL초(기본 60)마다만 다시 셈
+    - Alert는 링 버퍼의 5분 평균으로 평가, 중복 방지 기록은 프로세스 메모리에 유지
+    - SIGTERM/SIGINT 시 진행 중인 버킷까지 기록하고 종료
+
+1회 실행 모드는 기존처럼 system_health_logs에 한 행을 쓰고, 같은 샘플을
+1분/1시간 집계에도 병합해 Alert/대시보드가 어느 모드에서든 같은 테이블을 읽습니다.
+
+연결 수는 /proc/net/snmp, /proc/net/tcp 커널 카운터로 전체 + 포트별(backend/mysql/nginx)
+ESTABLISHED 수를 셉니다 (utils/net_counters.py, /proc이 없으면 psutil).
 """
 
+import argparse
 import os
 import sys
+import time
 from datetime import datetime
 
 # 프로젝트 루트를 sys.path에 추가
@@ -26,23 +43,54 @@ except ImportError:
     sys.exit(1)
 
 from config.alert_thresholds import get_threshold, get_cooldown
-from utils.alert_deduplicator import alert_deduplicator
+from utils.alert_deduplicator import AlertDeduplicator, alert_deduplicator
+from utils.db_pool import db_cursor
+from utils.health_aggregates import (
+    RESOLUTIONS, SAMPLE_COLUMNS, UPSERT_SQL, bucket_start, build_aggregate_row, purge_expired
+)
+from utils.health_daemon import HEALTH_SAMPLE_INTERVAL, HealthDaemon
+from utils.metrics_ring import MetricsRingBuffer
+from utils.net_counters import CONNECTION_COLUMNS, PORT_COLUMNS, PORT_GROUPS, collect_connection_counts
+from utils.process_lifecycle import record_process_start
 from utils.telegram_notifier import telegram_notifier
 
 
-def get_db_connection():
-    """데이터베이스 연결"""
+HEALTH_CONNECTIONS_INTERVAL = float(os.getenv('HEALTH_CONNECTIONS_INTERVAL', '60'))
+
+
+def count_connections_psutil():
+    """
+    psutil로 연결 수 집계 (/proc을 읽을 수 없는 환경용, 다른 사용자 소켓은 root 필요)
+
+    Returns:
+        dict: CONNECTION_COLUMNS 키 (권한이 없으면 전체 0, 포트별 None)
+    """
+    port_to_column = {port: f"{name}_connections" for name, ports in PORT_GROUPS.items() for port in ports}
+    counts = {'active_connections': 0, **{column: 0 for column in PORT_COLUMNS}}
     try:
-        import mysql.connector
-        return mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', ''),
-            database=os.getenv('DB_NAME', 'tutornote')
-        )
-    except Exception as e:
-        print(f"[HealthCheck] DB connection failed: {e}")
-        return None
+        for conn in psutil.net_connections(kind='tcp'):
+            if conn.status != psutil.CONN_ESTABLISHED:
+                continue
+            counts['active_connections'] += 1
+            column = port_to_column.get(conn.laddr.port) if conn.laddr else None
+            if column is not None:
+                counts[column] += 1
+    except (PermissionError, psutil.AccessDenied):
+        return {'active_connections': 0, **{column: None for column in PORT_COLUMNS}}
+    return counts
+
+
+def count_connections():
+    """
+    전체 + 포트별 ESTABLISHED 연결 수 (커널 카운터 우선, 없으면 psutil)
+
+    Returns:
+        dict: {'active_connections', 'backend_connections', 'mysql_connections', 'nginx_connections'}
+    """
+    counts = collect_connection_counts()
+    if counts is not None:
+        return counts
+    return count_connections_psutil()
 
 
 def collect_system_metrics():
@@ -50,7 +98,8 @@ def collect_system_metrics():
     시스템 리소스 사용량 수집
 
     Returns:
-        tuple: (cpu_usage, ram_usage, disk_usage, active_connections)
+        tuple: (cpu_usage, ram_usage, disk_usage, connections)
+               connections는 count_connections()의 dict
     """
     # CPU 사용률 (1초 간격)
     cpu_usage = psutil.cpu_percent(interval=1)
@@ -63,43 +112,74 @@ def collect_system_metrics():
     disk = psutil.disk_usage('/')
     disk_usage = disk.percent
 
-    # 활성 연결 수 (네트워크)
-    try:
-        active_connections = len([
-            conn for conn in psutil.net_connections()
-            if conn.status == 'ESTABLISHED'
-        ])
-    except (PermissionError, psutil.AccessDenied):
-        active_connections = 0
+    # 활성 연결 수 (전체 + 포트별)
+    connections = count_connections()
+
+    return cpu_usage, ram_usage, disk_usage, connections
+
+
+class HealthSampler:
+    """
+    데몬용 비블로킹 샘플러
+
+    cpu_percent(interval=None)은 직전 호출 이후의 CPU 시간 변화로 계산하므로
+    생성 시 한 번 호출해 기준점을 잡고, 이후 tick마다 그 사이 구간의 사용률을 얻습니다.
+    연결 수는 connections_interval초마다만 다시 셉니다.
+    """
 
-    return cpu_usage, ram_usage, disk_usage, active_connections
+    def __init__(self, connections_interval=HEALTH_CONNECTIONS_INTERVAL):
+        self.connections_interval = connections_interval
+        self._connections = None
+        self._connections_at = None
+        psutil.cpu_percent(interval=None)
+
+    def sample(self):
+        """
+        Returns:
+            tuple: SAMPLE_COLUMNS 순서 (cpu, ram, disk, 전체 연결 수, 포트별 연결 수...)
+        """
+        now = time.monotonic()
+        if self._connections_at is None or now - self._connections_at >= self.connections_interval:
+            self._connections = count_connections()
+            self._connections_at = now
+
+        return (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            psutil.disk_usage('/').percent,
+        ) + tuple(self._connections[column] for column in CONNECTION_COLUMNS)
 
 
 def save_metrics(cpu, ram, disk, connections):
     """
-    수집된 메트릭을 DB에 저장
+    수집된 메트릭을 DB에 저장 (system_health_logs 한 행 + 1분/1시간 집계 병합)
 
     Args:
         cpu: CPU 사용률 (%)
         ram: RAM 사용률 (%)
         disk: Disk 사용률 (%)
-        connections: 활성 연결 수
+        connections: count_connections() dict (int면 전체 연결 수만 기록)
     """
-    conn = get_db_connection()
-    if not conn:
-        return False
+    if not isinstance(connections, dict):
+        connections = {'active_connections': connections}
+    values = (cpu, ram, disk) + tuple(connections.get(column) for column in CONNECTION_COLUMNS)
+
+    # 샘플 1개짜리 버킷 (병합은 UPSERT가 처리)
+    now = time.time()
+    ring = MetricsRingBuffer(SAMPLE_COLUMNS, capacity=1)
+    ring.append(now, values)
+    summary = ring.summarize(now)
+    aggregates = [build_aggregate_row(resolution, bucket_start(now, resolution), summary) for resolution in RESOLUTIONS]
 
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO system_health_logs
-            (cpu_usage, ram_usage, disk_usage, active_connections)
-            VALUES (%s, %s, %s, %s)
-        """, (cpu, ram, disk, connections))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with db_cursor(dictionary=False, commit=True) as cursor:
+            cursor.execute(f"""
+                INSERT INTO system_health_logs
+                (cpu_usage, ram_usage, disk_usage, {', '.join(CONNECTION_COLUMNS)})
+                VALUES (%s, %s, %s, {', '.join(['%s'] * len(CONNECTION_COLUMNS))})
+            """, values)
+            cursor.executemany(UPSERT_SQL, aggregates)
+            purge_expired(cursor)
         return True
 
     except Exception as e:
@@ -107,8 +187,9 @@ def save_metrics(cpu, ram, disk, connections):
         return False
 
 
-def check_and_alert_cpu(cpu_usage):
-    """CPU Alert 체크 및 텔레그램 알림"""
+def check_and_alert_cpu(cpu_usage, dedup=None):
+    """CPU Alert 체크 및 텔레그램 알림 (dedup: 기본 alert_deduplicator 싱글톤)"""
+    dedup = dedup or alert_deduplicator
     cpu_warning = get_threshold('system', 'cpu', 'warning')
     cpu_critical = get_threshold('system', 'cpu', 'critical')
 
@@ -116,7 +197,7 @@ def check_and_alert_cpu(cpu_usage):
         alert_key = f"cpu_critical_{int(cpu_usage)}"
         cooldown = get_cooldown('cpu_critical')
 
-        if alert_deduplicator.should_send_alert(alert_key, cooldown):
+        if dedup.should_send_alert(alert_key, cooldown):
             telegram_notifier.send_critical_alert({
                 'severity': 'critical',
                 'title': f'CPU 사용률 위험: {cpu_usage:.1f}%',
@@ -129,7 +210,7 @@ def check_and_alert_cpu(cpu_usage):
         alert_key = f"cpu_warning_{int(cpu_usage)}"
         cooldown = get_cooldown('cpu_warning')
 
-        if alert_deduplicator.should_send_alert(alert_key, cooldown):
+        if dedup.should_send_alert(alert_key, cooldown):
             telegram_notifier.send_critical_alert({
                 'severity': 'warning',
                 'title': f'CPU 사용률 주의: {cpu_usage:.1f}%',
@@ -141,8 +222,9 @@ def check_and_alert_cpu(cpu_usage):
     return None
 
 
-def check_and_alert_ram(ram_usage):
-    """RAM Alert 체크 및 텔레그램 알림"""
+def check_and_alert_ram(ram_usage, dedup=None):
+    """RAM Alert 체크 및 텔레그램 알림 (dedup: 기본 alert_deduplicator 싱글톤)"""
+    dedup = dedup or alert_deduplicator
     ram_warning = get_threshold('system', 'ram', 'warning')
     ram_critical = get_threshold('system', 'ram', 'critical')
 
@@ -150,7 +232,7 @@ def check_and_alert_ram(ram_usage):
         alert_key = f"ram_critical_{int(ram_usage)}"
         cooldown = get_cooldown('ram_critical')
 
-        if alert_deduplicator.should_send_alert(alert_key, cooldown):
+        if dedup.should_send_alert(alert_key, cooldown):
             telegram_notifier.send_critical_alert({
                 'severity': 'critical',
                 'title': f'RAM 사용률 위험: {ram_usage:.1f}%',
@@ -163,7 +245,7 @@ def check_and_alert_ram(ram_usage):
         alert_key = f"ram_warning_{int(ram_usage)}"
         cooldown = get_cooldown('ram_warning')
 
-        if alert_deduplicator.should_send_alert(alert_key, cooldown):
+        if dedup.should_send_alert(alert_key, cooldown):
             telegram_notifier.send_critical_alert({
                 'severity': 'warning',
                 'title': f'RAM 사용률 주의: {ram_usage:.1f}%',
@@ -175,8 +257,9 @@ def check_and_alert_ram(ram_usage):
     return None
 
 
-def check_and_alert_disk(disk_usage):
-    """Disk Alert 체크 및 텔레그램 알림"""
+def check_and_alert_disk(disk_usage, dedup=None):
+    """Disk Alert 체크 및 텔레그램 알림 (dedup: 기본 alert_deduplicator 싱글톤)"""
+    dedup = dedup or alert_deduplicator
     disk_warning = get_threshold('system', 'disk', 'warning')
     disk_critical = get_threshold('system', 'disk', 'critical')
 
@@ -184,7 +267,7 @@ def check_and_alert_disk(disk_usage):
         alert_key = f"disk_critical_{int(disk_usage)}"
         cooldown = get_cooldown('disk_critical')
 
-        if alert_deduplicator.should_send_alert(alert_key, cooldown):
+        if dedup.should_send_alert(alert_key, cooldown):
             telegram_notifier.send_critical_alert({
                 'severity': 'critical',
                 'title': f'디스크 공간 부족: {disk_usage:.1f}%',
@@ -197,7 +280,7 @@ def check_and_alert_disk(disk_usage):
         alert_key = f"disk_warning_{int(disk_usage)}"
         cooldown = get_cooldown('disk_warning')
 
-        if alert_deduplicator.should_send_alert(alert_key, cooldown):
+        if dedup.should_send_alert(alert_key, cooldown):
             telegram_notifier.send_critical_alert({
                 'severity': 'warning',
                 'title': f'디스크 공간 주의: {disk_usage:.1f}%',
@@ -209,6 +292,40 @@ def check_and_alert_disk(disk_usage):
     return None
 
 
+def format_connections(connections):
+    """로그용 연결 수 문자열 (예: "182 (backend 12, mysql 9, nginx 140)")"""
+    by_port = ', '.join(
+        f"{column[:-len('_connections')]} {connections[column]:.0f}"
+        for column in PORT_COLUMNS if connections.get(column) is not None
+    )
+    total = f"{connections['active_connections']:.0f}"
+    return f"{total} ({by_port})" if by_port else total
+
+
+def check_and_alert_all(cpu, ram, disk, dedup=None):
+    """
+    CPU/RAM/Disk Alert 체크
+
+    Returns:
+        list: 발송된 Alert 설명 (예: ["CPU critical"])
+    """
+    alerts = []
+
+    cpu_alert = check_and_alert_cpu(cpu, dedup)
+    if cpu_alert:
+        alerts.append(f"CPU {cpu_alert}")
+
+    ram_alert = check_and_alert_ram(ram, dedup)
+    if ram_alert:
+        alerts.append(f"RAM {ram_alert}")
+
+    disk_alert = check_and_alert_disk(disk, dedup)
+    if disk_alert:
+        alerts.append(f"Disk {disk_alert}")
+
+    return alerts
+
+
 def main():
     """메인 헬스체크 실행"""
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -216,7 +333,7 @@ def main():
 
     # 1. 시스템 메트릭 수집
     cpu, ram, disk, connections = collect_system_metrics()
-    print(f"  CPU: {cpu:.1f}%, RAM: {ram:.1f}%, Disk: {disk:.1f}%, Connections: {connections}")
+    print(f"  CPU: {cpu:.1f}%, RAM: {ram:.1f}%, Disk: {disk:.1f}%, Connections: {format_connections(connections)}")
 
     # 2. DB에 저장
     saved = save_metrics(cpu, ram, disk, connections)
@@ -226,19 +343,7 @@ def main():
         print(f"  ⚠️ 메트릭 저장 실패 (DB 연결 확인 필요)")
 
     # 3. Alert 체크 및 알림
-    alerts = []
-
-    cpu_alert = check_and_alert_cpu(cpu)
-    if cpu_alert:
-        alerts.append(f"CPU {cpu_alert}")
-
-    ram_alert = check_and_alert_ram(ram)
-    if ram_alert:
-        alerts.append(f"RAM {ram_alert}")
-
-    disk_alert = check_and_alert_disk(disk)
-    if disk_alert:
-        alerts.append(f"Disk {disk_alert}")
+    alerts = check_and_alert_all(cpu, ram, disk)
 
     if alerts:
         print(f"  🚨 Alert 발생: {', '.join(alerts)}")
@@ -253,5 +358,40 @@ def main():
     print(f"[{timestamp}] HealthCheck 완료\n")
 
 
+def run_daemon(interval=HEALTH_SAMPLE_INTERVAL):
+    """상주 모드 실행 (SIGTERM/SIGINT까지)"""
+    dedup = AlertDeduplicator()
+
+    def on_window(averages, samples):
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        cpu, ram, disk = averages['cpu_usage'], averages['ram_usage'], averages['disk_usage']
+        print(f"[{timestamp}] {samples} samples - CPU: {cpu:.1f}%, RAM: {ram:.1f}%, Disk: {disk:.1f}%, "
+              f"Connections: {format_connections(averages)}")
+
+        alerts = check_and_alert_all(cpu, ram, disk, dedup)
+        if alerts:
+            print(f"  🚨 Alert 발생: {', '.join(alerts)}")
+        dedup.clear_old_alerts(hours=24)
+
+    record_process_start('health_daemon')
+    sampler = HealthSampler()
+    daemon = HealthDaemon(sampler.sample, on_window=on_window, interval=interval)
+    daemon.install_signal_handlers()
+
+    print(f"[HealthDaemon] Started (pid {os.getpid()}, interval {interval:g}s)")
+    daemon.run()
+    print(f"[HealthDaemon] Stopped after {daemon.ticks} ticks ({daemon.errors} errors, "
+          f"{daemon.aggregates_written} aggregates), writer: {daemon.writer.stats()}")
+
+
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='시스템 헬스체크')
+    parser.add_argument('--daemon', action='store_true', help='상주 모드로 실행')
+    parser.add_argument('--interval', type=float, default=HEALTH_SAMPLE_INTERVAL,
+                        help=f'데몬 샘플링 주기 (초, 기본 {HEALTH_SAMPLE_INTERVAL:g})')
+    args = parser.parse_args()
+
+    if args.daemon:
+        run_daemon(args.interval)
+    else:
+        main()
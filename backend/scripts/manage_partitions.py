@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+월별 파티션 관리 스크립트
+
+activity_logs의 미래 파티션을 미리 만들고, 보관 기간이 지난 달의 파티션을
+보관 테이블로 옮기거나(archive) 삭제(drop)합니다. (utils/partition_manager.py)
+
+실행 방법:
+    python3 scripts/manage_partitions.py
+    python3 scripts/manage_partitions.py --mode drop
+    python3 scripts/manage_partitions.py --dry-run
+
+Crontab 설정:
+    15 3 * * * /usr/bin/python3 /path/to/backend/scripts/manage_partitions.py >> /var/log/tutornote/manage_partitions.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+from datetime import date, datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.db_pool import db_cursor
+from utils.partition_manager import (
+    PARTITION_FUTURE_MONTHS, PARTITION_RETENTION_MODE, PARTITIONED_TABLES, RETENTION_MODES,
+    list_partitions, partition_name, plan_partitions, run_maintenance
+)
+
+
+def main():
+    """파티션 관리 실행"""
+    parser = argparse.ArgumentParser(description='월별 파티션 관리')
+    parser.add_argument('--mode', choices=RETENTION_MODES, default=PARTITION_RETENTION_MODE,
+                        help='보관 기간이 지난 파티션 처리 방식')
+    parser.add_argument('--dry-run', action='store_true', help='변경 없이 계획만 출력')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[{timestamp}] 파티션 관리 시작 (mode={args.mode})...")
+
+    if args.dry_run:
+        with db_cursor() as cursor:
+            for table, retention_months in PARTITIONED_TABLES.items():
+                plan = plan_partitions(list_partitions(cursor, table), date.today(),
+                                       PARTITION_FUTURE_MONTHS, retention_months)
+                print(f"  {table}: 생성 {[partition_name(m) for m in plan['create']]}, "
+                      f"만료 {[partition_name(m) for m in plan['expire']]}")
+        return 0
+
+    failed = False
+    for table, result in run_maintenance(mode=args.mode).items():
+        if 'error' in result:
+            print(f"  ❌ {table}: {result['error']}")
+            failed = True
+            continue
+        print(f"  {table}: 생성 {result['created']}, 보관 {result['archived']}, 삭제 {result['dropped']}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
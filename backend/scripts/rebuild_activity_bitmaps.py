@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+일별 활성 학원 비트맵 재생성 스크립트
+
+daily_active_academies를 activity_logs 기준으로 하루씩 다시 만듭니다.
+증분 반영에서 빠진 활동(비트맵 갱신 실패, spool replay로 늦게 들어온 로그)을
+반영하고, 지표 조회가 비트맵을 사용할 수 있도록 지난 날짜를 재생성 완료로 표시합니다.
+(utils/activity_bitmaps.py)
+
+실행 방법:
+    python3 scripts/rebuild_activity_bitmaps.py                  # 어제 ~ 오늘 (ACTIVITY_BITMAP_REBUILD_DAYS)
+    python3 scripts/rebuild_activity_bitmaps.py --days 62        # 최초 적재 (전월 1일부터 덮도록)
+    python3 scripts/rebuild_activity_bitmaps.py --start 2025-01-01 --end 2025-01-31
+
+Crontab 설정:
+    40 * * * * /usr/bin/python3 /path/to/backend/scripts/rebuild_activity_bitmaps.py >> /var/log/tutornote/rebuild_activity_bitmaps.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.activity_bitmaps import ACTIVITY_BITMAP_REBUILD_DAYS, rebuild_range
+
+
+def parse_date(value: str) -> date:
+    """'YYYY-MM-DD' → date"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value} (expected YYYY-MM-DD)")
+
+
+def main():
+    """비트맵 재생성 실행"""
+    parser = argparse.ArgumentParser(description='일별 활성 학원 비트맵 재생성')
+    parser.add_argument('--days', type=int, default=ACTIVITY_BITMAP_REBUILD_DAYS,
+                        help=f'오늘 포함 최근 일수 (기본 {ACTIVITY_BITMAP_REBUILD_DAYS})')
+    parser.add_argument('--start', type=parse_date, help='시작일 (YYYY-MM-DD, 지정 시 --days 무시)')
+    parser.add_argument('--end', type=parse_date, help='마지막 날 (YYYY-MM-DD, 기본 오늘)')
+    args = parser.parse_args()
+
+    end = args.end or date.today()
+    start = args.start or end - timedelta(days=max(args.days, 1) - 1)
+    if start > end:
+        parser.error(f"--start {start} is after --end {end}")
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[{timestamp}] 활성 학원 비트맵 재생성 시작: {start} ~ {end}")
+
+    begin = time.monotonic()
+    try:
+        results = rebuild_range(start, end)
+    except Exception as e:
+        print(f"  ❌ 재생성 실패: {e}")
+        return 1
+
+    for day, count in results.items():
+        print(f"  {day}: 활성 학원 {count}개")
+    print(f"  {len(results)}일 재생성 완료 ({time.monotonic() - begin:.1f}초)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
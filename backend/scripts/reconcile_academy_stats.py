@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+학원별 통계 보정 스크립트
+
+academy_stats를 students / progress_records / activity_logs 원본 기준으로
+다시 집계해 덮어씁니다. 증분 반영에서 빠진 값(통계 upsert 실패, spool replay,
+다른 달 리포트 삭제 등)을 바로잡고, 이번 달 리포트 수의 월 경계를 맞춥니다.
+마이그레이션 직후 최초 적재에도 사용합니다.
+
+실행 방법:
+    python3 scripts/reconcile_academy_stats.py
+    python3 scripts/reconcile_academy_stats.py --batch-size 200
+
+Crontab 설정:
+    30 * * * * /usr/bin/python3 /path/to/backend/scripts/reconcile_academy_stats.py >> /var/log/tutornote/reconcile_academy_stats.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.academy_stats import reconcile_all
+
+
+def main():
+    """academy_stats 보정 실행"""
+    parser = argparse.ArgumentParser(description='학원별 통계 보정')
+    parser.add_argument('--batch-size', type=int, help='트랜잭션당 학원 id 범위')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[{timestamp}] academy_stats 보정 시작...")
+
+    start = time.monotonic()
+    try:
+        result = reconcile_all(args.batch_size)
+    except Exception as e:
+        print(f"  ❌ 보정 실패: {e}")
+        return 1
+
+    print(f"  학원 id 1~{result['max_academy_id']} 보정 완료 "
+          f"({result['batches']}개 배치, {time.monotonic() - start:.1f}초)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
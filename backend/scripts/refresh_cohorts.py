@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+가입 코호트 리텐션 갱신 스크립트
+
+cohort_retention을 일별 활성 학원 비트맵 기준으로 갱신합니다.
+(utils/cohort_retention.py, 일별 비트맵 재생성 이후에 실행)
+
+실행 방법:
+    python3 scripts/refresh_cohorts.py                       # 주/월 모두, 직전·현재 기간만
+    python3 scripts/refresh_cohorts.py --full                # 모든 코호트 × 기간 재계산
+    python3 scripts/refresh_cohorts.py --granularity week
+
+Crontab 설정:
+    50 * * * * /usr/bin/python3 /path/to/backend/scripts/refresh_cohorts.py >> /var/log/tutornote/refresh_cohorts.log 2>&1
+    10 4 * * * /usr/bin/python3 /path/to/backend/scripts/refresh_cohorts.py --full >> /var/log/tutornote/refresh_cohorts.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.cohort_retention import GRANULARITIES, refresh_cohorts
+
+
+def main():
+    """코호트 리텐션 갱신 실행"""
+    parser = argparse.ArgumentParser(description='가입 코호트 리텐션 갱신')
+    parser.add_argument('--granularity', action='append', choices=GRANULARITIES,
+                        help='코호트 단위 (여러 번 지정 가능, 기본: 전체)')
+    parser.add_argument('--full', action='store_true', help='모든 코호트 × 기간 재계산')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[{timestamp}] 코호트 리텐션 갱신 시작{' (전체)' if args.full else ''}...")
+
+    failed = False
+    for granularity in args.granularity or GRANULARITIES:
+        start = time.monotonic()
+        try:
+            result = refresh_cohorts(granularity, full=args.full)
+        except Exception as e:
+            print(f"  ❌ {granularity}: {e}")
+            failed = True
+            continue
+        print(f"  {granularity}: 코호트 {result['cohorts']}개 × 기간 {result['periods']}개 → "
+              f"{result['cells']}칸 ({time.monotonic() - start:.1f}초)")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+이벤트 spool 재적재 스크립트
+
+DB 장애 동안 로컬 spool에 보관된 activity_logs / api_usage_logs 이벤트를
+DB에 다시 적재합니다. event_key 기준 INSERT IGNORE라서 여러 번 실행해도 안전합니다.
+
+실행 방법:
+    python3 scripts/replay_spool.py
+    python3 scripts/replay_spool.py --status   # 대기 중인 세그먼트만 확인
+
+Crontab 설정:
+    */5 * * * * /usr/bin/python3 /path/to/backend/scripts/replay_spool.py >> /var/log/tutornote/replay_spool.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.event_spool import get_event_spool, replay_spool
+
+
+def main():
+    """spool 재적재 실행"""
+    parser = argparse.ArgumentParser(description='이벤트 spool 재적재')
+    parser.add_argument('--status', action='store_true', help='대기 중인 세그먼트만 출력')
+    args = parser.parse_args()
+
+    spool = get_event_spool()
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    if args.status:
+        stats = spool.stats()
+        print(f"[{timestamp}] Spool: {stats['pending_segments']}개 세그먼트, {stats['pending_bytes']} bytes 대기")
+        return 0
+
+    if not spool.sealed_segments():
+        return 0
+
+    print(f"[{timestamp}] Spool 재적재 시작...")
+    result = replay_spool(spool)
+    print(f"  세그먼트: {result['segments']}개, 행: {result['rows']}건 "
+          f"(신규 {result['inserted']}, 중복 {result['duplicates']}, 손상 {result['corrupt']})")
+
+    if result['failed']:
+        print("  ⚠️  DB 오류로 중단 - 남은 세그먼트는 다음 실행 때 재시도")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+지표 롤업 스크립트
+
+activity_logs / progress_records를 일별 롤업 테이블에 반영합니다.
+
+실행 방법:
+    python3 scripts/rollup_metrics.py                        # 증분 (워터마크 이후)
+    python3 scripts/rollup_metrics.py --backfill 2025-01     # 2025-01 ~ 이번 달 재집계
+    python3 scripts/rollup_metrics.py --backfill 2025-01 --until 2025-03  # 특정 구간 재집계
+    python3 scripts/rollup_metrics.py --refresh              # 지표 비교 구간(전월 1일 ~ 오늘) 재집계
+
+Crontab 설정:
+    */5 * * * * /usr/bin/python3 /path/to/backend/scripts/rollup_metrics.py >> /var/log/tutornote/rollup_metrics.log 2>&1
+    20 4 * * * /usr/bin/python3 /path/to/backend/scripts/rollup_metrics.py --refresh >> /var/log/tutornote/rollup_metrics.log 2>&1
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.metrics_rollup import backfill, parse_month, refresh_compared_window, run_incremental
+
+
+def main():
+    """롤업 실행"""
+    parser = argparse.ArgumentParser(description='지표 일별 롤업')
+    parser.add_argument('--backfill', metavar='YYYY-MM', help='이 월부터 재집계')
+    parser.add_argument('--until', metavar='YYYY-MM', help='재집계 마지막 월 (기본 이번 달)')
+    parser.add_argument('--refresh', action='store_true', help='지표 비교 구간(전월 1일 ~ 오늘) 재집계')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    if args.refresh:
+        print(f"[{timestamp}] Rollup 비교 구간 재집계 시작...")
+        results = refresh_compared_window()
+        for source, days in results.items():
+            print(f"  {source}: {days}일 재집계")
+        return 0
+
+    if args.backfill:
+        start = parse_month(args.backfill)
+        end = parse_month(args.until) if args.until else None
+        print(f"[{timestamp}] Rollup 백필 시작: {args.backfill} ~ {args.until or '이번 달'}")
+        results = backfill(start, end)
+        for source, days in results.items():
+            print(f"  {source}: {days}일 재집계")
+        return 0
+
+    print(f"[{timestamp}] Rollup 증분 실행...")
+    results = run_incremental()
+    for source, processed in results.items():
+        status = '실패' if processed < 0 else f"id {processed}개 범위 반영"
+        print(f"  {source}: {status}")
+
+    return 1 if any(v < 0 for v in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
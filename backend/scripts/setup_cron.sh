@@ -5,6 +5,10 @@
 # 사용법:
 #   chmod +x scripts/setup_cron.sh
 #   ./scripts/setup_cron.sh
+#   HEALTH_CHECK_MODE=daemon ./scripts/setup_cron.sh   # 헬스체크 상주 모드
+#
+# 상주 모드에서는 cron이 매분 flock -n으로 데몬을 띄우며, 이미 실행 중이면
+# 즉시 종료되므로 데몬이 죽었을 때만 다시 시작됩니다.
 # ============================================================
 
 set -e
@@ -40,20 +44,53 @@ ${PYTHON3_PATH} -c "import psutil" 2>/dev/null || {
     pip3 install psutil --break-system-packages 2>/dev/null || pip3 install psutil
 }
 
+# numpy 설치 확인 (고객 건강도 점수 배치 필수 - 없으면 update_health_scores.py가 매번 실패)
+${PYTHON3_PATH} -c "import numpy" 2>/dev/null || {
+    echo -e "${YELLOW}⚠️  numpy 설치 중...${NC}"
+    pip3 install numpy --break-system-packages 2>/dev/null || pip3 install numpy || true
+}
+if ! ${PYTHON3_PATH} -c "import numpy" 2>/dev/null; then
+    echo -e "${YELLOW}⚠️  numpy 설치 실패: pip3 install numpy 후 다시 실행하세요.${NC}"
+    exit 1
+fi
+
 # Crontab 엔트리 생성
-CRON_ENTRY="*/5 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/health_check.py >> ${LOG_DIR}/health_check.log 2>&1"
+if [ "${HEALTH_CHECK_MODE}" = "daemon" ]; then
+    CRON_ENTRY="* * * * * flock -n ${LOG_DIR}/health_check.lock ${PYTHON3_PATH} ${SCRIPT_DIR}/health_check.py --daemon >> ${LOG_DIR}/health_check.log 2>&1"
+    echo -e "${GREEN}✓ 헬스체크 상주 모드${NC}"
+else
+    CRON_ENTRY="*/5 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/health_check.py >> ${LOG_DIR}/health_check.log 2>&1"
+fi
+ROLLUP_CRON_ENTRY="*/5 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/rollup_metrics.py >> ${LOG_DIR}/rollup_metrics.log 2>&1"
+ROLLUP_REFRESH_CRON_ENTRY="20 4 * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/rollup_metrics.py --refresh >> ${LOG_DIR}/rollup_metrics.log 2>&1"
+REPLAY_CRON_ENTRY="*/5 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/replay_spool.py >> ${LOG_DIR}/replay_spool.log 2>&1"
+STATS_CRON_ENTRY="30 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/reconcile_academy_stats.py >> ${LOG_DIR}/reconcile_academy_stats.log 2>&1"
+PARTITION_CRON_ENTRY="15 3 * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/manage_partitions.py >> ${LOG_DIR}/manage_partitions.log 2>&1"
+RETENTION_CRON_ENTRY="45 3 * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/apply_retention.py >> ${LOG_DIR}/apply_retention.log 2>&1"
+BITMAP_CRON_ENTRY="40 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/rebuild_activity_bitmaps.py >> ${LOG_DIR}/rebuild_activity_bitmaps.log 2>&1"
+COHORT_CRON_ENTRY="50 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/refresh_cohorts.py >> ${LOG_DIR}/refresh_cohorts.log 2>&1"
+COHORT_FULL_CRON_ENTRY="10 4 * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/refresh_cohorts.py --full >> ${LOG_DIR}/refresh_cohorts.log 2>&1"
+HEALTH_SCORE_CRON_ENTRY="0 * * * * ${PYTHON3_PATH} ${SCRIPT_DIR}/update_health_scores.py >> ${LOG_DIR}/update_health_scores.log 2>&1"
 
 # 기존 Crontab에 추가 (중복 방지)
-(crontab -l 2>/dev/null | grep -v "health_check.py"; echo "${CRON_ENTRY}") | crontab -
+(crontab -l 2>/dev/null | grep -v "health_check.py" | grep -v "rollup_metrics.py" | grep -v "replay_spool.py" | grep -v "reconcile_academy_stats.py" | grep -v "manage_partitions.py" | grep -v "apply_retention.py" | grep -v "rebuild_activity_bitmaps.py" | grep -v "refresh_cohorts.py" | grep -v "update_health_scores.py"; echo "${CRON_ENTRY}"; echo "${ROLLUP_CRON_ENTRY}"; echo "${ROLLUP_REFRESH_CRON_ENTRY}"; echo "${REPLAY_CRON_ENTRY}"; echo "${STATS_CRON_ENTRY}"; echo "${PARTITION_CRON_ENTRY}"; echo "${RETENTION_CRON_ENTRY}"; echo "${BITMAP_CRON_ENTRY}"; echo "${COHORT_CRON_ENTRY}"; echo "${COHORT_FULL_CRON_ENTRY}"; echo "${HEALTH_SCORE_CRON_ENTRY}") | crontab -
 
 echo ""
 echo -e "${GREEN}✅ Crontab 설정 완료!${NC}"
 echo ""
 echo -e "${BLUE}📋 현재 Crontab:${NC}"
-crontab -l | grep health_check || echo "(health_check 관련 항목 없음)"
+crontab -l | grep -E "health_check|rollup_metrics|replay_spool|reconcile_academy_stats|manage_partitions|apply_retention|rebuild_activity_bitmaps|refresh_cohorts|update_health_scores" || echo "(health_check 관련 항목 없음)"
 echo ""
 echo -e "${BLUE}📁 로그 파일:${NC}"
 echo "   ${LOG_DIR}/health_check.log"
+echo "   ${LOG_DIR}/rollup_metrics.log"
+echo "   ${LOG_DIR}/replay_spool.log"
+echo "   ${LOG_DIR}/reconcile_academy_stats.log"
+echo "   ${LOG_DIR}/manage_partitions.log"
+echo "   ${LOG_DIR}/apply_retention.log"
+echo "   ${LOG_DIR}/rebuild_activity_bitmaps.log"
+echo "   ${LOG_DIR}/refresh_cohorts.log"
+echo "   ${LOG_DIR}/update_health_scores.log"
 echo ""
 echo -e "${BLUE}🔧 수동 실행 테스트:${NC}"
 echo "   ${PYTHON3_PATH} ${SCRIPT_DIR}/health_check.py"
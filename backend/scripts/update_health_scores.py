@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+고객 건강도 점수 갱신 스크립트
+
+전체 학원의 건강도 점수(활동성/참여도/성과/성장성)와 이탈 위험 수준을 한 번에
+계산해 customer_health_scores에 upsert합니다. (utils/customer_health.py)
+
+의존성:
+    numpy (필수, scripts/setup_cron.sh가 설치 확인)
+
+실행 방법:
+    python3 scripts/update_health_scores.py
+
+Crontab 설정:
+    0 * * * * /usr/bin/python3 /path/to/backend/scripts/update_health_scores.py >> /var/log/tutornote/update_health_scores.log 2>&1
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.customer_health import update_health_scores
+
+
+def main():
+    """건강도 점수 갱신 실행"""
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[{timestamp}] 고객 건강도 점수 갱신 시작...")
+
+    start = time.monotonic()
+    try:
+        result = update_health_scores()
+    except Exception as e:
+        print(f"  ❌ 갱신 실패: {e}")
+        return 1
+
+    statuses = ', '.join(f"{status} {count}" for status, count in sorted(result['status'].items()))
+    print(f"  학원 {result['academies']}개 ({statuses}), 이탈 위험 {result['at_risk']}개")
+    print(f"  완료 ({time.monotonic() - start:.1f}초)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""
+pytest 공통 설정
+
+기본 경로가 backend/logs/ 아래인 로컬 저장소(Alert 중복 방지 SQLite, 이벤트 spool,
+보관 파일)를 테스트 세션 임시 디렉토리로 돌려 소스 트리에 파일을 남기지 않습니다.
+각 모듈이 import 시점에 경로를 읽으므로 테스트 모듈보다 먼저 로드되는 여기서 설정합니다.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+
+_LOCAL_STATE_DIR = tempfile.mkdtemp(prefix='tutornote-tests-')
+atexit.register(shutil.rmtree, _LOCAL_STATE_DIR, True)
+
+os.environ['ALERT_DEDUP_SQLITE_PATH'] = os.path.join(_LOCAL_STATE_DIR, 'alert_dedup.sqlite3')
+os.environ['EVENT_SPOOL_DIR'] = os.path.join(_LOCAL_STATE_DIR, 'spool')
+os.environ['RETENTION_ARCHIVE_DIR'] = os.path.join(_LOCAL_STATE_DIR, 'archive')
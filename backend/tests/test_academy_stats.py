@@ -0,0 +1,146 @@
+"""
+학원별 통계(academy_stats) 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_academy_stats.py -v
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+from datetime import date, datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.academy_stats as academy_stats
+from utils.academy_stats import aggregate_activity
+
+
+def event(academy_id, action_type, created_at):
+    return {'academy_id': academy_id, 'action_type': action_type, 'created_at': created_at}
+
+
+class TestAggregateActivity:
+    """활동 로그 배치 → upsert 파라미터 테스트"""
+
+    def test_counts_deltas_per_academy(self):
+        """액션 타입별 카운터 증감을 학원 단위로 합산해야 함"""
+        params = aggregate_activity([
+            event(1, 'create_student', '2025-01-10 09:00:00'),
+            event(1, 'create_report', '2025-01-10 10:00:00'),
+            event(1, 'create_report', '2025-01-11 10:00:00'),
+            event(1, 'share_kakaotalk', '2025-01-11 11:00:00'),
+            event(1, 'delete_student', '2025-01-12 09:00:00'),
+            event(2, 'login', '2025-01-12 09:00:00'),
+        ])
+
+        assert params == [
+            (1, 0, 2, date(2025, 1, 1), 2, 1,
+             datetime(2025, 1, 10, 9), datetime(2025, 1, 10, 10), datetime(2025, 1, 11, 11),
+             datetime(2025, 1, 12, 9)),
+            (2, 0, 0, date(2025, 1, 1), 0, 0, None, None, None, datetime(2025, 1, 12, 9)),
+        ]
+
+    def test_splits_by_month(self):
+        """월이 바뀌는 배치는 (학원, 월)별로 나누고 월 오름차순이어야 함"""
+        params = aggregate_activity([
+            event(1, 'create_report', '2025-02-01 00:00:01'),
+            event(1, 'create_report', '2025-01-31 23:59:59'),
+        ])
+
+        assert [(p[0], p[3], p[4]) for p in params] == [
+            (1, date(2025, 1, 1), 1),
+            (1, date(2025, 2, 1), 1),
+        ]
+
+    def test_delete_report_does_not_touch_monthly(self):
+        """delete_report는 전체 리포트 수만 줄여야 함 (작성 월을 알 수 없음)"""
+        params = aggregate_activity([event(1, 'delete_report', '2025-01-10 10:00:00')])
+
+        assert params[0][2] == -1
+        assert params[0][4] == 0
+
+    def test_skips_rows_without_academy(self):
+        """academy_id가 없는 행은 무시해야 함"""
+        assert aggregate_activity([event(None, 'login', '2025-01-10 10:00:00')]) == []
+
+    def test_accepts_datetime_values(self):
+        """created_at이 datetime이어도 처리해야 함"""
+        params = aggregate_activity([event(1, 'login', datetime(2025, 3, 5, 8, 30))])
+        assert params[0][3] == date(2025, 3, 1)
+        assert params[0][9] == datetime(2025, 3, 5, 8, 30)
+
+
+class RecordingCursor:
+    def __init__(self, state):
+        self.state = state
+        self._result = None
+
+    def execute(self, sql, params=None):
+        if 'as max_id' in sql:
+            if self.state.get('fail'):
+                raise RuntimeError("db down")
+            self._result = {'max_id': self.state['max_id']}
+        else:
+            self.state['executed'].append(params)
+
+    def executemany(self, sql, params):
+        if self.state.get('fail'):
+            raise RuntimeError("db down")
+        self.state['executed'].append(list(params))
+
+    def fetchone(self):
+        return self._result
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = {'executed': [], 'max_id': 0}
+
+    @contextmanager
+    def fake_db_cursor(dictionary=True, commit=False, **kwargs):
+        yield RecordingCursor(state)
+
+    monkeypatch.setattr(academy_stats, 'db_cursor', fake_db_cursor)
+    return state
+
+
+class TestReconcile:
+    """보정 작업 테스트"""
+
+    def test_reconciles_in_id_ranges(self, state):
+        """학원 id를 batch_size 구간으로 나눠 보정해야 함"""
+        state['max_id'] = 1200
+
+        result = academy_stats.reconcile_all(batch_size=500)
+
+        assert result == {'max_academy_id': 1200, 'batches': 3}
+        assert [params[:2] for params in state['executed']] == [(0, 500), (500, 1000), (1000, 1200)]
+        assert all(len(params) == 8 for params in state['executed'])
+
+    def test_no_academies(self, state):
+        """학원이 없으면 아무 것도 실행하지 않아야 함"""
+        assert academy_stats.reconcile_all() == {'max_academy_id': 0, 'batches': 0}
+        assert state['executed'] == []
+
+
+class TestRecordActivityRows:
+    """증분 반영 테스트"""
+
+    def test_writes_aggregated_rows(self, state):
+        """배치를 집계한 파라미터로 upsert해야 함"""
+        assert academy_stats.record_activity_rows([event(1, 'login', '2025-01-10 10:00:00')]) is True
+        assert len(state['executed']) == 1
+        assert state['executed'][0][0][0] == 1
+
+    def test_failure_is_swallowed(self, state):
+        """DB 오류가 나도 예외 없이 False를 반환해야 함"""
+        state['fail'] = True
+        assert academy_stats.record_activity_rows([event(1, 'login', '2025-01-10 10:00:00')]) is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,252 @@
+"""
+일별 활성 학원 비트맵 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_activity_bitmaps.py -v
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+from datetime import date, datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.activity_bitmaps as activity_bitmaps
+from utils.activity_bitmaps import (
+    DailyBitmaps, bitmap_from_ids, bitmap_ids, decode, encode, group_active_days, popcount
+)
+
+
+def event(academy_id, created_at):
+    return {'academy_id': academy_id, 'action_type': 'login', 'created_at': created_at}
+
+
+class FakeBitmapCursor:
+    """daily_active_academies / activity_logs 쿼리만 흉내 내는 커서 (튜플 행)"""
+
+    def __init__(self, table, logs=()):
+        self.table = table  # {날짜: {'bitmap': bytes, 'rebuilt_at': datetime | None}}
+        self.logs = logs    # [(academy_id, created_at)]
+        self.executed = []
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        sql = ' '.join(sql.split())
+        self.executed.append((sql, params))
+
+        if sql.startswith('SELECT bitmap'):
+            row = self.table.get(params[0])
+            self._rows = [(row['bitmap'],)] if row else []
+        elif sql.startswith('SELECT activity_date FROM'):
+            self._rows = [(params[0],)] if params[0] in self.table else []
+        elif sql.startswith('SELECT DISTINCT academy_id'):
+            start, end = params
+            self._rows = sorted({(a,) for a, at in self.logs if start <= at < end})
+        elif sql.startswith('INSERT'):
+            day, blob, count = params[:3]
+            row = self.table.setdefault(day, {'rebuilt_at': None})
+            row.update(bitmap=blob, academy_count=count)
+            if len(params) > 3:
+                row['rebuilt_at'] = params[3]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+class DictCursor:
+    """load_daily_bitmaps용 dict 행 커서"""
+
+    def __init__(self, table):
+        self.table = table
+
+    def execute(self, sql, params=None):
+        start, end = params
+        self._rows = [
+            {'activity_date': day, 'bitmap': row['bitmap'], 'rebuilt_at': row['rebuilt_at']}
+            for day, row in self.table.items() if start <= day <= end
+        ]
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestBitmapOps:
+    """비트맵 연산 테스트"""
+
+    def test_roundtrip(self):
+        """id 목록 ↔ 비트맵 ↔ BLOB 변환이 보존되어야 함"""
+        bits = bitmap_from_ids([3, 1, 1000, 3])
+
+        assert bitmap_ids(bits) == [1, 3, 1000]
+        assert popcount(bits) == 3
+        assert decode(encode(bits)) == bits
+        assert len(encode(bits)) == 126  # 최고 비트(1000)까지만
+
+    def test_empty(self):
+        """빈 비트맵은 빈 BLOB"""
+        assert encode(0) == b''
+        assert decode(b'') == 0
+        assert decode(None) == 0
+
+    def test_ignores_missing_academy(self):
+        """academy_id가 없으면 무시"""
+        assert bitmap_from_ids([None, 0, 2]) == bitmap_from_ids([2])
+
+
+class TestDailyBitmaps:
+    """기간 OR + popcount 테스트"""
+
+    @pytest.fixture
+    def bitmaps(self):
+        return DailyBitmaps({
+            date(2025, 2, 28): bitmap_from_ids([1, 2, 9]),
+            date(2025, 3, 1): bitmap_from_ids([1, 2]),
+            date(2025, 3, 5): bitmap_from_ids([2, 3]),
+            date(2025, 3, 7): bitmap_from_ids([4]),
+        })
+
+    def test_dau(self, bitmaps):
+        assert bitmaps.count(date(2025, 3, 5)) == 2
+        assert bitmaps.count(date(2025, 3, 6)) == 0
+
+    def test_mau_counts_each_academy_once(self, bitmaps):
+        """여러 날 활동한 학원은 한 번만 세야 함"""
+        assert bitmaps.count(date(2025, 3, 1), date(2025, 3, 7)) == 4
+
+    def test_rolling_window(self, bitmaps):
+        """end 포함 최근 N일"""
+        assert bitmaps.rolling(date(2025, 3, 7), 3) == 3      # 3/5 ~ 3/7
+        assert bitmaps.rolling(date(2025, 3, 7), 8) == 5      # 2/28 ~ 3/7
+
+
+class TestIncrementalUpdate:
+    """증분 반영 테스트"""
+
+    def test_groups_by_day(self):
+        """활동 로그를 날짜별 비트맵으로 묶어야 함"""
+        days = group_active_days([
+            event(1, '2025-03-01 23:59:59'),
+            event(2, datetime(2025, 3, 2, 0, 0, 1)),
+            event(1, '2025-03-02 10:00:00'),
+            event(None, '2025-03-02 10:00:00'),
+        ])
+
+        assert {day: bitmap_ids(bits) for day, bits in days.items()} == {
+            date(2025, 3, 1): [1],
+            date(2025, 3, 2): [1, 2],
+        }
+
+    def test_or_into_existing_bitmap(self):
+        """기존 비트맵과 OR해서 덮어써야 함"""
+        table = {date(2025, 3, 1): {'bitmap': encode(bitmap_from_ids([5])), 'rebuilt_at': None}}
+        cursor = FakeBitmapCursor(table)
+
+        updated = activity_bitmaps.apply_active_days(cursor, {date(2025, 3, 1): bitmap_from_ids([1, 5])})
+
+        assert updated == 1
+        assert bitmap_ids(decode(table[date(2025, 3, 1)]['bitmap'])) == [1, 5]
+        assert table[date(2025, 3, 1)]['academy_count'] == 2
+        assert 'FOR UPDATE' in cursor.executed[0][0]
+
+    def test_skips_write_without_new_bits(self):
+        """새 비트가 없으면 쓰지 않아야 함"""
+        table = {date(2025, 3, 1): {'bitmap': encode(bitmap_from_ids([1, 5])), 'rebuilt_at': None}}
+        cursor = FakeBitmapCursor(table)
+
+        assert activity_bitmaps.apply_active_days(cursor, {date(2025, 3, 1): bitmap_from_ids([5])}) == 0
+        assert not any(sql.startswith('INSERT') for sql, _ in cursor.executed)
+
+    def test_record_skips_known_bits(self, monkeypatch):
+        """이 프로세스가 이미 반영한 비트만 있는 배치는 DB를 열지 않아야 함"""
+        table = {}
+        opened = []
+
+        @contextmanager
+        def fake_db_cursor(dictionary=True, commit=False, **kwargs):
+            opened.append(commit)
+            yield FakeBitmapCursor(table)
+
+        monkeypatch.setattr(activity_bitmaps, 'db_cursor', fake_db_cursor)
+        monkeypatch.setattr(activity_bitmaps, '_known', activity_bitmaps._KnownBits())
+
+        assert activity_bitmaps.record_active_days([event(1, '2025-03-01 10:00:00')])
+        assert activity_bitmaps.record_active_days([event(1, '2025-03-01 11:00:00')])
+        assert len(opened) == 1
+
+        assert activity_bitmaps.record_active_days([event(2, '2025-03-01 12:00:00')])
+        assert len(opened) == 2
+        assert bitmap_ids(decode(table[date(2025, 3, 1)]['bitmap'])) == [1, 2]
+
+    def test_record_failure_is_swallowed(self, monkeypatch):
+        """DB 실패는 False만 반환하고, 다음 배치에서 다시 시도해야 함"""
+        @contextmanager
+        def failing_db_cursor(dictionary=True, commit=False, **kwargs):
+            raise RuntimeError('db down')
+            yield
+
+        monkeypatch.setattr(activity_bitmaps, 'db_cursor', failing_db_cursor)
+        monkeypatch.setattr(activity_bitmaps, '_known', activity_bitmaps._KnownBits())
+
+        assert activity_bitmaps.record_active_days([event(1, '2025-03-01 10:00:00')]) is False
+        assert activity_bitmaps._known.missing(date(2025, 3, 1), bitmap_from_ids([1]))
+
+
+class TestRebuildAndLoad:
+    """재생성 / 조회 테스트"""
+
+    def test_rebuild_day_overwrites_from_logs(self):
+        """그날 activity_logs 기준으로 덮어쓰고 rebuilt_at을 기록해야 함"""
+        table = {date(2025, 3, 1): {'bitmap': encode(bitmap_from_ids([99])), 'rebuilt_at': None}}
+        logs = [
+            (1, datetime(2025, 3, 1, 0, 0, 0)),
+            (2, datetime(2025, 3, 1, 23, 59, 59)),
+            (3, datetime(2025, 3, 2, 0, 0, 0)),
+        ]
+        now = datetime(2025, 3, 2, 0, 40)
+
+        count = activity_bitmaps.rebuild_day(FakeBitmapCursor(table, logs), date(2025, 3, 1), now=now)
+
+        assert count == 2
+        assert bitmap_ids(decode(table[date(2025, 3, 1)]['bitmap'])) == [1, 2]
+        assert table[date(2025, 3, 1)]['rebuilt_at'] == now
+
+    def test_load_requires_rebuilt_past_days(self):
+        """지난 날짜 중 재생성되지 않은 날이 있으면 None"""
+        rebuilt = datetime(2025, 3, 3, 0, 40)
+        table = {
+            date(2025, 3, 1): {'bitmap': encode(bitmap_from_ids([1])), 'rebuilt_at': rebuilt},
+            date(2025, 3, 2): {'bitmap': encode(bitmap_from_ids([2])), 'rebuilt_at': None},
+            date(2025, 3, 3): {'bitmap': encode(bitmap_from_ids([3])), 'rebuilt_at': None},
+        }
+
+        assert activity_bitmaps.load_daily_bitmaps(DictCursor(table), date(2025, 3, 1), date(2025, 3, 3)) is None
+
+        table[date(2025, 3, 2)]['rebuilt_at'] = rebuilt
+        bitmaps = activity_bitmaps.load_daily_bitmaps(DictCursor(table), date(2025, 3, 1), date(2025, 3, 3))
+        assert bitmaps.count(date(2025, 3, 1), date(2025, 3, 3)) == 3
+
+    def test_load_allows_missing_today(self):
+        """오늘 행이 아직 없으면 오늘은 활동 없음"""
+        table = {date(2025, 3, 1): {'bitmap': encode(bitmap_from_ids([1])), 'rebuilt_at': datetime(2025, 3, 2)}}
+
+        bitmaps = activity_bitmaps.load_daily_bitmaps(DictCursor(table), date(2025, 3, 1), date(2025, 3, 2))
+        assert bitmaps.count(date(2025, 3, 2)) == 0
+
+    def test_load_without_table(self):
+        """테이블이 없으면(마이그레이션 전) None"""
+        class MissingTableCursor:
+            def execute(self, sql, params=None):
+                raise RuntimeError("Table 'daily_active_academies' doesn't exist")
+
+        assert activity_bitmaps.load_daily_bitmaps(MissingTableCursor(), date(2025, 3, 1), date(2025, 3, 2)) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -9,12 +9,18 @@ Alert Deduplicator 테스트
 import pytest
 import sys
 import os
+import threading
 from datetime import datetime, timedelta
 
 # 프로젝트 루트를 sys.path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.alert_deduplicator import AlertDeduplicator, alert_deduplicator
+from utils.alert_deduplicator import (
+    AlertDeduplicator,
+    SQLiteAlertStore,
+    alert_deduplicator,
+    create_alert_deduplicator,
+)
 
 
 class TestAlertDeduplicator:
@@ -149,5 +155,69 @@ class TestIntegration:
         assert deleted == 1
 
 
+class TestSQLiteStore:
+    """SQLite 저장소 테스트 (cron 실행 간 / 워커 간 공유)"""
+
+    def make(self, tmp_path):
+        return AlertDeduplicator(SQLiteAlertStore(str(tmp_path / 'dedup.sqlite3')))
+
+    def test_cooldown_survives_new_instance(self, tmp_path):
+        """새 프로세스(인스턴스)에서도 cooldown이 유지되어야 함"""
+        assert self.make(tmp_path).should_send_alert("cpu_critical") is True
+        assert self.make(tmp_path).should_send_alert("cpu_critical") is False
+
+    def test_cooldown_expires(self, tmp_path):
+        """cooldown이 지나면 다시 발송되어야 함"""
+        dedup = self.make(tmp_path)
+        assert dedup.should_send_alert("disk_warning", cooldown_minutes=0) is True
+        assert dedup.should_send_alert("disk_warning", cooldown_minutes=0) is True
+
+    def test_concurrent_claims_send_once(self, tmp_path):
+        """동시에 같은 Alert를 확인해도 한 번만 발송되어야 함"""
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            dedup = self.make(tmp_path)
+            barrier.wait()
+            results.append(dedup.should_send_alert("ram_critical"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results.count(True) == 1
+
+    def test_reset_and_clear(self, tmp_path):
+        """reset/clear가 저장소에 반영되어야 함"""
+        dedup = self.make(tmp_path)
+        dedup.should_send_alert("a")
+        dedup.should_send_alert("b")
+
+        dedup.reset_alert("a")
+        assert self.make(tmp_path).should_send_alert("a") is True
+
+        assert set(dedup.get_active_alerts()) == {"a", "b"}
+        assert dedup.clear_old_alerts(hours=0) == 2
+        assert dedup.get_active_alerts() == {}
+
+    def test_store_failure_falls_back_to_memory(self, tmp_path):
+        """저장소 오류 시 프로세스 메모리 기록으로 판단해야 함"""
+        blocker = tmp_path / 'not_a_dir'
+        blocker.write_text('x')
+        dedup = AlertDeduplicator(SQLiteAlertStore(str(blocker / 'dedup.sqlite3')))
+
+        assert dedup.should_send_alert("api_error") is True
+        assert dedup.should_send_alert("api_error") is False
+
+    def test_factory_backends(self):
+        """설정값에 맞는 저장소를 선택해야 함"""
+        assert isinstance(create_alert_deduplicator('sqlite').store, SQLiteAlertStore)
+        memory = create_alert_deduplicator('memory')
+        assert memory.store is memory._local
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
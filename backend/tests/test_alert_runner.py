@@ -0,0 +1,141 @@
+"""
+Alert 체크 동시 실행 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_alert_runner.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.alert_checker as alert_checker
+from utils.alert_checker import run_alert_checks
+
+
+def passthrough(alert):
+    return dict(alert, formatted=True)
+
+
+def check_ok_alert():
+    return None
+
+
+def check_warning_alert():
+    return {'severity': 'warning', 'type': 'b_type', 'value': 1, 'threshold': 1}
+
+
+def check_critical_alert():
+    return {'severity': 'critical', 'type': 'z_type', 'value': 2, 'threshold': 1}
+
+
+def check_broken_alert():
+    raise RuntimeError("boom")
+
+
+class TestRunAlertChecks:
+    """run_alert_checks 테스트"""
+
+    def test_collects_and_sorts_alerts(self):
+        """Alert는 포맷 후 Critical 먼저 정렬되어야 함"""
+        result = run_alert_checks([check_ok_alert, check_warning_alert, check_critical_alert],
+                                  timeout=2, formatter=passthrough)
+
+        assert [a['type'] for a in result['alerts']] == ['z_type', 'b_type']
+        assert all(a['formatted'] for a in result['alerts'])
+        assert [(c['name'], c['status']) for c in result['checks']] == [
+            ('ok', 'ok'), ('warning', 'alert'), ('critical', 'alert'),
+        ]
+
+    def test_error_is_reported(self):
+        """예외를 던진 체크는 error 상태여야 함"""
+        result = run_alert_checks([check_broken_alert, check_ok_alert], timeout=2, formatter=passthrough)
+
+        assert result['alerts'] == []
+        assert [c['status'] for c in result['checks']] == ['error', 'ok']
+
+    def test_slow_check_becomes_unknown(self):
+        """제한 시간을 넘긴 체크는 기다리지 않고 unknown이어야 함"""
+        release = threading.Event()
+
+        def check_slow_alert():
+            release.wait(5)
+            return check_critical_alert()
+
+        start = time.monotonic()
+        result = run_alert_checks([check_slow_alert, check_warning_alert], timeout=0.2, formatter=passthrough)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 1.5
+        assert [a['type'] for a in result['alerts']] == ['b_type']
+        statuses = {c['name']: c for c in result['checks']}
+        assert statuses['slow']['status'] == 'unknown'
+        assert statuses['slow']['duration_ms'] >= 150
+        assert statuses['warning']['status'] == 'alert'
+
+    def test_checks_run_concurrently(self):
+        """체크는 동시에 실행되어 전체 시간이 합보다 짧아야 함"""
+        def make_check(i):
+            def check():
+                time.sleep(0.2)
+                return None
+            check.__name__ = f"check_sleep{i}_alert"
+            return check
+
+        start = time.monotonic()
+        result = run_alert_checks([make_check(i) for i in range(3)], timeout=2, formatter=passthrough)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert all(c['status'] == 'ok' for c in result['checks'])
+        assert all(c['duration_ms'] >= 150 for c in result['checks'])
+
+
+class FailingCursor:
+    """모든 쿼리가 실패하는 커서 (DB 장애)"""
+
+    def execute(self, sql, params=None):
+        raise RuntimeError("Lost connection to MySQL server")
+
+
+class TestCheckFailures:
+    """실제 체크 함수의 조회 실패가 'error'로 보고되는지"""
+
+    def test_db_outage_is_error_not_ok(self, monkeypatch):
+        @contextmanager
+        def failing_cursor(*args, **kwargs):
+            yield FailingCursor()
+
+        def unavailable(metric):
+            raise RuntimeError("system_health_logs unavailable")
+
+        monkeypatch.setattr(alert_checker, 'db_cursor', failing_cursor)
+        monkeypatch.setattr(alert_checker, 'get_resource_average', unavailable)
+
+        result = run_alert_checks(alert_checker.ALERT_CHECKS, timeout=2, formatter=passthrough)
+
+        assert result['alerts'] == []
+        assert {c['name']: c['status'] for c in result['checks']} == {
+            'cpu': 'error', 'ram': 'error', 'disk': 'error', 'backend_restart': 'error',
+            'inactive_academy': 'error', 'parent_view_rate': 'error', 'api_error_rate': 'error',
+        }
+
+    def test_dashboard_uses_checker_functions(self):
+        """대시보드 Alert는 alert_checker의 체크 함수를 그대로 사용해야 함 (중복 구현 금지)"""
+        pytest.importorskip('flask')
+        import routes.admin.alerts as alerts
+
+        assert all(check in alert_checker.ALERT_CHECKS for check in alerts.ALERT_CHECKS)
+        assert alerts.format_alert_message is alert_checker.format_alert_message
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
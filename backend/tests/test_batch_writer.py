@@ -0,0 +1,143 @@
+"""
+비동기 배치 작성기 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_batch_writer.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.batch_writer import BatchWriter
+from utils.event_spool import EventSpool, read_segment
+
+
+class RecordingSink:
+    """배치 쓰기 대용 (실패 모드 지원)"""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def __call__(self, rows):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.batches.append(list(rows))
+
+
+def make_writer(sink, **kwargs):
+    kwargs.setdefault('flush_interval', 60)
+    return BatchWriter('test_table', 'INSERT ...', write_batch=sink, **kwargs)
+
+
+class TestBatchWriter:
+    """BatchWriter 테스트"""
+
+    def test_flush_writes_pending_rows(self):
+        """flush()는 쌓인 행을 한 배치로 기록해야 함"""
+        sink = RecordingSink()
+        writer = make_writer(sink)
+
+        for i in range(3):
+            assert writer.submit((i,)) is True
+        assert writer.flush(2) is True
+
+        assert sink.batches == [[(0,), (1,), (2,)]]
+        assert writer.stats()['written'] == 3
+        writer.close()
+
+    def test_batch_size_triggers_write(self):
+        """batch_size에 도달하면 flush 없이 기록해야 함"""
+        sink = RecordingSink()
+        writer = make_writer(sink, batch_size=2)
+
+        for i in range(4):
+            writer.submit((i,))
+        writer.flush(2)
+
+        assert [len(b) for b in sink.batches] == [2, 2]
+        writer.close()
+
+    def test_flush_interval_triggers_write(self):
+        """flush_interval이 지나면 배치 크기와 무관하게 기록해야 함"""
+        written = threading.Event()
+        batches = []
+
+        def sink(rows):
+            batches.append(list(rows))
+            written.set()
+
+        writer = BatchWriter('test_table', 'INSERT ...', write_batch=sink, flush_interval=0.05)
+        writer.submit((1,))
+
+        assert written.wait(2)
+        assert batches == [[(1,)]]
+        writer.close()
+
+    def test_queue_overflow_is_counted(self):
+        """큐가 가득 차면 drop 카운터가 증가해야 함"""
+        release = threading.Event()
+
+        def blocked_sink(rows):
+            release.wait(2)
+
+        writer = BatchWriter('test_table', 'INSERT ...', write_batch=blocked_sink,
+                             max_queue=2, batch_size=1, flush_interval=60)
+
+        results = [writer.submit((i,)) for i in range(10)]
+        release.set()
+
+        assert results.count(False) >= 1
+        assert writer.stats()['dropped'] == results.count(False)
+        writer.close()
+
+    def test_close_drains_queue(self):
+        """close()는 남은 행을 모두 기록한 뒤 종료해야 함"""
+        sink = RecordingSink()
+        writer = make_writer(sink)
+
+        for i in range(5):
+            writer.submit((i,))
+        writer.close()
+
+        assert sum(len(b) for b in sink.batches) == 5
+        assert writer.submit((99,)) is False
+
+    def test_failed_batch_goes_to_spool(self, tmp_path):
+        """DB 쓰기 실패 시 이벤트 spool에 보관해야 함"""
+        spool = EventSpool(directory=str(tmp_path))
+        writer = make_writer(RecordingSink(fail=True), columns=('academy_id', 'action_type'), spool=spool)
+
+        writer.submit((1, 'login'))
+        writer.submit((2, 'logout'))
+        writer.flush(2)
+        spool.rotate()
+
+        by_table, corrupt = read_segment(spool.sealed_segments()[0])
+        assert by_table['test_table'] == [
+            {'academy_id': 1, 'action_type': 'login'},
+            {'academy_id': 2, 'action_type': 'logout'},
+        ]
+        assert writer.stats()['spooled'] == 2
+        assert writer.stats()['errors'] == 1
+        writer.close()
+
+    def test_failed_batch_without_spool_is_dropped(self):
+        """spool이 없으면 실패한 행은 drop으로 집계되어야 함"""
+        writer = make_writer(RecordingSink(fail=True))
+
+        writer.submit((1,))
+        writer.flush(2)
+
+        assert writer.stats()['dropped'] == 1
+        writer.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,182 @@
+"""
+가입 코호트 리텐션 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_cohort_retention.py -v
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+from datetime import date, datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.cohort_retention as cohort_retention
+from utils.activity_bitmaps import DailyBitmaps, bitmap_from_ids
+from utils.cohort_retention import (
+    CohortError, add_periods, compute_cells, get_retention_matrix, load_cohorts,
+    period_index, period_start, resolve_periods
+)
+
+
+class RowsCursor:
+    """준비된 행을 돌려주는 커서"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+        self.many = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((' '.join(sql.split()), params))
+
+    def executemany(self, sql, rows):
+        self.many.extend(rows)
+
+    def fetchall(self):
+        return self.rows
+
+
+class TestPeriods:
+    """기간 계산 테스트"""
+
+    def test_week_starts_on_monday(self):
+        assert period_start(date(2025, 3, 9), 'week') == date(2025, 3, 3)   # 일요일
+        assert period_start(date(2025, 3, 3), 'week') == date(2025, 3, 3)
+
+    def test_month_start(self):
+        assert period_start(date(2025, 3, 31), 'month') == date(2025, 3, 1)
+
+    def test_add_and_index(self):
+        """add_periods와 period_index는 서로 역이어야 함 (연도 경계 포함)"""
+        assert add_periods(date(2025, 3, 3), 6, 'week') == date(2025, 4, 14)
+        assert period_index(date(2025, 3, 3), date(2025, 4, 14), 'week') == 6
+        assert add_periods(date(2024, 11, 1), 3, 'month') == date(2025, 2, 1)
+        assert period_index(date(2024, 11, 1), date(2025, 2, 1), 'month') == 3
+
+    def test_resolve_periods(self):
+        assert resolve_periods('week') == cohort_retention.COHORT_MAX_PERIODS['week']
+        assert resolve_periods('month', 3) == 3
+        with pytest.raises(CohortError):
+            resolve_periods('day')
+        with pytest.raises(CohortError):
+            resolve_periods('week', 0)
+
+
+class TestComputeCells:
+    """코호트 × 기간 칸 계산 테스트"""
+
+    def test_load_cohorts_groups_by_signup_week(self):
+        """가입 시각을 가입 주별 비트맵으로 묶어야 함"""
+        cursor = RowsCursor([
+            (1, datetime(2025, 3, 3, 9)),
+            (2, datetime(2025, 3, 9, 23)),
+            (3, datetime(2025, 3, 10, 0)),
+        ])
+
+        cohorts = load_cohorts(cursor, date(2025, 3, 3), 'week')
+
+        assert cohorts == {
+            date(2025, 3, 3): bitmap_from_ids([1, 2]),
+            date(2025, 3, 10): bitmap_from_ids([3]),
+        }
+        assert 'is_deleted = 0' in cursor.executed[0][0]
+
+    def test_cells(self):
+        """칸 = 코호트 학원 중 그 기간에 활동한 학원 수, 가입 전 기간은 없음"""
+        cohorts = {
+            date(2025, 3, 3): bitmap_from_ids([1, 2, 3, 4]),
+            date(2025, 3, 10): bitmap_from_ids([5, 6]),
+        }
+        bitmaps = DailyBitmaps({
+            date(2025, 3, 4): bitmap_from_ids([1, 2, 3, 4]),
+            date(2025, 3, 11): bitmap_from_ids([1, 5]),
+            date(2025, 3, 16): bitmap_from_ids([2, 5]),   # 같은 주 일요일
+            date(2025, 3, 18): bitmap_from_ids([6]),
+        })
+
+        cells = compute_cells(cohorts, bitmaps, [date(2025, 3, 3), date(2025, 3, 10), date(2025, 3, 17)],
+                              'week', today=date(2025, 3, 19))
+
+        assert cells == [
+            ('week', date(2025, 3, 3), 0, 4, 4),
+            ('week', date(2025, 3, 3), 1, 4, 2),
+            ('week', date(2025, 3, 10), 0, 2, 1),
+            ('week', date(2025, 3, 3), 2, 4, 0),
+            ('week', date(2025, 3, 10), 1, 2, 1),
+        ]
+
+
+class TestRefresh:
+    """갱신 범위 테스트"""
+
+    @pytest.fixture
+    def refresh(self, monkeypatch):
+        calls = {'bitmaps': [], 'cursors': []}
+
+        @contextmanager
+        def fake_db_cursor(dictionary=True, commit=False, **kwargs):
+            cursor = RowsCursor()
+            calls['cursors'].append(cursor)
+            yield cursor
+
+        def fake_load_bitmaps(cursor, start, end):
+            calls['bitmaps'].append((start, end))
+            return DailyBitmaps({end: bitmap_from_ids([1])})
+
+        monkeypatch.setattr(cohort_retention, 'db_cursor', fake_db_cursor)
+        monkeypatch.setattr(cohort_retention, 'load_cohorts',
+                            lambda cursor, since, granularity: {date(2025, 3, 17): bitmap_from_ids([1, 2])})
+        monkeypatch.setattr(cohort_retention, 'load_daily_bitmaps', fake_load_bitmaps)
+        monkeypatch.setitem(cohort_retention.COHORT_MAX_PERIODS, 'week', 4)
+        return calls
+
+    def test_incremental_reads_previous_and_current_period(self, refresh):
+        result = cohort_retention.refresh_cohorts('week', today=date(2025, 3, 19))
+
+        assert refresh['bitmaps'] == [(date(2025, 3, 10), date(2025, 3, 19))]
+        assert result['periods'] == 2
+        assert refresh['cursors'][-1].many == [('week', date(2025, 3, 17), 0, 2, 1)]
+        assert not any(sql.startswith('DELETE') for c in refresh['cursors'] for sql, _ in c.executed)
+
+    def test_full_recomputes_all_and_prunes(self, refresh):
+        result = cohort_retention.refresh_cohorts('week', full=True, today=date(2025, 3, 19))
+
+        assert refresh['bitmaps'] == [(date(2025, 2, 24), date(2025, 3, 19))]
+        assert result['periods'] == 4
+        deletes = [params for sql, params in refresh['cursors'][-1].executed if sql.startswith('DELETE')]
+        assert deletes == [('week', date(2025, 2, 24))]
+
+    def test_requires_rebuilt_bitmaps(self, refresh, monkeypatch):
+        monkeypatch.setattr(cohort_retention, 'load_daily_bitmaps', lambda cursor, start, end: None)
+        with pytest.raises(RuntimeError):
+            cohort_retention.refresh_cohorts('week', today=date(2025, 3, 19))
+
+
+class TestRetentionMatrix:
+    """행렬 응답 테스트"""
+
+    def test_matrix(self):
+        updated = datetime(2025, 3, 19, 10, 50)
+        cursor = RowsCursor([
+            {'cohort_start': date(2025, 3, 3), 'period_index': 0, 'cohort_size': 4, 'active_count': 4, 'updated_at': updated},
+            {'cohort_start': date(2025, 3, 3), 'period_index': 2, 'cohort_size': 4, 'active_count': 1, 'updated_at': updated},
+            {'cohort_start': date(2025, 3, 17), 'period_index': 0, 'cohort_size': 0, 'active_count': 0, 'updated_at': updated},
+        ])
+
+        matrix = get_retention_matrix(cursor, 'week', periods=3, today=date(2025, 3, 19))
+
+        assert cursor.executed[0][1] == ('week', date(2025, 3, 3))
+        assert matrix['cohorts'] == [
+            {'cohort_start': '2025-03-03', 'size': 4, 'active': [4, 0, 1], 'retention': [100.0, 0, 25.0]},
+            {'cohort_start': '2025-03-17', 'size': 0, 'active': [0], 'retention': [0]},
+        ]
+        assert matrix['updated_at'] == '2025-03-19T10:50:00'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,212 @@
+"""
+고객 건강도 점수 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_customer_health.py -v
+"""
+
+import pytest
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+np = pytest.importorskip('numpy')
+
+import utils.customer_health as customer_health
+from utils.activity_bitmaps import DailyBitmaps, bitmap_from_ids
+from utils.customer_health import active_day_counts, compute_scores, score_rows
+from utils.time_windows import get_time_windows
+
+
+NOW = datetime(2025, 3, 19, 10, 0)
+
+
+def features(**columns):
+    """학원 1개 이상의 특성 배열 (지정하지 않은 컬럼은 0)"""
+    size = len(next(iter(columns.values())))
+    result = {'id': np.arange(1, size + 1, dtype=np.int64)}
+    for name in ('student_count', 'report_count', 'share_count', 'inactive_days',
+                 'active_days', 'recent_reports', 'previous_reports'):
+        result[name] = np.array(columns.get(name, [0] * size), dtype=np.float64)
+    result['inactive_week'] = np.array(columns.get('inactive_week', [False] * size), dtype=bool)
+    return result
+
+
+class ScriptedCursor:
+    """실행 순서대로 준비된 행을 돌려주는 dict 커서"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.executed = []
+        self.many = []
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        sql = ' '.join(sql.split())
+        self.executed.append((sql, params))
+        if not sql.startswith('DELETE'):
+            self._rows = self.results.pop(0)
+
+    def executemany(self, sql, rows):
+        self.many.append(list(rows))
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestComputeScores:
+    """점수 배열 계산 테스트"""
+
+    def test_healthy_and_idle_academies(self):
+        """매일 활동하고 리포트가 많은 학원은 champion, 한 달 넘게 쉰 학원은 critical"""
+        scores = compute_scores(features(
+            student_count=[10, 10],
+            report_count=[100, 100],
+            share_count=[100, 0],
+            inactive_days=[0, 45],
+            active_days=[25, 0],
+            recent_reports=[40, 0],
+            previous_reports=[20, 20],
+            inactive_week=[False, True],
+        ))
+
+        assert scores['activity'].tolist() == [100.0, 0.0]
+        assert scores['engagement'].tolist() == [100.0, 0.0]
+        assert scores['performance'].tolist() == [100.0, 0.0]
+        assert scores['status'].tolist() == ['champion', 'critical']
+        assert scores['risk_level'].tolist() == ['', 'critical']
+
+    def test_weighted_total(self):
+        """총점 = 활동성 30% + 참여도 30% + 성과 20% + 성장성 20%"""
+        scores = compute_scores(features(
+            student_count=[5], report_count=[10], share_count=[5],
+            inactive_days=[3], active_days=[10], recent_reports=[10], previous_reports=[10],
+        ))
+
+        expected = (0.3 * scores['activity'] + 0.3 * scores['engagement']
+                    + 0.2 * scores['performance'] + 0.2 * scores['growth'])
+        assert scores['total'][0] == pytest.approx(expected[0], abs=0.01)
+        assert scores['growth'][0] == 50.0   # 리포트 수 변화 없음
+
+    def test_growth_is_clipped(self):
+        """직전 대비 2배 이상은 100, 절반 이하는 0"""
+        scores = compute_scores(features(recent_reports=[39, 9, 0], previous_reports=[9, 19, 0]))
+        assert scores['growth'].tolist() == [100.0, 0.0, 50.0]
+
+    def test_no_students_or_reports(self):
+        """학생/리포트가 없어도 0으로 나누지 않아야 함"""
+        scores = compute_scores(features(inactive_days=[0]))
+        assert scores['engagement'].tolist() == [0.0]
+        assert np.isfinite(scores['total']).all()
+
+    def test_status_thresholds(self, monkeypatch):
+        """90 / 70 / 50 경계"""
+        monkeypatch.setattr(customer_health, 'HEALTH_WEIGHTS',
+                            {'activity': 1.0, 'engagement': 0.0, 'performance': 0.0, 'growth': 0.0})
+        # 활동성 = 50 × recency + 50 × frequency, frequency 0이면 (1 - 무활동/30) × 50
+        scores = compute_scores(features(inactive_days=[0, 0, 0, 0], active_days=[20, 16, 8, 0]))
+
+        assert scores['total'].tolist() == [100.0, 90.0, 70.0, 50.0]
+        assert scores['status'].tolist() == ['champion', 'champion', 'healthy', 'at_risk']
+
+    def test_risk_levels(self):
+        """7일 이상 무활동 학원만 위험 수준이 붙고, 일수로 수준을 나눔"""
+        scores = compute_scores(features(
+            inactive_days=[30, 21, 20, 14, 13, 7, 6, 30],
+            inactive_week=[True, True, True, True, True, True, True, False],
+        ))
+
+        assert scores['risk_level'].tolist() == [
+            'critical', 'critical', 'warning', 'warning', 'caution', 'caution', 'caution', ''
+        ]
+
+
+class TestFeatures:
+    """특성 조회 테스트"""
+
+    def test_active_day_counts_from_bitmaps(self):
+        """일별 비트맵을 학원별 활동 일수로 합산 (범위 밖 날짜, ids에 없는 학원은 무시)"""
+        bitmaps = DailyBitmaps({
+            date(2025, 3, 1): bitmap_from_ids([1, 3, 900]),
+            date(2025, 3, 2): bitmap_from_ids([3]),
+            date(2025, 3, 3): bitmap_from_ids([1, 3]),
+            date(2025, 2, 28): bitmap_from_ids([1]),
+        })
+        ids = np.array([1, 2, 3], dtype=np.int64)
+
+        counts = active_day_counts(bitmaps, ids, date(2025, 3, 1), date(2025, 3, 3))
+
+        assert counts.tolist() == [2.0, 0.0, 3.0]
+
+    def test_load_features_aligns_by_academy(self, monkeypatch):
+        """집계 행을 학원 id 순서에 맞추고, 비트맵이 없으면 activity_logs로 집계"""
+        monkeypatch.setattr(customer_health, 'load_daily_bitmaps', lambda cursor, start, end: None)
+        cursor = ScriptedCursor([
+            [
+                {'id': 2, 'student_count': 3, 'report_count': 7, 'share_count': 1,
+                 'inactive_days': 0, 'inactive_week': 0},
+                {'id': 5, 'student_count': None, 'report_count': 0, 'share_count': 0,
+                 'inactive_days': 12, 'inactive_week': 1},
+            ],
+            [
+                {'academy_id': 5, 'recent_reports': 0, 'previous_reports': 4},
+                {'academy_id': 9, 'recent_reports': 8, 'previous_reports': 0},   # 삭제된 학원
+                {'academy_id': 2, 'recent_reports': 6, 'previous_reports': 2},
+            ],
+            [{'academy_id': 2, 'active_days': 11}],
+        ])
+        windows = get_time_windows(NOW)
+
+        result = customer_health.load_features(cursor, windows)
+
+        assert result['id'].tolist() == [2, 5]
+        assert result['student_count'].tolist() == [3.0, 0.0]
+        assert result['inactive_week'].tolist() == [False, True]
+        assert result['recent_reports'].tolist() == [6.0, 0.0]
+        assert result['previous_reports'].tolist() == [2.0, 4.0]
+        assert result['active_days'].tolist() == [11.0, 0.0]
+        assert cursor.executed[0][1] == (windows.now, windows.week_ago)
+        assert cursor.executed[1][1] == (NOW - timedelta(days=30), NOW - timedelta(days=30), NOW - timedelta(days=60))
+        assert cursor.executed[2][1] == (datetime(2025, 2, 18),)
+
+
+class TestScoreAcademies:
+    """배치 upsert 테스트"""
+
+    def test_rows_are_python_values(self):
+        """NumPy 값을 Python 값으로 바꾸고, 위험 수준이 없으면 NULL"""
+        data = features(inactive_days=[0, 10], inactive_week=[False, True])
+        rows = score_rows(data, compute_scores(data), NOW)
+
+        assert [row[0] for row in rows] == [1, 2]
+        assert [row[7] for row in rows] == [None, 'caution']
+        assert [row[8] for row in rows] == [0, 10]
+        assert all(type(value) in (int, float, str, type(None), datetime) for row in rows for value in row)
+
+    def test_upserts_in_batches_and_prunes(self, monkeypatch):
+        data = features(inactive_days=[0, 10, 40], inactive_week=[False, True, True])
+        monkeypatch.setattr(customer_health, 'load_features', lambda cursor, windows: data)
+        cursor = ScriptedCursor([])
+
+        result = customer_health.score_academies(cursor, now=NOW, batch_size=2)
+
+        assert [len(batch) for batch in cursor.many] == [2, 1]
+        assert cursor.many[0][0][-1] == NOW
+        assert cursor.executed[-1][0].startswith('DELETE h FROM customer_health_scores')
+        assert result['academies'] == 3
+        assert result['at_risk'] == 2
+        assert sum(result['status'].values()) == 3
+
+    def test_previous_score_updated_before_total(self):
+        """previous_score / score_change는 이전 total_score를 읽으므로 먼저 갱신해야 함"""
+        sql = customer_health.UPSERT_SQL
+        assert sql.index('previous_score =') < sql.index('score_change =') < sql.index('total_score = VALUES')
+        assert sql.index('previous_score =') < sql.index('calculated_at = VALUES')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,231 @@
+"""
+DB 커넥션 풀 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_db_pool.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.db_pool import ConnectionPool, DBPoolError, db_stream_cursor
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        self.conn.in_transaction = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """mysql.connector 연결 대용"""
+
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.in_transaction = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, dictionary=False, **kwargs):
+        return FakeCursor(self)
+
+    def is_connected(self):
+        return self.alive
+
+    def commit(self):
+        self.commits += 1
+        self.in_transaction = False
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    pool = ConnectionPool(connect=connect, **kwargs)
+    return pool, created
+
+
+class TestConnectionPool:
+    """ConnectionPool 테스트"""
+
+    def test_connection_is_reused(self):
+        """반납된 연결은 재사용되어야 함"""
+        pool, created = make_pool(size=2, timeout=1)
+
+        with pool.connection() as c1:
+            pass
+        with pool.connection() as c2:
+            pass
+
+        assert c1 is c2
+        assert len(created) == 1
+        assert pool.stats()['checkouts'] == 2
+
+    def test_pool_size_is_respected(self):
+        """size 이상 연결을 만들지 않고 대기 후 timeout 되어야 함"""
+        pool, created = make_pool(size=1, timeout=0.05)
+
+        entry = pool.acquire()
+        with pytest.raises(DBPoolError):
+            pool.acquire()
+        pool.release(entry)
+
+        stats = pool.stats()
+        assert len(created) == 1
+        assert stats['timeouts'] == 1
+        assert stats['in_use'] == 0
+
+    def test_waiter_gets_released_connection(self):
+        """대기 중인 요청은 반납된 연결을 받아야 함"""
+        pool, created = make_pool(size=1, timeout=2)
+        entry = pool.acquire()
+
+        def release_later():
+            time.sleep(0.05)
+            pool.release(entry)
+
+        t = threading.Thread(target=release_later)
+        t.start()
+        with pool.connection() as conn:
+            assert conn is entry.conn
+        t.join()
+
+        stats = pool.stats()
+        assert stats['waits'] == 1
+        assert stats['wait_time_ms_max'] > 0
+
+    def test_dead_connection_is_replaced(self):
+        """끊긴 연결은 체크아웃 시 폐기되고 새 연결로 교체되어야 함"""
+        pool, created = make_pool(size=2, timeout=1, ping_interval=0)
+
+        with pool.connection() as c1:
+            pass
+        c1.alive = False
+
+        with pool.connection() as c2:
+            pass
+
+        assert c2 is not c1
+        assert c1.closed is True
+        assert pool.stats()['discarded'] == 1
+
+    def test_old_connection_is_recycled(self):
+        """recycle 시간을 넘긴 연결은 교체되어야 함"""
+        pool, created = make_pool(size=1, timeout=1, recycle=0)
+
+        with pool.connection() as c1:
+            pass
+        with pool.connection() as c2:
+            pass
+
+        assert c1 is not c2
+        assert len(created) == 2
+
+    def test_open_transaction_is_rolled_back_on_release(self):
+        """반납 시 열린 트랜잭션은 롤백되어야 함"""
+        pool, created = make_pool(size=1, timeout=1)
+
+        with pool.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        assert created[0].rollbacks == 1
+        assert created[0].in_transaction is False
+
+    def test_cursor_commit(self):
+        """commit=True면 정상 종료 시 commit 되어야 함"""
+        pool, created = make_pool(size=1, timeout=1)
+
+        with pool.cursor(commit=True) as cursor:
+            cursor.execute("INSERT ...")
+
+        assert created[0].commits == 1
+        assert created[0].rollbacks == 0
+
+    def test_cursor_no_commit_on_error(self):
+        """블록에서 예외 발생 시 commit 없이 롤백되어야 함"""
+        pool, created = make_pool(size=1, timeout=1)
+
+        with pytest.raises(ValueError):
+            with pool.cursor(commit=True) as cursor:
+                cursor.execute("INSERT ...")
+                raise ValueError("boom")
+
+        assert created[0].commits == 0
+        assert created[0].rollbacks == 1
+        assert pool.stats()['in_use'] == 0
+
+    def test_connect_failure(self):
+        """연결 생성 실패 시 DBPoolError가 발생하고 슬롯이 반환되어야 함"""
+        def connect():
+            raise RuntimeError("db down")
+
+        pool = ConnectionPool(size=1, timeout=0.05, connect=connect)
+
+        with pytest.raises(DBPoolError):
+            pool.acquire()
+        with pytest.raises(DBPoolError):
+            pool.acquire()
+
+        stats = pool.stats()
+        assert stats['connect_errors'] == 2
+        assert stats['created'] == 0
+
+
+
+class TestStreamCursor:
+    """db_stream_cursor 테스트"""
+
+    def test_dedicated_connection_is_closed(self):
+        """풀과 별도 연결을 열고, 중간에 예외가 나도 커서와 연결을 닫아야 함"""
+        created = []
+
+        def connect():
+            conn = FakeConnection()
+            created.append(conn)
+            return conn
+
+        with pytest.raises(ValueError):
+            with db_stream_cursor(connect=connect) as cursor:
+                cursor.execute("SELECT ...")
+                raise ValueError("client disconnected")
+
+        assert len(created) == 1
+        assert cursor.closed
+        assert created[0].closed
+
+    def test_connect_failure(self):
+        def connect():
+            raise RuntimeError("db down")
+
+        with pytest.raises(DBPoolError):
+            with db_stream_cursor(connect=connect):
+                pass
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
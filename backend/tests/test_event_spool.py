@@ -0,0 +1,161 @@
+"""
+이벤트 spool / replay 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_event_spool.py -v
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.db_pool
+from utils.event_spool import EventSpool, read_segment, replay_spool, new_event_key
+
+
+def activity_row(academy_id=1, event_key=None):
+    return {
+        'event_key': event_key or new_event_key(),
+        'academy_id': academy_id,
+        'user_id': 1,
+        'action_type': 'login',
+        'action_detail': None,
+        'ip_address': '127.0.0.1',
+        'user_agent': 'pytest',
+        'created_at': '2025-01-01 09:00:00',
+    }
+
+
+class FakeTable:
+    """event_key UNIQUE 제약을 흉내내는 INSERT IGNORE 대상"""
+
+    def __init__(self):
+        self.keys = set()
+        self.rows = []
+        self.fail = False
+
+
+class FakeCursor:
+    def __init__(self, table):
+        self.table = table
+        self.rowcount = 0
+
+    def executemany(self, sql, rows):
+        if self.table.fail:
+            raise RuntimeError("db down")
+        assert sql.startswith('INSERT IGNORE')
+        self.rowcount = 0
+        for row in rows:
+            if row[0] not in self.table.keys:
+                self.table.keys.add(row[0])
+                self.table.rows.append(row)
+                self.rowcount += 1
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = FakeTable()
+
+    @contextmanager
+    def fake_db_cursor(dictionary=True, commit=False, **kwargs):
+        yield FakeCursor(table)
+
+    monkeypatch.setattr(utils.db_pool, 'db_cursor', fake_db_cursor)
+    return table
+
+
+class TestEventSpool:
+    """EventSpool 테스트"""
+
+    def test_rotate_seals_segment(self, tmp_path):
+        """rotate() 전에는 replay 대상이 없고, 이후에는 닫힌 세그먼트가 생겨야 함"""
+        spool = EventSpool(directory=str(tmp_path))
+        spool.append('activity_logs', activity_row())
+
+        assert spool.sealed_segments() == []
+        spool.rotate()
+
+        segments = spool.sealed_segments()
+        assert len(segments) == 1
+        by_table, corrupt = read_segment(segments[0])
+        assert len(by_table['activity_logs']) == 1
+        assert corrupt == 0
+
+    def test_size_rotation(self, tmp_path):
+        """세그먼트가 최대 크기를 넘으면 새 세그먼트로 회전해야 함"""
+        spool = EventSpool(directory=str(tmp_path), segment_max_bytes=200)
+        for i in range(5):
+            spool.append('activity_logs', activity_row(i))
+
+        assert len(spool.sealed_segments()) >= 2
+
+    def test_corrupt_line_is_skipped(self, tmp_path):
+        """중간에 끊긴 줄은 건너뛰어야 함"""
+        spool = EventSpool(directory=str(tmp_path))
+        spool.append('activity_logs', activity_row())
+        spool.rotate()
+
+        path = spool.sealed_segments()[0]
+        with open(path, 'a') as f:
+            f.write('{"table": "activity_logs", "row": {')
+
+        by_table, corrupt = read_segment(path)
+        assert len(by_table['activity_logs']) == 1
+        assert corrupt == 1
+
+    def test_dead_process_segment_is_sealed(self, tmp_path):
+        """종료된 프로세스의 .open 세그먼트는 replay 대상이 되어야 함"""
+        stale = tmp_path / 'segment-1-999999999.jsonl.open'
+        stale.write_text('{"table": "activity_logs", "row": {}}\n')
+
+        spool = EventSpool(directory=str(tmp_path))
+        assert [os.path.basename(p) for p in spool.sealed_segments()] == ['segment-1-999999999.jsonl']
+
+
+class TestReplay:
+    """replay_spool 테스트"""
+
+    def test_replay_inserts_and_removes_segment(self, tmp_path, table):
+        spool = EventSpool(directory=str(tmp_path))
+        spool.append_many('activity_logs', [activity_row(1), activity_row(2)])
+
+        result = replay_spool(spool)
+
+        assert result['rows'] == 2
+        assert result['inserted'] == 2
+        assert len(table.rows) == 2
+        assert table.rows[0][-1] == '2025-01-01 09:00:00'  # 원래 created_at 유지
+        assert spool.sealed_segments() == []
+
+    def test_replay_is_idempotent(self, tmp_path, table):
+        """이미 들어간 event_key는 다시 집계되지 않아야 함"""
+        row = activity_row(event_key='a' * 32)
+        spool = EventSpool(directory=str(tmp_path))
+
+        spool.append('activity_logs', row)
+        replay_spool(spool)
+        spool.append('activity_logs', row)
+        result = replay_spool(spool)
+
+        assert len(table.rows) == 1
+        assert result['duplicates'] == 1
+
+    def test_replay_failure_keeps_segment(self, tmp_path, table):
+        """DB 오류 시 세그먼트를 남겨두고 중단해야 함"""
+        table.fail = True
+        spool = EventSpool(directory=str(tmp_path))
+        spool.append('activity_logs', activity_row())
+
+        result = replay_spool(spool)
+
+        assert result['failed'] == 1
+        assert len(spool.sealed_segments()) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
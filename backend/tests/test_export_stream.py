@@ -0,0 +1,142 @@
+"""
+Export 스트리밍 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_export_stream.py -v
+"""
+
+import pytest
+import sys
+import os
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.export_stream import BOM, ExportError, check_format, render_csv, stream_query
+
+
+class StreamingCursor:
+    """fetchmany 호출을 기록하는 unbuffered 커서 대용"""
+
+    def __init__(self, rows, columns):
+        self.rows = list(rows)
+        self.description = [(column,) for column in columns]
+        self.executed = []
+        self.fetches = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((' '.join(sql.split()), params))
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        self.fetches.append(len(batch))
+        return batch
+
+
+def factory(cursor, opened):
+    @contextmanager
+    def cursor_factory():
+        opened.append('open')
+        try:
+            yield cursor
+        finally:
+            opened.append('close')
+    return cursor_factory
+
+
+ROWS = [
+    {'id': 1, 'academy_name': '수학, 학원', 'score': Decimal('71.50'), 'created_at': datetime(2025, 3, 1, 9, 0), 'note': None},
+    {'id': 2, 'academy_name': '영어 "A" 학원', 'score': Decimal('40.00'), 'created_at': datetime(2025, 3, 2, 9, 0), 'note': 'x'},
+    {'id': 3, 'academy_name': '국어학원', 'score': None, 'created_at': datetime(2025, 3, 3, 9, 0), 'note': None},
+]
+COLUMNS = ['id', 'academy_name', 'score', 'created_at', 'note']
+
+
+class TestFormats:
+    """형식 검증 / 렌더링 테스트"""
+
+    def test_check_format(self):
+        assert check_format(None) == 'csv'
+        assert check_format('NDJSON') == 'ndjson'
+        with pytest.raises(ExportError):
+            check_format('xlsx')
+
+    def test_csv_quotes_and_blanks(self):
+        text = ''.join(render_csv(COLUMNS, [ROWS]))
+
+        assert text.startswith(BOM)
+        lines = text[len(BOM):].splitlines()
+        assert lines[0] == 'id,academy_name,score,created_at,note'
+        assert lines[1] == '1,"수학, 학원",71.50,2025-03-01T09:00:00,'
+        assert lines[2] == '2,"영어 ""A"" 학원",40.00,2025-03-02T09:00:00,x'
+
+    def test_csv_header_without_rows(self):
+        """행이 없어도 헤더는 내보내야 함"""
+        assert ''.join(render_csv(COLUMNS, [])) == BOM + 'id,academy_name,score,created_at,note\r\n'
+
+
+class TestStreamQuery:
+    """stream_query 테스트"""
+
+    def test_streams_one_chunk_per_fetch(self):
+        """fetchmany 크기만큼씩 읽어 묶음마다 청크 하나를 내보내야 함"""
+        cursor = StreamingCursor(ROWS, COLUMNS)
+        opened = []
+
+        chunks = list(stream_query("SELECT ...", [1], 'ndjson', fetch_size=2,
+                                   cursor_factory=factory(cursor, opened)))
+
+        assert len(chunks) == 2
+        assert cursor.fetches == [2, 1, 0]
+        lines = b''.join(chunks).decode('utf-8').splitlines()
+        assert json.loads(lines[0]) == {
+            'id': 1, 'academy_name': '수학, 학원', 'score': 71.5, 'created_at': '2025-03-01T09:00:00', 'note': None
+        }
+        assert len(lines) == 3
+        assert 'net_write_timeout' in cursor.executed[0][0]
+        assert cursor.executed[1] == ('SELECT ...', [1])
+        assert opened == ['open', 'close']
+
+    def test_is_lazy(self):
+        """첫 청크를 요청하기 전에는 연결을 열지 않아야 함"""
+        opened = []
+        chunks = stream_query("SELECT ...", [], 'csv', cursor_factory=factory(StreamingCursor(ROWS, COLUMNS), opened))
+
+        assert opened == []
+        next(chunks)
+        assert opened == ['open']
+
+    def test_close_mid_stream_releases_connection(self):
+        """클라이언트가 중간에 끊으면(제너레이터 close) 연결을 닫아야 함"""
+        cursor = StreamingCursor(ROWS, COLUMNS)
+        opened = []
+        chunks = stream_query("SELECT ...", [], 'csv', fetch_size=1, cursor_factory=factory(cursor, opened))
+
+        next(chunks)
+        chunks.close()
+
+        assert opened == ['open', 'close']
+        assert cursor.fetches == [1]
+
+    def test_transform_adds_columns(self):
+        """파생 컬럼은 CSV 헤더에도 포함되어야 함"""
+        def transform(row):
+            row['is_heavy_user'] = row['id'] > 1
+            return row
+
+        text = b''.join(stream_query("SELECT ...", [], 'csv', transform=transform,
+                                     cursor_factory=factory(StreamingCursor(ROWS, COLUMNS), []))).decode('utf-8')
+
+        lines = text[len(BOM):].splitlines()
+        assert lines[0].endswith(',is_heavy_user')
+        assert lines[1].endswith(',False')
+        assert lines[3].endswith(',True')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
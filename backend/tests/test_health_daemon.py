@@ -0,0 +1,182 @@
+"""
+헬스체크 데몬 루프 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_health_daemon.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.health_aggregates import AGGREGATE_COLUMNS
+from utils.health_daemon import HealthDaemon
+
+
+class RecordingWriter:
+    """BatchWriter 대용"""
+
+    def __init__(self):
+        self.rows = []
+        self.closed = False
+
+    def submit(self, row):
+        self.rows.append(row)
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+def counting_sampler(values=(10.0, 20.0, 30.0, 5, 1, 2, 3)):
+    calls = []
+
+    def sample():
+        calls.append(time.monotonic())
+        return values
+    sample.calls = calls
+    return sample
+
+
+class FakeClock:
+    """버킷 경계 계산용 epoch 시계"""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+# 2025-01-01 00:00:00 UTC (분/시 경계)
+HOUR = 1735689600.0
+
+
+def make_daemon(sample, clock=None, **kwargs):
+    kwargs.setdefault('writer', RecordingWriter())
+    kwargs.setdefault('interval', 0.01)
+    kwargs.setdefault('alert_interval', 3600)
+    kwargs.setdefault('purge', None)
+    return HealthDaemon(sample, clock=clock or FakeClock(HOUR), **kwargs)
+
+
+class TestHealthDaemon:
+    """HealthDaemon 테스트"""
+
+    def test_minute_bucket_written_when_minute_changes(self):
+        """분이 바뀌면 이전 1분 버킷 집계를 작성기에 넣어야 함"""
+        clock = FakeClock(HOUR + 10)
+        values = iter([(10, 50, 70, 4, 1, 0, 2), (30, 70, 70, 6, 3, None, 4), (90, 0, 0, 0, 0, 0, 0)])
+        daemon = make_daemon(lambda: next(values), clock)
+
+        daemon.tick()
+        clock.now = HOUR + 20
+        daemon.tick()
+        assert daemon.writer.rows == []
+
+        clock.now = HOUR + 61
+        daemon.tick()
+
+        assert len(daemon.writer.rows) == 1
+        row = dict(zip(AGGREGATE_COLUMNS, daemon.writer.rows[0]))
+        assert row['resolution'] == '1m'
+        assert row['bucket_start'] == datetime.fromtimestamp(HOUR)
+        assert row['samples'] == 2
+        assert (row['cpu_min'], row['cpu_avg'], row['cpu_max'], row['cpu_p95']) == (10, 20, 30, 30)
+        assert row['active_connections_max'] == 6
+        assert row['mysql_connections_max'] == 0
+
+    def test_hour_bucket_and_purge(self):
+        """시가 바뀌면 1시간 버킷을 기록하고 보관 기간 정리를 호출해야 함"""
+        clock = FakeClock(HOUR + 3500)
+        purged = []
+        daemon = make_daemon(lambda: (10, 20, 30, 1, 0, 0, 0), clock, purge=lambda: purged.append(True))
+
+        daemon.tick()
+        clock.now = HOUR + 3600
+        daemon.tick()
+
+        resolutions = [row[0] for row in daemon.writer.rows]
+        assert sorted(resolutions) == ['1h', '1m']
+        assert purged == [True]
+
+    def test_open_buckets_flushed_on_stop(self):
+        """종료 시 진행 중인 버킷을 기록하고 작성기를 닫아야 함"""
+        daemon = make_daemon(counting_sampler())
+
+        daemon.run(max_ticks=3)
+
+        assert sorted(row[0] for row in daemon.writer.rows) == ['1h', '1m']
+        assert all(row[2] == 3 for row in daemon.writer.rows)
+        assert daemon.writer.closed is True
+
+    def test_alert_window_reads_ring_average(self):
+        """Alert 콜백은 링 버퍼의 최근 윈도우 평균과 샘플 수를 받아야 함"""
+        clock = FakeClock(HOUR)
+        values = iter([(10, 0, 0, 0, 0, 0, 0), (30, 0, 0, 0, 0, 0, 0), (50, 0, 0, 0, 0, 0, 0)])
+        windows = []
+        daemon = make_daemon(lambda: next(values), clock, alert_interval=300,
+                             on_window=lambda avg, n: windows.append((avg, n)))
+
+        daemon.tick()
+        clock.now = HOUR + 400
+        daemon.tick()
+        clock.now = HOUR + 401
+        daemon.tick()
+        daemon.evaluate_window()
+
+        assert len(windows) == 1
+        assert windows[0][0]['cpu_usage'] == 40
+        assert windows[0][1] == 2
+
+    def test_sample_error_does_not_stop_loop(self):
+        """샘플 실패는 기록만 하고 루프는 계속되어야 함"""
+        def broken():
+            raise RuntimeError("boom")
+
+        daemon = make_daemon(broken)
+        daemon.run(max_ticks=2)
+
+        assert daemon.ticks == 2
+        assert daemon.errors == 2
+        assert daemon.writer.rows == []
+
+    def test_stop_interrupts_wait(self):
+        """stop()은 다음 tick을 기다리지 않고 즉시 종료시켜야 함"""
+        daemon = make_daemon(counting_sampler(), interval=30)
+
+        thread = threading.Thread(target=daemon.run)
+        start = time.monotonic()
+        thread.start()
+        daemon.stop()
+        thread.join(2)
+
+        assert not thread.is_alive()
+        assert time.monotonic() - start < 1
+        assert daemon.ticks == 0
+        assert daemon.writer.closed is True
+
+    def test_ticks_do_not_drift(self):
+        """tick 간격은 샘플 수집 시간과 무관하게 interval이어야 함"""
+        sample = counting_sampler()
+
+        def slow_sample():
+            time.sleep(0.04)
+            return sample()
+
+        daemon = make_daemon(slow_sample, interval=0.05)
+        daemon.run(max_ticks=4)
+
+        # 고정 스케줄이면 3구간 = 0.15초, 수집 시간이 누적되면 0.27초
+        assert sample.calls[-1] - sample.calls[0] < 0.22
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,225 @@
+"""
+HTTP 조건부 요청 / 압축 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_http_cache.py -v
+"""
+
+import pytest
+import sys
+import os
+import gzip
+import json
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.http_cache import (
+    accepts_gzip, cache_control, combine_versions, etag_matches, make_etag, payload_version,
+)
+
+
+class TestVersions:
+    """버전 / ETag 비교 테스트"""
+
+    def test_payload_version_ignores_key_order(self):
+        a = payload_version({'x': 1, 'at': datetime(2025, 3, 1), 'rows': [{'b': 2, 'a': 1}]})
+        b = payload_version({'rows': [{'a': 1, 'b': 2}], 'at': datetime(2025, 3, 1), 'x': 1})
+        assert a == b
+        assert a != payload_version({'x': 2, 'at': datetime(2025, 3, 1), 'rows': [{'a': 1, 'b': 2}]})
+
+    def test_combine_versions_is_order_sensitive(self):
+        assert combine_versions(['a:1', 'b:2']) == combine_versions(['a:1', 'b:2'])
+        assert combine_versions(['a:1', 'b:2']) != combine_versions(['b:2', 'a:1'])
+
+    def test_etag_matches(self):
+        etag = make_etag('abc')
+        assert etag == 'W/"abc"'
+        assert etag_matches('W/"abc"', etag)
+        assert etag_matches('"abc"', etag)             # weak 비교
+        assert etag_matches('"x", W/"abc"', etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches('W/"abd"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestHeaders:
+    """Cache-Control / Accept-Encoding 테스트"""
+
+    def test_cache_control(self):
+        assert cache_control(0) == 'private, no-cache'
+        assert cache_control(-5) == 'private, no-cache'
+        assert cache_control(120.7) == 'private, max-age=120'
+        assert cache_control(300, stale=600) == 'private, max-age=300, stale-while-revalidate=600'
+
+    def test_accepts_gzip(self):
+        assert accepts_gzip('gzip, deflate, br')
+        assert accepts_gzip('br;q=1.0, gzip;q=0.8')
+        assert not accepts_gzip('gzip;q=0')
+        assert not accepts_gzip('identity')
+        assert not accepts_gzip(None)
+
+
+class TestConditionalJson:
+    """Flask 응답 테스트 (flask 설치 시)"""
+
+    @pytest.fixture
+    def app(self):
+        flask = pytest.importorskip('flask')
+        from utils.http_cache import conditional_json
+
+        app = flask.Flask(__name__)
+        payload = {'rows': [{'id': i, 'name': f'학원 {i}'} for i in range(200)]}
+
+        @app.route('/data')
+        def data():
+            return conditional_json(payload, payload_version(payload), max_age=60)
+
+        return app
+
+    def test_304_when_etag_matches(self, app):
+        client = app.test_client()
+        first = client.get('/data')
+        assert first.status_code == 200
+        assert first.headers['Cache-Control'] == 'private, max-age=60'
+
+        second = client.get('/data', headers={'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == first.headers['ETag']
+
+    def test_large_response_is_gzipped(self, app):
+        response = app.test_client().get('/data', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert len(json.loads(gzip.decompress(response.data))['rows']) == 200
+
+
+class FakeCursor:
+    """db_cursor 대체 - 실행한 쿼리 수를 셉니다"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = 0
+
+    def execute(self, sql, params=None):
+        self.executed += 1
+
+    def fetchall(self):
+        return [dict(row) for row in self.rows]
+
+
+class TestCachedListPages:
+    """목록 API - 캐시 항목 버전으로 304 (flask 설치 시)"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        flask = pytest.importorskip('flask')
+        from contextlib import contextmanager
+        from routes.admin import tables
+        from utils.result_cache import ResultCache
+
+        cursor = FakeCursor([{'academy_id': 1, 'monthly_reports': 30, 'signup_date': datetime(2024, 1, 1)}])
+
+        @contextmanager
+        def fake_db_cursor(*args, **kwargs):
+            yield cursor
+
+        monkeypatch.setattr(tables, 'db_cursor', fake_db_cursor)
+        monkeypatch.setattr(tables, 'tables_cache', ResultCache(namespace='tables-test'))
+
+        app = flask.Flask(__name__)
+        app.register_blueprint(tables.tables_bp)
+        return app.test_client(), cursor
+
+    def test_revalidation_skips_queries(self, client):
+        client, cursor = client
+        first = client.get('/api/admin/tables/heavy-users')
+        assert first.status_code == 200
+        assert first.get_json()['academies'][0]['signup_date'] == '2024-01-01T00:00:00'
+        assert cursor.executed == 1
+
+        second = client.get('/api/admin/tables/heavy-users',
+                            headers={'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+        assert cursor.executed == 1
+
+    def test_pages_are_cached_per_query(self, client):
+        client, cursor = client
+        client.get('/api/admin/tables/heavy-users')
+        client.get('/api/admin/tables/heavy-users?recommended_plan=Pro')
+        assert cursor.executed == 2
+
+        client.get('/api/admin/tables/heavy-users?refresh=1')
+        assert cursor.executed == 3
+
+    def test_invalid_cursor_is_400(self, client):
+        client, cursor = client
+        response = client.get('/api/admin/tables/heavy-users?cursor=!!!')
+        assert response.status_code == 400
+        assert cursor.executed == 0
+
+
+class TestCachedAlerts:
+    """Alert API - 캐시된 체크 결과의 버전으로 304 (flask 설치 시)"""
+
+    @pytest.fixture
+    def app(self, monkeypatch):
+        flask = pytest.importorskip('flask')
+        from routes.admin import alerts
+        from utils.result_cache import ResultCache
+
+        state = {'runs': 0, 'status': 'ok'}
+
+        def fake_checks():
+            state['runs'] += 1
+            return {
+                'alerts': [],
+                'checks': [{'name': 'cpu', 'status': state['status'], 'duration_ms': 1.0}],
+                'duration_ms': float(state['runs']),
+            }
+
+        monkeypatch.setattr(alerts, 'run_dashboard_checks', fake_checks)
+        monkeypatch.setattr(alerts, 'alerts_cache', ResultCache(namespace='alerts-test'))
+
+        app = flask.Flask(__name__)
+        app.register_blueprint(alerts.alerts_bp)
+        return app, state
+
+    def test_revalidation_skips_checks(self, app):
+        app, state = app
+        client = app.test_client()
+        first = client.get('/api/admin/dashboard/alerts')
+        assert first.status_code == 200
+        assert first.headers['Cache-Control'].startswith('private, max-age=')
+
+        second = client.get('/api/admin/dashboard/alerts',
+                            headers={'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+        assert state['runs'] == 1
+
+    def test_version_survives_recompute(self, app):
+        app, state = app
+        client = app.test_client()
+        first = client.get('/api/admin/dashboard/alerts')
+        second = client.get('/api/admin/dashboard/alerts?refresh=1',
+                            headers={'If-None-Match': first.headers['ETag']})
+        assert state['runs'] == 2
+        assert second.status_code == 304
+
+    def test_incomplete_checks_are_not_cached(self, app):
+        app, state = app
+        state['status'] = 'unknown'
+        client = app.test_client()
+        first = client.get('/api/admin/dashboard/alerts')
+        assert first.headers['Cache-Control'] == 'private, no-cache'
+
+        client.get('/api/admin/dashboard/alerts')
+        assert state['runs'] == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,272 @@
+"""
+지표 공유 스캔 동등성 테스트
+
+공유 스캔(routes/admin/metrics.py)으로 만든 카드 값이 개별 카드 엔드포인트의
+원래 쿼리와 같은지 SQLite 픽스처 DB에서 비교합니다.
+
+실행 방법:
+    cd backend
+    pytest tests/test_metric_scans.py -v
+"""
+
+import pytest
+import sys
+import os
+import re
+import sqlite3
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('flask')
+
+import routes.admin.metrics as metrics
+from utils.activity_bitmaps import DailyBitmaps, group_active_days
+from utils.metrics_rollup import ROLLUP_SOURCES
+from utils.time_windows import get_time_windows
+
+
+SCHEMA = """
+    CREATE TABLE academies (id INTEGER PRIMARY KEY, created_at TEXT, is_deleted INTEGER DEFAULT 0);
+    CREATE TABLE students (id INTEGER PRIMARY KEY, academy_id INTEGER, is_deleted INTEGER DEFAULT 0);
+    CREATE TABLE progress_records (
+        id INTEGER PRIMARY KEY, student_id INTEGER, created_at TEXT, is_deleted INTEGER DEFAULT 0,
+        card_news_generated INTEGER DEFAULT 0, ai_generated INTEGER DEFAULT 0
+    );
+    CREATE TABLE activity_logs (id INTEGER PRIMARY KEY, academy_id INTEGER, action_type TEXT, created_at TEXT);
+    CREATE TABLE daily_academy_activity (
+        activity_date TEXT, academy_id INTEGER, action_count INTEGER, share_count INTEGER,
+        first_activity_at TEXT, last_activity_at TEXT
+    );
+    CREATE TABLE daily_report_counts (
+        report_date TEXT, student_id INTEGER, academy_id INTEGER,
+        report_count INTEGER, card_news_count INTEGER, ai_report_count INTEGER
+    );
+"""
+
+
+def _sql_value(value):
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+class SQLiteCursor:
+    """MySQL 스타일(%(name)s / %s) 쿼리를 SQLite에서 실행하는 dict 커서"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._cursor = None
+
+    def execute(self, sql, params=None):
+        if isinstance(params, dict):
+            sql = re.sub(r'%\((\w+)\)s', r':\1', sql)
+            params = {k: _sql_value(v) for k, v in params.items()}
+        else:
+            sql = sql.replace('%s', '?')
+            params = [_sql_value(v) for v in params or ()]
+        self._cursor = self.conn.execute(sql, params)
+
+    def _row(self, row):
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return self._row(row) if row is not None else None
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(SCHEMA)
+    yield conn
+    conn.close()
+
+
+def insert(conn, table, rows):
+    for row in rows:
+        columns = ', '.join(row)
+        conn.execute(f"INSERT INTO {table} ({columns}) VALUES ({', '.join('?' * len(row))})",
+                     [_sql_value(v) for v in row.values()])
+
+
+def fetch(conn, sql, **params):
+    cursor = SQLiteCursor(conn)
+    cursor.execute(sql, params)
+    return cursor.fetchone()
+
+
+class TestReportCards:
+    """content-generation / ai-efficiency 카드 = 기존 개별 엔드포인트 쿼리"""
+
+    def seed(self, conn, windows):
+        this_month, last_month = windows.month_start, windows.prev_month_start
+        insert(conn, 'students', [
+            {'id': 1, 'academy_id': 10},
+            {'id': 2, 'academy_id': 10, 'is_deleted': 1},
+            {'id': 3, 'academy_id': 20},
+        ])
+        insert(conn, 'progress_records', [
+            {'id': 1, 'student_id': 1, 'created_at': this_month, 'card_news_generated': 1, 'ai_generated': 1},
+            {'id': 2, 'student_id': 2, 'created_at': this_month, 'card_news_generated': 1},
+            {'id': 3, 'student_id': 99, 'created_at': this_month, 'card_news_generated': 1, 'ai_generated': 1},
+            {'id': 4, 'student_id': 3, 'created_at': this_month, 'ai_generated': 1},
+            {'id': 5, 'student_id': 99, 'created_at': last_month, 'card_news_generated': 1},
+            {'id': 6, 'student_id': 1, 'created_at': last_month, 'card_news_generated': 1},
+            {'id': 7, 'student_id': 1, 'created_at': this_month, 'card_news_generated': 1, 'is_deleted': 1},
+        ])
+
+    def test_matches_original_endpoint_queries(self, db):
+        """학생 행이 없는 리포트(student_id 99)는 이번 달 카드뉴스/AI 수에서 빠져야 함 (JOIN students)"""
+        scans = metrics.MetricScans(SQLiteCursor(db))
+        windows = scans.windows
+        self.seed(db, windows)
+
+        # 기존 get_content_generation / get_ai_efficiency 쿼리 (기간 경계만 파라미터로)
+        card_news = fetch(db, """
+            SELECT
+                COUNT(CASE WHEN card_news_generated = 1 THEN 1 END) as card_news_count,
+                COUNT(DISTINCT CASE WHEN card_news_generated = 1 THEN academy_id END) as academy_count
+            FROM progress_records pr
+            JOIN students s ON pr.student_id = s.id
+            WHERE pr.created_at >= %(month_start)s
+            AND pr.is_deleted = 0
+        """, month_start=windows.month_start)
+        card_news_last = fetch(db, """
+            SELECT COUNT(*) as last_month
+            FROM progress_records
+            WHERE card_news_generated = 1
+            AND created_at >= %(prev_month_start)s
+            AND created_at < %(month_start)s
+            AND is_deleted = 0
+        """, prev_month_start=windows.prev_month_start, month_start=windows.month_start)
+        ai = fetch(db, """
+            SELECT
+                COUNT(CASE WHEN ai_generated = 1 THEN 1 END) as ai_reports,
+                COUNT(DISTINCT CASE WHEN ai_generated = 1 THEN s.academy_id END) as academy_count
+            FROM progress_records pr
+            JOIN students s ON pr.student_id = s.id
+            WHERE pr.created_at >= %(month_start)s
+            AND pr.is_deleted = 0
+        """, month_start=windows.month_start)
+
+        content = metrics._build_content_generation(scans)
+        assert content['card_news_count'] == card_news['card_news_count'] == 2
+        assert content['avg_per_academy'] == round(card_news['card_news_count'] / card_news['academy_count'], 1)
+        assert content['last_month'] == card_news_last['last_month'] == 2
+
+        reports = scans.get('reports')
+        assert reports['ai_reports'] == ai['ai_reports'] == 2
+        assert reports['ai_academies'] == ai['academy_count'] == 2
+
+
+class TestRollupEquivalence:
+    """롤업 + tail 스캔 = 원본 스캔 (워터마크 신선도와 무관하게 같은 카드 값)"""
+
+    WATERMARKS = {'progress_records': 6, 'activity_logs': 2}
+
+    def seed(self, conn, windows):
+        recent = windows.now - timedelta(minutes=5)
+        last_month = windows.prev_month_start
+        insert(conn, 'academies', [
+            {'id': 1, 'created_at': windows.days_30_ago + timedelta(hours=1)},
+            {'id': 2, 'created_at': windows.days_30_ago + timedelta(hours=1)},
+            {'id': 3, 'created_at': windows.days_30_ago + timedelta(hours=1), 'is_deleted': 1},
+            {'id': 4, 'created_at': windows.now - timedelta(days=60)},
+        ])
+        insert(conn, 'students', [
+            {'id': 1, 'academy_id': 1},
+            {'id': 2, 'academy_id': 2, 'is_deleted': 1},
+            {'id': 3, 'academy_id': 3},
+            {'id': 4, 'academy_id': 4},
+        ])
+        insert(conn, 'progress_records', [
+            # 롤업에 반영된 행 (id <= 6)
+            {'id': 1, 'student_id': 1, 'created_at': recent, 'card_news_generated': 1, 'ai_generated': 1},
+            {'id': 2, 'student_id': 2, 'created_at': recent, 'card_news_generated': 1},
+            {'id': 3, 'student_id': 99, 'created_at': recent, 'card_news_generated': 1, 'ai_generated': 1},
+            {'id': 4, 'student_id': 3, 'created_at': recent, 'ai_generated': 1},
+            {'id': 5, 'student_id': 99, 'created_at': last_month, 'card_news_generated': 1},
+            {'id': 6, 'student_id': 4, 'created_at': last_month, 'card_news_generated': 1},
+            # tail (워터마크 이후)
+            {'id': 7, 'student_id': 1, 'created_at': recent, 'card_news_generated': 1, 'is_deleted': 1},
+            {'id': 8, 'student_id': 2, 'created_at': recent, 'ai_generated': 1},
+            {'id': 9, 'student_id': 99, 'created_at': recent, 'card_news_generated': 1},
+            {'id': 10, 'student_id': 1, 'created_at': recent, 'card_news_generated': 1},
+        ])
+        insert(conn, 'activity_logs', [
+            {'id': 1, 'academy_id': 1, 'action_type': 'share_kakaotalk', 'created_at': recent},
+            {'id': 2, 'academy_id': 2, 'action_type': 'login', 'created_at': recent},
+            {'id': 3, 'academy_id': 3, 'action_type': 'share_kakaotalk', 'created_at': recent},
+        ])
+
+        cursor = SQLiteCursor(conn)
+        cursor.execute(ROLLUP_SOURCES['progress_records']['rebuild'],
+                       (windows.prev_month_start, windows.next_month_start, self.WATERMARKS['progress_records']))
+        cursor.execute(ROLLUP_SOURCES['activity_logs']['rebuild'],
+                       (windows.days_31_start, windows.next_month_start, self.WATERMARKS['activity_logs']))
+
+    def test_reports(self, db):
+        windows = get_time_windows()
+        self.seed(db, windows)
+        cursor = SQLiteCursor(db)
+
+        raw = metrics._scan_reports(cursor, windows)
+        rollup = metrics._scan_reports_rollup(cursor, self.WATERMARKS, windows)
+
+        assert rollup == raw
+        assert raw['card_news_this_month'] == 3    # 1, 2, 10 (학생 행 없는 3, 9 제외)
+
+    def test_funnel(self, db):
+        windows = get_time_windows()
+        self.seed(db, windows)
+        cursor = SQLiteCursor(db)
+
+        raw = metrics._scan_funnel(cursor, windows)
+        rollup = metrics._scan_funnel_rollup(cursor, self.WATERMARKS, windows)
+
+        assert rollup == raw
+        # 삭제된 학원 3 제외, 학원 2는 삭제된 학생의 리포트뿐이라 리포트 단계 미달
+        assert raw == {'total_signups': 2, 'has_students': 1, 'created_report': 1, 'shared_kakaotalk': 1}
+
+
+
+class TestActiveWindows:
+    """7일 활성(WAU)은 원본 / 롤업 / 비트맵 모두 오늘 포함 최근 7일(달력 기준)"""
+
+    def seed(self, conn, windows):
+        rows = [
+            {'id': 1, 'academy_id': 1, 'action_type': 'login', 'created_at': windows.now - timedelta(minutes=5)},
+            # 7×24시간 안이지만 달력 7일 밖
+            {'id': 2, 'academy_id': 2, 'action_type': 'login', 'created_at': windows.week_start - timedelta(seconds=1)},
+            {'id': 3, 'academy_id': 3, 'action_type': 'login', 'created_at': windows.week_start},
+        ]
+        insert(conn, 'activity_logs', rows)
+        SQLiteCursor(conn).execute(ROLLUP_SOURCES['activity_logs']['rebuild'],
+                                   (windows.days_31_start, windows.next_month_start, 2))
+        return rows
+
+    def test_same_definition_for_all_sources(self, db, monkeypatch):
+        windows = get_time_windows()
+        rows = self.seed(db, windows)
+        cursor = SQLiteCursor(db)
+        monkeypatch.setattr(metrics, 'load_daily_bitmaps',
+                            lambda cursor, start, end: DailyBitmaps(group_active_days(rows)))
+
+        keys = ('dau', 'active_7d', 'mau')
+        raw = metrics._scan_activity(cursor, windows)
+        rollup = metrics._scan_activity_rollup(cursor, {'activity_logs': 2}, windows)
+        bitmaps = metrics._scan_active_academies(cursor, windows)
+
+        assert [raw[k] for k in keys] == [rollup[k] for k in keys] == [bitmaps[k] for k in keys]
+        assert raw['active_7d'] == 2    # 학원 1, 3
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,135 @@
+"""
+메트릭 링 버퍼 / 헬스 집계 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_metrics_ring.py -v
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.health_aggregates import (
+    AGGREGATE_COLUMNS, SAMPLE_COLUMNS, UPSERT_SQL, bucket_start, build_aggregate_row, merge_buckets
+)
+from utils.metrics_ring import MetricsRingBuffer, describe
+
+
+def bucket(samples, cpu, ram, disk):
+    """1분 집계 행 (avg = p95 = max)"""
+    row = {'samples': samples}
+    for resource, value in (('cpu', cpu), ('ram', ram), ('disk', disk)):
+        row.update({f"{resource}_avg": value, f"{resource}_p95": value, f"{resource}_max": value})
+    return row
+
+
+class TestDescribe:
+    """min/avg/max/p95 테스트"""
+
+    def test_nearest_rank_p95(self):
+        """p95는 nearest-rank여야 함"""
+        assert describe([float(i) for i in range(1, 21)]) == {'min': 1.0, 'avg': 10.5, 'max': 20.0, 'p95': 19.0}
+
+    def test_empty(self):
+        """값이 없으면 모두 None이어야 함"""
+        assert describe([]) == {'min': None, 'avg': None, 'max': None, 'p95': None}
+
+
+class TestMetricsRingBuffer:
+    """MetricsRingBuffer 테스트"""
+
+    def test_summarize_time_range(self):
+        """[start, end) 구간 샘플만 집계해야 함"""
+        ring = MetricsRingBuffer(('cpu', 'ram'), capacity=10)
+        for t in range(5):
+            ring.append(100.0 + t, (t * 10, 50))
+
+        summary = ring.summarize(101.0, 104.0)
+
+        assert summary['samples'] == 3
+        assert summary['cpu'] == {'min': 10.0, 'avg': 20.0, 'max': 30.0, 'p95': 30.0}
+        assert summary['ram']['avg'] == 50.0
+
+    def test_overwrites_oldest(self):
+        """용량을 넘으면 가장 오래된 샘플부터 덮어써야 함"""
+        ring = MetricsRingBuffer(('cpu',), capacity=3)
+        for t in range(5):
+            ring.append(float(t), (t,))
+
+        assert len(ring) == 3
+        assert ring.oldest() == 2.0
+        assert ring.summarize(0)['cpu']['min'] == 2.0
+
+    def test_none_values_skipped(self):
+        """None 값은 집계에서 제외해야 함"""
+        ring = MetricsRingBuffer(('cpu', 'conn'), capacity=4)
+        ring.append(1.0, (10, None))
+        ring.append(2.0, (20, 5))
+
+        summary = ring.summarize(0)
+
+        assert summary['samples'] == 2
+        assert summary['conn'] == {'min': 5.0, 'avg': 5.0, 'max': 5.0, 'p95': 5.0}
+
+    def test_invalid_capacity(self):
+        """용량이 1 미만이면 ValueError"""
+        with pytest.raises(ValueError):
+            MetricsRingBuffer(('cpu',), capacity=0)
+
+
+class TestHealthAggregates:
+    """집계 행 생성/병합 테스트"""
+
+    def test_bucket_start(self):
+        """버킷 시작은 해상도 단위로 내림해야 함"""
+        assert bucket_start(3725.0, '1m') == 3720
+        assert bucket_start(3725.0, '1h') == 3600
+
+    def test_build_row(self):
+        """링 버퍼 요약을 AGGREGATE_COLUMNS 순서의 행으로 만들어야 함"""
+        ring = MetricsRingBuffer(SAMPLE_COLUMNS, capacity=4)
+        ring.append(60.0, (10.123, 40, 70, 3, 1, None, 2))
+        ring.append(61.0, (20.0, 60, 70, 5, 2, None, 2))
+
+        row = dict(zip(AGGREGATE_COLUMNS, build_aggregate_row('1m', 60.0, ring.summarize(60.0))))
+
+        assert row['bucket_start'] == datetime.fromtimestamp(60.0)
+        assert row['samples'] == 2
+        assert row['cpu_min'] == 10.12
+        assert row['ram_avg'] == 50.0
+        assert row['active_connections_max'] == 5
+        assert row['mysql_connections_max'] is None
+
+    def test_empty_bucket_not_written(self):
+        """샘플이 없는 버킷은 None"""
+        ring = MetricsRingBuffer(SAMPLE_COLUMNS, capacity=4)
+        assert build_aggregate_row('1m', 0.0, ring.summarize(0)) is None
+
+    def test_upsert_updates_samples_last(self):
+        """가중 평균이 이전 samples로 계산되도록 samples는 마지막에 갱신해야 함"""
+        update = UPSERT_SQL.split('ON DUPLICATE KEY UPDATE')[1]
+        assert update.strip().endswith('samples = samples + VALUES(samples)')
+        assert update.index('cpu_avg =') < update.index('samples = samples')
+
+    def test_merge_buckets(self):
+        """평균은 샘플 수 가중, p95/max는 버킷 중 최대여야 함"""
+        summary = merge_buckets([bucket(60, 10, 50, 70), bucket(20, 50, 50, 70)])
+
+        assert summary['samples'] == 80
+        assert summary['cpu'] == {'avg': 20.0, 'p95': 50.0, 'max': 50.0}
+        assert summary['ram']['avg'] == 50.0
+
+    def test_merge_no_buckets(self):
+        """집계가 없으면 값은 None이어야 함"""
+        summary = merge_buckets([])
+        assert summary['samples'] == 0
+        assert summary['cpu'] == {'avg': None, 'p95': None, 'max': None}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,154 @@
+"""
+지표 롤업 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_metrics_rollup.py -v
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+from datetime import date
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.metrics_rollup as rollup
+
+
+class ScriptedCursor:
+    """워터마크/MAX(id) 조회에 고정 값을 돌려주고 실행한 SQL을 기록"""
+
+    def __init__(self, state):
+        self.state = state
+        self._result = None
+
+    def execute(self, sql, params=None):
+        self.state['executed'].append((' '.join(sql.split()), params))
+        if 'FROM rollup_watermarks' in sql and 'FOR UPDATE' in sql:
+            self._result = self.state['watermark']
+        elif 'as max_id' in sql:
+            self._result = {'max_id': self._settled_max_id(params[0])}
+        elif sql.strip().startswith('UPDATE rollup_watermarks') and self.state['watermark']:
+            self.state['watermark'] = dict(self.state['watermark'], last_id=params[0])
+
+    def _settled_max_id(self, settle_seconds):
+        """rows가 있으면 커밋되어 보이고 settle_seconds보다 오래된 행 중 최대 id"""
+        rows = self.state.get('rows')
+        if rows is None:
+            return self.state['max_id']
+        return max([row['id'] for row in rows if row['committed'] and row['age'] >= settle_seconds], default=0)
+
+    def fetchone(self):
+        return self._result
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = {'executed': [], 'watermark': None, 'max_id': 0}
+
+    @contextmanager
+    def fake_db_cursor(dictionary=True, commit=False, **kwargs):
+        yield ScriptedCursor(state)
+
+    monkeypatch.setattr(rollup, 'db_cursor', fake_db_cursor)
+    return state
+
+
+def appended_ranges(state):
+    return [params for sql, params in state['executed'] if sql.startswith('INSERT') and 'id > %s' in sql]
+
+
+class TestRollForward:
+    """증분 롤업 테스트"""
+
+    def test_requires_backfill(self, state):
+        """워터마크가 없으면 아무 것도 누적하지 않아야 함"""
+        assert rollup.roll_forward('activity_logs') == 0
+        assert appended_ranges(state) == []
+
+    def test_processes_in_batches(self, state):
+        """워터마크 이후 id를 배치 단위로 누적해야 함"""
+        state['watermark'] = {'last_id': 0, 'covered_from': date(2025, 1, 1)}
+        state['max_id'] = 120
+
+        assert rollup.roll_forward('activity_logs', batch_size=50) == 120
+        assert appended_ranges(state) == [(0, 50), (50, 100), (100, 120)]
+        assert state['watermark']['last_id'] == 120
+
+    def test_no_new_rows_still_touches_watermark(self, state):
+        """새 행이 없어도 워터마크 갱신 시각은 기록되어야 함"""
+        state['watermark'] = {'last_id': 120, 'covered_from': date(2025, 1, 1)}
+        state['max_id'] = 120
+
+        assert rollup.roll_forward('activity_logs') == 0
+        assert appended_ranges(state) == []
+        assert any(sql.startswith('UPDATE rollup_watermarks') for sql, _ in state['executed'])
+
+    def test_late_commit_of_lower_id_is_not_skipped(self, state):
+        """더 큰 id가 먼저 커밋돼도, 아직 커밋 전인 작은 id를 워터마크가 건너뛰면 안 됨"""
+        state['watermark'] = {'last_id': 0, 'covered_from': date(2025, 1, 1)}
+        state['rows'] = [
+            {'id': 1, 'age': 600, 'committed': True},
+            {'id': 2, 'age': 600, 'committed': True},
+            {'id': 3, 'age': 1, 'committed': False},     # 다른 워커의 executemany 진행 중
+            {'id': 4, 'age': 0, 'committed': True},
+        ]
+
+        rollup.roll_forward('activity_logs')
+        assert state['watermark']['last_id'] == 2       # 3, 4는 tail(id > 2)로 읽힘
+
+        # id 3이 늦게 커밋되고 시간이 지난 뒤 다음 실행
+        for row in state['rows']:
+            row['committed'] = True
+            row['age'] += 300
+        rollup.roll_forward('activity_logs')
+
+        appended = {i for lo, hi in appended_ranges(state) for i in range(lo + 1, hi + 1)}
+        assert appended == {1, 2, 3, 4}
+        assert state['watermark']['last_id'] == 4
+
+    def test_progress_records_refreshes_recent_days(self, state):
+        """progress_records는 최근 일자를 다시 집계해야 함"""
+        state['watermark'] = {'last_id': 10, 'covered_from': date(2025, 1, 1)}
+        state['max_id'] = 10
+
+        rollup.roll_forward('progress_records')
+
+        deletes = [sql for sql, _ in state['executed'] if sql.startswith('DELETE FROM daily_report_counts')]
+        assert len(deletes) == 1
+
+
+class TestRefresh:
+    """비교 구간 재집계 테스트"""
+
+    def test_refreshes_whole_compared_window(self, state, monkeypatch):
+        """전월 대비 카드가 읽는 구간 전체(비교 시작일이 속한 월 1일부터)를 다시 집계해야 함"""
+        calls = []
+        monkeypatch.setattr(rollup, 'backfill', lambda start, end=None: calls.append(start) or {})
+
+        rollup.refresh_compared_window(date(2025, 3, 20))
+        rollup.refresh_compared_window(date(2025, 3, 1))
+
+        assert calls == [date(2025, 2, 1), date(2025, 1, 1)]
+
+
+class TestDates:
+    """날짜 계산 테스트"""
+
+    def test_parse_month(self):
+        assert rollup.parse_month('2025-03') == date(2025, 3, 1)
+
+    def test_next_month_wraps_year(self):
+        assert rollup._next_month(date(2025, 12, 1)) == date(2026, 1, 1)
+
+    def test_required_coverage_start(self):
+        """전월 1일과 31일 전 중 이른 날짜"""
+        assert rollup.required_coverage_start(date(2025, 3, 20)) == date(2025, 2, 1)
+        assert rollup.required_coverage_start(date(2025, 3, 1)) == date(2025, 1, 29)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
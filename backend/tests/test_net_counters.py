@@ -0,0 +1,95 @@
+"""
+커널 카운터 연결 수 집계 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_net_counters.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.net_counters import count_established_by_port, read_established_total
+
+
+SNMP = """Ip: Forwarding DefaultTTL InReceives
+Ip: 1 64 1000
+Tcp: RtoAlgorithm RtoMin RtoMax MaxConn ActiveOpens PassiveOpens AttemptFails EstabResets CurrEstab InSegs
+Tcp: 1 200 120000 -1 500 300 2 10 42 99999
+Udp: InDatagrams NoPorts
+Udp: 10 0
+"""
+
+TCP_HEADER = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n"
+
+
+def tcp_line(local_port, remote_port, state):
+    return (f"   0: 0100007F:{local_port:04X} 0100007F:{remote_port:04X} {state} "
+            f"00000000:00000000 00:00000000 00000000     0        0 12345 1 0000000000000000 100 0 0 10 0\n")
+
+
+def tcp6_line(local_port, remote_port, state):
+    addr = '0000000000000000FFFF00000100007F'
+    return (f"   0: {addr}:{local_port:04X} {addr}:{remote_port:04X} {state} "
+            f"00000000:00000000 00:00000000 00000000     0        0 12345 1 0000000000000000 100 0 0 10 0\n")
+
+
+GROUPS = {'backend': (3003,), 'mysql': (3306,), 'nginx': (80, 443)}
+
+
+class TestReadEstablishedTotal:
+    """/proc/net/snmp CurrEstab 테스트"""
+
+    def test_reads_curr_estab(self, tmp_path):
+        """Tcp 헤더의 CurrEstab 위치 값을 읽어야 함"""
+        path = tmp_path / 'snmp'
+        path.write_text(SNMP)
+        assert read_established_total(str(path)) == 42
+
+    def test_missing_file(self, tmp_path):
+        """파일이 없으면 None이어야 함"""
+        assert read_established_total(str(tmp_path / 'missing')) is None
+
+
+class TestCountEstablishedByPort:
+    """/proc/net/tcp 포트별 집계 테스트"""
+
+    def test_counts_local_port_established_only(self, tmp_path):
+        """ESTABLISHED이고 로컬 포트가 그룹에 속한 소켓만 세야 함"""
+        tcp = tmp_path / 'tcp'
+        tcp.write_text(TCP_HEADER + ''.join([
+            tcp_line(3003, 51000, '01'),
+            tcp_line(3003, 51001, '01'),
+            tcp_line(3003, 0, '0A'),       # LISTEN
+            tcp_line(443, 52000, '01'),
+            tcp_line(80, 52001, '06'),     # TIME_WAIT
+            tcp_line(51002, 3306, '01'),   # 클라이언트 측 소켓 (원격 포트가 3306)
+            tcp_line(3306, 51002, '01'),
+        ]))
+        tcp6 = tmp_path / 'tcp6'
+        tcp6.write_text(TCP_HEADER + tcp6_line(80, 53000, '01'))
+
+        counts = count_established_by_port(GROUPS, [str(tcp), str(tcp6)])
+
+        assert counts == {'backend_connections': 2, 'mysql_connections': 1, 'nginx_connections': 2}
+
+    def test_missing_tcp6_is_skipped(self, tmp_path):
+        """일부 파일이 없어도 읽은 파일로 집계해야 함"""
+        tcp = tmp_path / 'tcp'
+        tcp.write_text(TCP_HEADER + tcp_line(3306, 51000, '01'))
+
+        counts = count_established_by_port(GROUPS, [str(tcp), str(tmp_path / 'tcp6')])
+
+        assert counts['mysql_connections'] == 1
+
+    def test_no_readable_files(self, tmp_path):
+        """읽을 수 있는 파일이 없으면 None이어야 함"""
+        assert count_established_by_port(GROUPS, [str(tmp_path / 'tcp')]) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,88 @@
+"""
+Keyset 페이지네이션 유틸리티 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_pagination.py -v
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.pagination import (
+    PaginationError, MAX_PAGE_SIZE,
+    encode_cursor, decode_cursor, parse_page_params, keyset_clause, build_page
+)
+
+
+class TestCursor:
+    """커서 인코딩 테스트"""
+
+    def test_roundtrip(self):
+        token = encode_cursor(21, 105)
+        assert decode_cursor(token) == {'k': 21, 'id': 105}
+
+    def test_datetime_key(self):
+        token = encode_cursor(datetime(2025, 3, 1, 9, 30), 7)
+        assert decode_cursor(token) == {'k': '2025-03-01 09:30:00', 'id': 7}
+
+    def test_empty_cursor_is_first_page(self):
+        assert decode_cursor(None) is None
+        assert decode_cursor('') is None
+
+    def test_invalid_cursor(self):
+        with pytest.raises(PaginationError):
+            decode_cursor('not-a-cursor')
+
+
+class TestPageParams:
+    """limit / cursor 인자 테스트"""
+
+    def test_default_limit(self):
+        assert parse_page_params({}) == (50, None)
+
+    def test_limit_is_clamped(self):
+        limit, _ = parse_page_params({'limit': '100000'})
+        assert limit == MAX_PAGE_SIZE
+
+    @pytest.mark.parametrize('value', ['0', '-1', 'abc'])
+    def test_invalid_limit(self, value):
+        with pytest.raises(PaginationError):
+            parse_page_params({'limit': value})
+
+
+class TestKeyset:
+    """keyset 조건 / 페이지 구성 테스트"""
+
+    def test_no_cursor(self):
+        assert keyset_clause('t.inactive_days', None) == ('1 = 1', [])
+
+    def test_descending_clause(self):
+        clause, params = keyset_clause('t.inactive_days', {'k': 21, 'id': 5}, descending=True)
+        assert clause == '(t.inactive_days < %s OR (t.inactive_days = %s AND id > %s))'
+        assert params == [21, 21, 5]
+
+    def test_build_page_with_more(self):
+        rows = [{'id': i, 'score': 10 - i} for i in range(4)]
+        page, next_cursor, has_more = build_page(rows, 3, 'score')
+
+        assert [r['id'] for r in page] == [0, 1, 2]
+        assert has_more is True
+        assert decode_cursor(next_cursor) == {'k': 8, 'id': 2}
+
+    def test_build_last_page(self):
+        rows = [{'id': 1, 'score': 3}]
+        page, next_cursor, has_more = build_page(rows, 3, 'score')
+
+        assert page == rows
+        assert next_cursor is None
+        assert has_more is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
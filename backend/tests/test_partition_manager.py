@@ -0,0 +1,279 @@
+"""
+월별 파티션 관리 / partition pruning 테스트
+
+파티션 계획과 DDL은 가짜 커서로 검사하고, pruning은 실제 DB에서
+지표 쿼리의 EXPLAIN partitions 열로 확인합니다.
+(DB 연결, 파티셔닝된 activity_logs, Flask가 없으면 pruning 테스트는 건너뜀)
+
+실행 방법:
+    cd backend
+    pytest tests/test_partition_manager.py -v
+"""
+
+import pytest
+import sys
+import os
+import time
+from datetime import date
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.partition_manager import (
+    add_months, archive_partition, create_partitions, maintain_table,
+    partition_month, partition_name, plan_partitions
+)
+from utils.time_windows import get_time_windows
+
+
+class RecordingCursor:
+    """실행한 SQL 기록, 쿼리 종류별로 준비된 결과 반환"""
+
+    def __init__(self, partitions=(), existing_tables=(), partition_rows=False):
+        self.partitions = list(partitions)
+        self.existing_tables = set(existing_tables)
+        self.partition_rows = partition_rows
+        self.executed = []
+        self._last = None
+
+    def execute(self, sql, params=None):
+        self.executed.append(' '.join(sql.split()))
+        self._last = (sql, params)
+
+    def fetchall(self):
+        return [{'name': name} for name in self.partitions]
+
+    def fetchone(self):
+        sql, params = self._last
+        if 'information_schema.TABLES' in sql:
+            return {'count': 1 if params[0] in self.existing_tables else 0}
+        return {'found': 1} if self.partition_rows else None
+
+
+class TestPartitionNames:
+    """파티션 이름 ↔ 월 변환 테스트"""
+
+    def test_round_trip(self):
+        """p<YYYYMM> 이름과 월이 서로 변환되어야 함"""
+        assert partition_name(date(2025, 1, 1)) == 'p202501'
+        assert partition_month('p202501') == date(2025, 1, 1)
+
+    def test_non_month_partitions(self):
+        """p_future 등은 월 파티션이 아님"""
+        assert partition_month('p_future') is None
+        assert partition_month('p202513') is None
+
+    def test_add_months_crosses_year(self):
+        """연도 경계를 넘어 이동해야 함"""
+        assert add_months(date(2025, 11, 20), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 5), -1) == date(2024, 12, 1)
+
+
+class TestPlanPartitions:
+    """파티션 생성/만료 계획 테스트"""
+
+    def test_creates_future_months(self):
+        """이번 달 + future_months개월까지 없는 파티션을 생성해야 함"""
+        plan = plan_partitions(['p202510', 'p_future'], date(2025, 10, 18), future_months=2)
+        assert plan['create'] == [date(2025, 11, 1), date(2025, 12, 1)]
+        assert plan['expire'] == []
+
+    def test_up_to_date_is_noop(self):
+        """이미 충분히 만들어져 있으면 아무것도 하지 않아야 함"""
+        existing = ['p202510', 'p202511', 'p202512', 'p_future']
+        plan = plan_partitions(existing, date(2025, 10, 18), future_months=2, retention_months=12)
+        assert plan == {'create': [], 'expire': []}
+
+    def test_catches_up_after_missed_runs(self):
+        """작업이 여러 달 밀렸으면 마지막 파티션 다음 달부터 모두 생성해야 함"""
+        plan = plan_partitions(['p202506', 'p_future'], date(2025, 9, 1), future_months=1)
+        assert [partition_name(m) for m in plan['create']] == ['p202507', 'p202508', 'p202509', 'p202510']
+
+    def test_unpartitioned_starts_from_current_month(self):
+        """월 파티션이 없으면 이번 달부터 생성해야 함"""
+        plan = plan_partitions(['p_future'], date(2025, 10, 18), future_months=1)
+        assert plan['create'] == [date(2025, 10, 1), date(2025, 11, 1)]
+
+    def test_expires_whole_months_past_retention(self):
+        """이번 달 이전 retention_months개월보다 오래된 달만 만료해야 함"""
+        existing = ['p202407', 'p202408', 'p202409', 'p202410', 'p_future']
+        plan = plan_partitions(existing, date(2025, 10, 18), future_months=0, retention_months=13)
+        assert [partition_name(m) for m in plan['expire']] == ['p202407', 'p202408']
+
+
+class TestPartitionDDL:
+    """파티션 DDL 테스트"""
+
+    def test_create_reorganizes_future_partition(self):
+        """p_future를 새 월 파티션들 + p_future로 쪼개야 함"""
+        cursor = RecordingCursor()
+        create_partitions(cursor, 'activity_logs', [date(2025, 11, 1), date(2025, 12, 1)])
+
+        assert cursor.executed == [
+            "ALTER TABLE activity_logs REORGANIZE PARTITION p_future INTO ("
+            "PARTITION p202511 VALUES LESS THAN (UNIX_TIMESTAMP('2025-12-01 00:00:00')), "
+            "PARTITION p202512 VALUES LESS THAN (UNIX_TIMESTAMP('2026-01-01 00:00:00')), "
+            "PARTITION p_future VALUES LESS THAN MAXVALUE)"
+        ]
+
+    def test_create_nothing(self):
+        """만들 파티션이 없으면 DDL을 실행하지 않아야 함"""
+        cursor = RecordingCursor()
+        create_partitions(cursor, 'activity_logs', [])
+        assert cursor.executed == []
+
+    def test_archive_exchanges_then_drops(self):
+        """보관 테이블을 만들어 EXCHANGE한 뒤 파티션을 삭제해야 함"""
+        cursor = RecordingCursor()
+        archive = archive_partition(cursor, 'activity_logs', date(2024, 7, 1))
+
+        assert archive == 'activity_logs_archive_202407'
+        assert cursor.executed[1:] == [
+            "CREATE TABLE activity_logs_archive_202407 LIKE activity_logs",
+            "ALTER TABLE activity_logs_archive_202407 REMOVE PARTITIONING",
+            "ALTER TABLE activity_logs EXCHANGE PARTITION p202407 WITH TABLE activity_logs_archive_202407",
+            "ALTER TABLE activity_logs DROP PARTITION p202407",
+        ]
+
+    def test_archive_resumes_after_interrupted_run(self):
+        """EXCHANGE 후 중단된 경우 (보관 테이블 존재, 파티션 비어 있음) 파티션만 삭제해야 함"""
+        cursor = RecordingCursor(existing_tables={'activity_logs_archive_202407'})
+        archive_partition(cursor, 'activity_logs', date(2024, 7, 1))
+
+        assert not any('EXCHANGE' in sql for sql in cursor.executed)
+        assert cursor.executed[-1] == "ALTER TABLE activity_logs DROP PARTITION p202407"
+
+    def test_archive_refuses_to_overwrite(self):
+        """보관 테이블과 파티션 모두에 행이 있으면 실패해야 함"""
+        cursor = RecordingCursor(existing_tables={'activity_logs_archive_202407'}, partition_rows=True)
+        with pytest.raises(RuntimeError):
+            archive_partition(cursor, 'activity_logs', date(2024, 7, 1))
+        assert not any('DROP PARTITION' in sql for sql in cursor.executed)
+
+    def test_maintain_drop_mode(self):
+        """drop 모드는 만료 파티션을 바로 삭제해야 함"""
+        cursor = RecordingCursor(partitions=['p202407', 'p202510', 'p_future'])
+        result = maintain_table(cursor, 'activity_logs', 12, date(2025, 10, 18), future_months=0, mode='drop')
+
+        assert result == {'created': [], 'archived': [], 'dropped': ['p202407']}
+        assert cursor.executed[-1] == "ALTER TABLE activity_logs DROP PARTITION p202407"
+
+    def test_maintain_requires_partitioned_table(self):
+        """migration 010이 적용되지 않은 테이블은 건드리지 않아야 함"""
+        cursor = RecordingCursor(partitions=[])
+        with pytest.raises(RuntimeError):
+            maintain_table(cursor, 'activity_logs', 12, date(2025, 10, 18))
+        assert len(cursor.executed) == 1
+
+
+# =============================================================================
+# partition pruning (실제 DB)
+# =============================================================================
+# 지표 쿼리의 가장 넓은 activity_logs 구간은 약 31일 (이번 달 1일 또는 30일 전)
+PRUNED_BEFORE_SECONDS = 62 * 86400
+
+
+class ExplainCursor:
+    """execute를 EXPLAIN으로 바꿔 실행하고 계획만 수집"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.plans = []
+
+    def execute(self, sql, params=None):
+        self._cursor.execute('EXPLAIN ' + sql, params)
+        self.plans.append(self._cursor.fetchall())
+
+    def fetchone(self):
+        return {}
+
+    def fetchall(self):
+        return []
+
+
+@pytest.fixture(scope='module')
+def db():
+    """파티셔닝된 activity_logs가 있는 DB 연결 (없으면 skip)"""
+    mysql_connector = pytest.importorskip('mysql.connector')
+    try:
+        conn = mysql_connector.connect(
+            host=os.getenv('DB_HOST', 'localhost'),
+            user=os.getenv('DB_USER', 'root'),
+            password=os.getenv('DB_PASSWORD', ''),
+            database=os.getenv('DB_NAME', 'tutornote')
+        )
+    except Exception as e:
+        pytest.skip(f"DB connection failed: {e}")
+
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute("""
+        SELECT PARTITION_NAME as name, PARTITION_DESCRIPTION as bound
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'activity_logs'
+        AND PARTITION_NAME IS NOT NULL
+    """)
+    bounds = {row['name']: row['bound'] for row in cursor.fetchall()}
+    old = {name for name, bound in bounds.items()
+           if bound != 'MAXVALUE' and int(bound) <= time.time() - PRUNED_BEFORE_SECONDS}
+    if not old:
+        conn.close()
+        pytest.skip("activity_logs has no partition older than the metric windows (migration 010)")
+
+    yield cursor, old
+    conn.close()
+
+
+def _scanned_partitions(plans):
+    """EXPLAIN 결과 중 파티셔닝된 테이블(activity_logs)이 읽는 파티션"""
+    scanned = set()
+    for plan in plans:
+        for row in plan:
+            if row.get('partitions'):
+                scanned.update(row['partitions'].split(','))
+    return scanned
+
+
+class TestPartitionPruning:
+    """지표 쿼리가 기간 밖 파티션을 읽지 않는지 EXPLAIN으로 확인"""
+
+    def _metrics(self):
+        try:
+            import routes.admin.metrics as metrics
+        except ImportError as e:
+            pytest.skip(f"metrics routes unavailable: {e}")
+        return metrics
+
+    def _assert_pruned(self, db, run):
+        cursor, old = db
+        explain = ExplainCursor(cursor)
+        run(explain)
+        scanned = _scanned_partitions(explain.plans)
+        assert scanned, "query did not touch activity_logs"
+        assert not scanned & old
+
+    def test_activity_scan(self, db):
+        self._assert_pruned(db, lambda c: self._metrics()._scan_activity(c, get_time_windows()))
+
+    def test_funnel_scan(self, db):
+        self._assert_pruned(db, lambda c: self._metrics()._scan_funnel(c, get_time_windows()))
+
+    def test_activity_rollup_tail(self, db):
+        watermarks = {'activity_logs': 0, 'progress_records': 0}
+        self._assert_pruned(db, lambda c: self._metrics()._scan_activity_rollup(c, watermarks, get_time_windows()))
+
+    def test_funnel_rollup_tail(self, db):
+        watermarks = {'activity_logs': 0, 'progress_records': 0}
+        self._assert_pruned(db, lambda c: self._metrics()._scan_funnel_rollup(c, watermarks, get_time_windows()))
+
+    def test_inactive_academy_alert_skips_activity_logs(self, db):
+        """무활동 학원 Alert는 academy_stats만 읽고 activity_logs는 건드리지 않아야 함"""
+        from utils.alert_checker import INACTIVE_ACADEMY_SQL
+        cursor, _ = db
+        explain = ExplainCursor(cursor)
+        explain.execute(INACTIVE_ACADEMY_SQL, (30, 14))
+        assert _scanned_partitions(explain.plans) == set()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -17,7 +17,7 @@ import json
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
-from middleware.activity_logger import log_activity, get_activity_stats, get_recent_activities
+from middleware.activity_logger import log_activity, flush_activity_logs, get_activity_stats, get_recent_activities
 
 
 def get_db_connection():
@@ -67,6 +67,9 @@ def test_action_type_logging():
             print(f"  ❌ {action_type}: 저장 실패")
             all_success = False
 
+    # 비동기 작성기 큐를 비워 이후 테스트에서 조회 가능하도록
+    flush_activity_logs()
+
     return all_success
 
 
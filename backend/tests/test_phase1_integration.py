@@ -46,7 +46,7 @@ def scenario_1_academy_activity():
     print("[시나리오 1] 학원 활동 시뮬레이션")
     print("=" * 55)
 
-    from middleware.activity_logger import log_activity
+    from middleware.activity_logger import log_activity, flush_activity_logs
 
     test_academy_id = 100
     test_user_id = 100
@@ -90,6 +90,8 @@ def scenario_1_academy_activity():
     )
     print(f"     {'✅' if cardnews_result else '❌'} 카드뉴스 생성 로깅")
 
+    flush_activity_logs()
+
     all_success = login_result and report_result and share_result and cardnews_result
     return all_success, test_academy_id
 
@@ -0,0 +1,165 @@
+"""
+프로세스 생명주기 기록 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_process_lifecycle.py -v
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.process_lifecycle as process_lifecycle
+from utils.process_lifecycle import get_boot_time, get_process_start_time, get_restart_stats, uptime_hours
+
+
+class QueuedCursor:
+    """execute마다 준비된 fetchone 결과를 순서대로 반환"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return self.results.pop(0)
+
+    def fetchall(self):
+        return self.results.pop(0)
+
+
+class TestProcStat:
+    """/proc 파싱 테스트"""
+
+    def test_boot_time(self, tmp_path):
+        """/proc/stat btime을 읽어야 함"""
+        path = tmp_path / 'stat'
+        path.write_text("cpu  1 2 3\nbtime 1700000000\nprocesses 10\n")
+        assert get_boot_time(str(path)) == datetime.fromtimestamp(1700000000)
+
+    def test_process_start_time(self, tmp_path):
+        """starttime(clock tick)을 부팅 시각에 더해야 함 (comm에 공백/괄호 허용)"""
+        ticks = os.sysconf('SC_CLK_TCK') * 120
+        fields = ['S'] + ['0'] * 18 + [str(ticks)] + ['0'] * 10
+        path = tmp_path / 'self_stat'
+        path.write_text(f"1234 (my (proc) name) {' '.join(fields)}\n")
+        boot = datetime(2025, 1, 1, 9, 0, 0)
+
+        assert get_process_start_time(str(path), boot_time=boot) == boot + timedelta(seconds=120)
+
+    def test_process_start_time_fallback(self, tmp_path):
+        """/proc을 읽을 수 없으면 import 시각을 사용해야 함"""
+        started = get_process_start_time(str(tmp_path / 'missing'), boot_time=datetime(2025, 1, 1))
+        assert started == process_lifecycle._IMPORTED_AT
+
+
+class TestRecordProcessStart:
+    """시작 기록 테스트"""
+
+    @pytest.fixture
+    def events(self, monkeypatch):
+        events = []
+        monkeypatch.setattr(process_lifecycle, '_recorded', set())
+        monkeypatch.setattr(process_lifecycle, '_insert_event', lambda *args: events.append(args))
+        monkeypatch.setattr(process_lifecycle, 'get_version', lambda: 'abc1234')
+        return events
+
+    def test_records_once_per_process(self, events):
+        """같은 프로세스에서 여러 번 호출해도 1회만 기록해야 함"""
+        assert process_lifecycle.record_process_start('backend', record_stop=False) is True
+        assert process_lifecycle.record_process_start('backend', record_stop=False) is False
+
+        assert len(events) == 1
+        assert events[0][:2] == ('backend', 'start')
+        assert events[0][4] == 'abc1234'
+
+    def test_failure_is_swallowed(self, monkeypatch, events):
+        """DB 오류가 나도 예외 없이 False를 반환해야 함"""
+        def broken(*args):
+            raise RuntimeError("db down")
+        monkeypatch.setattr(process_lifecycle, '_insert_event', broken)
+
+        assert process_lifecycle.record_process_start('backend', record_stop=False) is False
+
+    def test_post_fork_hook_records_worker(self, monkeypatch, events):
+        """gunicorn post_fork 훅은 워커(현재 프로세스)의 backend start를 기록해야 함"""
+        monkeypatch.setattr(process_lifecycle, 'record_process_start',
+                            lambda name, record_stop=True: events.append((name, 'start')) or True)
+
+        process_lifecycle.post_fork(server=None, worker=None)
+
+        assert events == [('backend', 'start')]
+
+    def test_start_hook_does_not_short_circuit_requests(self, monkeypatch, events):
+        """before_request 훅은 기록 여부와 무관하게 None을 반환해야 함 (값을 반환하면 응답이 됨)"""
+        monkeypatch.setattr(process_lifecycle, 'atexit', type('NoAtexit', (), {'register': staticmethod(lambda *a: None)}))
+
+        class App:
+            hooks = []
+
+            def before_request(self, fn):
+                self.hooks.append(fn)
+                return fn
+
+        app = App()
+        process_lifecycle.install_start_hook(app, 'backend')
+
+        assert [hook() for hook in app.hooks * 2] == [None, None]
+        assert len(events) == 1
+
+
+class TestRestartStats:
+    """재시작 통계 / uptime 테스트"""
+
+    def test_restart_stats(self):
+        """재시작 이벤트 수와 마지막 시작 시각을 반환해야 함"""
+        last = datetime(2025, 1, 7, 12, 0)
+        starts = [
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 6, 3, 0)},
+            {'hostname': 'web1', 'started_at': last},
+        ]
+        cursor = QueuedCursor([starts, {'last_started_at': last}])
+
+        assert get_restart_stats(cursor, hours=168) == {'restart_count': 2, 'last_started_at': last}
+        assert cursor.executed[0][1] == ('backend', 168)
+        assert all("event_type = 'start'" in sql for sql, _ in cursor.executed)
+
+    def test_burst_across_minute_boundary_is_one_event(self):
+        """배포로 워커들이 :59초 ~ :01초에 걸쳐 떠도 재시작 1건 (분 단위 구간으로 나누지 않음)"""
+        starts = [
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 0, 58)},
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 0, 59)},
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 1, 1)},
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 1, 2)},
+        ]
+        assert process_lifecycle.count_restart_events(starts, window_seconds=60) == 1
+
+    def test_events_split_by_gap_and_host(self):
+        """간격이 window를 넘으면 새 재시작, 호스트가 다르면 따로 셈"""
+        starts = [
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 0, 0)},
+            {'hostname': 'web2', 'started_at': datetime(2025, 1, 7, 12, 0, 5)},
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 0, 30)},
+            {'hostname': 'web1', 'started_at': datetime(2025, 1, 7, 12, 5, 0)},   # 크래시 후 재생성
+        ]
+        assert process_lifecycle.count_restart_events(starts, window_seconds=60) == 3
+
+    def test_uptime_hours(self):
+        """마지막 시작 이후 경과 시간(시간)이어야 함"""
+        started = datetime(2025, 1, 1, 0, 0)
+        assert uptime_hours(started, now=datetime(2025, 1, 2, 6, 30)) == 30.5
+
+    def test_uptime_without_records(self):
+        """기록이 없으면 현재 프로세스 기준으로 0 이상이어야 함"""
+        assert uptime_hours(None) >= 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
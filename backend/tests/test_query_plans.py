@@ -0,0 +1,189 @@
+"""
+지표/Alert 쿼리 실행 계획 테스트
+
+metrics.py / tables.py / alerts.py / alert_checker.py의 쿼리를 실제 DB에서
+EXPLAIN으로 실행해 전체 테이블 스캔(type=ALL)이 없는지 확인합니다.
+(migrations/011 인덱스 기준, DB 연결이나 Flask가 없으면 건너뜀)
+
+실행 방법:
+    cd backend
+    pytest tests/test_query_plans.py -v
+"""
+
+import pytest
+import sys
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.time_windows import get_time_windows
+
+
+class ExplainCursor:
+    """execute를 EXPLAIN으로 바꿔 실행하고 계획만 수집 (결과는 0으로 채운 빈 행)"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.plans = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self._cursor.execute('EXPLAIN ' + sql, params)
+        self.plans.append(self._cursor.fetchall())
+
+    def fetchone(self):
+        return defaultdict(int)
+
+    def fetchall(self):
+        return []
+
+
+def full_scans(plans, allowed=()):
+    """EXPLAIN 결과 중 type=ALL인 실제 테이블 (파생/UNION 임시 테이블, allowed 별칭 제외)"""
+    return sorted({
+        row['table'] for plan in plans for row in plan
+        if row['type'] == 'ALL' and not row['table'].startswith('<') and row['table'] not in allowed
+    })
+
+
+@pytest.fixture(scope='module')
+def db():
+    """DB 커서 (연결할 수 없으면 skip)"""
+    mysql_connector = pytest.importorskip('mysql.connector')
+    try:
+        conn = mysql_connector.connect(
+            host=os.getenv('DB_HOST', 'localhost'),
+            user=os.getenv('DB_USER', 'root'),
+            password=os.getenv('DB_PASSWORD', ''),
+            database=os.getenv('DB_NAME', 'tutornote')
+        )
+    except Exception as e:
+        pytest.skip(f"DB connection failed: {e}")
+
+    yield conn.cursor(dictionary=True)
+    conn.close()
+
+
+@pytest.fixture
+def explain(db, monkeypatch):
+    """
+    run(fn) → fn이 실행한 쿼리들의 EXPLAIN 결과
+
+    fn은 커서를 인자로 받거나, 모듈의 db_cursor()로 커서를 여는 함수
+    """
+    cursor = ExplainCursor(db)
+
+    @contextmanager
+    def explain_db_cursor(dictionary=True, commit=False, **kwargs):
+        yield cursor
+
+    try:
+        import routes.admin.alerts as alerts
+        import utils.alert_checker as alert_checker
+    except ImportError as e:
+        pytest.skip(f"routes unavailable: {e}")
+    monkeypatch.setattr(alerts, 'db_cursor', explain_db_cursor)
+    monkeypatch.setattr(alert_checker, 'db_cursor', explain_db_cursor)
+
+    def run(fn, *args):
+        cursor.plans = []
+        if args or fn.__code__.co_argcount > 0:
+            fn(cursor, *args)
+        else:
+            fn()
+        assert cursor.plans, f"{fn} executed no query"
+        return cursor.plans
+
+    return run
+
+
+def _metrics():
+    try:
+        import routes.admin.metrics as metrics
+    except ImportError as e:
+        pytest.skip(f"metrics routes unavailable: {e}")
+    return metrics
+
+
+WATERMARKS = {'activity_logs': 0, 'progress_records': 0}
+
+
+class TestMetricsPlans:
+    """metrics.py 공유 스캔"""
+
+    @pytest.mark.parametrize('name', [
+        'academies', 'students', 'activity', 'active_academies', 'inactivity', 'reports', 'heavy_users',
+        'parent_views', 'funnel', 'costs', 'restarts', 'api_health',
+    ])
+    def test_scan(self, explain, name):
+        assert full_scans(explain(_metrics().SCANS[name], get_time_windows())) == []
+
+    @pytest.mark.parametrize('name', ['activity', 'reports', 'heavy_users', 'funnel'])
+    def test_rollup_scan(self, explain, name):
+        _, scan = _metrics().ROLLUP_SCANS[name]
+        assert full_scans(explain(scan, WATERMARKS, get_time_windows())) == []
+
+
+class TestTablesPlans:
+    """tables.py 학원 목록"""
+
+    def _tables(self):
+        try:
+            import routes.admin.tables as tables
+        except ImportError as e:
+            pytest.skip(f"tables routes unavailable: {e}")
+        return tables
+
+    def test_at_risk(self, explain):
+        # 위험 학원 비율이 높으면 customer_health_scores 전체 읽기가 더 싸므로 허용
+        tables = self._tables()
+        params = get_time_windows().values(*tables.AT_RISK_WINDOWS)
+        plans = explain(lambda c: c.execute(tables.AT_RISK_ROWS, params))
+        assert full_scans(plans, allowed={'h'}) == []
+
+    def test_at_risk_stats(self, explain):
+        # 점수가 없을 때의 대체 쿼리는 학원 수만큼 읽음 (학원당 1행인 academy_stats PK 조인)
+        tables = self._tables()
+        params = get_time_windows().values(*tables.AT_RISK_STATS_WINDOWS)
+        plans = explain(lambda c: c.execute(tables.AT_RISK_STATS_ROWS, params))
+        assert full_scans(plans, allowed={'a'}) == []
+
+    @pytest.mark.parametrize('name', ['ACTIVE', 'HEAVY_USER', 'FUNNEL'])
+    def test_list(self, explain, name):
+        tables = self._tables()
+        sql = getattr(tables, f'{name}_ROWS')
+        params = get_time_windows().values(*getattr(tables, f'{name}_WINDOWS'))
+        assert full_scans(explain(lambda c: c.execute(sql, params))) == []
+
+
+class TestExportPlans:
+    """exports.py 활동 로그 export"""
+
+    def test_activity_logs(self, explain):
+        try:
+            import routes.admin.exports as exports
+        except ImportError as e:
+            pytest.skip(f"exports routes unavailable: {e}")
+        windows = get_time_windows()
+        sql = f"{exports.ACTIVITY_LOG_ROWS} ORDER BY created_at"
+        plans = explain(lambda c: c.execute(sql, [windows.week_ago, windows.now]))
+        assert full_scans(plans) == []
+
+
+class TestAlertPlans:
+    """alert_checker.py DB 기반 체크 (대시보드 alerts.py도 같은 함수 사용)"""
+
+    @pytest.mark.parametrize('name', [
+        'check_backend_restart_alert', 'check_inactive_academy_alert',
+        'check_parent_view_rate_alert', 'check_api_error_rate_alert',
+    ])
+    def test_checker(self, explain, name):
+        import utils.alert_checker as alert_checker
+        assert full_scans(explain(getattr(alert_checker, name))) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
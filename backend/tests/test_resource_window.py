@@ -0,0 +1,115 @@
+"""
+리소스 윈도우 평가 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_resource_window.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.resource_window as resource_window
+from utils.resource_window import get_resource_window, summarize_samples
+from utils.result_cache import ResultCache
+
+
+def sample(cpu, ram, disk):
+    return {'cpu_usage': cpu, 'ram_usage': ram, 'disk_usage': disk}
+
+
+def bucket(samples, cpu, ram, disk):
+    """1분 집계 행 (avg = p95 = max)"""
+    row = {'samples': samples}
+    for resource, value in (('cpu', cpu), ('ram', ram), ('disk', disk)):
+        row.update({f"{resource}_avg": value, f"{resource}_p95": value, f"{resource}_max": value})
+    return row
+
+
+class CountingCursor:
+    def __init__(self, rows, raw_rows=None):
+        self.rows = rows
+        self.raw_rows = raw_rows or []
+        self.queries = []
+
+    def execute(self, sql, params=None):
+        self.queries.append('raw' if 'system_health_logs' in sql else 'aggregates')
+
+    def fetchall(self):
+        return self.raw_rows if self.queries[-1] == 'raw' else self.rows
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(resource_window, 'resource_cache', ResultCache(namespace='test-resources'))
+
+
+class TestSummarizeSamples:
+    """샘플 요약 테스트"""
+
+    def test_avg_p95_max(self):
+        """리소스별 평균/p95/최대를 계산해야 함"""
+        rows = [sample(float(i), 50.0, 70.0) for i in range(1, 21)]
+        summary = summarize_samples(rows)
+
+        assert summary['samples'] == 20
+        assert summary['cpu'] == {'avg': 10.5, 'p95': 19.0, 'max': 20.0}
+        assert summary['ram']['avg'] == 50.0
+        assert summary['disk']['max'] == 70.0
+
+    def test_no_samples(self):
+        """샘플이 없으면 값은 None이어야 함"""
+        summary = summarize_samples([])
+        assert summary['samples'] == 0
+        assert summary['cpu'] == {'avg': None, 'p95': None, 'max': None}
+
+    def test_ignores_null_values(self):
+        """NULL 값은 계산에서 제외해야 함"""
+        summary = summarize_samples([sample(10, None, 30), sample(20, 40, None)])
+        assert summary['cpu']['avg'] == 15
+        assert summary['ram']['avg'] == 40
+        assert summary['disk']['avg'] == 30
+
+
+class TestGetResourceWindow:
+    """윈도우 캐시 테스트"""
+
+    def test_single_query_shared_by_callers(self):
+        """여러 호출이 한 번의 집계 쿼리 결과를 공유해야 함"""
+        cursor = CountingCursor([bucket(60, 40, 60, 80)])
+
+        first = get_resource_window(cursor)
+        second = get_resource_window(cursor)
+
+        assert cursor.queries == ['aggregates']
+        assert first == second
+        assert first['cpu']['avg'] == 40
+        assert first['samples'] == 60
+        assert first['window_minutes'] == 5
+
+    def test_falls_back_to_raw_samples(self):
+        """1분 집계가 없으면 system_health_logs 원본으로 계산해야 함"""
+        cursor = CountingCursor([], raw_rows=[sample(40, 60, 80)])
+
+        window = get_resource_window(cursor)
+
+        assert cursor.queries == ['aggregates', 'raw']
+        assert window['cpu']['avg'] == 40
+        assert window['samples'] == 1
+
+    def test_refresh_bypasses_cache(self):
+        """refresh=True면 다시 조회해야 함"""
+        cursor = CountingCursor([bucket(60, 40, 60, 80)])
+
+        get_resource_window(cursor)
+        get_resource_window(cursor, refresh=True)
+
+        assert len(cursor.queries) == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,176 @@
+"""
+TTL 결과 캐시 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_result_cache.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.result_cache import ResultCache, MemoryCacheBackend
+from config.cache_settings import get_cache_ttl, get_stale_ttl
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache:
+    """ResultCache 테스트"""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = ResultCache(namespace='test', clock=self.clock)
+
+    def test_hit_within_ttl(self):
+        """TTL 이내 재요청은 다시 계산하지 않아야 함"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {'total': len(calls)}
+
+        assert self.cache.get_or_compute('a', compute, ttl=60) == {'total': 1}
+        self.clock.now += 30
+        assert self.cache.get_or_compute('a', compute, ttl=60) == {'total': 1}
+
+        counters = self.cache.stats()['keys']['a']
+        assert len(calls) == 1
+        assert counters['hits'] == 1
+        assert counters['misses'] == 1
+
+    def test_recompute_after_ttl(self):
+        """TTL(+stale) 경과 후에는 다시 계산해야 함"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.cache.get_or_compute('a', compute, ttl=60)
+        self.clock.now += 61
+        assert self.cache.get_or_compute('a', compute, ttl=60) == 2
+
+    def test_concurrent_misses_single_flight(self):
+        """동시 miss는 한 번만 계산해야 함"""
+        calls = []
+        started = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_compute('a', compute, ttl=60)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(1)
+        for t in threads[1:]:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == ['value'] * 5
+        assert self.cache.stats()['keys']['a']['coalesced'] == 4
+
+    def test_stale_while_revalidate(self):
+        """stale 구간에서는 이전 값을 즉시 응답하고 백그라운드에서 갱신해야 함"""
+        self.cache.get_or_compute('a', lambda: 'old', ttl=60, stale_ttl=60)
+        self.clock.now += 90
+
+        refreshed = threading.Event()
+
+        def refresh():
+            refreshed.set()
+            return 'new'
+
+        assert self.cache.get_or_compute('a', refresh, ttl=60, stale_ttl=60) == 'old'
+        assert refreshed.wait(1)
+
+        deadline = time.time() + 1
+        while self.cache.peek('a')['value'] != 'new' and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert self.cache.get_or_compute('a', refresh, ttl=60, stale_ttl=60) == 'new'
+        assert self.cache.stats()['keys']['a']['stale_hits'] == 1
+
+    def test_error_is_not_cached(self):
+        """계산 실패는 캐시하지 않고 예외를 전파해야 함"""
+        def fail():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            self.cache.get_or_compute('a', fail, ttl=60)
+
+        assert self.cache.peek('a') is None
+        assert self.cache.get_or_compute('a', lambda: 'ok', ttl=60) == 'ok'
+        assert self.cache.stats()['keys']['a']['errors'] == 1
+
+    def test_invalidate(self):
+        """invalidate 후에는 다시 계산해야 함"""
+        self.cache.get_or_compute('a', lambda: 1, ttl=60)
+        self.cache.invalidate('a')
+        assert self.cache.get_or_compute('a', lambda: 2, ttl=60) == 2
+
+    def test_shared_backend_between_instances(self):
+        """같은 백엔드를 쓰는 캐시(워커)끼리는 결과를 공유해야 함"""
+        backend = MemoryCacheBackend()
+        worker1 = ResultCache(backend=backend, namespace='metrics', clock=self.clock)
+        worker2 = ResultCache(backend=backend, namespace='metrics', clock=self.clock)
+
+        worker1.get_or_compute('a', lambda: 'from-1', ttl=60)
+        assert worker2.get_or_compute('a', lambda: 'from-2', ttl=60) == 'from-1'
+
+    def test_entry_version(self):
+        """항목 버전은 값이 같으면 재계산해도 같고, 값이 바뀌면 달라야 함"""
+        first = self.cache.get_or_compute_entry('a', lambda: {'x': 1, 'y': [1, 2]}, ttl=60)
+        assert first['stored_at'] == 1000.0
+        assert self.cache.get_or_compute_entry('a', lambda: None, ttl=60)['version'] == first['version']
+
+        self.cache.invalidate('a')
+        same = self.cache.get_or_compute_entry('a', lambda: {'y': [1, 2], 'x': 1}, ttl=60)
+        self.cache.invalidate('a')
+        changed = self.cache.get_or_compute_entry('a', lambda: {'x': 2, 'y': [1, 2]}, ttl=60)
+
+        assert same['version'] == first['version']
+        assert changed['version'] != first['version']
+
+    def test_hit_rate(self):
+        """hit_rate는 응답 중 캐시에서 나간 비율(%)"""
+        for _ in range(4):
+            self.cache.get_or_compute('a', lambda: 1, ttl=60)
+
+        assert self.cache.stats()['hit_rate'] == 75.0
+
+
+class TestCacheSettings:
+    """카드별 캐시 설정 테스트"""
+
+    def test_known_card(self):
+        assert get_cache_ttl('academy-status') == 300
+        assert get_stale_ttl('system-health') == 0
+
+    def test_default(self):
+        assert get_cache_ttl('unknown') == 60
+        assert get_stale_ttl('unknown') == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
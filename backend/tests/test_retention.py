@@ -0,0 +1,186 @@
+"""
+텔레메트리 보관 기간 정리 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_retention.py -v
+"""
+
+import pytest
+import sys
+import os
+import csv
+import gzip
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import utils.retention as retention
+
+
+NOW = datetime(2025, 10, 18, 12, 0, 0)
+COLUMNS = ('id', 'cpu_usage', 'note', 'created_at')
+
+
+class FakeTableCursor:
+    """한 테이블(행 목록)에 대한 retention 쿼리만 흉내 내는 커서"""
+
+    def __init__(self, state):
+        self.state = state
+        self.description = None
+        self.rowcount = 0
+        self._one = None
+        self._all = []
+
+    def execute(self, sql, params=None):
+        sql = ' '.join(sql.split())
+        self.state['executed'].append((sql, params))
+        rows = self.state['rows']
+
+        if sql.startswith('SELECT MIN(id)'):
+            expired = [r[0] for r in rows if r[3] < params[0]]
+            self._one = {'min_id': min(expired, default=None), 'max_id': max(expired, default=None)}
+        elif 'information_schema.TABLES' in sql:
+            self._one = {'total_bytes': 100 * len(rows), 'table_rows': len(rows)}
+        elif sql.startswith('SELECT COUNT(*)'):
+            self._one = {'count': sum(1 for r in rows if r[3] < params[0])}
+        elif sql.startswith('SELECT *'):
+            lo, hi, cutoff = params
+            self.description = [(c,) for c in COLUMNS]
+            self._all = [r for r in rows if lo <= r[0] < hi and r[3] < cutoff]
+        elif sql.startswith('DELETE'):
+            lo, hi, cutoff = params
+            keep = [r for r in rows if not (lo <= r[0] < hi and r[3] < cutoff)]
+            self.rowcount = len(rows) - len(keep)
+            self.state['rows'] = keep
+
+    def fetchone(self):
+        return self._one
+
+    def fetchall(self):
+        return self._all
+
+
+@pytest.fixture
+def state(monkeypatch):
+    # id 1~10: 40일 전부터 하루 간격, 3번은 값이 NULL
+    rows = [
+        (i, None if i == 3 else float(i), 'a,"b"' if i == 1 else 'ok', NOW - timedelta(days=41 - i))
+        for i in range(1, 11)
+    ]
+    state = {'executed': [], 'rows': rows}
+
+    @contextmanager
+    def fake_db_cursor(dictionary=True, commit=False, **kwargs):
+        yield FakeTableCursor(state)
+
+    monkeypatch.setattr(retention, 'db_cursor', fake_db_cursor)
+    return state
+
+
+def read_archive(path):
+    with gzip.open(path, 'rt', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+class TestApplyPolicy:
+    """보관 기간 적용 테스트"""
+
+    def test_deletes_only_expired_rows(self, state, tmp_path):
+        """cutoff 이전 행만 삭제해야 함"""
+        result = retention.apply_policy('system_health_logs', 35, now=NOW, batch_size=2,
+                                        pause=0, archive_dir=str(tmp_path))
+
+        # 41-i일 전 < 35일 전 → i < 6
+        assert result['rows_deleted'] == 5
+        assert [r[0] for r in state['rows']] == [6, 7, 8, 9, 10]
+        assert result['cutoff'] == NOW - timedelta(days=35)
+
+    def test_deletes_in_primary_key_batches(self, state, tmp_path):
+        """만료 id 범위를 batch_size씩 나눠 PK 범위로 삭제해야 함"""
+        result = retention.apply_policy('system_health_logs', 35, now=NOW, batch_size=2,
+                                        pause=0, archive_dir=str(tmp_path))
+
+        deletes = [params[:2] for sql, params in state['executed'] if sql.startswith('DELETE')]
+        assert deletes == [(1, 3), (3, 5), (5, 6)]
+        assert result['batches'] == 3
+
+    def test_archives_before_delete(self, state, tmp_path):
+        """각 배치는 내보낸 뒤 삭제해야 함"""
+        retention.apply_policy('system_health_logs', 35, now=NOW, batch_size=2,
+                               pause=0, archive_dir=str(tmp_path))
+
+        kinds = [sql.split()[0] for sql, _ in state['executed'] if sql.startswith(('SELECT *', 'DELETE'))]
+        assert kinds == ['SELECT', 'DELETE'] * 3
+
+    def test_archive_file_contents(self, state, tmp_path):
+        """보관 파일은 헤더 + 삭제된 행, NULL은 \\N이어야 함"""
+        result = retention.apply_policy('system_health_logs', 35, now=NOW, batch_size=2,
+                                        pause=0, archive_dir=str(tmp_path))
+
+        assert result['archive_path'].endswith('system_health_logs_20250913_120000.csv.gz')
+        assert result['archive_bytes'] == os.path.getsize(result['archive_path'])
+        assert not os.path.exists(result['archive_path'] + '.partial')
+
+        rows = read_archive(result['archive_path'])
+        assert rows[0] == list(COLUMNS)
+        assert [r[0] for r in rows[1:]] == ['1', '2', '3', '4', '5']
+        assert rows[1][2] == 'a,"b"'
+        assert rows[3][1] == '\\N'
+        assert rows[1][3] == '2025-09-08 12:00:00'
+
+    def test_reports_reclaimed_bytes(self, state, tmp_path):
+        """회수 용량은 삭제 행 수 × 행당 평균 크기로 추정해야 함"""
+        result = retention.apply_policy('system_health_logs', 35, now=NOW, batch_size=100,
+                                        pause=0, archive_dir=str(tmp_path))
+        assert result['bytes_reclaimed'] == 5 * 100
+
+    def test_without_archive(self, state, tmp_path):
+        """archive=False면 파일 없이 삭제만 해야 함"""
+        result = retention.apply_policy('api_health_checks', 35, archive=False, now=NOW,
+                                        pause=0, archive_dir=str(tmp_path))
+
+        assert result['rows_deleted'] == 5
+        assert result['archive_path'] is None
+        assert not any(sql.startswith('SELECT *') for sql, _ in state['executed'])
+
+    def test_nothing_expired(self, state, tmp_path):
+        """만료 행이 없으면 파일도 DELETE도 없어야 함"""
+        result = retention.apply_policy('system_health_logs', 60, now=NOW, pause=0, archive_dir=str(tmp_path))
+
+        assert result['rows_deleted'] == 0
+        assert result['archive_path'] is None
+        assert not any(sql.startswith('DELETE') for sql, _ in state['executed'])
+
+    def test_dry_run(self, state, tmp_path):
+        """dry-run은 대상 행 수와 추정치만 계산해야 함"""
+        result = retention.apply_policy('system_health_logs', 35, now=NOW, dry_run=True,
+                                        archive_dir=str(tmp_path))
+
+        assert result['rows_deleted'] == 5
+        assert result['bytes_reclaimed'] == 500
+        assert len(state['rows']) == 10
+        assert not os.listdir(tmp_path)
+
+
+class TestRunRetention:
+    """정책 전체 실행 테스트"""
+
+    def test_failure_is_isolated(self, state, monkeypatch):
+        """한 테이블이 실패해도 나머지 테이블은 처리해야 함"""
+        def fake_apply(table, days, archive, now=None, dry_run=False):
+            if table == 'api_usage_logs':
+                raise RuntimeError('lock wait timeout')
+            return {'rows_deleted': 0}
+
+        monkeypatch.setattr(retention, 'apply_policy', fake_apply)
+        results = retention.run_retention()
+
+        assert results['api_usage_logs'] == {'error': 'lock wait timeout'}
+        assert set(results) == set(retention.RETENTION_POLICIES)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,91 @@
+"""
+지표 쿼리 기간 경계 테스트
+
+실행 방법:
+    cd backend
+    pytest tests/test_time_windows.py -v
+"""
+
+import pytest
+import sys
+import os
+from datetime import date, datetime
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.time_windows import DAY_BOUNDARIES, get_time_windows
+
+
+class TestTimeWindows:
+    """기간 경계 계산 테스트"""
+
+    def test_month_boundaries(self):
+        """이번 달/전월/다음 달 1일 0시"""
+        w = get_time_windows(datetime(2025, 3, 15, 13, 45, 10, 123456))
+
+        assert w.now == datetime(2025, 3, 15, 13, 45, 10)
+        assert w.today == datetime(2025, 3, 15)
+        assert w.month_start == datetime(2025, 3, 1)
+        assert w.prev_month_start == datetime(2025, 2, 1)
+        assert w.next_month_start == datetime(2025, 4, 1)
+
+    def test_year_boundaries(self):
+        """1월/12월은 연도가 바뀌어야 함"""
+        january = get_time_windows(datetime(2025, 1, 31, 23, 59, 59))
+        assert january.prev_month_start == datetime(2024, 12, 1)
+        assert january.next_month_start == datetime(2025, 2, 1)
+
+        december = get_time_windows(datetime(2024, 12, 1))
+        assert december.prev_month_start == datetime(2024, 11, 1)
+        assert december.next_month_start == datetime(2025, 1, 1)
+
+    def test_relative_windows(self):
+        """1시간/7일/30일 전은 기준 시각 기준"""
+        w = get_time_windows(datetime(2025, 3, 15, 13, 0, 0))
+
+        assert w.hour_ago == datetime(2025, 3, 15, 12, 0, 0)
+        assert w.week_ago == datetime(2025, 3, 8, 13, 0, 0)
+        assert w.days_30_ago == datetime(2025, 2, 13, 13, 0, 0)
+        assert w.days_31_start == datetime(2025, 2, 12)
+
+    def test_week_start_is_calendar_days(self):
+        """7일 활성 하한은 오늘 포함 최근 7일의 첫날 0시 (기준 시각과 무관)"""
+        w = get_time_windows(datetime(2025, 3, 15, 13, 0, 0))
+        assert w.week_start == datetime(2025, 3, 9)
+        assert w.params()['week_start_date'] == date(2025, 3, 9)
+
+    @pytest.mark.parametrize('now, recent_start', [
+        # 월초: 7일 구간 첫날이 더 이름
+        (datetime(2025, 3, 3, 9, 0), datetime(2025, 2, 25)),
+        # 월중: 이번 달 1일이 더 이름
+        (datetime(2025, 3, 20, 9, 0), datetime(2025, 3, 1)),
+    ])
+    def test_recent_start(self, now, recent_start):
+        """7일 활성과 이번 달 지표를 함께 읽는 구간의 하한"""
+        assert get_time_windows(now).recent_start == recent_start
+
+    def test_params_include_date_keys(self):
+        """일 단위 경계는 DATE 컬럼 비교용 _date 파라미터도 있어야 함"""
+        params = get_time_windows(datetime(2025, 3, 15, 13, 0)).params()
+
+        for name in DAY_BOUNDARIES:
+            assert isinstance(params[f'{name}_date'], date)
+            assert not isinstance(params[f'{name}_date'], datetime)
+        assert params['month_start_date'] == date(2025, 3, 1)
+        assert params['week_ago'] == datetime(2025, 3, 8, 13, 0)
+
+    def test_values_order(self):
+        """values()는 인자 순서대로 위치 파라미터를 반환"""
+        w = get_time_windows(datetime(2025, 3, 15, 13, 0))
+        assert w.values('week_ago', 'month_start_date') == [w.week_ago, date(2025, 3, 1)]
+
+    def test_params_is_copy(self):
+        """params()를 수정해도 경계 값은 바뀌지 않아야 함"""
+        w = get_time_windows(datetime(2025, 3, 15, 13, 0))
+        w.params()['month_start'] = None
+        assert w.month_start == datetime(2025, 3, 1)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
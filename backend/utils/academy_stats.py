@@ -0,0 +1,255 @@
+"""
+학원별 통계 (academy_stats)
+
+학원당 1행으로 학생 수 / 리포트 수 / 이번 달 리포트 수 / 공유 수 /
+첫 학생·리포트·공유 시각 / 마지막 활동 시각을 유지합니다.
+대시보드 목록, 무활동 Alert, 이탈 지표는 이 테이블을 PK 또는 인덱스로 읽습니다.
+
+- 증분: 활동 로그가 DB에 기록된 직후 같은 배치를 학원별로 묶어 upsert
+  (create_/delete_student, create_/delete_report, share_kakaotalk, 모든 활동의 시각)
+  학생/리포트 작성 경로는 이미 log_activity()로 해당 이벤트를 남기므로 별도 호출이 필요 없습니다.
+- 보정: scripts/reconcile_academy_stats.py가 원본 테이블을 학원 id 구간 단위로 다시
+  집계해 덮어씁니다. 증분 반영 실패, spool replay로 늦게 들어온 로그, 다른 달
+  리포트 삭제 등으로 생긴 오차는 여기서 바로잡힙니다.
+  activity_logs는 보관 기간이 지난 파티션이 빠지므로(utils/partition_manager.py)
+  첫 공유/마지막 활동 시각은 기존 값과 병합합니다.
+
+환경변수:
+    ACADEMY_STATS_RECONCILE_BATCH: 보정 1회 트랜잭션에서 처리할 학원 id 범위 (기본 500)
+
+사용 예시:
+    >>> from utils.academy_stats import record_activity_rows, reconcile_all
+    >>> record_activity_rows([{'academy_id': 1, 'action_type': 'create_report', 'created_at': '2025-01-15 10:00:00'}])
+    >>> reconcile_all()  # {'max_academy_id': 1234, 'batches': 3}
+"""
+
+import os
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.db_pool import db_cursor
+
+
+RECONCILE_BATCH_SIZE = int(os.getenv('ACADEMY_STATS_RECONCILE_BATCH', '500'))
+
+# 액션 타입 → 카운터 증감
+# delete_report는 원래 작성 월을 알 수 없어 monthly_reports는 보정 작업에 맡깁니다.
+STAT_DELTAS: Dict[str, Dict[str, int]] = {
+    'create_student': {'student_count': 1},
+    'delete_student': {'student_count': -1},
+    'create_report': {'report_count': 1, 'monthly_reports': 1},
+    'delete_report': {'report_count': -1},
+    'share_kakaotalk': {'share_count': 1},
+}
+
+# 액션 타입 → 처음 발생 시각 컬럼
+FIRST_SEEN: Dict[str, str] = {
+    'create_student': 'first_student_at',
+    'create_report': 'first_report_at',
+    'share_kakaotalk': 'first_share_at',
+}
+
+COUNTERS = ('student_count', 'report_count', 'monthly_reports', 'share_count')
+
+# monthly_reports는 month_start보다 먼저 갱신해야 이전 값과 비교할 수 있음
+UPSERT_SQL = """
+    INSERT INTO academy_stats
+    (academy_id, student_count, report_count, month_start, monthly_reports, share_count,
+     first_student_at, first_report_at, first_share_at, last_activity_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        student_count = GREATEST(student_count + VALUES(student_count), 0),
+        report_count = GREATEST(report_count + VALUES(report_count), 0),
+        monthly_reports = CASE
+            WHEN month_start = VALUES(month_start) THEN GREATEST(monthly_reports + VALUES(monthly_reports), 0)
+            WHEN month_start < VALUES(month_start) THEN VALUES(monthly_reports)
+            ELSE monthly_reports
+        END,
+        month_start = GREATEST(month_start, VALUES(month_start)),
+        share_count = share_count + VALUES(share_count),
+        first_student_at = COALESCE(LEAST(first_student_at, VALUES(first_student_at)), first_student_at, VALUES(first_student_at)),
+        first_report_at = COALESCE(LEAST(first_report_at, VALUES(first_report_at)), first_report_at, VALUES(first_report_at)),
+        first_share_at = COALESCE(LEAST(first_share_at, VALUES(first_share_at)), first_share_at, VALUES(first_share_at)),
+        last_activity_at = COALESCE(GREATEST(last_activity_at, VALUES(last_activity_at)), last_activity_at, VALUES(last_activity_at))
+"""
+
+# 학원 id 구간 (lo, hi] 재집계 (params: lo, hi × 4)
+RECONCILE_SQL = """
+    INSERT INTO academy_stats
+    (academy_id, student_count, report_count, month_start, monthly_reports, share_count,
+     first_student_at, first_report_at, first_share_at, last_activity_at, reconciled_at)
+    SELECT
+        a.id,
+        COALESCE(sc.student_count, 0),
+        COALESCE(rc.report_count, 0),
+        DATE_FORMAT(NOW(), '%Y-%m-01'),
+        COALESCE(rc.monthly_reports, 0),
+        COALESCE(al.share_count, 0),
+        sc.first_student_at,
+        rc.first_report_at,
+        al.first_share_at,
+        al.last_activity_at,
+        NOW()
+    FROM academies a
+    LEFT JOIN (
+        SELECT academy_id, COUNT(*) as student_count, MIN(created_at) as first_student_at
+        FROM students
+        WHERE is_deleted = 0
+        AND academy_id > %s AND academy_id <= %s
+        GROUP BY academy_id
+    ) sc ON sc.academy_id = a.id
+    LEFT JOIN (
+        SELECT
+            s.academy_id,
+            COUNT(*) as report_count,
+            COUNT(CASE WHEN pr.created_at >= DATE_FORMAT(NOW(), '%Y-%m-01') THEN 1 END) as monthly_reports,
+            MIN(pr.created_at) as first_report_at
+        FROM progress_records pr
+        JOIN students s ON pr.student_id = s.id AND s.is_deleted = 0
+        WHERE pr.is_deleted = 0
+        AND s.academy_id > %s AND s.academy_id <= %s
+        GROUP BY s.academy_id
+    ) rc ON rc.academy_id = a.id
+    LEFT JOIN (
+        SELECT
+            academy_id,
+            MAX(created_at) as last_activity_at,
+            COUNT(CASE WHEN action_type = 'share_kakaotalk' THEN 1 END) as share_count,
+            MIN(CASE WHEN action_type = 'share_kakaotalk' THEN created_at END) as first_share_at
+        FROM activity_logs
+        WHERE academy_id > %s AND academy_id <= %s
+        GROUP BY academy_id
+    ) al ON al.academy_id = a.id
+    WHERE a.id > %s AND a.id <= %s
+    ON DUPLICATE KEY UPDATE
+        student_count = VALUES(student_count),
+        report_count = VALUES(report_count),
+        month_start = VALUES(month_start),
+        monthly_reports = VALUES(monthly_reports),
+        share_count = VALUES(share_count),
+        first_student_at = VALUES(first_student_at),
+        first_report_at = VALUES(first_report_at),
+        first_share_at = COALESCE(LEAST(first_share_at, VALUES(first_share_at)), first_share_at, VALUES(first_share_at)),
+        last_activity_at = COALESCE(GREATEST(last_activity_at, VALUES(last_activity_at)), last_activity_at, VALUES(last_activity_at)),
+        reconciled_at = VALUES(reconciled_at)
+"""
+
+
+def _as_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.strptime(str(value), '%Y-%m-%d %H:%M:%S')
+
+
+def aggregate_activity(rows: Iterable[Dict[str, Any]]) -> List[Tuple]:
+    """
+    활동 로그 행을 (학원, 월)별 upsert 파라미터로 집계
+
+    Args:
+        rows: academy_id / action_type / created_at 키를 가진 dict
+
+    Returns:
+        List[Tuple]: UPSERT_SQL 파라미터 (학원별로 월 오름차순)
+    """
+    groups: Dict[Tuple[int, date], Dict[str, Any]] = {}
+
+    for row in rows:
+        academy_id = row.get('academy_id')
+        if not academy_id:
+            continue
+        at = _as_datetime(row['created_at'])
+        key = (academy_id, at.date().replace(day=1))
+        group = groups.setdefault(key, dict.fromkeys(COUNTERS, 0))
+
+        action_type = row.get('action_type')
+        for column, delta in STAT_DELTAS.get(action_type, {}).items():
+            group[column] += delta
+
+        first_column = FIRST_SEEN.get(action_type)
+        if first_column and (group.get(first_column) is None or at < group[first_column]):
+            group[first_column] = at
+
+        if group.get('last_activity_at') is None or at > group['last_activity_at']:
+            group['last_activity_at'] = at
+
+    return [
+        (
+            academy_id,
+            group['student_count'],
+            group['report_count'],
+            month_start,
+            group['monthly_reports'],
+            group['share_count'],
+            group.get('first_student_at'),
+            group.get('first_report_at'),
+            group.get('first_share_at'),
+            group['last_activity_at'],
+        )
+        for (academy_id, month_start), group in sorted(groups.items())
+    ]
+
+
+def apply_activity_rows(cursor, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    주어진 커서(트랜잭션)로 활동 로그 배치를 academy_stats에 반영
+
+    Returns:
+        int: upsert한 (학원, 월) 수
+    """
+    params = aggregate_activity(rows)
+    if params:
+        cursor.executemany(UPSERT_SQL, params)
+    return len(params)
+
+
+def record_activity_rows(rows: Iterable[Dict[str, Any]]) -> bool:
+    """
+    활동 로그 배치를 academy_stats에 반영 (별도 트랜잭션)
+
+    실패해도 활동 로그 기록에는 영향이 없고, 누락분은 보정 작업이 채웁니다.
+
+    Returns:
+        bool: 반영 성공 여부
+    """
+    try:
+        with db_cursor(dictionary=False, commit=True) as cursor:
+            apply_activity_rows(cursor, rows)
+        return True
+    except Exception as e:
+        print(f"[AcademyStats] Incremental update failed (reconcile will repair): {e}")
+        return False
+
+
+def reconcile_range(cursor, lo: int, hi: int) -> None:
+    """학원 id 구간 (lo, hi]를 원본 테이블 기준으로 다시 집계해 덮어씀"""
+    cursor.execute(RECONCILE_SQL, (lo, hi) * 4)
+
+
+def reconcile_all(batch_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    전체 학원 보정 (cron)
+
+    학원 id 구간마다 별도 트랜잭션으로 처리하므로 한 번에 잠기는 범위가 작습니다.
+    보정 도중 들어온 증분은 덮어써질 수 있으나 다음 보정에서 다시 맞춰집니다.
+
+    Returns:
+        Dict[str, int]: {'max_academy_id': 처리한 마지막 학원 id, 'batches': 트랜잭션 수}
+    """
+    batch_size = batch_size or RECONCILE_BATCH_SIZE
+
+    with db_cursor() as cursor:
+        cursor.execute("SELECT COALESCE(MAX(id), 0) as max_id FROM academies")
+        max_id = cursor.fetchone()['max_id']
+
+    lo = 0
+    batches = 0
+    while lo < max_id:
+        hi = min(lo + batch_size, max_id)
+        with db_cursor(commit=True) as cursor:
+            reconcile_range(cursor, lo, hi)
+        lo = hi
+        batches += 1
+
+    return {'max_academy_id': max_id, 'batches': batches}
@@ -0,0 +1,303 @@
+"""
+일별 활성 학원 비트맵 (daily_active_academies)
+
+하루마다 그날 활동한 학원 id를 비트맵(Python int, 비트 i = 학원 id i)으로 유지합니다.
+DAU / 7일 / MAU / 임의 기간 활성 학원 수는 기간 내 비트맵을 OR한 뒤 popcount로
+계산하므로 활동 로그 양과 무관하게 메모리 연산 몇 번으로 끝납니다.
+(학원 1만 개 기준 하루 비트맵 약 1.2KB)
+
+- 증분: 활동 로그가 DB에 기록된 직후 같은 배치의 (일, 학원)을 그날 비트맵에 OR
+  (행 잠금 후 read-modify-write). 프로세스가 이미 반영한 비트만 있는 배치는 DB를 읽지 않습니다.
+- 재생성: scripts/rebuild_activity_bitmaps.py가 activity_logs에서 하루씩 다시 만들고
+  rebuilt_at을 기록합니다. 증분 실패, spool replay로 늦게 들어온 로그는 여기서 반영됩니다.
+- 조회: 지난 날짜가 모두 재생성된 경우에만 비트맵을 사용합니다 (load_daily_bitmaps가
+  None이면 호출 측이 원본 집계로 대체). 오늘은 증분으로 유지되므로 재생성 여부를 보지 않습니다.
+
+환경변수:
+    ACTIVITY_BITMAP_REBUILD_DAYS: 재생성 기본 일수 (오늘 포함, 기본 2)
+
+사용 예시:
+    >>> from utils.activity_bitmaps import load_daily_bitmaps, record_active_days
+    >>> record_active_days([{'academy_id': 7, 'created_at': '2025-01-15 10:00:00'}])
+    >>> bitmaps = load_daily_bitmaps(cursor, date(2025, 1, 1), date(2025, 1, 15))
+    >>> bitmaps.count(date(2025, 1, 15))                     # DAU
+    >>> bitmaps.rolling(date(2025, 1, 15), 7)                 # 최근 7일 활성 학원 수
+    >>> bitmaps.count(date(2025, 1, 1), date(2025, 1, 15))   # MAU (이번 달)
+"""
+
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.db_pool import db_cursor
+
+
+ACTIVITY_BITMAP_REBUILD_DAYS = int(os.getenv('ACTIVITY_BITMAP_REBUILD_DAYS', '2'))
+
+UPSERT_SQL = """
+    INSERT INTO daily_active_academies (activity_date, bitmap, academy_count)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        bitmap = VALUES(bitmap),
+        academy_count = VALUES(academy_count)
+"""
+
+REBUILD_SQL = """
+    INSERT INTO daily_active_academies (activity_date, bitmap, academy_count, rebuilt_at)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        bitmap = VALUES(bitmap),
+        academy_count = VALUES(academy_count),
+        rebuilt_at = VALUES(rebuilt_at)
+"""
+
+
+# =============================================================================
+# 비트맵 연산
+# =============================================================================
+def bitmap_from_ids(academy_ids: Iterable[int]) -> int:
+    """학원 id 목록 → 비트맵"""
+    bits = 0
+    for academy_id in academy_ids:
+        if academy_id:
+            bits |= 1 << academy_id
+    return bits
+
+
+def bitmap_ids(bits: int) -> List[int]:
+    """비트맵 → 학원 id 목록 (오름차순)"""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+def popcount(bits: int) -> int:
+    """비트맵의 학원 수"""
+    return bin(bits).count('1')
+
+
+def encode(bits: int) -> bytes:
+    """비트맵 → BLOB (little-endian, 최고 비트까지만)"""
+    return bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+
+
+def decode(blob: Optional[bytes]) -> int:
+    """BLOB → 비트맵"""
+    return int.from_bytes(bytes(blob), 'little') if blob else 0
+
+
+class DailyBitmaps:
+    """
+    날짜별 비트맵 묶음 (기간 OR + popcount)
+
+    Args:
+        days: {날짜: 비트맵} (없는 날은 활동 없음)
+    """
+
+    def __init__(self, days: Dict[date, int]):
+        self.days = days
+
+    def union(self, start: date, end: Optional[date] = None) -> int:
+        """start ~ end(포함, 기본 start) 기간에 한 번이라도 활동한 학원 비트맵"""
+        end = end or start
+        bits = 0
+        for day, day_bits in self.days.items():
+            if start <= day <= end:
+                bits |= day_bits
+        return bits
+
+    def count(self, start: date, end: Optional[date] = None) -> int:
+        """start ~ end(포함) 기간 활성 학원 수"""
+        return popcount(self.union(start, end))
+
+    def rolling(self, end: date, days: int) -> int:
+        """end를 포함한 최근 days일 활성 학원 수"""
+        return self.count(end - timedelta(days=days - 1), end)
+
+
+# =============================================================================
+# 증분 반영
+# =============================================================================
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def group_active_days(rows: Iterable[Dict[str, Any]]) -> Dict[date, int]:
+    """
+    활동 로그 행을 날짜별 비트맵으로 묶음
+
+    Args:
+        rows: academy_id / created_at 키를 가진 dict
+    """
+    days: Dict[date, int] = {}
+    for row in rows:
+        academy_id = row.get('academy_id')
+        if not academy_id:
+            continue
+        day = _as_date(row['created_at'])
+        days[day] = days.get(day, 0) | (1 << academy_id)
+    return days
+
+
+class _KnownBits:
+    """이 프로세스가 DB에 반영한 것으로 확인한 날짜별 비트 (최근 며칠만 유지)"""
+
+    def __init__(self, keep_days: int = 2):
+        self.keep_days = keep_days
+        self._days: Dict[date, int] = {}
+        self._lock = threading.Lock()
+
+    def missing(self, day: date, bits: int) -> int:
+        with self._lock:
+            return bits & ~self._days.get(day, 0)
+
+    def add(self, day: date, bits: int) -> None:
+        with self._lock:
+            self._days[day] = self._days.get(day, 0) | bits
+            for old in sorted(self._days)[:-self.keep_days]:
+                del self._days[old]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._days.clear()
+
+
+_known = _KnownBits()
+
+
+def apply_active_days(cursor, days: Dict[date, int]) -> int:
+    """
+    주어진 커서(트랜잭션)로 날짜별 비트를 daily_active_academies에 OR
+
+    행을 FOR UPDATE로 잠근 뒤 합치므로 여러 프로세스가 동시에 반영해도 비트를 잃지 않습니다.
+    새 비트가 없으면 쓰지 않습니다.
+
+    Returns:
+        int: 갱신한 날짜 수
+    """
+    updated = 0
+    for day, bits in sorted(days.items()):
+        cursor.execute("""
+            SELECT bitmap FROM daily_active_academies
+            WHERE activity_date = %s
+            FOR UPDATE
+        """, (day,))
+        row = cursor.fetchone()
+        current = decode(row[0]) if row else 0
+        merged = current | bits
+        if row is None or merged != current:
+            cursor.execute(UPSERT_SQL, (day, encode(merged), popcount(merged)))
+            updated += 1
+    return updated
+
+
+def record_active_days(rows: Iterable[Dict[str, Any]]) -> bool:
+    """
+    활동 로그 배치를 일별 비트맵에 반영 (별도 트랜잭션)
+
+    실패해도 활동 로그 기록에는 영향이 없고, 누락분은 재생성 작업이 채웁니다.
+
+    Returns:
+        bool: 반영 성공 여부
+    """
+    days = {}
+    for day, bits in group_active_days(rows).items():
+        missing = _known.missing(day, bits)
+        if missing:
+            days[day] = missing
+    if not days:
+        return True
+
+    try:
+        with db_cursor(dictionary=False, commit=True) as cursor:
+            apply_active_days(cursor, days)
+        for day, bits in days.items():
+            _known.add(day, bits)
+        return True
+    except Exception as e:
+        print(f"[ActivityBitmaps] Incremental update failed (rebuild will repair): {e}")
+        return False
+
+
+# =============================================================================
+# 재생성 / 조회
+# =============================================================================
+def rebuild_day(cursor, day: date, now: Optional[datetime] = None) -> int:
+    """
+    activity_logs 기준으로 하루 비트맵을 다시 만들어 덮어씀
+
+    비트맵 행을 먼저 잠그므로, 집계 도중 기록된 로그의 증분은 커밋 이후 다시 OR됩니다.
+
+    Returns:
+        int: 그날 활성 학원 수
+    """
+    start = datetime(day.year, day.month, day.day)
+    cursor.execute("""
+        SELECT activity_date FROM daily_active_academies
+        WHERE activity_date = %s
+        FOR UPDATE
+    """, (day,))
+    cursor.fetchall()
+
+    cursor.execute("""
+        SELECT DISTINCT academy_id
+        FROM activity_logs
+        WHERE created_at >= %s AND created_at < %s
+    """, (start, start + timedelta(days=1)))
+    bits = bitmap_from_ids(row[0] for row in cursor.fetchall())
+
+    count = popcount(bits)
+    cursor.execute(REBUILD_SQL, (day, encode(bits), count, now or datetime.now()))
+    return count
+
+
+def rebuild_range(start: date, end: date) -> Dict[date, int]:
+    """
+    start ~ end(포함)를 하루씩 별도 트랜잭션으로 재생성
+
+    Returns:
+        Dict[date, int]: {날짜: 활성 학원 수}
+    """
+    results = {}
+    day = start
+    while day <= end:
+        with db_cursor(dictionary=False, commit=True) as cursor:
+            results[day] = rebuild_day(cursor, day)
+        day += timedelta(days=1)
+    return results
+
+
+def load_daily_bitmaps(cursor, start: date, end: date) -> Optional[DailyBitmaps]:
+    """
+    start ~ end(포함) 비트맵 조회
+
+    end 이전 날짜 중 재생성되지 않은 날이 있으면(마이그레이션 직후, 재생성 작업 중단 등)
+    None을 반환합니다. 테이블이 없어도 None.
+    """
+    try:
+        cursor.execute("""
+            SELECT activity_date, bitmap, rebuilt_at
+            FROM daily_active_academies
+            WHERE activity_date >= %s AND activity_date <= %s
+        """, (start, end))
+        rows = cursor.fetchall()
+    except Exception as e:
+        print(f"[ActivityBitmaps] Bitmap lookup failed, using raw tables: {e}")
+        return None
+
+    rebuilt = {row['activity_date'] for row in rows if row['rebuilt_at'] is not None}
+    day = start
+    while day < end:
+        if day not in rebuilt:
+            return None
+        day += timedelta(days=1)
+
+    return DailyBitmaps({row['activity_date']: decode(row['bitmap']) for row in rows})
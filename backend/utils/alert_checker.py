@@ -3,15 +3,29 @@ Alert Checker 유틸리티
 
 각 Alert 타입별로 체크 함수를 제공하며, 모든 Alert를 한번에 체크하는 기능을 제공합니다.
 
+체크 함수들은 제한된 크기의 스레드 풀에서 동시에 실행됩니다.
+체크 함수는 조회 실패를 삼키지 않고 예외로 올리며, run_alert_checks가 해당 체크를
+'error'로 표시합니다 (DB 장애를 '정상'으로 보고하지 않도록). 각 체크는 공유 DB
+커넥션 풀(utils/db_pool.py)에서 연결을 빌려 쓰고, 제한 시간 안에 끝나지 않은
+체크는 응답을 막지 않고 'unknown'으로 보고됩니다.
+
+환경변수:
+    ALERT_CHECK_TIMEOUT: 체크 1개당 제한 시간 (초, 기본 3)
+    ALERT_CHECK_WORKERS: 동시에 실행할 체크 수 (기본 4, DB 풀 크기보다 작게)
+
 사용 예시:
-    >>> from utils.alert_checker import check_all_alerts, check_cpu_alert
+    >>> from utils.alert_checker import check_all_alerts, check_cpu_alert, run_alert_checks
     >>> alerts = check_all_alerts()
     >>> cpu_alert = check_cpu_alert()
+    >>> run_alert_checks()['checks']  # [{'name': 'cpu', 'status': 'ok', 'duration_ms': 12.3}, ...]
 """
 
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 # 프로젝트 루트 설정
 import sys
@@ -19,21 +33,26 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 from config.alert_thresholds import get_threshold, get_cooldown
-
-
-def get_db_connection():
-    """데이터베이스 연결"""
-    try:
-        import mysql.connector
-        return mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD', ''),
-            database=os.getenv('DB_NAME', 'tutornote')
-        )
-    except Exception as e:
-        print(f"[AlertChecker] DB connection failed: {e}")
-        return None
+from utils.db_pool import db_cursor
+from utils.process_lifecycle import count_restarts
+from utils.resource_window import get_resource_average
+
+
+ALERT_CHECK_TIMEOUT = float(os.getenv('ALERT_CHECK_TIMEOUT', '3'))
+ALERT_CHECK_WORKERS = int(os.getenv('ALERT_CHECK_WORKERS', '4'))
+
+# 기간(critical / warning 일수) 이상 활동이 없는 학원 수
+# 학원당 1행인 academy_stats.last_activity_at (utils/academy_stats.py)을 PK로 읽음
+INACTIVE_ACADEMY_SQL = """
+    SELECT
+        COUNT(CASE WHEN st.last_activity_at IS NULL
+                   OR st.last_activity_at < DATE_SUB(NOW(), INTERVAL %s DAY) THEN 1 END) as critical_count,
+        COUNT(CASE WHEN st.last_activity_at IS NULL
+                   OR st.last_activity_at < DATE_SUB(NOW(), INTERVAL %s DAY) THEN 1 END) as warning_count
+    FROM academies a
+    LEFT JOIN academy_stats st ON st.academy_id = a.id
+    WHERE a.status = 'active'
+"""
 
 
 def check_cpu_alert() -> Optional[Dict]:
@@ -44,44 +63,29 @@ def check_cpu_alert() -> Optional[Dict]:
 
     Returns:
         dict: Alert 정보 (severity, type, value, threshold) or None
-    """
-    conn = get_db_connection()
-    if not conn:
-        return None
 
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT AVG(cpu_usage) as avg_cpu
-            FROM system_health_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """)
-        result = cursor.fetchone()
-        avg_cpu = float(result['avg_cpu']) if result and result['avg_cpu'] else 0
-
-        cursor.close()
-        conn.close()
-
-        cpu_warning = get_threshold('system', 'cpu', 'warning')
-        cpu_critical = get_threshold('system', 'cpu', 'critical')
+    Raises:
+        조회 실패 예외는 그대로 전파 (run_alert_checks가 'error'로 표시)
+    """
+    avg_cpu = get_resource_average('cpu')
 
-        if avg_cpu > cpu_critical:
-            return {
-                'severity': 'critical',
-                'type': 'cpu_usage',
-                'value': avg_cpu,
-                'threshold': cpu_critical
-            }
-        elif avg_cpu > cpu_warning:
-            return {
-                'severity': 'warning',
-                'type': 'cpu_usage',
-                'value': avg_cpu,
-                'threshold': cpu_warning
-            }
+    cpu_warning = get_threshold('system', 'cpu', 'warning')
+    cpu_critical = get_threshold('system', 'cpu', 'critical')
 
-    except Exception as e:
-        print(f"[AlertChecker] CPU check error: {e}")
+    if avg_cpu > cpu_critical:
+        return {
+            'severity': 'critical',
+            'type': 'cpu_usage',
+            'value': avg_cpu,
+            'threshold': cpu_critical
+        }
+    elif avg_cpu > cpu_warning:
+        return {
+            'severity': 'warning',
+            'type': 'cpu_usage',
+            'value': avg_cpu,
+            'threshold': cpu_warning
+        }
 
     return None
 
@@ -95,43 +99,25 @@ def check_ram_alert() -> Optional[Dict]:
     Returns:
         dict: Alert 정보 or None
     """
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT AVG(ram_usage) as avg_ram
-            FROM system_health_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """)
-        result = cursor.fetchone()
-        avg_ram = float(result['avg_ram']) if result and result['avg_ram'] else 0
-
-        cursor.close()
-        conn.close()
+    avg_ram = get_resource_average('ram')
 
-        ram_warning = get_threshold('system', 'ram', 'warning')
-        ram_critical = get_threshold('system', 'ram', 'critical')
+    ram_warning = get_threshold('system', 'ram', 'warning')
+    ram_critical = get_threshold('system', 'ram', 'critical')
 
-        if avg_ram > ram_critical:
-            return {
-                'severity': 'critical',
-                'type': 'ram_usage',
-                'value': avg_ram,
-                'threshold': ram_critical
-            }
-        elif avg_ram > ram_warning:
-            return {
-                'severity': 'warning',
-                'type': 'ram_usage',
-                'value': avg_ram,
-                'threshold': ram_warning
-            }
-
-    except Exception as e:
-        print(f"[AlertChecker] RAM check error: {e}")
+    if avg_ram > ram_critical:
+        return {
+            'severity': 'critical',
+            'type': 'ram_usage',
+            'value': avg_ram,
+            'threshold': ram_critical
+        }
+    elif avg_ram > ram_warning:
+        return {
+            'severity': 'warning',
+            'type': 'ram_usage',
+            'value': avg_ram,
+            'threshold': ram_warning
+        }
 
     return None
 
@@ -145,43 +131,25 @@ def check_disk_alert() -> Optional[Dict]:
     Returns:
         dict: Alert 정보 or None
     """
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT AVG(disk_usage) as avg_disk
-            FROM system_health_logs
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """)
-        result = cursor.fetchone()
-        avg_disk = float(result['avg_disk']) if result and result['avg_disk'] else 0
+    avg_disk = get_resource_average('disk')
 
-        cursor.close()
-        conn.close()
+    disk_warning = get_threshold('system', 'disk', 'warning')
+    disk_critical = get_threshold('system', 'disk', 'critical')
 
-        disk_warning = get_threshold('system', 'disk', 'warning')
-        disk_critical = get_threshold('system', 'disk', 'critical')
-
-        if avg_disk > disk_critical:
-            return {
-                'severity': 'critical',
-                'type': 'disk_usage',
-                'value': avg_disk,
-                'threshold': disk_critical
-            }
-        elif avg_disk > disk_warning:
-            return {
-                'severity': 'warning',
-                'type': 'disk_usage',
-                'value': avg_disk,
-                'threshold': disk_warning
-            }
-
-    except Exception as e:
-        print(f"[AlertChecker] Disk check error: {e}")
+    if avg_disk > disk_critical:
+        return {
+            'severity': 'critical',
+            'type': 'disk_usage',
+            'value': avg_disk,
+            'threshold': disk_critical
+        }
+    elif avg_disk > disk_warning:
+        return {
+            'severity': 'warning',
+            'type': 'disk_usage',
+            'value': avg_disk,
+            'threshold': disk_warning
+        }
 
     return None
 
@@ -191,58 +159,31 @@ def check_backend_restart_alert() -> Optional[Dict]:
     Backend 재시작 빈도 Alert 체크
 
     최근 24시간 내 Backend 재시작 횟수를 기준으로 Alert 생성
-    PM2 로그 또는 system_health_logs 기반
+    process_lifecycle_events의 start 기록 기반 (utils/process_lifecycle.py)
 
     Returns:
         dict: Alert 정보 or None
     """
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # system_health_logs에서 연결 끊김 횟수로 재시작 횟수 추정
-        # (실제 PM2 로그 파싱이 더 정확하지만, DB 기반으로 단순화)
-        cursor.execute("""
-            SELECT COUNT(*) as restart_count
-            FROM (
-                SELECT
-                    created_at,
-                    LAG(created_at) OVER (ORDER BY created_at) as prev_time
-                FROM system_health_logs
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL 24 HOUR)
-            ) t
-            WHERE TIMESTAMPDIFF(MINUTE, prev_time, created_at) > 10
-        """)
-
-        result = cursor.fetchone()
-        restart_count = result['restart_count'] if result else 0
-
-        cursor.close()
-        conn.close()
-
-        restart_critical = get_threshold('system', 'backend_restart', 'critical')
-        restart_warning = get_threshold('system', 'backend_restart', 'warning')
-
-        if restart_count > restart_critical:
-            return {
-                'severity': 'critical',
-                'type': 'backend_restart',
-                'value': restart_count,
-                'threshold': restart_critical
-            }
-        elif restart_count > restart_warning:
-            return {
-                'severity': 'warning',
-                'type': 'backend_restart',
-                'value': restart_count,
-                'threshold': restart_warning
-            }
-
-    except Exception as e:
-        print(f"[AlertChecker] Backend restart check error: {e}")
+    with db_cursor() as cursor:
+        restart_count = count_restarts(cursor, hours=24)
+
+    restart_critical = get_threshold('system', 'backend_restart', 'critical')
+    restart_warning = get_threshold('system', 'backend_restart', 'warning')
+
+    if restart_count > restart_critical:
+        return {
+            'severity': 'critical',
+            'type': 'backend_restart',
+            'value': restart_count,
+            'threshold': restart_critical
+        }
+    elif restart_count > restart_warning:
+        return {
+            'severity': 'warning',
+            'type': 'backend_restart',
+            'value': restart_count,
+            'threshold': restart_warning
+        }
 
     return None
 
@@ -256,70 +197,31 @@ def check_inactive_academy_alert() -> Optional[Dict]:
     Returns:
         dict: Alert 정보 or None
     """
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-
+    with db_cursor() as cursor:
         inactive_days_critical = get_threshold('business', 'inactive_days', 'critical')
         inactive_days_warning = get_threshold('business', 'inactive_days', 'warning')
 
-        # 활동이 없는 학원 수 조회
-        cursor.execute("""
-            SELECT COUNT(DISTINCT a.id) as count
-            FROM academies a
-            LEFT JOIN (
-                SELECT academy_id, MAX(created_at) as last_activity
-                FROM activity_logs
-                GROUP BY academy_id
-            ) al ON a.id = al.academy_id
-            WHERE a.status = 'active'
-            AND (al.last_activity IS NULL
-                 OR al.last_activity < DATE_SUB(NOW(), INTERVAL %s DAY))
-        """, (inactive_days_critical,))
+        # 활동이 없는 학원 수 조회 (academy_stats.last_activity_at, 학원당 1행)
+        cursor.execute(INACTIVE_ACADEMY_SQL, (inactive_days_critical, inactive_days_warning))
 
         result = cursor.fetchone()
-        inactive_count_critical = result['count'] if result else 0
-
-        # Warning 레벨도 체크
-        cursor.execute("""
-            SELECT COUNT(DISTINCT a.id) as count
-            FROM academies a
-            LEFT JOIN (
-                SELECT academy_id, MAX(created_at) as last_activity
-                FROM activity_logs
-                GROUP BY academy_id
-            ) al ON a.id = al.academy_id
-            WHERE a.status = 'active'
-            AND (al.last_activity IS NULL
-                 OR al.last_activity < DATE_SUB(NOW(), INTERVAL %s DAY))
-        """, (inactive_days_warning,))
-
-        result = cursor.fetchone()
-        inactive_count_warning = result['count'] if result else 0
-
-        cursor.close()
-        conn.close()
-
-        if inactive_count_critical > 0:
-            return {
-                'severity': 'critical',
-                'type': 'inactive_academy',
-                'value': inactive_count_critical,
-                'threshold': inactive_days_critical
-            }
-        elif inactive_count_warning > 0:
-            return {
-                'severity': 'warning',
-                'type': 'inactive_academy',
-                'value': inactive_count_warning,
-                'threshold': inactive_days_warning
-            }
-
-    except Exception as e:
-        print(f"[AlertChecker] Inactive academy check error: {e}")
+        inactive_count_critical = result['critical_count'] if result else 0
+        inactive_count_warning = result['warning_count'] if result else 0
+
+    if inactive_count_critical > 0:
+        return {
+            'severity': 'critical',
+            'type': 'inactive_academy',
+            'value': inactive_count_critical,
+            'threshold': inactive_days_critical
+        }
+    elif inactive_count_warning > 0:
+        return {
+            'severity': 'warning',
+            'type': 'inactive_academy',
+            'value': inactive_count_warning,
+            'threshold': inactive_days_warning
+        }
 
     return None
 
@@ -333,19 +235,14 @@ def check_parent_view_rate_alert() -> Optional[Dict]:
     Returns:
         dict: Alert 정보 or None
     """
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-
-        # 최근 7일간 리포트 열람률 계산
+    with db_cursor() as cursor:
+        # 최근 7일간 리포트 열람률 계산 (삭제된 리포트는 분모에서 제외)
         cursor.execute("""
             SELECT
                 COUNT(DISTINCT rv.report_id) as viewed,
                 (SELECT COUNT(*) FROM progress_records
-                 WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)) as total
+                 WHERE is_deleted = 0
+                 AND created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)) as total
             FROM report_views rv
             WHERE rv.created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
         """)
@@ -354,32 +251,26 @@ def check_parent_view_rate_alert() -> Optional[Dict]:
         viewed = result['viewed'] if result else 0
         total = result['total'] if result else 0
 
-        cursor.close()
-        conn.close()
-
-        if total > 0:
-            view_rate = (viewed / total) * 100
-
-            view_rate_warning = get_threshold('business', 'parent_view_rate', 'warning')
-            view_rate_critical = get_threshold('business', 'parent_view_rate', 'critical')
-
-            if view_rate < view_rate_critical:
-                return {
-                    'severity': 'critical',
-                    'type': 'parent_view_rate',
-                    'value': view_rate,
-                    'threshold': view_rate_critical
-                }
-            elif view_rate < view_rate_warning:
-                return {
-                    'severity': 'warning',
-                    'type': 'parent_view_rate',
-                    'value': view_rate,
-                    'threshold': view_rate_warning
-                }
-
-    except Exception as e:
-        print(f"[AlertChecker] Parent view rate check error: {e}")
+    if total > 0:
+        view_rate = (viewed / total) * 100
+
+        view_rate_warning = get_threshold('business', 'parent_view_rate', 'warning')
+        view_rate_critical = get_threshold('business', 'parent_view_rate', 'critical')
+
+        if view_rate < view_rate_critical:
+            return {
+                'severity': 'critical',
+                'type': 'parent_view_rate',
+                'value': view_rate,
+                'threshold': view_rate_critical
+            }
+        elif view_rate < view_rate_warning:
+            return {
+                'severity': 'warning',
+                'type': 'parent_view_rate',
+                'value': view_rate,
+                'threshold': view_rate_warning
+            }
 
     return None
 
@@ -393,13 +284,7 @@ def check_api_error_rate_alert() -> Optional[Dict]:
     Returns:
         dict: Alert 정보 or None
     """
-    conn = get_db_connection()
-    if not conn:
-        return None
-
-    try:
-        cursor = conn.cursor(dictionary=True)
-
+    with db_cursor() as cursor:
         cursor.execute("""
             SELECT
                 COUNT(*) as total,
@@ -409,38 +294,44 @@ def check_api_error_rate_alert() -> Optional[Dict]:
         """)
         result = cursor.fetchone()
 
-        cursor.close()
-        conn.close()
-
-        if result and result['total'] and result['total'] > 0:
-            total = result['total']
-            errors = result['errors'] or 0
-            error_rate = (errors / total) * 100
-
-            api_error_warning = get_threshold('system', 'api_error_rate', 'warning')
-            api_error_critical = get_threshold('system', 'api_error_rate', 'critical')
-
-            if error_rate > api_error_critical:
-                return {
-                    'severity': 'critical',
-                    'type': 'api_error_rate',
-                    'value': error_rate,
-                    'threshold': api_error_critical
-                }
-            elif error_rate > api_error_warning:
-                return {
-                    'severity': 'warning',
-                    'type': 'api_error_rate',
-                    'value': error_rate,
-                    'threshold': api_error_warning
-                }
-
-    except Exception as e:
-        print(f"[AlertChecker] API error rate check error: {e}")
+    if result and result['total'] and result['total'] > 0:
+        total = result['total']
+        errors = result['errors'] or 0
+        error_rate = (errors / total) * 100
+
+        api_error_warning = get_threshold('system', 'api_error_rate', 'warning')
+        api_error_critical = get_threshold('system', 'api_error_rate', 'critical')
+
+        if error_rate > api_error_critical:
+            return {
+                'severity': 'critical',
+                'type': 'api_error_rate',
+                'value': error_rate,
+                'threshold': api_error_critical
+            }
+        elif error_rate > api_error_warning:
+            return {
+                'severity': 'warning',
+                'type': 'api_error_rate',
+                'value': error_rate,
+                'threshold': api_error_warning
+            }
 
     return None
 
 
+# Alert 체크 함수 목록
+ALERT_CHECKS: List[Callable[[], Optional[Dict]]] = [
+    check_cpu_alert,
+    check_ram_alert,
+    check_disk_alert,
+    check_backend_restart_alert,
+    check_inactive_academy_alert,
+    check_parent_view_rate_alert,
+    check_api_error_rate_alert,
+]
+
+
 def format_alert_message(alert: Dict) -> Dict:
     """
     Alert 데이터를 UI용 메시지로 변환
@@ -508,41 +399,132 @@ def format_alert_message(alert: Dict) -> Dict:
     }
 
 
-def check_all_alerts() -> List[Dict]:
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """체크 실행용 스레드 풀 (프로세스당 1개, fork 이후 다시 생성)"""
+    global _executor, _executor_pid
+
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=ALERT_CHECK_WORKERS, thread_name_prefix='alert-check')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _check_name(check_fn: Callable) -> str:
+    """check_cpu_alert → cpu"""
+    name = check_fn.__name__
+    if name.startswith('check_'):
+        name = name[len('check_'):]
+    if name.endswith('_alert'):
+        name = name[:-len('_alert')]
+    return name
+
+
+def run_alert_checks(
+    check_functions: Optional[List[Callable]] = None,
+    timeout: Optional[float] = None,
+    formatter: Optional[Callable[[Dict], Dict]] = None
+) -> Dict[str, Any]:
     """
-    모든 Alert 체크 및 수집
+    Alert 체크 함수들을 스레드 풀에서 동시에 실행
 
-    등록된 모든 Alert 체크 함수를 실행하고 결과를 수집합니다.
+    각 체크는 실행을 시작한 시점부터 timeout초 안에 끝나야 하며, 넘기면
+    결과를 기다리지 않고 'unknown'으로 표시합니다 (스레드는 끝까지 실행된 뒤 반환).
+    풀이 모두 사용 중이라 시작하지 못한 체크도 전체 대기 한도(timeout × 2)를
+    넘기면 'unknown'이 됩니다.
+
+    Args:
+        check_functions: 실행할 체크 함수 목록 (기본: ALERT_CHECKS)
+        timeout: 체크 1개당 제한 시간 (초, 기본 ALERT_CHECK_TIMEOUT)
+        formatter: Alert 포맷 함수 (기본: format_alert_message)
 
     Returns:
-        list: 포맷팅된 Alert 목록 (Critical 먼저 정렬)
+        dict: {
+            'alerts': 포맷팅된 Alert 목록 (Critical 먼저),
+            'checks': [{'name', 'status': ok/alert/unknown/error, 'duration_ms'}],
+            'duration_ms': 전체 소요 시간
+        }
     """
+    check_functions = check_functions if check_functions is not None else ALERT_CHECKS
+    timeout = timeout if timeout is not None else ALERT_CHECK_TIMEOUT
+    formatter = formatter or format_alert_message
+
+    run_start = time.monotonic()
+    hard_deadline = run_start + timeout * 2
+    started: Dict[str, float] = {}
+
+    def timed(name: str, check_fn: Callable):
+        started[name] = time.monotonic()
+        result = check_fn()
+        return result, (time.monotonic() - started[name]) * 1000
+
+    executor = _get_executor()
+    futures = {executor.submit(timed, _check_name(fn), fn): _check_name(fn) for fn in check_functions}
+    checks: Dict[str, Dict[str, Any]] = {}
     alerts = []
 
-    # Alert 체크 함수 목록
-    check_functions = [
-        check_cpu_alert,
-        check_ram_alert,
-        check_disk_alert,
-        check_backend_restart_alert,
-        check_inactive_academy_alert,
-        check_parent_view_rate_alert,
-        check_api_error_rate_alert,
-    ]
-
-    for check_fn in check_functions:
-        try:
-            alert = check_fn()
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        expired = [
+            f for f in pending
+            if now >= min(started.get(futures[f], now) + timeout, hard_deadline)
+        ]
+        for future in expired:
+            future.cancel()
+            name = futures[future]
+            elapsed = (now - started.get(name, run_start)) * 1000
+            print(f"[AlertChecker] Check {name} timed out after {elapsed:.0f}ms")
+            checks[name] = {'name': name, 'status': 'unknown', 'duration_ms': round(elapsed, 1)}
+        pending.difference_update(expired)
+        if not pending:
+            break
+
+        next_deadline = min(
+            min(started.get(futures[f], now) + timeout, hard_deadline) for f in pending
+        )
+        done, pending = wait(pending, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            name = futures[future]
+            try:
+                alert, duration_ms = future.result()
+            except Exception as e:
+                print(f"[AlertChecker] Check function {name} error: {e}")
+                elapsed = (time.monotonic() - started.get(name, run_start)) * 1000
+                checks[name] = {'name': name, 'status': 'error', 'duration_ms': round(elapsed, 1)}
+                continue
+
+            checks[name] = {'name': name, 'status': 'alert' if alert else 'ok', 'duration_ms': round(duration_ms, 1)}
             if alert:
-                formatted = format_alert_message(alert)
-                alerts.append(formatted)
-        except Exception as e:
-            print(f"[AlertChecker] Check function {check_fn.__name__} error: {e}")
+                alerts.append(formatter(alert))
 
     # Critical Alert를 먼저, 그 다음 Warning 정렬
     alerts.sort(key=lambda x: (0 if x['severity'] == 'critical' else 1, x['type']))
 
-    return alerts
+    return {
+        'alerts': alerts,
+        'checks': [checks[_check_name(fn)] for fn in check_functions],
+        'duration_ms': round((time.monotonic() - run_start) * 1000, 1),
+    }
+
+
+def check_all_alerts() -> List[Dict]:
+    """
+    모든 Alert 체크 및 수집
+
+    등록된 모든 Alert 체크 함수를 동시에 실행하고 결과를 수집합니다.
+    제한 시간을 넘긴 체크는 결과에서 빠집니다 (run_alert_checks 참고).
+
+    Returns:
+        list: 포맷팅된 Alert 목록 (Critical 먼저 정렬)
+    """
+    return run_alert_checks()['alerts']
 
 
 def get_alert_summary() -> Dict[str, Any]:
@@ -554,10 +536,12 @@ def get_alert_summary() -> Dict[str, Any]:
             'critical_count': int,
             'warning_count': int,
             'total_count': int,
-            'alerts': list
+            'alerts': list,
+            'checks': list  # 체크별 상태/소요 시간
         }
     """
-    alerts = check_all_alerts()
+    result = run_alert_checks()
+    alerts = result['alerts']
 
     critical_count = len([a for a in alerts if a['severity'] == 'critical'])
     warning_count = len([a for a in alerts if a['severity'] == 'warning'])
@@ -566,7 +550,8 @@ def get_alert_summary() -> Dict[str, Any]:
         'critical_count': critical_count,
         'warning_count': warning_count,
         'total_count': len(alerts),
-        'alerts': alerts
+        'alerts': alerts,
+        'checks': result['checks']
     }
 
 
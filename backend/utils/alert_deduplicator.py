@@ -3,20 +3,210 @@ Alert 중복 발송 방지 모듈
 
 5분마다 헬스체크가 실행되면서 같은 Critical Alert가
 반복 발송되는 것을 방지합니다.
+
+발송 기록 저장소:
+    - memory: 프로세스 메모리 (AlertDeduplicator() 기본값, 테스트용)
+    - sqlite: 로컬 SQLite 파일 (싱글톤 기본값) - cron 실행 간, 같은 서버의 워커 간 공유
+    - mysql: alert_dedup 테이블 (migrations/006) - 여러 서버 간 공유
+
+persistent 저장소는 "cooldown보다 오래됐으면 지금 시각으로 기록"을 한 문장(원자적)으로
+처리하므로 여러 프로세스가 동시에 같은 Alert를 확인해도 한 곳에서만 발송됩니다.
+저장소 오류 시에는 프로세스 메모리 기록으로 대신 판단합니다.
+
+환경변수:
+    ALERT_DEDUP_BACKEND: sqlite(기본) / mysql / memory
+    ALERT_DEDUP_SQLITE_PATH: SQLite 파일 경로 (기본 backend/logs/alert_dedup.sqlite3)
 """
 
+import os
+import sqlite3
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SQLITE_PATH = os.getenv('ALERT_DEDUP_SQLITE_PATH', os.path.join(PROJECT_ROOT, 'logs', 'alert_dedup.sqlite3'))
+
+
+class MemoryAlertStore:
+    """프로세스 메모리 저장소"""
+
+    def __init__(self, sent_alerts: Optional[Dict[str, datetime]] = None):
+        self.sent_alerts = sent_alerts if sent_alerts is not None else {}
+
+    def claim(self, alert_key: str, now: datetime, cooldown_minutes: float) -> Optional[datetime]:
+        """
+        cooldown이 지났으면 now로 기록
+
+        Returns:
+            None이면 발송 허용, 아니면 마지막 발송 시각 (skip)
+        """
+        last_sent = self.sent_alerts.get(alert_key)
+        if last_sent is not None and now - last_sent < timedelta(minutes=cooldown_minutes):
+            return last_sent
+        self.sent_alerts[alert_key] = now
+        return None
+
+    def reset(self, alert_key: str) -> None:
+        self.sent_alerts.pop(alert_key, None)
+
+    def clear_older_than(self, cutoff: datetime) -> int:
+        old_keys = [key for key, sent_time in self.sent_alerts.items() if sent_time < cutoff]
+        for key in old_keys:
+            del self.sent_alerts[key]
+        return len(old_keys)
+
+    def items(self) -> Dict[str, datetime]:
+        return self.sent_alerts.copy()
+
+
+class SQLiteAlertStore:
+    """
+    SQLite 파일 저장소
+
+    호출마다 짧게 연결하며, UPSERT의 WHERE 조건으로 check-and-set을 한 문장에서 처리합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 5.0):
+        self.path = path or DEFAULT_SQLITE_PATH
+        self.timeout = timeout
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS alert_dedup (
+                    alert_key TEXT PRIMARY KEY,
+                    last_sent REAL NOT NULL
+                )
+            """)
+            self._initialized = True
+        return conn
+
+    def claim(self, alert_key: str, now: datetime, cooldown_minutes: float) -> Optional[datetime]:
+        cutoff = (now - timedelta(minutes=cooldown_minutes)).timestamp()
+        conn = self._connect()
+        try:
+            cursor = conn.execute("""
+                INSERT INTO alert_dedup (alert_key, last_sent) VALUES (?, ?)
+                ON CONFLICT(alert_key) DO UPDATE SET last_sent = excluded.last_sent
+                WHERE alert_dedup.last_sent <= ?
+            """, (alert_key, now.timestamp(), cutoff))
+            if cursor.rowcount == 1:
+                return None
+
+            row = conn.execute("SELECT last_sent FROM alert_dedup WHERE alert_key = ?", (alert_key,)).fetchone()
+            return datetime.fromtimestamp(row[0]) if row else now
+        finally:
+            conn.close()
+
+    def reset(self, alert_key: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM alert_dedup WHERE alert_key = ?", (alert_key,))
+        finally:
+            conn.close()
+
+    def clear_older_than(self, cutoff: datetime) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute("DELETE FROM alert_dedup WHERE last_sent < ?", (cutoff.timestamp(),)).rowcount
+        finally:
+            conn.close()
+
+    def items(self) -> Dict[str, datetime]:
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT alert_key, last_sent FROM alert_dedup").fetchall()
+            return {key: datetime.fromtimestamp(ts) for key, ts in rows}
+        finally:
+            conn.close()
+
+
+class MySQLAlertStore:
+    """
+    MySQL alert_dedup 테이블 저장소 (여러 서버 공유)
+
+    UPSERT가 cooldown이 지난 경우에만 claim_token을 바꾸고, 같은 트랜잭션에서
+    token을 다시 읽어 이번 호출이 기록했는지 판단합니다. (affected rows는
+    클라이언트 플래그에 따라 달라지므로 사용하지 않음)
+    """
+
+    def claim(self, alert_key: str, now: datetime, cooldown_minutes: float) -> Optional[datetime]:
+        from utils.db_pool import db_cursor
+
+        token = uuid.uuid4().hex
+        cutoff = now - timedelta(minutes=cooldown_minutes)
+        with db_cursor(commit=True) as cursor:
+            # claim_token을 먼저 갱신해야 이전 last_sent_at으로 비교됨
+            cursor.execute("""
+                INSERT INTO alert_dedup (alert_key, last_sent_at, claim_token)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    claim_token = IF(last_sent_at <= %s, VALUES(claim_token), claim_token),
+                    last_sent_at = IF(claim_token = VALUES(claim_token), VALUES(last_sent_at), last_sent_at)
+            """, (alert_key, now, token, cutoff))
+            cursor.execute("""
+                SELECT last_sent_at, claim_token
+                FROM alert_dedup
+                WHERE alert_key = %s
+            """, (alert_key,))
+            row = cursor.fetchone()
+
+        if row is None or row['claim_token'] == token:
+            return None
+        return row['last_sent_at']
+
+    def reset(self, alert_key: str) -> None:
+        from utils.db_pool import db_cursor
+
+        with db_cursor(commit=True) as cursor:
+            cursor.execute("DELETE FROM alert_dedup WHERE alert_key = %s", (alert_key,))
+
+    def clear_older_than(self, cutoff: datetime) -> int:
+        from utils.db_pool import db_cursor
+
+        with db_cursor(commit=True) as cursor:
+            cursor.execute("DELETE FROM alert_dedup WHERE last_sent_at < %s", (cutoff,))
+            return cursor.rowcount
+
+    def items(self) -> Dict[str, datetime]:
+        from utils.db_pool import db_cursor
+
+        with db_cursor() as cursor:
+            cursor.execute("SELECT alert_key, last_sent_at FROM alert_dedup")
+            return {row['alert_key']: row['last_sent_at'] for row in cursor.fetchall()}
+
 
 class AlertDeduplicator:
     """
     Alert 중복 발송 방지 클래스
     같은 알림을 설정된 시간(기본 60분) 내에는 재발송하지 않음
+
+    Args:
+        store: 발송 기록 저장소 (None이면 프로세스 메모리)
     """
 
-    def __init__(self):
+    def __init__(self, store=None):
+        # 프로세스 메모리 기록 (memory 저장소 본체, persistent 저장소 장애 시 대체)
         self._sent_alerts: Dict[str, datetime] = {}
+        self._local = MemoryAlertStore(self._sent_alerts)
+        self.store = store or self._local
+
+    def _call(self, method: str, *args):
+        """저장소 호출 (실패 시 프로세스 메모리 기록 사용)"""
+        if self.store is not self._local:
+            try:
+                return getattr(self.store, method)(*args)
+            except Exception as e:
+                print(f"[AlertDeduplicator] {type(self.store).__name__}.{method} failed, using process memory: {e}")
+        return getattr(self._local, method)(*args)
 
     def should_send_alert(self, alert_key: str, cooldown_minutes: int = 60) -> bool:
         """
@@ -37,17 +227,13 @@ class AlertDeduplicator:
             False
         """
         now = datetime.now()
+        last_sent = self._call('claim', alert_key, now, cooldown_minutes)
 
-        if alert_key in self._sent_alerts:
-            last_sent = self._sent_alerts[alert_key]
+        if last_sent is not None:
             elapsed = (now - last_sent).total_seconds() / 60
+            print(f"Alert '{alert_key}' skipped (sent {elapsed:.1f}m ago)")
+            return False
 
-            if elapsed < cooldown_minutes:
-                print(f"Alert '{alert_key}' skipped (sent {elapsed:.1f}m ago)")
-                return False
-
-        # 발송 허용 - 시간 기록
-        self._sent_alerts[alert_key] = now
         return True
 
     def reset_alert(self, alert_key: str) -> None:
@@ -57,12 +243,13 @@ class AlertDeduplicator:
         Args:
             alert_key: 리셋할 알림의 고유 키
         """
-        if alert_key in self._sent_alerts:
-            del self._sent_alerts[alert_key]
+        self._call('reset', alert_key)
+        if self.store is not self._local:
+            self._local.reset(alert_key)
 
     def clear_old_alerts(self, hours: int = 24) -> int:
         """
-        24시간 이상 오래된 알림 기록 삭제 (메모리 관리)
+        24시간 이상 오래된 알림 기록 삭제 (메모리/저장소 관리)
 
         Args:
             hours: 이 시간보다 오래된 알림 기록 삭제
@@ -70,22 +257,29 @@ class AlertDeduplicator:
         Returns:
             int: 삭제된 알림 기록 수
         """
-        now = datetime.now()
-        keys_to_delete = []
+        cutoff = datetime.now() - timedelta(hours=hours)
+        deleted = self._call('clear_older_than', cutoff)
+        if self.store is not self._local:
+            self._local.clear_older_than(cutoff)
+        return deleted
 
-        for key, sent_time in self._sent_alerts.items():
-            if (now - sent_time).total_seconds() > hours * 3600:
-                keys_to_delete.append(key)
+    def get_active_alerts(self) -> Dict[str, datetime]:
+        """현재 활성 상태인 알림 기록 반환 (디버깅용)"""
+        return self._call('items')
 
-        for key in keys_to_delete:
-            del self._sent_alerts[key]
 
-        return len(keys_to_delete)
+def create_alert_deduplicator(backend: Optional[str] = None) -> AlertDeduplicator:
+    """ALERT_DEDUP_BACKEND 설정에 맞는 저장소로 AlertDeduplicator 생성"""
+    backend = (backend or os.getenv('ALERT_DEDUP_BACKEND', 'sqlite')).lower()
 
-    def get_active_alerts(self) -> Dict[str, datetime]:
-        """현재 활성 상태인 알림 기록 반환 (디버깅용)"""
-        return self._sent_alerts.copy()
+    if backend == 'mysql':
+        return AlertDeduplicator(MySQLAlertStore())
+    if backend == 'memory':
+        return AlertDeduplicator()
+    if backend != 'sqlite':
+        print(f"[AlertDeduplicator] Unknown backend '{backend}', using sqlite")
+    return AlertDeduplicator(SQLiteAlertStore())
 
 
 # 싱글톤 인스턴스
-alert_deduplicator = AlertDeduplicator()
+alert_deduplicator = create_alert_deduplicator()
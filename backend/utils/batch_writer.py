@@ -0,0 +1,259 @@
+"""
+비동기 배치 INSERT 작성기
+
+요청 스레드는 행을 메모리 큐에 넣기만 하고, 백그라운드 워커 스레드가
+batch_size개가 모이거나 flush_interval초가 지나면 executemany로 한 번에 씁니다.
+
+- 큐가 가득 차면 행을 버리고 dropped 카운터 증가 (요청은 절대 대기하지 않음)
+- DB 쓰기 실패 시 로컬 이벤트 spool(utils/event_spool.py)에 보관 → 복구 후 replay
+- 프로세스 종료 시(atexit) 큐를 비우고 종료
+
+사용 예시:
+    >>> from utils.batch_writer import BatchWriter
+    >>> writer = BatchWriter('activity_logs', "INSERT INTO activity_logs (...) VALUES (%s, ...)",
+    ...                      columns=('event_key', 'academy_id', ...), spool=get_event_spool())
+    >>> writer.submit((academy_id, user_id, ...))
+    >>> writer.flush()  # 테스트/배치 작업에서 즉시 반영이 필요할 때
+    >>> writer.stats()
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from utils.db_pool import db_cursor
+
+
+class _FlushMarker:
+    """flush() 요청 (워커가 현재 배치를 쓴 뒤 event를 set)"""
+
+    __slots__ = ('event',)
+
+    def __init__(self):
+        self.event = threading.Event()
+
+
+_STOP = object()
+
+
+class BatchWriter:
+    """
+    bounded 큐 + 워커 스레드 기반 배치 작성기
+
+    Args:
+        name: 로그/통계용 이름 (보통 테이블 이름)
+        insert_sql: executemany에 사용할 INSERT 문
+        max_queue: 큐 최대 길이 (초과 시 drop)
+        batch_size: 한 번에 쓰는 최대 행 수
+        flush_interval: 첫 행이 들어온 뒤 이 시간(초)이 지나면 배치 크기와 무관하게 기록
+        columns: insert_sql의 컬럼 순서 (spool 기록 시 행을 dict로 변환)
+        spool: DB 쓰기 실패 시 행을 보관할 EventSpool (None이면 버림)
+        write_batch: 배치 쓰기 함수 (기본: 공유 풀 executemany, 테스트용 교체 가능)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        insert_sql: str,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        columns: Optional[Sequence[str]] = None,
+        spool=None,
+        write_batch: Optional[Callable[[List[Sequence[Any]]], None]] = None
+    ):
+        self.name = name
+        self.insert_sql = insert_sql
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.columns = tuple(columns) if columns else None
+        self.spool = spool
+        self._write_batch = write_batch or self._executemany
+
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._closed = False
+        self._atexit_registered = False
+
+        self._submitted = 0
+        self._written = 0
+        self._batches = 0
+        self._dropped = 0
+        self._spooled = 0
+        self._errors = 0
+        self._last_batch_ms = 0.0
+
+    def _executemany(self, rows: List[Sequence[Any]]) -> None:
+        with db_cursor(dictionary=False, commit=True) as cursor:
+            cursor.executemany(self.insert_sql, rows)
+
+    def _ensure_worker(self) -> None:
+        """워커 스레드 시작 (gunicorn fork 이후에도 워커별로 다시 시작)"""
+        pid = os.getpid()
+        if self._thread is not None and self._thread.is_alive() and self._pid == pid:
+            return
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == pid:
+                return
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name=f"batch-writer-{self.name}", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def submit(self, row: Sequence[Any]) -> bool:
+        """
+        행 추가 (블로킹 없음)
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 큐가 가득 찼거나 종료된 경우 False
+        """
+        if self._closed:
+            return False
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+
+        with self._lock:
+            self._submitted += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        지금까지 넣은 행을 모두 기록할 때까지 대기
+
+        Returns:
+            bool: timeout 안에 기록되었으면 True
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+
+        marker = _FlushMarker()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.event.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """새 행을 받지 않고 남은 큐를 모두 기록한 뒤 워커 종료"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._thread is not None and self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                print(f"[BatchWriter] {self.name}: queue full on close, remaining rows may be lost")
+                return
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        batch: List[Sequence[Any]] = []
+        deadline: Optional[float] = None
+
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, _FlushMarker):
+                self._write(batch)
+                batch, deadline = [], None
+                item.event.set()
+                continue
+
+            if item is _STOP:
+                self._write(batch)
+                self._drain_remaining()
+                return
+
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if len(batch) >= self.batch_size or (deadline is not None and time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+
+    def _drain_remaining(self) -> None:
+        """종료 시 STOP 이후 남은 행 기록"""
+        batch: List[Sequence[Any]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushMarker):
+                item.event.set()
+            elif item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self._write(batch)
+                    batch = []
+        self._write(batch)
+
+    def _write(self, batch: List[Sequence[Any]]) -> None:
+        if not batch:
+            return
+
+        start = time.monotonic()
+        try:
+            self._write_batch(batch)
+            with self._lock:
+                self._written += len(batch)
+                self._batches += 1
+                self._last_batch_ms = (time.monotonic() - start) * 1000
+        except Exception as e:
+            print(f"[BatchWriter] {self.name}: batch of {len(batch)} failed: {e}")
+            with self._lock:
+                self._errors += 1
+            self._spool(batch)
+
+    def _spool(self, batch: List[Sequence[Any]]) -> None:
+        """DB 쓰기 실패한 행을 이벤트 spool에 보관"""
+        if self.spool is None or self.columns is None:
+            with self._lock:
+                self._dropped += len(batch)
+            return
+
+        try:
+            self.spool.append_many(self.name, [dict(zip(self.columns, row)) for row in batch])
+            with self._lock:
+                self._spooled += len(batch)
+        except Exception as e:
+            print(f"[BatchWriter] {self.name}: spool failed, dropping {len(batch)} rows: {e}")
+            with self._lock:
+                self._dropped += len(batch)
+
+    def stats(self) -> Dict[str, Any]:
+        """작성기 통계"""
+        with self._lock:
+            return {
+                'name': self.name,
+                'queued': self._queue.qsize(),
+                'submitted': self._submitted,
+                'written': self._written,
+                'batches': self._batches,
+                'dropped': self._dropped,
+                'spooled': self._spooled,
+                'errors': self._errors,
+                'last_batch_ms': round(self._last_batch_ms, 1),
+            }
+
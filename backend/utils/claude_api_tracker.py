@@ -9,6 +9,7 @@ Claude API 호출 시 토큰 사용량과 비용을 자동으로 추적합니다
 """
 
 import os
+import sys
 import time
 from decimal import Decimal
 from datetime import datetime
@@ -19,6 +20,15 @@ try:
 except ImportError:
     anthropic = None
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.db_pool import db_cursor
+from utils.event_spool import SPOOL_TABLES, get_event_spool, new_event_key
+
+
+API_USAGE_COLUMNS = SPOOL_TABLES['api_usage_logs']
+
 
 class ClaudeAPITracker:
     """Claude API 호출 및 사용량 추적 클래스"""
@@ -38,20 +48,6 @@ class ClaudeAPITracker:
         if anthropic and self.api_key:
             self.client = anthropic.Anthropic(api_key=self.api_key)
 
-    def _get_db_connection(self):
-        """데이터베이스 연결 (프로젝트에 맞게 수정 필요)"""
-        try:
-            import mysql.connector
-            return mysql.connector.connect(
-                host=os.getenv('DB_HOST', 'localhost'),
-                user=os.getenv('DB_USER', 'root'),
-                password=os.getenv('DB_PASSWORD', ''),
-                database=os.getenv('DB_NAME', 'tutornote')
-            )
-        except Exception as e:
-            print(f"[ClaudeAPITracker] DB connection failed: {e}")
-            return None
-
     def _calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> Decimal:
         """토큰 사용량에 따른 비용 계산 (USD)"""
         pricing = self.PRICING.get(model, self.PRICING['default'])
@@ -70,36 +66,35 @@ class ClaudeAPITracker:
         status: str = 'success',
         error_message: Optional[str] = None
     ):
-        """API 사용량을 DB에 저장"""
-        conn = self._get_db_connection()
-        if not conn:
-            return
+        """API 사용량을 DB에 저장 (DB 장애 시 이벤트 spool에 보관 후 replay)"""
+        row = {
+            'event_key': new_event_key(),
+            'api_name': 'claude',
+            'academy_id': academy_id,
+            'endpoint': endpoint,
+            'request_tokens': input_tokens,
+            'response_tokens': output_tokens,
+            'total_cost': float(total_cost),
+            'response_time_ms': response_time_ms,
+            'status': status,
+            'error_message': error_message,
+            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
 
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO api_usage_logs
-                (api_name, academy_id, endpoint, request_tokens, response_tokens,
-                 total_cost, response_time_ms, status, error_message)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                'claude',
-                academy_id,
-                endpoint,
-                input_tokens,
-                output_tokens,
-                float(total_cost),
-                response_time_ms,
-                status,
-                error_message
-            ))
-            conn.commit()
+            with db_cursor(dictionary=False, commit=True) as cursor:
+                cursor.execute(f"""
+                    INSERT INTO api_usage_logs
+                    ({', '.join(API_USAGE_COLUMNS)})
+                    VALUES ({', '.join(['%s'] * len(API_USAGE_COLUMNS))})
+                """, tuple(row[c] for c in API_USAGE_COLUMNS))
             print(f"[ClaudeAPITracker] Logged: {input_tokens}+{output_tokens} tokens, ${total_cost:.4f}")
         except Exception as e:
-            print(f"[ClaudeAPITracker] Failed to log usage: {e}")
-        finally:
-            cursor.close()
-            conn.close()
+            print(f"[ClaudeAPITracker] Failed to log usage, spooling: {e}")
+            try:
+                get_event_spool().append('api_usage_logs', row)
+            except Exception as spool_error:
+                print(f"[ClaudeAPITracker] Spool failed, usage lost: {spool_error}")
 
     def generate(
         self,
@@ -231,42 +226,35 @@ def get_api_usage_stats(academy_id: Optional[int] = None, days: int = 30) -> Dic
     Returns:
         dict: 사용량 통계
     """
-    conn = _tracker._get_db_connection()
-    if not conn:
-        return {}
-
     try:
-        cursor = conn.cursor(dictionary=True)
-
-        if academy_id:
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total_calls,
-                    SUM(request_tokens) as total_input_tokens,
-                    SUM(response_tokens) as total_output_tokens,
-                    SUM(total_cost) as total_cost_usd,
-                    AVG(response_time_ms) as avg_response_time
-                FROM api_usage_logs
-                WHERE api_name = 'claude'
-                AND academy_id = %s
-                AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """, (academy_id, days))
-        else:
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total_calls,
-                    SUM(request_tokens) as total_input_tokens,
-                    SUM(response_tokens) as total_output_tokens,
-                    SUM(total_cost) as total_cost_usd,
-                    AVG(response_time_ms) as avg_response_time
-                FROM api_usage_logs
-                WHERE api_name = 'claude'
-                AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """, (days,))
-
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with db_cursor() as cursor:
+            if academy_id:
+                cursor.execute("""
+                    SELECT
+                        COUNT(*) as total_calls,
+                        SUM(request_tokens) as total_input_tokens,
+                        SUM(response_tokens) as total_output_tokens,
+                        SUM(total_cost) as total_cost_usd,
+                        AVG(response_time_ms) as avg_response_time
+                    FROM api_usage_logs
+                    WHERE api_name = 'claude'
+                    AND academy_id = %s
+                    AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                """, (academy_id, days))
+            else:
+                cursor.execute("""
+                    SELECT
+                        COUNT(*) as total_calls,
+                        SUM(request_tokens) as total_input_tokens,
+                        SUM(response_tokens) as total_output_tokens,
+                        SUM(total_cost) as total_cost_usd,
+                        AVG(response_time_ms) as avg_response_time
+                    FROM api_usage_logs
+                    WHERE api_name = 'claude'
+                    AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                """, (days,))
+
+            result = cursor.fetchone()
 
         return {
             'total_calls': result['total_calls'] or 0,
@@ -0,0 +1,242 @@
+"""
+가입 코호트 리텐션 (cohort_retention)
+
+가입 주(또는 월) 코호트 × 활동 주(또는 월)별로 "코호트 학원 중 그 기간에 활동한
+학원 수"를 요약 테이블에 유지합니다. 각 칸은 코호트 학원 비트맵과 기간 활성 학원
+비트맵(daily_active_academies, utils/activity_bitmaps.py)의 AND → popcount이므로
+비용은 코호트 수 × 기간 수에 비례하고 activity_logs는 읽지 않습니다.
+
+- 증분(기본): 직전 기간과 현재 기간 열만 다시 계산 (끝난 기간의 칸은 바뀌지 않음)
+- 전체(--full): 최근 COHORT_MAX_PERIODS개 코호트의 모든 칸을 다시 계산하고 범위 밖 코호트 삭제
+  (학원 삭제로 코호트 구성이 바뀐 경우 반영)
+
+주는 월요일 시작, period_index 0은 가입 기간입니다.
+
+환경변수:
+    COHORT_WEEKS: 주 단위 코호트 수 (기본 26)
+    COHORT_MONTHS: 월 단위 코호트 수 (기본 12)
+
+사용 예시:
+    >>> from utils.cohort_retention import refresh_cohorts, get_retention_matrix
+    >>> refresh_cohorts('week')               # {'cohorts': 26, 'periods': 2, 'cells': 53}
+    >>> refresh_cohorts('month', full=True)
+    >>> get_retention_matrix(cursor, 'week', periods=12)
+"""
+
+import os
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.activity_bitmaps import DailyBitmaps, bitmap_from_ids, load_daily_bitmaps, popcount
+from utils.db_pool import db_cursor
+from utils.partition_manager import add_months
+
+
+COHORT_MAX_PERIODS: Dict[str, int] = {
+    'week': int(os.getenv('COHORT_WEEKS', '26')),
+    'month': int(os.getenv('COHORT_MONTHS', '12')),
+}
+
+GRANULARITIES = tuple(COHORT_MAX_PERIODS)
+
+UPSERT_SQL = """
+    INSERT INTO cohort_retention
+    (granularity, cohort_start, period_index, cohort_size, active_count)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        cohort_size = VALUES(cohort_size),
+        active_count = VALUES(active_count)
+"""
+
+
+class CohortError(ValueError):
+    """잘못된 코호트 조회 인자"""
+
+
+def _check_granularity(granularity: str) -> None:
+    if granularity not in COHORT_MAX_PERIODS:
+        raise CohortError(f"invalid granularity: {granularity} (allowed: {', '.join(GRANULARITIES)})")
+
+
+def period_start(day: date, granularity: str) -> date:
+    """day가 속한 기간의 시작일 (주: 월요일, 월: 1일)"""
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def add_periods(start: date, periods: int, granularity: str) -> date:
+    """기간 시작일에서 periods개 기간 이동"""
+    if granularity == 'week':
+        return start + timedelta(weeks=periods)
+    return add_months(start, periods)
+
+
+def period_index(cohort_start: date, start: date, granularity: str) -> int:
+    """코호트 시작 기간으로부터 몇 번째 기간인지 (0 = 가입 기간)"""
+    if granularity == 'week':
+        return (start - cohort_start).days // 7
+    return (start.year - cohort_start.year) * 12 + (start.month - cohort_start.month)
+
+
+def load_cohorts(cursor, since: date, granularity: str) -> Dict[date, int]:
+    """
+    since 이후 가입한(삭제되지 않은) 학원을 가입 기간별 비트맵으로 묶음
+
+    Returns:
+        Dict[date, int]: {코호트 시작일: 학원 id 비트맵}
+    """
+    cursor.execute("""
+        SELECT id, created_at
+        FROM academies
+        WHERE is_deleted = 0
+        AND created_at >= %s
+    """, (since,))
+
+    members: Dict[date, List[int]] = {}
+    for academy_id, created_at in cursor.fetchall():
+        cohort = period_start(created_at.date(), granularity)
+        members.setdefault(cohort, []).append(academy_id)
+    return {cohort: bitmap_from_ids(ids) for cohort, ids in members.items()}
+
+
+def compute_cells(
+    cohorts: Dict[date, int],
+    bitmaps: DailyBitmaps,
+    periods: List[date],
+    granularity: str,
+    today: date
+) -> List[Tuple]:
+    """
+    기간 열별 리텐션 칸 계산 (코호트 비트맵 AND 기간 활성 비트맵)
+
+    Returns:
+        List[Tuple]: UPSERT_SQL 파라미터 (granularity, cohort_start, period_index, cohort_size, active_count)
+    """
+    cells = []
+    for start in periods:
+        end = min(add_periods(start, 1, granularity) - timedelta(days=1), today)
+        active = bitmaps.union(start, end)
+        for cohort_start, members in sorted(cohorts.items()):
+            if cohort_start > start:
+                continue
+            cells.append((
+                granularity,
+                cohort_start,
+                period_index(cohort_start, start, granularity),
+                popcount(members),
+                popcount(members & active),
+            ))
+    return cells
+
+
+def refresh_cohorts(granularity: str, full: bool = False, today: Optional[date] = None) -> Dict[str, int]:
+    """
+    코호트 리텐션 갱신
+
+    Args:
+        granularity: 'week' / 'month'
+        full: True면 최근 COHORT_MAX_PERIODS개 코호트의 모든 칸을 다시 계산
+        today: 기준일 (기본 오늘)
+
+    Returns:
+        Dict[str, int]: {'cohorts': 코호트 수, 'periods': 계산한 기간 열 수, 'cells': upsert한 칸 수}
+
+    Raises:
+        RuntimeError: 필요한 기간의 일별 비트맵이 재생성되지 않은 경우
+    """
+    _check_granularity(granularity)
+    today = today or date.today()
+    current = period_start(today, granularity)
+    first_cohort = add_periods(current, -(COHORT_MAX_PERIODS[granularity] - 1), granularity)
+    first_period = first_cohort if full else max(add_periods(current, -1, granularity), first_cohort)
+
+    with db_cursor(dictionary=False) as cursor:
+        cohorts = load_cohorts(cursor, first_cohort, granularity)
+
+    with db_cursor() as cursor:
+        bitmaps = load_daily_bitmaps(cursor, first_period, today)
+    if bitmaps is None:
+        raise RuntimeError(
+            f"daily_active_academies is not rebuilt from {first_period} "
+            f"(run scripts/rebuild_activity_bitmaps.py --start {first_period})"
+        )
+
+    periods = []
+    start = first_period
+    while start <= current:
+        periods.append(start)
+        start = add_periods(start, 1, granularity)
+
+    cells = compute_cells(cohorts, bitmaps, periods, granularity, today)
+
+    with db_cursor(dictionary=False, commit=True) as cursor:
+        if cells:
+            cursor.executemany(UPSERT_SQL, cells)
+        if full:
+            cursor.execute("""
+                DELETE FROM cohort_retention
+                WHERE granularity = %s AND cohort_start < %s
+            """, (granularity, first_cohort))
+
+    return {'cohorts': len(cohorts), 'periods': len(periods), 'cells': len(cells)}
+
+
+def resolve_periods(granularity: str, periods: Optional[int] = None) -> int:
+    """조회 인자 검증 → 코호트 수 (기본: 최대 코호트 수)"""
+    _check_granularity(granularity)
+    max_periods = COHORT_MAX_PERIODS[granularity]
+    periods = max_periods if periods is None else periods
+    if not 1 <= periods <= max_periods:
+        raise CohortError(f"invalid periods: {periods} (1~{max_periods})")
+    return periods
+
+
+def get_retention_matrix(cursor, granularity: str, periods: Optional[int] = None,
+                         today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    최근 periods개 코호트의 리텐션 행렬 (cohort_retention PK 범위 조회)
+
+    Returns:
+        dict: {'granularity', 'periods', 'cohorts': [{'cohort_start', 'size', 'active', 'retention'}], 'updated_at'}
+            active[i] / retention[i]는 가입 후 i번째 기간의 활동 학원 수 / 비율(%)
+    """
+    periods = resolve_periods(granularity, periods)
+    current = period_start(today or date.today(), granularity)
+    first_cohort = add_periods(current, -(periods - 1), granularity)
+
+    cursor.execute("""
+        SELECT cohort_start, period_index, cohort_size, active_count, updated_at
+        FROM cohort_retention
+        WHERE granularity = %s
+        AND cohort_start >= %s
+        ORDER BY cohort_start, period_index
+    """, (granularity, first_cohort))
+
+    cohorts: Dict[date, Dict[str, Any]] = {}
+    updated_at = None
+    for row in cursor.fetchall():
+        cohort = cohorts.setdefault(row['cohort_start'], {
+            'cohort_start': row['cohort_start'].isoformat(),
+            'size': 0,
+            'active': [],
+            'retention': [],
+        })
+        size = row['cohort_size'] or 0
+        active = row['active_count'] or 0
+        # 기간 열이 빠진 경우(갱신 중단) 0으로 채움
+        while len(cohort['active']) < row['period_index']:
+            cohort['active'].append(0)
+            cohort['retention'].append(0)
+        cohort['size'] = size
+        cohort['active'].append(active)
+        cohort['retention'].append(round(active / size * 100, 1) if size > 0 else 0)
+        if updated_at is None or row['updated_at'] > updated_at:
+            updated_at = row['updated_at']
+
+    return {
+        'granularity': granularity,
+        'periods': periods,
+        'cohorts': list(cohorts.values()),
+        'updated_at': updated_at.isoformat() if updated_at else None,
+    }
@@ -0,0 +1,335 @@
+"""
+고객 건강도 점수 (customer_health_scores)
+
+전체 학원의 건강도 점수를 한 번에 계산해 학원당 1행으로 upsert합니다.
+학원별 특성(무활동 일수, 최근 30일 활동 일수, 리포트/공유 수, 리포트 추세)을
+몇 개의 집계 쿼리로 한꺼번에 읽어 학원 id 순서의 NumPy 배열로 만들고,
+점수/상태/이탈 위험 수준을 학원별 루프 없이 배열 연산으로 계산합니다.
+
+점수 (각 100점 만점, Phase 3 스펙 4.4):
+    activity (30%):    무활동 일수(0일 → 1, 30일 이상 → 0)와 최근 30일 활동 일수(20일 이상 → 1)
+    engagement (30%):  리포트당 카카오톡 공유율(60%)과 최근 30일 학생당 리포트 수(40%)
+    performance (20%): 최근 30일 리포트 수 (20건 이상 → 100)
+    growth (20%):      최근 30일 / 직전 30일 리포트 수 비 (같으면 50, 2배 → 100, 절반 → 0)
+    status:            champion 90+ / healthy 70+ / at_risk 50+ / critical
+
+이탈 위험 수준(risk_level)은 7일 이상 활동이 없는 학원에만 붙습니다
+(critical 21일+ / warning 14일+ / caution). /api/admin/tables/at-risk-academies는
+이 컬럼을 인덱스로 읽습니다.
+
+previous_score는 전날까지의 마지막 점수이고 score_change는 그 대비 변화입니다
+(같은 날 여러 번 계산해도 기준은 바뀌지 않음).
+
+최근 30일 활동 일수는 일별 활성 학원 비트맵(utils/activity_bitmaps.py)에서 읽고,
+비트맵이 재생성되지 않았으면 activity_logs로 집계합니다.
+
+의존성:
+    numpy - 점수 계산(배치)에 필수입니다. scripts/setup_cron.sh가 설치를 확인하며, 없으면
+    update_health_scores()가 RuntimeError를 냅니다. 대시보드 API는 numpy 없이 동작하고,
+    점수가 없거나 오래되면 이탈 위험 목록을 academy_stats로 계산합니다 (routes/admin/tables.py).
+
+사용 예시:
+    >>> from utils.customer_health import update_health_scores
+    >>> update_health_scores()   # {'academies': 1234, 'at_risk': 210, 'status': {'champion': 80, ...}}
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from utils.activity_bitmaps import encode, load_daily_bitmaps
+from utils.db_pool import db_cursor
+from utils.time_windows import get_time_windows
+
+
+UPSERT_BATCH_SIZE = int(os.getenv('HEALTH_SCORE_UPSERT_BATCH', '500'))
+
+HEALTH_WEIGHTS: Dict[str, float] = {
+    'activity': 0.30,
+    'engagement': 0.30,
+    'performance': 0.20,
+    'growth': 0.20,
+}
+
+# (상태, 최소 점수) - 높은 순
+STATUS_THRESHOLDS = (
+    ('champion', 90),
+    ('healthy', 70),
+    ('at_risk', 50),
+)
+DEFAULT_STATUS = 'critical'
+
+# 이탈 위험 수준 → 최소 무활동 일수 (높은 순, 7일 이상 무활동 학원만 대상)
+RISK_LEVEL_MIN_DAYS = {
+    'critical': 21,
+    'warning': 14,
+    'caution': 7,
+}
+RISK_LEVELS = tuple(RISK_LEVEL_MIN_DAYS)
+
+SCORE_WINDOW_DAYS = 30
+ACTIVE_DAYS_TARGET = 20
+REPORTS_TARGET = 20
+REPORTS_PER_STUDENT_TARGET = 4
+
+FEATURES_SQL = """
+    SELECT
+        a.id,
+        COALESCE(st.student_count, 0) as student_count,
+        COALESCE(st.report_count, 0) as report_count,
+        COALESCE(st.share_count, 0) as share_count,
+        DATEDIFF(%s, COALESCE(st.last_activity_at, a.created_at)) as inactive_days,
+        (st.last_activity_at IS NULL OR st.last_activity_at < %s) as inactive_week
+    FROM academies a
+    LEFT JOIN academy_stats st ON st.academy_id = a.id
+    WHERE a.is_deleted = 0
+    ORDER BY a.id
+"""
+
+REPORT_TREND_SQL = """
+    SELECT
+        s.academy_id,
+        SUM(pr.created_at >= %s) as recent_reports,
+        SUM(pr.created_at < %s) as previous_reports
+    FROM progress_records pr
+    JOIN students s ON s.id = pr.student_id
+    WHERE pr.is_deleted = 0
+    AND pr.created_at >= %s
+    GROUP BY s.academy_id
+"""
+
+ACTIVE_DAYS_SQL = """
+    SELECT academy_id, COUNT(DISTINCT DATE(created_at)) as active_days
+    FROM activity_logs
+    WHERE created_at >= %s
+    GROUP BY academy_id
+"""
+
+# previous_score / score_change는 이전 값(calculated_at, total_score)을 읽으므로 먼저 갱신
+UPSERT_SQL = """
+    INSERT INTO customer_health_scores
+    (academy_id, total_score, activity_score, engagement_score, performance_score, growth_score,
+     status, risk_level, inactive_days, calculated_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        previous_score = IF(DATE(calculated_at) < DATE(VALUES(calculated_at)), total_score, previous_score),
+        score_change = VALUES(total_score) - previous_score,
+        total_score = VALUES(total_score),
+        activity_score = VALUES(activity_score),
+        engagement_score = VALUES(engagement_score),
+        performance_score = VALUES(performance_score),
+        growth_score = VALUES(growth_score),
+        status = VALUES(status),
+        risk_level = VALUES(risk_level),
+        inactive_days = VALUES(inactive_days),
+        calculated_at = VALUES(calculated_at)
+"""
+
+PRUNE_SQL = """
+    DELETE h FROM customer_health_scores h
+    JOIN academies a ON a.id = h.academy_id
+    WHERE a.is_deleted = 1
+"""
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy 패키지 필요: pip3 install numpy")
+
+
+# =============================================================================
+# 특성 조회
+# =============================================================================
+def _scatter(ids, rows: List[Dict[str, Any]], column: str):
+    """학원별 집계 행 → ids(정렬됨) 순서 배열 (행이 없는 학원은 0, ids에 없는 학원은 무시)"""
+    result = np.zeros(len(ids), dtype=np.float64)
+    if not rows or not len(ids):
+        return result
+    keys = np.array([row['academy_id'] for row in rows], dtype=np.int64)
+    values = np.array([row[column] or 0 for row in rows], dtype=np.float64)
+    positions = np.minimum(np.searchsorted(ids, keys), len(ids) - 1)
+    found = ids[positions] == keys
+    result[positions[found]] = values[found]
+    return result
+
+
+def active_day_counts(bitmaps, ids, start, end):
+    """
+    start ~ end(포함) 기간 학원별 활동 일수 (일별 비트맵을 비트 배열로 풀어 합산)
+
+    Returns:
+        np.ndarray: ids 순서의 활동 일수
+    """
+    size = int(ids.max()) + 1 if len(ids) else 0
+    counts = np.zeros(size, dtype=np.int32)
+    for day, bits in bitmaps.days.items():
+        if not start <= day <= end or not bits:
+            continue
+        flags = np.unpackbits(np.frombuffer(encode(bits), dtype=np.uint8), bitorder='little')[:size]
+        counts[:len(flags)] += flags
+    return counts[ids].astype(np.float64)
+
+
+def load_features(cursor, windows) -> Dict[str, Any]:
+    """
+    삭제되지 않은 전체 학원의 점수 특성을 학원 id 순서 배열로 조회
+
+    Args:
+        cursor: dictionary 커서
+        windows: 기준 시각 (utils.time_windows.TimeWindows)
+
+    Returns:
+        Dict[str, np.ndarray]: {'id', 'student_count', 'report_count', 'share_count', 'inactive_days',
+            'inactive_week', 'active_days', 'recent_reports', 'previous_reports'}
+    """
+    _require_numpy()
+    recent_start = windows.now - timedelta(days=SCORE_WINDOW_DAYS)
+    previous_start = recent_start - timedelta(days=SCORE_WINDOW_DAYS)
+
+    cursor.execute(FEATURES_SQL, (windows.now, windows.week_ago))
+    rows = cursor.fetchall()
+    ids = np.array([row['id'] for row in rows], dtype=np.int64)
+    features = {'id': ids}
+    for column in ('student_count', 'report_count', 'share_count', 'inactive_days'):
+        features[column] = np.array([row[column] or 0 for row in rows], dtype=np.float64)
+    features['inactive_week'] = np.array([bool(row['inactive_week']) for row in rows], dtype=bool)
+
+    cursor.execute(REPORT_TREND_SQL, (recent_start, recent_start, previous_start))
+    trend = cursor.fetchall()
+    features['recent_reports'] = _scatter(ids, trend, 'recent_reports')
+    features['previous_reports'] = _scatter(ids, trend, 'previous_reports')
+
+    today = windows.today.date()
+    first_day = today - timedelta(days=SCORE_WINDOW_DAYS - 1)
+    bitmaps = load_daily_bitmaps(cursor, first_day, today)
+    if bitmaps is not None:
+        features['active_days'] = active_day_counts(bitmaps, ids, first_day, today)
+    else:
+        cursor.execute(ACTIVE_DAYS_SQL, (windows.today - timedelta(days=SCORE_WINDOW_DAYS - 1),))
+        features['active_days'] = _scatter(ids, cursor.fetchall(), 'active_days')
+
+    return features
+
+
+# =============================================================================
+# 점수 계산 (배열 연산)
+# =============================================================================
+def _ratio(numerator, denominator, target: float = 1.0):
+    """numerator / denominator / target을 0~1로 자름 (분모 0이면 0)"""
+    ratio = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+    return np.clip(ratio / target, 0.0, 1.0)
+
+
+def compute_scores(features: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    특성 배열 → 점수 / 상태 / 이탈 위험 수준 배열
+
+    Returns:
+        Dict[str, np.ndarray]: {'activity', 'engagement', 'performance', 'growth', 'total',
+            'status', 'risk_level' (해당 없음은 '')}
+    """
+    _require_numpy()
+    inactive_days = features['inactive_days']
+    recent = features['recent_reports']
+    previous = features['previous_reports']
+
+    recency = np.clip(1.0 - inactive_days / SCORE_WINDOW_DAYS, 0.0, 1.0)
+    frequency = np.clip(features['active_days'] / ACTIVE_DAYS_TARGET, 0.0, 1.0)
+
+    scores = {
+        'activity': 100.0 * (0.5 * recency + 0.5 * frequency),
+        'engagement': 100.0 * (
+            0.6 * _ratio(features['share_count'], features['report_count'])
+            + 0.4 * _ratio(recent, features['student_count'], REPORTS_PER_STUDENT_TARGET)
+        ),
+        'performance': 100.0 * np.clip(recent / REPORTS_TARGET, 0.0, 1.0),
+        'growth': np.clip(50.0 + 50.0 * np.log2((recent + 1.0) / (previous + 1.0)), 0.0, 100.0),
+    }
+    scores = {name: np.round(values, 2) for name, values in scores.items()}
+    total = np.round(sum(HEALTH_WEIGHTS[name] * scores[name] for name in HEALTH_WEIGHTS), 2)
+
+    scores['total'] = total
+    scores['status'] = np.select(
+        [total >= threshold for _, threshold in STATUS_THRESHOLDS],
+        [status for status, _ in STATUS_THRESHOLDS],
+        default=DEFAULT_STATUS,
+    )
+    # 대상은 7일 이상 무활동(시각 기준), 수준은 무활동 일수(날짜 기준)
+    at_risk = features['inactive_week']
+    scores['risk_level'] = np.select(
+        [
+            at_risk & (inactive_days >= RISK_LEVEL_MIN_DAYS['critical']),
+            at_risk & (inactive_days >= RISK_LEVEL_MIN_DAYS['warning']),
+            at_risk,
+        ],
+        ['critical', 'warning', 'caution'],
+        default='',
+    )
+    return scores
+
+
+def score_rows(features: Dict[str, Any], scores: Dict[str, Any], calculated_at: datetime) -> List[tuple]:
+    """UPSERT_SQL 파라미터 목록 (NumPy 값을 Python 값으로 변환)"""
+    columns = zip(
+        features['id'].tolist(),
+        scores['total'].tolist(),
+        scores['activity'].tolist(),
+        scores['engagement'].tolist(),
+        scores['performance'].tolist(),
+        scores['growth'].tolist(),
+        scores['status'].tolist(),
+        scores['risk_level'].tolist(),
+        features['inactive_days'].astype(np.int64).tolist(),
+    )
+    return [
+        (academy_id, total, activity, engagement, performance, growth, status, risk_level or None,
+         inactive_days, calculated_at)
+        for academy_id, total, activity, engagement, performance, growth, status, risk_level, inactive_days
+        in columns
+    ]
+
+
+# =============================================================================
+# 배치 실행
+# =============================================================================
+def score_academies(cursor, now: Optional[datetime] = None, batch_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    전체 학원 점수 계산 + upsert (커밋은 호출 측)
+
+    Args:
+        cursor: dictionary 커서
+        now: 기준 시각 (기본 현재)
+        batch_size: executemany 1회 행 수
+
+    Returns:
+        dict: {'academies': 학원 수, 'at_risk': 이탈 위험 학원 수, 'status': {상태: 학원 수}}
+    """
+    windows = get_time_windows(now)
+    batch_size = batch_size or UPSERT_BATCH_SIZE
+
+    features = load_features(cursor, windows)
+    scores = compute_scores(features)
+    rows = score_rows(features, scores, windows.now)
+
+    for i in range(0, len(rows), batch_size):
+        cursor.executemany(UPSERT_SQL, rows[i:i + batch_size])
+    cursor.execute(PRUNE_SQL)
+
+    statuses, counts = np.unique(scores['status'], return_counts=True)
+    return {
+        'academies': len(rows),
+        'at_risk': int(np.count_nonzero(scores['risk_level'])),
+        'status': dict(zip(statuses.tolist(), counts.tolist())),
+    }
+
+
+def update_health_scores(now: Optional[datetime] = None) -> Dict[str, Any]:
+    """전체 학원 건강도 점수 갱신 (cron, 한 트랜잭션)"""
+    _require_numpy()
+    with db_cursor(commit=True) as cursor:
+        return score_academies(cursor, now)
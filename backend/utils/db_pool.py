@@ -0,0 +1,343 @@
+"""
+공유 MySQL 커넥션 풀
+
+Admin Blueprint, AlertChecker, ActivityLogger 등이 요청마다 새 연결을 맺는 대신
+이 모듈의 풀에서 연결을 빌려 쓰고 반납합니다.
+
+환경변수:
+    DB_POOL_SIZE: 최대 연결 수 (기본 10)
+    DB_POOL_TIMEOUT: 풀이 가득 찼을 때 연결 대기 최대 시간 (초, 기본 5)
+    DB_POOL_PING_INTERVAL: 이 시간(초) 이상 유휴였던 연결은 체크아웃 시 ping으로 확인 (기본 30)
+    DB_POOL_RECYCLE: 이 시간(초)보다 오래된 연결은 폐기 후 재생성 (기본 3600)
+
+사용 예시:
+    >>> from utils.db_pool import db_cursor
+    >>> with db_cursor() as cursor:
+    ...     cursor.execute("SELECT COUNT(*) as total FROM academies")
+    ...     total = cursor.fetchone()['total']
+    >>> with db_cursor(commit=True) as cursor:
+    ...     cursor.execute("INSERT INTO ...", params)
+    >>> with db_stream_cursor() as cursor:    # 풀 밖 전용 연결 (대용량 스트리밍)
+    ...     cursor.execute("SELECT ... FROM activity_logs WHERE ...")
+    ...     rows = cursor.fetchmany(1000)
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class DBPoolError(Exception):
+    """풀에서 연결을 얻지 못한 경우 (연결 실패 또는 대기 시간 초과)"""
+
+
+def _mysql_connect():
+    """mysql.connector 연결 생성"""
+    import mysql.connector
+    return mysql.connector.connect(
+        host=os.getenv('DB_HOST', 'localhost'),
+        user=os.getenv('DB_USER', 'root'),
+        password=os.getenv('DB_PASSWORD', ''),
+        database=os.getenv('DB_NAME', 'tutornote')
+    )
+
+
+class _PoolEntry:
+    """풀에 보관되는 연결과 메타데이터"""
+
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn):
+        now = time.monotonic()
+        self.conn = conn
+        self.created_at = now
+        self.last_used = now
+
+
+class ConnectionPool:
+    """
+    스레드 안전한 고정 크기 커넥션 풀
+
+    연결은 필요할 때 생성되며(최대 size개), 최근 반납된 연결부터 재사용합니다(LIFO).
+    오래 쉰 연결은 체크아웃 시 ping으로 확인하고, 끊긴 연결은 폐기 후 새로 만듭니다.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        ping_interval: Optional[float] = None,
+        recycle: Optional[float] = None,
+        connect: Optional[Callable[[], Any]] = None
+    ):
+        self.size = size or int(os.getenv('DB_POOL_SIZE', '10'))
+        self.timeout = timeout if timeout is not None else float(os.getenv('DB_POOL_TIMEOUT', '5'))
+        self.ping_interval = ping_interval if ping_interval is not None else float(os.getenv('DB_POOL_PING_INTERVAL', '30'))
+        self.recycle = recycle if recycle is not None else float(os.getenv('DB_POOL_RECYCLE', '3600'))
+        self._connect = connect or _mysql_connect
+
+        self._idle: 'queue.LifoQueue[_PoolEntry]' = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+
+        # 풀 크기 산정용 통계
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeouts = 0
+        self._discarded = 0
+        self._connect_errors = 0
+
+    def _is_healthy(self, entry: _PoolEntry) -> bool:
+        """체크아웃 직전 연결 상태 확인"""
+        now = time.monotonic()
+        if now - entry.created_at > self.recycle:
+            return False
+        if now - entry.last_used > self.ping_interval:
+            try:
+                return bool(entry.conn.is_connected())
+            except Exception:
+                return False
+        return True
+
+    def _discard(self, entry: _PoolEntry) -> None:
+        """연결 폐기 (슬롯 반환)"""
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+            self._discarded += 1
+
+    def _create(self) -> _PoolEntry:
+        try:
+            return _PoolEntry(self._connect())
+        except Exception as e:
+            with self._lock:
+                self._created -= 1
+                self._connect_errors += 1
+            raise DBPoolError(f"DB connection failed: {e}") from e
+
+    def acquire(self) -> _PoolEntry:
+        """
+        풀에서 연결 체크아웃
+
+        Returns:
+            _PoolEntry: 사용 후 반드시 release()로 반납
+
+        Raises:
+            DBPoolError: 연결 생성 실패 또는 timeout 초과
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+
+        while True:
+            entry = None
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+
+                if can_create:
+                    entry = self._create()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        with self._lock:
+                            self._timeouts += 1
+                        raise DBPoolError(
+                            f"DB connection pool exhausted (size={self.size}, timeout={self.timeout}s)"
+                        )
+                    waited = True
+                    try:
+                        entry = self._idle.get(timeout=remaining)
+                    except queue.Empty:
+                        continue
+
+                    if not self._is_healthy(entry):
+                        self._discard(entry)
+                        continue
+            else:
+                if not self._is_healthy(entry):
+                    self._discard(entry)
+                    continue
+
+            wait_time = time.monotonic() - start
+            with self._lock:
+                self._in_use += 1
+                self._checkouts += 1
+                if waited:
+                    self._waits += 1
+                self._wait_time_total += wait_time
+                self._wait_time_max = max(self._wait_time_max, wait_time)
+            return entry
+
+    def release(self, entry: _PoolEntry) -> None:
+        """
+        연결 반납
+
+        열린 트랜잭션은 롤백해서 다음 사용자가 이전 스냅샷을 보지 않도록 합니다.
+        롤백이 실패하면 연결을 폐기합니다.
+        """
+        with self._lock:
+            self._in_use -= 1
+
+        try:
+            if getattr(entry.conn, 'in_transaction', False):
+                entry.conn.rollback()
+        except Exception:
+            self._discard(entry)
+            return
+
+        entry.last_used = time.monotonic()
+        self._idle.put(entry)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """연결 체크아웃 컨텍스트 (블록 종료 시 자동 반납)"""
+        entry = self.acquire()
+        try:
+            yield entry.conn
+        finally:
+            self.release(entry)
+
+    @contextmanager
+    def cursor(self, dictionary: bool = True, commit: bool = False, **cursor_kwargs) -> Iterator[Any]:
+        """
+        커서 컨텍스트
+
+        Args:
+            dictionary: dict 형태로 row 반환 여부
+            commit: True면 블록이 정상 종료될 때 commit
+            **cursor_kwargs: conn.cursor()에 그대로 전달 (buffered 등)
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor(dictionary=dictionary, **cursor_kwargs)
+            try:
+                yield cursor
+                if commit:
+                    conn.commit()
+            finally:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 사용 통계 (풀 크기 산정용)"""
+        with self._lock:
+            checkouts = self._checkouts
+            return {
+                'size': self.size,
+                'created': self._created,
+                'in_use': self._in_use,
+                'idle': self._idle.qsize(),
+                'checkouts': checkouts,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+                'discarded': self._discarded,
+                'connect_errors': self._connect_errors,
+                'wait_time_ms_total': round(self._wait_time_total * 1000, 1),
+                'wait_time_ms_avg': round(self._wait_time_total * 1000 / checkouts, 2) if checkouts else 0,
+                'wait_time_ms_max': round(self._wait_time_max * 1000, 1),
+            }
+
+    def close_all(self) -> int:
+        """유휴 연결 모두 종료 (프로세스 종료 시)"""
+        closed = 0
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(entry)
+            closed += 1
+        return closed
+
+
+# 프로세스 전역 풀 (첫 사용 시 생성)
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """프로세스 전역 커넥션 풀 반환"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def db_connection():
+    """
+    공유 풀에서 연결 체크아웃 (컨텍스트 매니저)
+
+    Examples:
+        >>> with db_connection() as conn:
+        ...     cursor = conn.cursor()
+    """
+    return get_pool().connection()
+
+
+def db_cursor(dictionary: bool = True, commit: bool = False, **cursor_kwargs):
+    """
+    공유 풀에서 커서 획득 (컨텍스트 매니저)
+
+    Args:
+        dictionary: dict 형태로 row 반환 여부 (기본 True)
+        commit: True면 블록이 정상 종료될 때 commit
+
+    Raises:
+        DBPoolError: 연결을 얻지 못한 경우
+    """
+    return get_pool().cursor(dictionary=dictionary, commit=commit, **cursor_kwargs)
+
+
+@contextmanager
+def db_stream_cursor(dictionary: bool = True, connect: Optional[Callable[[], Any]] = None) -> Iterator[Any]:
+    """
+    풀과 별도인 전용 연결의 unbuffered 커서 (대용량 export 스트리밍용)
+
+    행을 fetchmany()로 읽는 만큼만 서버에서 받아오므로 결과 크기와 무관하게 메모리가 일정합니다.
+    수 분 걸리는 스트리밍이 풀 슬롯을 점유하지 않도록 전용 연결을 열고, 블록 종료 시 닫습니다.
+    중간에 중단되어 읽지 않은 행이 남아도 연결째 닫으므로 풀에는 영향이 없습니다.
+
+    Raises:
+        DBPoolError: 연결 실패
+    """
+    try:
+        conn = (connect or _mysql_connect)()
+    except Exception as e:
+        raise DBPoolError(f"DB connection failed: {e}") from e
+
+    try:
+        cursor = conn.cursor(dictionary=dictionary, buffered=False)
+        try:
+            yield cursor
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """공유 풀 통계 반환"""
+    return get_pool().stats()
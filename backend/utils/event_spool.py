@@ -0,0 +1,324 @@
+"""
+로컬 이벤트 spool (DB 장애 대비)
+
+DB에 쓰지 못한 activity_logs / api_usage_logs 행을 로컬 디스크에 보관하고,
+DB가 복구되면 replay_spool()로 다시 적재합니다.
+
+파일 구조:
+    {EVENT_SPOOL_DIR}/segment-<시각>-<pid>.jsonl.open   # 기록 중인 세그먼트 (프로세스별)
+    {EVENT_SPOOL_DIR}/segment-<시각>-<pid>.jsonl        # 닫힌 세그먼트 (replay 대상)
+
+- 한 줄에 이벤트 하나: {"table": "activity_logs", "row": {컬럼: 값, ...}}
+- 매 기록마다 OS 버퍼로 flush, fsync는 fsync_batch건 또는 fsync_interval초마다 묶어서 수행
+- 세그먼트가 segment_max_bytes를 넘으면 닫고 새 세그먼트 시작
+- 모든 행은 event_key(고유 키)를 가지며 replay는 INSERT IGNORE라서 여러 번 재생해도
+  중복 집계되지 않음 (원래 created_at 유지)
+
+환경변수:
+    EVENT_SPOOL_DIR: spool 디렉토리 (기본 backend/logs/spool)
+    EVENT_SPOOL_SEGMENT_MB: 세그먼트 최대 크기 (MB, 기본 8)
+
+사용 예시:
+    >>> from utils.event_spool import get_event_spool, replay_spool
+    >>> get_event_spool().append('activity_logs', {'event_key': ..., 'academy_id': 1, ...})
+    >>> replay_spool()  # {'segments': 1, 'rows': 120, 'inserted': 118, 'duplicates': 2}
+"""
+
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SPOOL_DIR = os.getenv('EVENT_SPOOL_DIR', os.path.join(PROJECT_ROOT, 'logs', 'spool'))
+
+# replay 대상 테이블과 컬럼 (spool 행의 키)
+SPOOL_TABLES: Dict[str, Tuple[str, ...]] = {
+    'activity_logs': (
+        'event_key', 'academy_id', 'user_id', 'action_type', 'action_detail',
+        'ip_address', 'user_agent', 'created_at',
+    ),
+    'api_usage_logs': (
+        'event_key', 'api_name', 'academy_id', 'endpoint', 'request_tokens', 'response_tokens',
+        'total_cost', 'response_time_ms', 'status', 'error_message', 'created_at',
+    ),
+}
+
+
+def new_event_key() -> str:
+    """이벤트 고유 키 (spool replay 중복 방지용)"""
+    return uuid.uuid4().hex
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, Decimal):
+        return str(value)
+    return str(value)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class EventSpool:
+    """
+    append-only 세그먼트 spool
+
+    Args:
+        directory: spool 디렉토리
+        segment_max_bytes: 세그먼트 최대 크기 (초과 시 회전)
+        fsync_batch: 이 건수마다 fsync
+        fsync_interval: 마지막 fsync 이후 이 시간(초)이 지나면 다음 기록 때 fsync
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        segment_max_bytes: Optional[int] = None,
+        fsync_batch: int = 100,
+        fsync_interval: float = 1.0
+    ):
+        self.directory = directory or DEFAULT_SPOOL_DIR
+        self.segment_max_bytes = segment_max_bytes or int(os.getenv('EVENT_SPOOL_SEGMENT_MB', '8')) * 1024 * 1024
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._path: Optional[str] = None
+        self._pid: Optional[int] = None
+        self._size = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._appended = 0
+
+    def _open_segment(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._pid = os.getpid()
+        name = f"segment-{time.time_ns()}-{self._pid}.jsonl.open"
+        self._path = os.path.join(self.directory, name)
+        self._file = open(self._path, 'a', encoding='utf-8')
+        self._size = self._file.tell()
+
+    def _seal_locked(self) -> None:
+        """현재 세그먼트를 fsync 후 닫고 .jsonl로 이름 변경 (replay 대상)"""
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+        if self._size > 0:
+            os.replace(self._path, self._path[:-len('.open')])
+        else:
+            os.remove(self._path)
+        self._file = None
+        self._path = None
+        self._unsynced = 0
+
+    def append(self, table: str, row: Dict[str, Any]) -> None:
+        """이벤트 한 건 기록"""
+        self.append_many(table, [row])
+
+    def append_many(self, table: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        이벤트 여러 건 기록
+
+        Returns:
+            int: 기록한 건수
+        """
+        lines = [
+            json.dumps({'table': table, 'row': row}, ensure_ascii=False, default=_json_default) + '\n'
+            for row in rows
+        ]
+        if not lines:
+            return 0
+
+        with self._lock:
+            # fork 이후에는 부모의 세그먼트를 이어 쓰지 않음
+            if self._file is not None and self._pid != os.getpid():
+                self._file = None
+                self._path = None
+            if self._file is None:
+                self._open_segment()
+
+            data = ''.join(lines)
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data.encode('utf-8'))
+            self._unsynced += len(lines)
+            self._appended += len(lines)
+
+            now = time.monotonic()
+            if self._unsynced >= self.fsync_batch or now - self._last_sync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+                self._last_sync = now
+
+            if self._size >= self.segment_max_bytes:
+                self._seal_locked()
+
+        return len(lines)
+
+    def sync(self) -> None:
+        """기록 중인 세그먼트 fsync"""
+        with self._lock:
+            if self._file is not None and self._unsynced:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+                self._last_sync = time.monotonic()
+
+    def rotate(self) -> None:
+        """기록 중인 세그먼트를 닫아 replay 대상으로 만듦"""
+        with self._lock:
+            if self._file is not None and self._pid == os.getpid():
+                self._seal_locked()
+
+    def close(self) -> None:
+        """프로세스 종료 시 세그먼트 닫기"""
+        self.rotate()
+
+    def sealed_segments(self) -> List[str]:
+        """
+        replay할 세그먼트 목록 (오래된 순)
+
+        종료된 프로세스가 남긴 .open 세그먼트도 닫힌 것으로 처리합니다.
+        """
+        for path in glob.glob(os.path.join(self.directory, 'segment-*.jsonl.open')):
+            if path == self._path:
+                continue
+            try:
+                pid = int(os.path.basename(path).split('-')[2].split('.')[0])
+            except (IndexError, ValueError):
+                continue
+            if not _pid_alive(pid):
+                os.replace(path, path[:-len('.open')])
+
+        return sorted(glob.glob(os.path.join(self.directory, 'segment-*.jsonl')))
+
+    def stats(self) -> Dict[str, Any]:
+        """spool 상태"""
+        segments = sorted(glob.glob(os.path.join(self.directory, 'segment-*.jsonl')))
+        return {
+            'directory': self.directory,
+            'appended': self._appended,
+            'pending_segments': len(segments),
+            'pending_bytes': sum(os.path.getsize(p) for p in segments),
+        }
+
+
+def read_segment(path: str) -> Tuple[Dict[str, List[Dict[str, Any]]], int]:
+    """
+    세그먼트 파일 읽기
+
+    쓰다가 끊긴 마지막 줄 등 손상된 줄은 건너뜁니다.
+
+    Returns:
+        tuple: ({테이블: [행, ...]}, 손상된 줄 수)
+    """
+    by_table: Dict[str, List[Dict[str, Any]]] = {}
+    corrupt = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+                by_table.setdefault(event['table'], []).append(event['row'])
+            except (ValueError, KeyError, TypeError):
+                corrupt += 1
+    return by_table, corrupt
+
+
+def _insert_ignore(cursor, table: str, rows: List[Dict[str, Any]], batch_size: int) -> int:
+    """event_key 기준 INSERT IGNORE (이미 있는 행은 건너뜀). 반환: 새로 들어간 행 수"""
+    columns = SPOOL_TABLES[table]
+    sql = (
+        f"INSERT IGNORE INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+    inserted = 0
+    for i in range(0, len(rows), batch_size):
+        chunk = [tuple(row.get(c) for c in columns) for row in rows[i:i + batch_size]]
+        cursor.executemany(sql, chunk)
+        inserted += max(cursor.rowcount, 0)
+    return inserted
+
+
+def replay_spool(spool: Optional['EventSpool'] = None, batch_size: int = 500) -> Dict[str, int]:
+    """
+    닫힌 세그먼트를 DB에 재적재
+
+    세그먼트 하나를 한 트랜잭션으로 적재하고 커밋이 끝나면 파일을 삭제합니다.
+    DB 오류가 나면 해당 세그먼트와 이후 세그먼트는 남겨두고 중단합니다.
+
+    Returns:
+        dict: segments/rows/inserted/duplicates/corrupt/failed
+    """
+    from utils.db_pool import db_cursor
+
+    spool = spool or get_event_spool()
+    spool.rotate()
+
+    result = {'segments': 0, 'rows': 0, 'inserted': 0, 'duplicates': 0, 'corrupt': 0, 'failed': 0}
+
+    for path in spool.sealed_segments():
+        by_table, corrupt = read_segment(path)
+        unknown = [t for t in by_table if t not in SPOOL_TABLES]
+        if unknown:
+            print(f"[EventSpool] {os.path.basename(path)}: unknown tables {unknown}, skipped")
+        rows = sum(len(v) for t, v in by_table.items() if t in SPOOL_TABLES)
+
+        try:
+            inserted = 0
+            with db_cursor(dictionary=False, commit=True) as cursor:
+                for table, table_rows in by_table.items():
+                    if table in SPOOL_TABLES:
+                        inserted += _insert_ignore(cursor, table, table_rows, batch_size)
+        except Exception as e:
+            print(f"[EventSpool] Replay stopped at {os.path.basename(path)}: {e}")
+            result['failed'] += 1
+            break
+
+        os.remove(path)
+        result['segments'] += 1
+        result['rows'] += rows
+        result['inserted'] += inserted
+        result['duplicates'] += rows - inserted
+        result['corrupt'] += corrupt
+
+    return result
+
+
+# 프로세스 전역 spool (첫 사용 시 생성)
+_spool: Optional[EventSpool] = None
+_spool_lock = threading.Lock()
+
+
+def get_event_spool() -> EventSpool:
+    """프로세스 전역 이벤트 spool 반환"""
+    global _spool
+    if _spool is None:
+        with _spool_lock:
+            if _spool is None:
+                _spool = EventSpool()
+                atexit.register(_spool.close)
+    return _spool
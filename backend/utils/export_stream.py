@@ -0,0 +1,178 @@
+"""
+대용량 export 스트리밍 (CSV / NDJSON)
+
+쿼리 결과를 전용 연결의 unbuffered 커서(utils.db_pool.db_stream_cursor)에서
+EXPORT_FETCH_SIZE행씩 읽어 바로 CSV / NDJSON 청크로 내보냅니다.
+전체 결과를 fetchall()로 모으지 않으므로 수백만 행도 메모리가 일정하고,
+Flask 응답을 이 제너레이터로 만들면 chunked transfer로 첫 행부터 바로 전송됩니다.
+
+- CSV: UTF-8 BOM + 헤더 (Excel에서 한글이 깨지지 않도록), None은 빈 칸
+- NDJSON: 한 줄에 JSON 객체 하나, datetime은 ISO 8601, DECIMAL은 숫자
+
+클라이언트가 느리게 읽으면 MySQL이 결과 전송을 기다리므로 세션의
+net_write_timeout을 늘리고, 전역 max_execution_time도 이 세션에서는 끕니다.
+
+환경변수:
+    EXPORT_FETCH_SIZE: 한 번에 읽어 청크 하나로 내보낼 행 수 (기본 1000)
+    EXPORT_NET_WRITE_TIMEOUT: export 세션 net_write_timeout (초, 기본 600)
+
+사용 예시:
+    >>> from utils.export_stream import stream_query
+    >>> chunks = stream_query("SELECT ... FROM activity_logs WHERE created_at >= %s", [start], 'ndjson')
+    >>> return Response(chunks, content_type=EXPORT_FORMATS['ndjson'])
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from utils.db_pool import db_stream_cursor
+
+
+EXPORT_FETCH_SIZE = int(os.getenv('EXPORT_FETCH_SIZE', '1000'))
+EXPORT_NET_WRITE_TIMEOUT = int(os.getenv('EXPORT_NET_WRITE_TIMEOUT', '600'))
+
+# 형식 → Content-Type
+EXPORT_FORMATS: Dict[str, str] = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+
+
+# Excel이 UTF-8로 읽도록 CSV 맨 앞에 붙이는 BOM
+BOM = '\ufeff'
+
+
+class ExportError(ValueError):
+    """잘못된 export 인자"""
+
+
+def check_format(fmt: Optional[str]) -> str:
+    """export 형식 검증 (기본 csv)"""
+    fmt = (fmt or 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f"invalid format: {fmt} (allowed: {', '.join(EXPORT_FORMATS)})")
+    return fmt
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', 'replace')
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', 'replace')
+    return value
+
+
+# =============================================================================
+# 렌더링 (행 묶음 → 텍스트 청크)
+# =============================================================================
+def render_csv(columns: List[str], batches: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """
+    행 묶음 → CSV 청크 (묶음당 1청크)
+
+    헤더는 첫 행의 키(파생 컬럼 포함), 행이 없으면 columns를 사용합니다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header = None
+
+    for batch in batches:
+        if not batch:
+            continue
+        if header is None:
+            header = list(batch[0].keys())
+            buffer.write(BOM)
+            writer.writerow(header)
+        for row in batch:
+            writer.writerow([_csv_value(row.get(column)) for column in header])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if header is None:
+        buffer.write(BOM)
+        writer.writerow(columns)
+        yield buffer.getvalue()
+
+
+def render_ndjson(columns: List[str], batches: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """행 묶음 → NDJSON 청크 (묶음당 1청크)"""
+    for batch in batches:
+        if batch:
+            yield ''.join(
+                json.dumps(row, ensure_ascii=False, default=_json_default) + '\n'
+                for row in batch
+            )
+
+
+RENDERERS = {
+    'csv': render_csv,
+    'ndjson': render_ndjson,
+}
+
+
+# =============================================================================
+# 스트리밍
+# =============================================================================
+def fetch_batches(cursor, size: int) -> Iterator[List[Dict[str, Any]]]:
+    """fetchmany(size)를 결과가 끝날 때까지 반복"""
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield rows
+
+
+def stream_query(
+    sql: str,
+    params: Iterable[Any],
+    fmt: str,
+    transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    fetch_size: Optional[int] = None,
+    cursor_factory: Optional[Callable[[], Any]] = None
+) -> Iterator[bytes]:
+    """
+    쿼리 결과를 fmt 형식의 바이트 청크로 스트리밍
+
+    연결은 첫 청크를 요청할 때 열리고, 제너레이터가 끝나거나 닫힐 때(클라이언트 중단 포함) 닫힙니다.
+
+    Args:
+        sql / params: 실행할 쿼리 (ORDER BY는 인덱스 순서를 따르도록 호출 측에서 지정)
+        fmt: 'csv' / 'ndjson'
+        transform: 행(dict) → 파생 컬럼을 추가한 행
+        fetch_size: 청크당 행 수 (기본 EXPORT_FETCH_SIZE)
+        cursor_factory: dict 커서 컨텍스트 (기본 db_stream_cursor)
+    """
+    render = RENDERERS[check_format(fmt)]
+    fetch_size = fetch_size or EXPORT_FETCH_SIZE
+
+    with (cursor_factory or db_stream_cursor)() as cursor:
+        cursor.execute(
+            "SET SESSION net_write_timeout = %s, max_execution_time = 0",
+            (EXPORT_NET_WRITE_TIMEOUT,)
+        )
+        cursor.execute(sql, list(params))
+        columns = [column[0] for column in cursor.description or ()]
+
+        batches = fetch_batches(cursor, fetch_size)
+        if transform:
+            batches = ([transform(row) for row in batch] for batch in batches)
+
+        for chunk in render(columns, batches):
+            yield chunk.encode('utf-8')
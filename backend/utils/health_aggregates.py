@@ -0,0 +1,140 @@
+"""
+시스템 헬스 다운샘플 집계 (system_health_aggregates)
+
+헬스체크 데몬은 1초 샘플을 링 버퍼(utils/metrics_ring.py)에만 두고,
+1분/1시간 단위 집계(min/avg/max/p95)만 DB에 기록합니다 (migrations/008).
+같은 버킷이 여러 번 기록되면(데몬 재시작, 1회 실행 모드) 샘플 수 가중 평균,
+min/max는 LEAST/GREATEST로 병합합니다. p95는 병합 시 큰 값을 취하는 근사치입니다.
+
+해상도별 보관 기간은 purge_expired()가 적용합니다. 1분 집계는 리소스 Alert /
+system-health 카드의 최근 몇 분 윈도우(utils/resource_window.py)만 읽으므로 짧게 두고,
+그 이상의 추이는 1시간 집계로 봅니다. (재시작 횟수는 process_lifecycle_events에서 계산)
+
+환경변수:
+    HEALTH_AGG_RETENTION_1M_DAYS: 1분 집계 보관 일수 (기본 2 - 최근 하루 장애 분석용 여유 포함)
+    HEALTH_AGG_RETENTION_1H_DAYS: 1시간 집계 보관 일수 (기본 400)
+"""
+
+import math
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.net_counters import CONNECTION_COLUMNS
+
+
+SAMPLE_COLUMNS = ('cpu_usage', 'ram_usage', 'disk_usage') + CONNECTION_COLUMNS
+
+# 해상도 → (버킷 길이 초, 보관 일수)
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    '1m': (60, int(os.getenv('HEALTH_AGG_RETENTION_1M_DAYS', '2'))),
+    '1h': (3600, int(os.getenv('HEALTH_AGG_RETENTION_1H_DAYS', '400'))),
+}
+
+RESOURCES = ('cpu', 'ram', 'disk')
+STATS = ('min', 'avg', 'max', 'p95')
+
+# 리소스는 min/avg/max/p95, 연결 수는 버킷 내 최대값만 기록
+STAT_COLUMNS = tuple(f"{r}_{s}" for r in RESOURCES for s in STATS) + tuple(f"{c}_max" for c in CONNECTION_COLUMNS)
+AGGREGATE_COLUMNS = ('resolution', 'bucket_start', 'samples') + STAT_COLUMNS
+
+
+def _merge_expr(column: str) -> str:
+    """ON DUPLICATE KEY UPDATE 병합식 (NULL은 반대편 값 사용)"""
+    new = f"VALUES({column})"
+    if column.endswith('_min'):
+        return f"{column} = LEAST(COALESCE({column}, {new}), COALESCE({new}, {column}))"
+    if column.endswith('_avg'):
+        return (f"{column} = COALESCE(({column} * samples + {new} * VALUES(samples)) "
+                f"/ (samples + VALUES(samples)), {column}, {new})")
+    return f"{column} = GREATEST(COALESCE({column}, {new}), COALESCE({new}, {column}))"
+
+
+# samples는 가중 평균 계산이 끝난 뒤 마지막에 갱신해야 함 (MySQL은 SET을 왼쪽부터 적용)
+UPSERT_SQL = f"""
+    INSERT INTO system_health_aggregates ({', '.join(AGGREGATE_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(AGGREGATE_COLUMNS))})
+    ON DUPLICATE KEY UPDATE
+        {', '.join(_merge_expr(c) for c in STAT_COLUMNS)},
+        samples = samples + VALUES(samples)
+"""
+
+
+def bucket_start(timestamp: float, resolution: str) -> float:
+    """timestamp가 속한 버킷 시작 (epoch 초)"""
+    seconds = RESOLUTIONS[resolution][0]
+    return math.floor(timestamp / seconds) * seconds
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 2)
+
+
+def build_aggregate_row(resolution: str, start: float, summary: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    링 버퍼 요약 → UPSERT_SQL 파라미터
+
+    Args:
+        resolution: '1m' / '1h'
+        start: 버킷 시작 (epoch 초)
+        summary: MetricsRingBuffer.summarize() 결과 (필드는 SAMPLE_COLUMNS)
+
+    Returns:
+        tuple: AGGREGATE_COLUMNS 순서, 샘플이 없으면 None
+    """
+    if not summary['samples']:
+        return None
+
+    stats: List[Optional[float]] = []
+    for resource in RESOURCES:
+        described = summary[f"{resource}_usage"]
+        stats.extend(_round(described[s]) for s in STATS)
+    for column in CONNECTION_COLUMNS:
+        peak = summary[column]['max']
+        stats.append(None if peak is None else int(peak))
+
+    return (resolution, datetime.fromtimestamp(start), summary['samples']) + tuple(stats)
+
+
+def merge_buckets(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    집계 행 여러 개 → resource_window 요약 형태
+
+    평균은 샘플 수 가중, max/p95는 버킷 값 중 최대 (p95는 근사)
+
+    Args:
+        rows: samples, <resource>_avg/_max/_p95 키를 가진 행
+
+    Returns:
+        dict: {'cpu': {'avg', 'p95', 'max'}, 'ram': {...}, 'disk': {...}, 'samples': int}
+    """
+    summary: Dict[str, Any] = {'samples': int(sum(r['samples'] for r in rows))}
+    for resource in RESOURCES:
+        weighted = [(float(r[f"{resource}_avg"]), r['samples']) for r in rows if r[f"{resource}_avg"] is not None]
+        weight = sum(w for _, w in weighted)
+        maxes = [float(r[f"{resource}_max"]) for r in rows if r[f"{resource}_max"] is not None]
+        p95s = [float(r[f"{resource}_p95"]) for r in rows if r[f"{resource}_p95"] is not None]
+        summary[resource] = {
+            'avg': sum(v * w for v, w in weighted) / weight if weight else None,
+            'p95': max(p95s) if p95s else None,
+            'max': max(maxes) if maxes else None,
+        }
+    return summary
+
+
+def purge_expired(cursor) -> int:
+    """
+    해상도별 보관 기간이 지난 집계 삭제
+
+    Returns:
+        int: 삭제된 행 수
+    """
+    deleted = 0
+    for resolution, (_, retention_days) in RESOLUTIONS.items():
+        cursor.execute("""
+            DELETE FROM system_health_aggregates
+            WHERE resolution = %s
+            AND bucket_start < NOW() - INTERVAL %s DAY
+        """, (resolution, retention_days))
+        deleted += cursor.rowcount
+    return deleted
@@ -0,0 +1,195 @@
+"""
+헬스체크 데몬 실행 루프
+
+scripts/health_check.py --daemon 이 사용합니다. cron이 5분마다 프로세스를 새로
+띄우는 대신 한 프로세스가 interval초(기본 1초)마다 샘플을 수집합니다.
+
+- 샘플은 메모리 링 버퍼(utils/metrics_ring.py)에만 보관
+- 1분/1시간 버킷이 끝날 때마다 min/avg/max/p95 집계를 BatchWriter로
+  system_health_aggregates에 기록하고, 매시 보관 기간이 지난 집계를 삭제
+- alert_interval초마다 링 버퍼의 최근 alert_interval초 평균으로 Alert 콜백 호출
+  (순간값 대신 평균으로 판단하고, 평가 주기는 기존 cron과 같은 5분)
+- SIGTERM/SIGINT를 받으면 진행 중인 버킷까지 기록한 뒤 종료
+  (다음 실행이 같은 버킷을 기록하면 UPSERT가 병합)
+
+환경변수:
+    HEALTH_SAMPLE_INTERVAL: 샘플링 주기 (초, 데몬 기본 1)
+    HEALTH_ALERT_INTERVAL: Alert 평가 주기 (초, 기본 300)
+
+사용 예시:
+    >>> daemon = HealthDaemon(sampler.sample, on_window=check_alerts)
+    >>> daemon.install_signal_handlers()
+    >>> daemon.run()
+"""
+
+import math
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from utils.batch_writer import BatchWriter
+from utils.db_pool import db_cursor
+from utils.health_aggregates import (
+    RESOLUTIONS, SAMPLE_COLUMNS, UPSERT_SQL, bucket_start, build_aggregate_row, purge_expired
+)
+from utils.metrics_ring import MetricsRingBuffer
+
+
+HEALTH_SAMPLE_INTERVAL = float(os.getenv('HEALTH_SAMPLE_INTERVAL', '1'))
+HEALTH_ALERT_INTERVAL = float(os.getenv('HEALTH_ALERT_INTERVAL', '300'))
+
+# 가장 긴 버킷(1시간) + 여유분을 담을 수 있어야 1시간 집계를 링 버퍼에서 계산 가능
+RING_SECONDS = 3600 + 300
+
+
+def create_aggregate_writer() -> BatchWriter:
+    """system_health_aggregates 비동기 작성기 (DB 장애 시 집계는 버림)"""
+    return BatchWriter('system_health_aggregates', UPSERT_SQL, max_queue=1000, batch_size=50, flush_interval=1.0)
+
+
+def purge_expired_aggregates() -> int:
+    """보관 기간이 지난 집계 삭제 (공유 풀 사용)"""
+    with db_cursor(dictionary=False, commit=True) as cursor:
+        return purge_expired(cursor)
+
+
+class HealthDaemon:
+    """
+    헬스체크 샘플링 루프
+
+    Args:
+        sample: () -> SAMPLE_COLUMNS 순서의 튜플을 반환하는 샘플 함수 (블로킹하지 않아야 함)
+        on_window: (averages, sample_count) Alert 평가 콜백
+        writer: submit()/close()를 가진 집계 작성기 (기본: create_aggregate_writer())
+        interval: 샘플링 주기 (초)
+        alert_interval: Alert 평가 주기 = 평가 윈도우 길이 (초)
+        purge: 보관 기간 정리 함수 (매시 호출, 기본: purge_expired_aggregates)
+        clock: epoch 초를 반환하는 함수 (버킷 경계 계산용, 테스트에서 교체)
+    """
+
+    def __init__(
+        self,
+        sample: Callable[[], Sequence[float]],
+        on_window: Optional[Callable[[Dict[str, Optional[float]], int], Any]] = None,
+        writer=None,
+        interval: float = HEALTH_SAMPLE_INTERVAL,
+        alert_interval: float = HEALTH_ALERT_INTERVAL,
+        purge: Optional[Callable[[], Any]] = purge_expired_aggregates,
+        clock: Callable[[], float] = time.time
+    ):
+        self._sample = sample
+        self._on_window = on_window
+        self.writer = writer or create_aggregate_writer()
+        self.interval = interval
+        self.alert_interval = alert_interval
+        self._purge = purge
+        self._clock = clock
+
+        self.ring = MetricsRingBuffer(SAMPLE_COLUMNS, capacity=int(RING_SECONDS / interval) + 1)
+        self._buckets: Dict[str, Optional[float]] = {resolution: None for resolution in RESOLUTIONS}
+        self._stop = threading.Event()
+        self._window_started = time.monotonic()
+
+        self.ticks = 0
+        self.errors = 0
+        self.aggregates_written = 0
+
+    def stop(self, signum=None, frame=None) -> None:
+        """루프 종료 요청 (시그널 핸들러로도 사용)"""
+        if signum is not None:
+            print(f"[HealthDaemon] Received signal {signum}, shutting down...")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """SIGTERM/SIGINT → stop() (메인 스레드에서만 호출 가능)"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def tick(self) -> None:
+        """샘플 1회 수집 → 링 버퍼, 끝난 버킷 집계 기록, Alert 평가 주기가 지났으면 콜백"""
+        now = self._clock()
+        self._close_buckets(now)
+
+        try:
+            self.ring.append(now, tuple(self._sample()))
+        except Exception as e:
+            self.errors += 1
+            print(f"[HealthDaemon] Sample failed: {e}")
+
+        self.ticks += 1
+        if time.monotonic() - self._window_started >= self.alert_interval:
+            self.evaluate_window()
+
+    def _close_buckets(self, now: float) -> None:
+        """now가 새 버킷에 들어갔으면 이전 버킷 집계 기록"""
+        for resolution in RESOLUTIONS:
+            current = bucket_start(now, resolution)
+            previous = self._buckets[resolution]
+            self._buckets[resolution] = current
+            if previous is None or current <= previous:
+                continue
+
+            self._write_bucket(resolution, previous, current)
+            if resolution == '1h' and self._purge is not None:
+                try:
+                    self._purge()
+                except Exception as e:
+                    self.errors += 1
+                    print(f"[HealthDaemon] Aggregate purge failed: {e}")
+
+    def _write_bucket(self, resolution: str, start: float, end: float) -> None:
+        row = build_aggregate_row(resolution, start, self.ring.summarize(start, end))
+        if row is not None:
+            self.writer.submit(row)
+            self.aggregates_written += 1
+
+    def evaluate_window(self) -> None:
+        """링 버퍼의 최근 alert_interval초 평균으로 Alert 콜백 호출"""
+        self._window_started = time.monotonic()
+        if self._on_window is None:
+            return
+
+        summary = self.ring.summarize(self._clock() - self.alert_interval)
+        if not summary['samples']:
+            return
+
+        averages = {column: summary[column]['avg'] for column in SAMPLE_COLUMNS}
+        try:
+            self._on_window(averages, summary['samples'])
+        except Exception as e:
+            self.errors += 1
+            print(f"[HealthDaemon] Alert evaluation failed: {e}")
+
+    def flush_open_buckets(self) -> None:
+        """진행 중인 버킷을 지금까지의 샘플로 기록 (종료 시)"""
+        for resolution, start in self._buckets.items():
+            if start is not None:
+                self._write_bucket(resolution, start, math.inf)
+
+    def run(self, max_ticks: Optional[int] = None) -> None:
+        """
+        stop()이 호출될 때까지 interval초마다 tick 실행
+
+        tick 시각은 시작 시각 기준으로 고정되어 누적 지연이 없으며,
+        tick이 interval보다 오래 걸려 밀린 주기는 건너뜁니다.
+        첫 tick은 interval초 뒤 (CPU 사용률은 tick 사이 구간으로 계산되므로)
+
+        Args:
+            max_ticks: 이 횟수만큼 실행 후 종료 (테스트용)
+        """
+        next_tick = time.monotonic() + self.interval
+        try:
+            while not self._stop.wait(max(0.0, next_tick - time.monotonic())):
+                self.tick()
+                if max_ticks is not None and self.ticks >= max_ticks:
+                    break
+
+                next_tick += self.interval
+                now = time.monotonic()
+                if next_tick <= now:
+                    next_tick = now + self.interval
+        finally:
+            self.flush_open_buckets()
+            self.writer.close()
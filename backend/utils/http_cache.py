@@ -0,0 +1,139 @@
+"""
+HTTP 조건부 요청 (ETag / If-None-Match) + 응답 압축
+
+대시보드는 같은 지표/목록/Alert를 주기적으로 폴링하고, 대부분의 응답은 직전과 같습니다.
+응답마다 버전(ETag)을 붙이고 클라이언트가 보낸 If-None-Match와 같으면 본문 없이
+304를 돌려주므로, 변하지 않은 데이터는 JSON 직렬화도 전송도 하지 않습니다.
+브라우저 fetch는 HTTP 캐시에 저장한 응답의 ETag로 자동 재검증하므로 프론트엔드 변경은 없습니다.
+
+- 버전: 페이로드를 키 정렬 JSON으로 만든 blake2b 해시 (같은 데이터면 재계산해도 같은 값)
+  캐시된 카드는 utils/result_cache.py가 저장 시점에 한 번 계산해 두므로 폴링 때는 비교만 합니다.
+- ETag는 weak(W/"...") - gzip 여부와 무관하게 같은 데이터면 같은 값
+- Cache-Control: private, max-age (카드별 남은 TTL) - 0이면 매번 재검증(no-cache)
+- HTTP_GZIP_MIN_BYTES 이상인 200 응답은 Accept-Encoding에 gzip이 있으면 압축
+
+환경변수:
+    HTTP_GZIP_MIN_BYTES: 압축할 최소 응답 크기 (바이트, 기본 1024)
+    HTTP_GZIP_LEVEL: gzip 압축 레벨 (기본 6)
+
+사용 예시:
+    >>> from utils.http_cache import conditional_json, payload_version
+    >>> return conditional_json(data, payload_version(data), max_age=60)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Iterable, Optional
+
+
+HTTP_GZIP_MIN_BYTES = int(os.getenv('HTTP_GZIP_MIN_BYTES', '1024'))
+HTTP_GZIP_LEVEL = int(os.getenv('HTTP_GZIP_LEVEL', '6'))
+
+
+def payload_version(payload: Any) -> str:
+    """페이로드 버전 (키 정렬 JSON의 16자리 해시)"""
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def combine_versions(parts: Iterable[Any]) -> str:
+    """여러 버전 / 워터마크를 하나의 버전으로 합침 (스냅샷 등)"""
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def make_etag(version: str) -> str:
+    return f'W/"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 etag와 일치하는지 (weak 비교)
+
+    '*' 또는 쉼표로 구분한 ETag 목록을 받으며, W/ 접두어는 무시합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith('W/') else tag
+
+    target = opaque(etag)
+    return any(opaque(tag) == target for tag in if_none_match.split(','))
+
+
+def cache_control(max_age: float, stale: float = 0) -> str:
+    """Cache-Control 값 (max_age 0이면 매번 재검증)"""
+    max_age = int(max_age)
+    if max_age <= 0:
+        return 'private, no-cache'
+    value = f'private, max-age={max_age}'
+    if stale > 0:
+        value += f', stale-while-revalidate={int(stale)}'
+    return value
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding에 gzip이 있는지 (q=0은 거부로 처리)"""
+    for item in (accept_encoding or '').split(','):
+        coding, _, params = item.strip().partition(';')
+        if coding.strip().lower() in ('gzip', '*'):
+            q = params.strip()
+            return not (q.startswith('q=') and q[2:].strip() in ('0', '0.0', '0.00', '0.000'))
+    return False
+
+
+def compress_response(response):
+    """
+    큰 200 응답을 gzip으로 압축 (Vary: Accept-Encoding)
+
+    스트리밍 응답, 이미 인코딩된 응답, HTTP_GZIP_MIN_BYTES 미만 응답은 그대로 둡니다.
+    """
+    from flask import request
+
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or not accepts_gzip(request.headers.get('Accept-Encoding'))):
+        return response
+
+    body = response.get_data()
+    if len(body) < HTTP_GZIP_MIN_BYTES:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=HTTP_GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+def conditional_json(payload: Any, version: str, max_age: float = 0, stale: float = 0):
+    """
+    조건부 JSON 응답
+
+    If-None-Match가 version과 같으면 본문 없는 304, 아니면 ETag / Cache-Control을 붙인
+    JSON 200 (크면 gzip)을 반환합니다. payload는 304일 때 직렬화하지 않습니다.
+
+    Args:
+        payload: 응답 데이터
+        version: payload_version() 등으로 만든 데이터 버전
+        max_age: 클라이언트가 재요청 없이 재사용해도 되는 시간 (초)
+        stale: max_age 이후 재검증하는 동안 이전 응답을 보여줘도 되는 시간 (초)
+    """
+    from flask import Response, jsonify, request
+
+    etag = make_etag(version)
+    headers = {'ETag': etag, 'Cache-Control': cache_control(max_age, stale)}
+
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        response = Response(status=304, headers=headers)
+        response.vary.add('Accept-Encoding')
+        return response
+
+    response = jsonify(payload)
+    response.headers.update(headers)
+    return compress_response(response)
@@ -0,0 +1,114 @@
+"""
+고해상도 메트릭 링 버퍼
+
+헬스체크 데몬이 1초 단위 샘플을 프로세스 메모리에 보관하는 고정 크기 버퍼입니다.
+필드마다 array('d') 하나씩을 미리 할당하고 위치만 돌려 쓰므로 샘플당 dict/tuple
+객체가 남지 않고 메모리 사용량이 일정합니다. (필드 7개 × 4,000개 ≈ 250KB)
+
+값이 없는 칸(None)은 NaN으로 저장하고 집계에서 제외합니다.
+
+사용 예시:
+    >>> ring = MetricsRingBuffer(('cpu_usage', 'ram_usage'), capacity=3600)
+    >>> ring.append(time.time(), (12.5, 48.0))
+    >>> ring.summarize(time.time() - 300)
+    {'samples': 1, 'cpu_usage': {'min': 12.5, 'avg': 12.5, 'max': 12.5, 'p95': 12.5}, ...}
+"""
+
+import math
+import threading
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence
+
+
+def describe(values: List[float]) -> Dict[str, Optional[float]]:
+    """
+    값 목록 → min/avg/max/p95 (p95는 nearest-rank)
+
+    Returns:
+        dict: 값이 없으면 모두 None
+    """
+    if not values:
+        return {'min': None, 'avg': None, 'max': None, 'p95': None}
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(0.95 * len(ordered)))
+    return {
+        'min': ordered[0],
+        'avg': sum(ordered) / len(ordered),
+        'max': ordered[-1],
+        'p95': ordered[rank - 1],
+    }
+
+
+class MetricsRingBuffer:
+    """
+    array 기반 고정 크기 시계열 버퍼 (가장 오래된 샘플부터 덮어씀)
+
+    Args:
+        fields: 필드 이름 (append 값 순서)
+        capacity: 보관할 최대 샘플 수
+    """
+
+    def __init__(self, fields: Sequence[str], capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self._times = array('d', [0.0]) * capacity
+        self._columns = [array('d', [math.nan]) * capacity for _ in self.fields]
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, values: Sequence[Optional[float]]) -> None:
+        """
+        샘플 추가 (timestamp는 오름차순으로 들어온다고 가정)
+
+        Args:
+            timestamp: epoch 초
+            values: fields 순서의 값 (None 허용)
+        """
+        with self._lock:
+            i = self._next
+            self._times[i] = timestamp
+            for column, value in zip(self._columns, values):
+                column[i] = math.nan if value is None else float(value)
+            self._next = (i + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def _indices(self, start: float, end: float) -> Iterator[int]:
+        """[start, end) 구간 샘플의 위치 (오래된 순)"""
+        first = (self._next - self._size) % self.capacity
+        for k in range(self._size):
+            i = (first + k) % self.capacity
+            t = self._times[i]
+            if t >= end:
+                break
+            if t >= start:
+                yield i
+
+    def oldest(self) -> Optional[float]:
+        """가장 오래된 샘플 시각 (비어 있으면 None)"""
+        with self._lock:
+            if self._size == 0:
+                return None
+            return self._times[(self._next - self._size) % self.capacity]
+
+    def summarize(self, start: float, end: float = math.inf) -> Dict[str, object]:
+        """
+        [start, end) 구간 필드별 min/avg/max/p95
+
+        Returns:
+            dict: {'samples': int, '<field>': describe(...), ...}
+        """
+        with self._lock:
+            indices = list(self._indices(start, end))
+            summary: Dict[str, object] = {'samples': len(indices)}
+            for field, column in zip(self.fields, self._columns):
+                values = [column[i] for i in indices if not math.isnan(column[i])]
+                summary[field] = describe(values)
+        return summary
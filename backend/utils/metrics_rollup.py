@@ -0,0 +1,329 @@
+"""
+일별 지표 롤업
+
+activity_logs / progress_records 원본을 일별 요약 테이블로 유지합니다.
+
+- daily_academy_activity: (일, 학원)별 활동 수/공유 수/첫·마지막 활동 시각
+- daily_report_counts: (일, 학생)별 리포트/카드뉴스/AI 리포트 수
+- rollup_watermarks: 원본별 마지막 반영 id와 롤업이 덮는 시작일(covered_from)
+
+증분 실행은 워터마크 이후 id만 처리하고(배치 단위 트랜잭션), progress_records는
+soft delete/플래그 수정을 반영하기 위해 최근 며칠을 다시 집계합니다.
+그보다 오래된 날의 soft delete / 카드뉴스·AI 플래그 수정은 매일 한 번 지표가 비교하는
+전체 구간(전월 1일 ~ 오늘)을 다시 집계해 반영합니다 (refresh_compared_window).
+
+auto-increment id는 할당 순서일 뿐 커밋 순서가 아니므로(여러 워커의 배치 INSERT 등)
+워터마크는 ROLLUP_SETTLE_SECONDS보다 오래된 행까지만 올립니다. 그보다 최근 행은
+워터마크 이후 원본(tail)으로 읽히므로, 늦게 커밋된 더 작은 id도 빠지지 않습니다.
+metrics.py는 워터마크가 신선하면 롤업 + 워터마크 이후 원본(tail)을 읽고,
+그렇지 않으면 원본 테이블 스캔으로 돌아갑니다.
+
+환경변수:
+    ROLLUP_BATCH_SIZE: 증분 1회 트랜잭션에서 처리할 id 범위 (기본 50000)
+    ROLLUP_REFRESH_DAYS: progress_records 재집계 일수 (오늘 포함, 기본 2)
+    ROLLUP_MAX_LAG_SECONDS: 이 시간(초) 안에 실행된 롤업만 신선한 것으로 간주 (기본 900)
+    ROLLUP_SETTLE_SECONDS: 워터마크에 넣기 전 행이 지나야 하는 시간 (초, 기본 60
+        - 원본 INSERT 트랜잭션이 이보다 오래 열려 있지 않다고 가정)
+
+사용 예시:
+    >>> from utils.metrics_rollup import run_incremental, backfill
+    >>> backfill(parse_month('2025-01'))  # 2025-01 ~ 이번 달
+    >>> run_incremental()  # {'activity_logs': 123456, 'progress_records': 7890}
+    >>> refresh_compared_window()  # 매일: {'activity_logs': 48, 'progress_records': 48}
+"""
+
+import os
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+
+from utils.db_pool import db_cursor
+
+
+ROLLUP_BATCH_SIZE = int(os.getenv('ROLLUP_BATCH_SIZE', '50000'))
+ROLLUP_REFRESH_DAYS = int(os.getenv('ROLLUP_REFRESH_DAYS', '2'))
+ROLLUP_MAX_LAG_SECONDS = int(os.getenv('ROLLUP_MAX_LAG_SECONDS', '900'))
+ROLLUP_SETTLE_SECONDS = int(os.getenv('ROLLUP_SETTLE_SECONDS', '60'))
+
+
+# 원본 테이블별 롤업 정의
+#   append: 워터마크 이후 id 범위를 누적 (params: last_id, hi)
+#   rebuild: 날짜 범위를 다시 집계 (params: start, end, last_id)
+ROLLUP_SOURCES: Dict[str, Dict[str, Any]] = {
+    'activity_logs': {
+        'target': 'daily_academy_activity',
+        'date_column': 'activity_date',
+        'refresh_days': 0,  # append-only
+        'append': """
+            INSERT INTO daily_academy_activity
+            (activity_date, academy_id, action_count, share_count, first_activity_at, last_activity_at)
+            SELECT
+                DATE(created_at), academy_id, COUNT(*),
+                SUM(action_type = 'share_kakaotalk'), MIN(created_at), MAX(created_at)
+            FROM activity_logs
+            WHERE id > %s AND id <= %s
+            GROUP BY DATE(created_at), academy_id
+            ON DUPLICATE KEY UPDATE
+                action_count = action_count + VALUES(action_count),
+                share_count = share_count + VALUES(share_count),
+                first_activity_at = LEAST(first_activity_at, VALUES(first_activity_at)),
+                last_activity_at = GREATEST(last_activity_at, VALUES(last_activity_at))
+        """,
+        'rebuild': """
+            INSERT INTO daily_academy_activity
+            (activity_date, academy_id, action_count, share_count, first_activity_at, last_activity_at)
+            SELECT
+                DATE(created_at), academy_id, COUNT(*),
+                SUM(action_type = 'share_kakaotalk'), MIN(created_at), MAX(created_at)
+            FROM activity_logs
+            WHERE created_at >= %s AND created_at < %s
+            AND id <= %s
+            GROUP BY DATE(created_at), academy_id
+        """,
+    },
+    'progress_records': {
+        'target': 'daily_report_counts',
+        'date_column': 'report_date',
+        'refresh_days': ROLLUP_REFRESH_DAYS,
+        'append': """
+            INSERT INTO daily_report_counts
+            (report_date, student_id, academy_id, report_count, card_news_count, ai_report_count)
+            SELECT
+                DATE(pr.created_at), pr.student_id, MAX(s.academy_id), COUNT(*),
+                SUM(pr.card_news_generated = 1), SUM(pr.ai_generated = 1)
+            FROM progress_records pr
+            LEFT JOIN students s ON pr.student_id = s.id
+            WHERE pr.id > %s AND pr.id <= %s
+            AND pr.is_deleted = 0
+            GROUP BY DATE(pr.created_at), pr.student_id
+            ON DUPLICATE KEY UPDATE
+                report_count = report_count + VALUES(report_count),
+                card_news_count = card_news_count + VALUES(card_news_count),
+                ai_report_count = ai_report_count + VALUES(ai_report_count)
+        """,
+        'rebuild': """
+            INSERT INTO daily_report_counts
+            (report_date, student_id, academy_id, report_count, card_news_count, ai_report_count)
+            SELECT
+                DATE(pr.created_at), pr.student_id, MAX(s.academy_id), COUNT(*),
+                SUM(pr.card_news_generated = 1), SUM(pr.ai_generated = 1)
+            FROM progress_records pr
+            LEFT JOIN students s ON pr.student_id = s.id
+            WHERE pr.created_at >= %s AND pr.created_at < %s
+            AND pr.id <= %s
+            AND pr.is_deleted = 0
+            GROUP BY DATE(pr.created_at), pr.student_id
+        """,
+    },
+}
+
+
+def parse_month(value: str) -> date:
+    """'YYYY-MM' → 해당 월 1일"""
+    year, month = value.split('-')
+    return date(int(year), int(month), 1)
+
+
+def _next_month(d: date) -> date:
+    return date(d.year + (d.month // 12), d.month % 12 + 1, 1)
+
+
+def required_coverage_start(today: Optional[date] = None) -> date:
+    """지표 쿼리가 필요로 하는 가장 이른 날짜 (전월 1일과 31일 전 중 이른 날)"""
+    today = today or date.today()
+    this_month = today.replace(day=1)
+    last_month = (this_month - timedelta(days=1)).replace(day=1)
+    return min(last_month, today - timedelta(days=31))
+
+
+def _lock_watermark(cursor, source: str) -> Optional[Dict[str, Any]]:
+    cursor.execute("""
+        SELECT last_id, covered_from
+        FROM rollup_watermarks
+        WHERE source_table = %s
+        FOR UPDATE
+    """, (source,))
+    return cursor.fetchone()
+
+
+def _settled_max_id(cursor, source: str) -> int:
+    """
+    워터마크로 올려도 되는 마지막 id (ROLLUP_SETTLE_SECONDS보다 오래된 행 중 최대)
+
+    방금 커밋된 행보다 작은 id를 가진 트랜잭션이 아직 열려 있을 수 있으므로 MAX(id)까지
+    바로 올리지 않습니다. 최근 행은 PK 역순으로 몇 개만 건너뛰면 되므로 비용은 작습니다.
+    """
+    cursor.execute(f"""
+        SELECT COALESCE(MAX(id), 0) as max_id
+        FROM {source}
+        WHERE created_at < NOW() - INTERVAL %s SECOND
+    """, (ROLLUP_SETTLE_SECONDS,))
+    return cursor.fetchone()['max_id']
+
+
+def _rebuild_range(cursor, source: str, start: date, end: date, last_id: int) -> None:
+    """[start, end) 구간 롤업을 원본(id <= last_id)으로 다시 집계"""
+    spec = ROLLUP_SOURCES[source]
+    cursor.execute(
+        f"DELETE FROM {spec['target']} WHERE {spec['date_column']} >= %s AND {spec['date_column']} < %s",
+        (start, end)
+    )
+    cursor.execute(spec['rebuild'], (start, end, last_id))
+
+
+def roll_forward(source: str, batch_size: Optional[int] = None) -> int:
+    """
+    워터마크 이후 원본 행을 롤업에 누적
+
+    배치마다 워터마크 행을 잠그고(FOR UPDATE) 같은 트랜잭션에서 누적/워터마크
+    갱신을 커밋하므로, 동시에 두 번 실행되어도 중복 집계되지 않습니다.
+    워터마크는 _settled_max_id까지만 올라갑니다 (뒤로 가지는 않음).
+
+    Returns:
+        int: 처리한 id 범위 크기 (백필 전이면 0)
+    """
+    spec = ROLLUP_SOURCES[source]
+    batch_size = batch_size or ROLLUP_BATCH_SIZE
+    processed = 0
+
+    while True:
+        with db_cursor(commit=True) as cursor:
+            watermark = _lock_watermark(cursor, source)
+            if watermark is None or watermark['covered_from'] is None:
+                print(f"[Rollup] {source}: 백필 필요 (scripts/rollup_metrics.py --backfill YYYY-MM)")
+                return processed
+
+            last_id = watermark['last_id']
+            max_id = _settled_max_id(cursor, source)
+            hi = min(max_id, last_id + batch_size)
+
+            if hi > last_id:
+                cursor.execute(spec['append'], (last_id, hi))
+
+            # 새 행이 없어도 updated_at을 갱신해야 신선도 판단이 가능
+            cursor.execute("""
+                UPDATE rollup_watermarks
+                SET last_id = %s, updated_at = NOW()
+                WHERE source_table = %s
+            """, (max(hi, last_id), source))
+
+        processed += max(hi - last_id, 0)
+        if hi >= max_id:
+            break
+
+    if spec['refresh_days'] > 0:
+        today = date.today()
+        with db_cursor(commit=True) as cursor:
+            watermark = _lock_watermark(cursor, source)
+            start = today - timedelta(days=spec['refresh_days'] - 1)
+            _rebuild_range(cursor, source, start, today + timedelta(days=1), watermark['last_id'])
+
+    return processed
+
+
+def run_incremental(batch_size: Optional[int] = None) -> Dict[str, int]:
+    """모든 원본 증분 롤업 (cron 5분 주기)"""
+    results = {}
+    for source in ROLLUP_SOURCES:
+        try:
+            results[source] = roll_forward(source, batch_size)
+        except Exception as e:
+            print(f"[Rollup] {source} incremental failed: {e}")
+            results[source] = -1
+    return results
+
+
+def backfill(start_month: date, end_month: Optional[date] = None) -> Dict[str, int]:
+    """
+    과거 월 롤업 재집계
+
+    워터마크가 없으면 현재 MAX(id)로 초기화한 뒤 하루 단위 트랜잭션으로
+    [start_month, end_month 말일] 구간을 다시 집계합니다. 재집계 구간이
+    기존 커버 구간 또는 오늘과 이어질 때만 covered_from을 앞당깁니다.
+
+    Args:
+        start_month: 시작 월 1일
+        end_month: 마지막 월 1일 (기본 이번 달)
+
+    Returns:
+        Dict[str, int]: 원본별 재집계 일수
+    """
+    today = date.today()
+    end_month = end_month or today.replace(day=1)
+    end = min(_next_month(end_month), today + timedelta(days=1))
+    results = {}
+
+    for source in ROLLUP_SOURCES:
+        with db_cursor(commit=True) as cursor:
+            cursor.execute(f"""
+                INSERT IGNORE INTO rollup_watermarks (source_table, last_id)
+                SELECT %s, COALESCE(MAX(id), 0) FROM {source}
+            """, (source,))
+
+        day = start_month
+        days = 0
+        while day < end:
+            with db_cursor(commit=True) as cursor:
+                watermark = _lock_watermark(cursor, source)
+                _rebuild_range(cursor, source, day, day + timedelta(days=1), watermark['last_id'])
+            day += timedelta(days=1)
+            days += 1
+
+        with db_cursor(commit=True) as cursor:
+            watermark = _lock_watermark(cursor, source)
+            covered_from = watermark['covered_from']
+            contiguous = end > today or (covered_from is not None and covered_from <= end)
+
+            if not contiguous:
+                print(f"[Rollup] {source}: {start_month}~{end} 재집계 완료, "
+                      f"기존 커버 구간({covered_from})과 이어지지 않아 covered_from 유지")
+            elif covered_from is None or start_month < covered_from:
+                cursor.execute("""
+                    UPDATE rollup_watermarks
+                    SET covered_from = %s, updated_at = NOW()
+                    WHERE source_table = %s
+                """, (start_month, source))
+
+        results[source] = days
+
+    return results
+
+
+def refresh_compared_window(today: Optional[date] = None) -> Dict[str, int]:
+    """
+    지표가 비교하는 전체 구간 재집계 (cron 매일)
+
+    required_coverage_start가 속한 월 1일부터 오늘까지 모든 원본을 하루 단위로 다시
+    집계합니다. 증분의 최근 ROLLUP_REFRESH_DAYS일 재집계가 닿지 않는 오래된 soft delete와
+    플래그 수정, 워터마크가 지나간 뒤 들어온 과거 날짜 행을 반영해 전월 대비 카드가
+    원본 스캔과 다시 같아집니다.
+
+    Returns:
+        Dict[str, int]: 원본별 재집계 일수
+    """
+    return backfill(required_coverage_start(today).replace(day=1))
+
+
+def get_fresh_watermarks(cursor, max_lag_seconds: Optional[int] = None) -> Dict[str, int]:
+    """
+    지표 조회에 사용할 수 있는 롤업의 워터마크
+
+    최근 max_lag_seconds 안에 갱신되었고 지표에 필요한 기간을 모두 덮는
+    원본만 반환합니다. 롤업 테이블이 없으면(마이그레이션 전) 빈 dict.
+
+    Returns:
+        Dict[str, int]: {원본 테이블: last_id}
+    """
+    lag = max_lag_seconds if max_lag_seconds is not None else ROLLUP_MAX_LAG_SECONDS
+    try:
+        cursor.execute("""
+            SELECT source_table, last_id
+            FROM rollup_watermarks
+            WHERE covered_from IS NOT NULL
+            AND covered_from <= %s
+            AND updated_at >= NOW() - INTERVAL %s SECOND
+        """, (required_coverage_start(), lag))
+        return {row['source_table']: row['last_id'] for row in cursor.fetchall()}
+
+    except Exception as e:
+        print(f"[Rollup] Watermark lookup failed, using raw tables: {e}")
+        return {}
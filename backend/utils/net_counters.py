@@ -0,0 +1,128 @@
+"""
+커널 카운터 기반 TCP 연결 수 집계
+
+psutil.net_connections()는 소켓마다 namedtuple을 만들고(연결이 많으면 수만 개)
+다른 사용자 소켓을 보려면 root가 필요합니다. 이 모듈은 커널이 노출하는 값을
+한 줄씩 읽어 상수 메모리로 셉니다. (root 불필요)
+
+- 전체 ESTABLISHED 수: /proc/net/snmp 의 Tcp CurrEstab (IPv4/IPv6 합산 카운터)
+- 포트별 ESTABLISHED 수: /proc/net/tcp, /proc/net/tcp6 을 스트리밍하며 로컬 포트로 집계
+  (이 서버에서 대기 중인 서비스로 들어온 연결 = 서버 측 소켓만 셈)
+
+/proc이 없는 환경(macOS 등)에서는 None을 반환하므로 호출 측에서 psutil로 대체합니다.
+
+환경변수 (쉼표로 여러 포트 지정):
+    HEALTH_BACKEND_PORTS: Backend(Flask) 포트 (기본 3003)
+    HEALTH_MYSQL_PORTS: MySQL 포트 (기본 3306)
+    HEALTH_NGINX_PORTS: nginx 포트 (기본 80,443)
+
+사용 예시:
+    >>> from utils.net_counters import collect_connection_counts
+    >>> collect_connection_counts()
+    {'active_connections': 182, 'backend_connections': 12, 'mysql_connections': 9, 'nginx_connections': 140}
+"""
+
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+
+PROC_NET_SNMP = '/proc/net/snmp'
+PROC_NET_TCP = ('/proc/net/tcp', '/proc/net/tcp6')
+
+# /proc/net/tcp st 컬럼 (include/net/tcp_states.h)
+TCP_ESTABLISHED = '01'
+
+
+def _parse_ports(value: str) -> Tuple[int, ...]:
+    return tuple(int(port) for port in value.split(',') if port.strip())
+
+
+# 컬럼 이름 → 로컬 포트 목록 (system_health_logs.<name>_connections)
+PORT_GROUPS: Dict[str, Tuple[int, ...]] = {
+    'backend': _parse_ports(os.getenv('HEALTH_BACKEND_PORTS', '3003')),
+    'mysql': _parse_ports(os.getenv('HEALTH_MYSQL_PORTS', '3306')),
+    'nginx': _parse_ports(os.getenv('HEALTH_NGINX_PORTS', '80,443')),
+}
+
+PORT_COLUMNS = tuple(f"{name}_connections" for name in PORT_GROUPS)
+CONNECTION_COLUMNS = ('active_connections',) + PORT_COLUMNS
+
+
+def read_established_total(path: str = PROC_NET_SNMP) -> Optional[int]:
+    """
+    /proc/net/snmp 의 Tcp CurrEstab
+
+    Returns:
+        int: 현재 ESTABLISHED(+CLOSE_WAIT) 연결 수, 읽을 수 없으면 None
+    """
+    try:
+        with open(path) as f:
+            header = None
+            for line in f:
+                if not line.startswith('Tcp:'):
+                    continue
+                if header is None:
+                    header = line.split()
+                    continue
+                return int(line.split()[header.index('CurrEstab')])
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def count_established_by_port(
+    port_groups: Optional[Dict[str, Iterable[int]]] = None,
+    paths: Iterable[str] = PROC_NET_TCP
+) -> Optional[Dict[str, int]]:
+    """
+    /proc/net/tcp{,6} 의 ESTABLISHED 소켓을 로컬 포트 그룹별로 집계
+
+    Args:
+        port_groups: {이름: 포트 목록} (기본 PORT_GROUPS)
+        paths: 읽을 파일 목록 (없는 파일은 건너뜀, 예: IPv6 비활성)
+
+    Returns:
+        dict: {'<이름>_connections': int}, 읽을 수 있는 파일이 없으면 None
+    """
+    port_groups = PORT_GROUPS if port_groups is None else port_groups
+    port_to_column = {
+        port: f"{name}_connections"
+        for name, ports in port_groups.items()
+        for port in ports
+    }
+    counts = {f"{name}_connections": 0 for name in port_groups}
+
+    readable = False
+    for path in paths:
+        try:
+            f = open(path)
+        except OSError:
+            continue
+
+        readable = True
+        with f:
+            next(f, None)  # 헤더
+            for line in f:
+                # sl local_address rem_address st ...
+                fields = line.split(None, 4)
+                if len(fields) < 4 or fields[3] != TCP_ESTABLISHED:
+                    continue
+                column = port_to_column.get(int(fields[1].rsplit(':', 1)[1], 16))
+                if column is not None:
+                    counts[column] += 1
+
+    return counts if readable else None
+
+
+def collect_connection_counts() -> Optional[Dict[str, int]]:
+    """
+    전체 + 포트별 ESTABLISHED 연결 수
+
+    Returns:
+        dict: CONNECTION_COLUMNS 키, /proc을 읽을 수 없으면 None
+    """
+    total = read_established_total()
+    by_port = count_established_by_port()
+    if total is None or by_port is None:
+        return None
+    return {'active_connections': total, **by_port}
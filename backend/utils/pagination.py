@@ -0,0 +1,128 @@
+"""
+Keyset(커서) 페이지네이션 유틸리티
+
+OFFSET 대신 "마지막으로 본 행의 정렬 키 + id"를 불투명 커서로 넘겨받아
+다음 페이지를 WHERE 조건으로 이어 읽습니다. 깊은 페이지도 첫 페이지와
+같은 비용으로 조회됩니다.
+
+커서 형식:
+    base64url(JSON {"k": 정렬 키 값, "id": 마지막 행 id}) - 클라이언트는 해석하지 않음
+
+사용 예시:
+    >>> from utils.pagination import get_page_params, keyset_clause, build_page
+    >>> limit, page_cursor = get_page_params()
+    >>> clause, params = keyset_clause('t.inactive_days', page_cursor, descending=True)
+    >>> cursor.execute(f"SELECT ... WHERE {clause} ORDER BY ... LIMIT %s", params + [limit + 1])
+    >>> rows, next_cursor, has_more = build_page(cursor.fetchall(), limit, 'inactive_days')
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PaginationError(ValueError):
+    """잘못된 커서/페이지 크기 (400 응답용)"""
+
+
+def encode_cursor(key: Any, row_id: int) -> str:
+    """정렬 키 값 + id → 불투명 커서"""
+    if isinstance(key, (datetime, date)):
+        key = key.isoformat(sep=' ') if isinstance(key, datetime) else key.isoformat()
+    payload = json.dumps({'k': key, 'id': row_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    커서 해석
+
+    Returns:
+        dict: {'k': 정렬 키 값, 'id': int} 또는 None (첫 페이지)
+
+    Raises:
+        PaginationError: 형식이 잘못된 커서
+    """
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return {'k': data['k'], 'id': int(data['id'])}
+    except (ValueError, KeyError, TypeError) as e:
+        raise PaginationError(f"invalid cursor: {token}") from e
+
+
+def parse_page_params(args, default_limit: int = DEFAULT_PAGE_SIZE) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    요청 인자에서 limit / cursor 추출
+
+    Args:
+        args: request.args (get 메서드가 있는 매핑)
+        default_limit: limit 미지정 시 페이지 크기
+
+    Returns:
+        tuple: (limit, 해석된 커서 또는 None)
+    """
+    raw_limit = args.get('limit')
+    try:
+        limit = int(raw_limit) if raw_limit else default_limit
+    except ValueError:
+        raise PaginationError(f"invalid limit: {raw_limit}")
+    if limit < 1:
+        raise PaginationError(f"invalid limit: {raw_limit}")
+
+    return min(limit, MAX_PAGE_SIZE), decode_cursor(args.get('cursor'))
+
+
+def get_page_params(default_limit: int = DEFAULT_PAGE_SIZE) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """현재 Flask 요청의 limit / cursor"""
+    from flask import request
+    return parse_page_params(request.args, default_limit)
+
+
+def keyset_clause(
+    key_column: str,
+    cursor: Optional[Dict[str, Any]],
+    descending: bool = True,
+    id_column: str = 'id'
+) -> Tuple[str, List[Any]]:
+    """
+    커서 이후 행만 남기는 WHERE 조건
+
+    정렬은 (key_column DESC|ASC, id_column ASC) 기준입니다.
+
+    Returns:
+        tuple: (SQL 조건, 바인드 파라미터 목록). 커서가 없으면 ('1 = 1', [])
+    """
+    if cursor is None:
+        return '1 = 1', []
+
+    op = '<' if descending else '>'
+    clause = f"({key_column} {op} %s OR ({key_column} = %s AND {id_column} > %s))"
+    return clause, [cursor['k'], cursor['k'], cursor['id']]
+
+
+def order_clause(key_column: str, descending: bool = True, id_column: str = 'id') -> str:
+    """keyset_clause와 짝이 되는 ORDER BY"""
+    return f"{key_column} {'DESC' if descending else 'ASC'}, {id_column} ASC"
+
+
+def build_page(rows: List[Dict[str, Any]], limit: int, key_field: str, id_field: str = 'id') -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+    """
+    limit + 1개 조회 결과로 페이지 구성
+
+    Returns:
+        tuple: (페이지 행, 다음 커서 또는 None, 다음 페이지 존재 여부)
+    """
+    has_more = len(rows) > limit
+    page = rows[:limit]
+    next_cursor = None
+    if has_more and page:
+        last = page[-1]
+        next_cursor = encode_cursor(last[key_field], last[id_field])
+    return page, next_cursor, has_more
@@ -0,0 +1,244 @@
+"""
+월별 RANGE 파티션 관리
+
+migrations/010에서 월별로 파티셔닝한 테이블(activity_logs)의 파티션을 유지합니다.
+
+- 이번 달부터 future_months개월 뒤까지 p<YYYYMM> 파티션을 미리 생성
+  (p_future(MAXVALUE)를 REORGANIZE로 쪼개므로, 작업이 며칠 밀려 p_future에
+  들어간 행도 해당 달 파티션으로 옮겨짐)
+- 보관 기간(retention_months)이 지난 달의 파티션은 DELETE 없이 파티션 단위로 처리
+    archive: EXCHANGE PARTITION으로 <table>_archive_<YYYYMM> 테이블로 옮긴 뒤 파티션 삭제
+    drop: 파티션 삭제 (데이터 삭제)
+
+보관 기간이 지난 달은 원본에서 빠지므로 롤업 backfill은 그 이전 달을 다시 계산할 수
+없고, 학원 통계 보정의 공유 수는 보관 기간 안의 원본 기준이 됩니다
+(일별 롤업 행과 academy_stats의 첫 공유/마지막 활동 시각은 유지).
+
+환경변수:
+    ACTIVITY_LOG_RETENTION_MONTHS: activity_logs 보관 개월 수 (기본 24, 이번 달 제외)
+    PARTITION_FUTURE_MONTHS: 미리 만들어 둘 미래 파티션 개월 수 (기본 3)
+    PARTITION_RETENTION_MODE: archive / drop (기본 archive)
+
+사용 예시:
+    >>> from utils.partition_manager import run_maintenance
+    >>> run_maintenance()
+    {'activity_logs': {'created': ['p202611'], 'archived': ['p202409'], 'dropped': []}}
+"""
+
+import os
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+from utils.db_pool import db_cursor
+
+
+PARTITION_FUTURE_MONTHS = int(os.getenv('PARTITION_FUTURE_MONTHS', '3'))
+PARTITION_RETENTION_MODE = os.getenv('PARTITION_RETENTION_MODE', 'archive')
+
+# 관리 대상 테이블 → 보관 개월 수 (파티션 키는 모두 UNIX_TIMESTAMP(created_at))
+PARTITIONED_TABLES: Dict[str, int] = {
+    'activity_logs': int(os.getenv('ACTIVITY_LOG_RETENTION_MONTHS', '24')),
+}
+
+FUTURE_PARTITION = 'p_future'
+RETENTION_MODES = ('archive', 'drop')
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    """d가 속한 달의 1일에서 months개월 이동"""
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """월 → 파티션 이름 (p202501)"""
+    return f"p{month:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """파티션 이름 → 월 (p_future 등 월 파티션이 아니면 None)"""
+    if len(name) != 7 or not name.startswith('p') or not name[1:].isdigit():
+        return None
+    year, month = int(name[1:5]), int(name[5:7])
+    if not 1 <= month <= 12:
+        return None
+    return date(year, month, 1)
+
+
+def plan_partitions(
+    existing: Sequence[str],
+    today: date,
+    future_months: int = PARTITION_FUTURE_MONTHS,
+    retention_months: Optional[int] = None
+) -> Dict[str, List[date]]:
+    """
+    현재 파티션 목록 → 만들 달 / 보관 기간이 지난 달
+
+    Args:
+        existing: 현재 파티션 이름 (p_future 포함 가능)
+        today: 기준일
+        future_months: 이번 달 이후 미리 만들 개월 수
+        retention_months: 이번 달 이전에 남길 개월 수 (None이면 만료 없음)
+
+    Returns:
+        dict: {'create': [월, ...], 'expire': [월, ...]} (오름차순)
+    """
+    months = sorted(m for m in (partition_month(name) for name in existing) if m is not None)
+    current = month_start(today)
+
+    # 마지막 월 파티션 다음 달부터만 생성 (REORGANIZE p_future는 맨 뒤에만 추가 가능)
+    first_new = add_months(months[-1], 1) if months else current
+    create = []
+    month = first_new
+    while month <= add_months(current, future_months):
+        create.append(month)
+        month = add_months(month, 1)
+
+    expire = []
+    if retention_months is not None:
+        cutoff = add_months(current, -retention_months)
+        expire = [m for m in months if m < cutoff]
+
+    return {'create': create, 'expire': expire}
+
+
+def _boundary(month: date) -> str:
+    """month 파티션의 상한 (다음 달 1일 0시, 세션 time_zone 기준)"""
+    return f"UNIX_TIMESTAMP('{add_months(month, 1):%Y-%m-%d} 00:00:00')"
+
+
+def list_partitions(cursor, table: str) -> List[str]:
+    """파티션 이름 목록 (정의 순서, 파티셔닝되지 않았으면 빈 목록)"""
+    cursor.execute("""
+        SELECT PARTITION_NAME as name
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = %s
+        AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """, (table,))
+    return [row['name'] for row in cursor.fetchall()]
+
+
+def create_partitions(cursor, table: str, months: Sequence[date]) -> None:
+    """p_future를 쪼개 months 파티션 추가"""
+    if not months:
+        return
+    definitions = ', '.join(
+        f"PARTITION {partition_name(m)} VALUES LESS THAN ({_boundary(m)})" for m in months
+    )
+    cursor.execute(
+        f"ALTER TABLE {table} REORGANIZE PARTITION {FUTURE_PARTITION} INTO "
+        f"({definitions}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE)"
+    )
+
+
+def _table_exists(cursor, table: str) -> bool:
+    cursor.execute("""
+        SELECT COUNT(*) as count
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = %s
+    """, (table,))
+    return cursor.fetchone()['count'] > 0
+
+
+def _partition_has_rows(cursor, table: str, partition: str) -> bool:
+    cursor.execute(f"SELECT 1 as found FROM {table} PARTITION ({partition}) LIMIT 1")
+    return cursor.fetchone() is not None
+
+
+def archive_partition(cursor, table: str, month: date) -> str:
+    """
+    month 파티션을 <table>_archive_<YYYYMM>으로 옮긴 뒤 파티션 삭제
+
+    이전 실행이 EXCHANGE 후 DROP 전에 중단됐다면 (보관 테이블 존재 + 파티션 비어 있음)
+    파티션만 삭제합니다. 보관 테이블과 파티션 모두에 행이 있으면 덮어쓰지 않고 실패합니다.
+
+    Returns:
+        str: 보관 테이블 이름
+    """
+    partition = partition_name(month)
+    archive = f"{table}_archive_{month:%Y%m}"
+
+    if not _table_exists(cursor, archive):
+        cursor.execute(f"CREATE TABLE {archive} LIKE {table}")
+        cursor.execute(f"ALTER TABLE {archive} REMOVE PARTITIONING")
+        cursor.execute(f"ALTER TABLE {table} EXCHANGE PARTITION {partition} WITH TABLE {archive}")
+    elif _partition_has_rows(cursor, table, partition):
+        raise RuntimeError(f"{archive} already exists and {table} partition {partition} is not empty")
+
+    cursor.execute(f"ALTER TABLE {table} DROP PARTITION {partition}")
+    return archive
+
+
+def drop_partition(cursor, table: str, month: date) -> None:
+    """month 파티션 삭제 (데이터 삭제)"""
+    cursor.execute(f"ALTER TABLE {table} DROP PARTITION {partition_name(month)}")
+
+
+def maintain_table(
+    cursor,
+    table: str,
+    retention_months: Optional[int],
+    today: Optional[date] = None,
+    future_months: int = PARTITION_FUTURE_MONTHS,
+    mode: str = PARTITION_RETENTION_MODE
+) -> Dict[str, List[str]]:
+    """
+    테이블 하나의 파티션 생성/만료 처리
+
+    Returns:
+        dict: {'created': [...], 'archived': [...], 'dropped': [...]} (파티션 이름)
+    """
+    if mode not in RETENTION_MODES:
+        raise ValueError(f"Unknown retention mode: {mode}")
+
+    existing = list_partitions(cursor, table)
+    if FUTURE_PARTITION not in existing:
+        raise RuntimeError(f"{table} is not partitioned by migration 010 (no {FUTURE_PARTITION})")
+
+    plan = plan_partitions(existing, today or date.today(), future_months, retention_months)
+    result: Dict[str, List[str]] = {'created': [], 'archived': [], 'dropped': []}
+
+    create_partitions(cursor, table, plan['create'])
+    result['created'] = [partition_name(m) for m in plan['create']]
+
+    for month in plan['expire']:
+        if mode == 'archive':
+            archive_partition(cursor, table, month)
+            result['archived'].append(partition_name(month))
+        else:
+            drop_partition(cursor, table, month)
+            result['dropped'].append(partition_name(month))
+
+    return result
+
+
+def run_maintenance(
+    today: Optional[date] = None,
+    mode: Optional[str] = None,
+    tables: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    관리 대상 테이블 전체 파티션 유지 (테이블별 실패는 기록 후 다음 테이블 진행)
+
+    Returns:
+        dict: {테이블: maintain_table 결과 또는 {'error': str}}
+    """
+    results: Dict[str, Any] = {}
+    for table, retention_months in (tables or PARTITIONED_TABLES).items():
+        try:
+            with db_cursor(commit=True) as cursor:
+                results[table] = maintain_table(
+                    cursor, table, retention_months, today,
+                    mode=mode or PARTITION_RETENTION_MODE
+                )
+        except Exception as e:
+            print(f"[PartitionManager] {table} maintenance failed: {e}")
+            results[table] = {'error': str(e)}
+    return results
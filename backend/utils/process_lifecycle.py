@@ -0,0 +1,242 @@
+"""
+프로세스 생명주기 기록 (process_lifecycle_events)
+
+Backend와 헬스체크 데몬이 시작/정상 종료할 때 한 행씩 기록합니다 (migrations/009).
+재시작 횟수는 system_health_logs의 샘플 간격(LAG)으로 추정하던 방식 대신
+이 테이블의 (process_name, event_type, created_at) 인덱스 범위 COUNT로 계산하고,
+uptime은 마지막 start 이후 경과 시간으로 계산합니다.
+
+한 프로세스 시작 = start 1건이며, Backend는 요청을 처리하는 워커 프로세스마다
+fork 이후에 기록합니다 (gunicorn post_fork 훅 또는 첫 요청 - install_start_hook).
+--preload로 앱을 import하는 master는 기록하지 않습니다.
+
+재시작 횟수는 start 행 수가 아니라 재시작 이벤트 수입니다. 같은 호스트의 직전 start와
+RESTART_EVENT_WINDOW_SECONDS 이내로 이어진 start들은 한 번의 재시작(배포, 서비스 재시작)으로
+묶고(고정 분 단위 구간이 아니라 간격 기준), 워커 하나만 다시 뜬 경우(크래시 후 재생성)도 1건입니다.
+
+환경변수:
+    APP_VERSION: 기록할 버전 (없으면 git short SHA, 그것도 없으면 NULL)
+    RESTART_EVENT_WINDOW_SECONDS: 한 재시작으로 묶는 같은 호스트 start 간 최대 간격 (초, 기본 60)
+
+사용 예시:
+    >>> # gunicorn.conf.py
+    >>> from utils.process_lifecycle import post_fork
+    >>> # Flask 앱 (gunicorn 외 실행 방식 포함, 워커당 첫 요청에서 1회)
+    >>> install_start_hook(app, 'backend')
+"""
+
+import atexit
+import os
+import socket
+import subprocess
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from utils.db_pool import db_cursor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RESTART_EVENT_WINDOW_SECONDS = int(os.getenv('RESTART_EVENT_WINDOW_SECONDS', '60'))
+
+# /proc을 읽을 수 없을 때의 프로세스 시작 시각 대용 (모듈 import 시각)
+_IMPORTED_AT = datetime.now()
+
+_recorded = set()
+
+
+def get_boot_time(stat_path: str = '/proc/stat') -> Optional[datetime]:
+    """서버 부팅 시각 (/proc/stat btime, 읽을 수 없으면 None)"""
+    try:
+        with open(stat_path) as f:
+            for line in f:
+                if line.startswith('btime '):
+                    return datetime.fromtimestamp(int(line.split()[1]))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def get_process_start_time(
+    self_stat_path: str = '/proc/self/stat',
+    boot_time: Optional[datetime] = None
+) -> datetime:
+    """
+    현재 프로세스 시작 시각
+
+    /proc/self/stat의 starttime(부팅 후 clock tick)으로 계산하며,
+    읽을 수 없으면 이 모듈을 import한 시각을 사용합니다.
+    """
+    boot_time = boot_time or get_boot_time()
+    try:
+        with open(self_stat_path) as f:
+            stat = f.read()
+        # comm(2번째 필드)에 공백/괄호가 올 수 있으므로 마지막 ')' 이후부터 셈 (3번째 필드 = index 0)
+        start_ticks = int(stat.rsplit(')', 1)[1].split()[19])
+        if boot_time is not None:
+            return boot_time + timedelta(seconds=start_ticks / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        pass
+    return _IMPORTED_AT
+
+
+def get_version() -> Optional[str]:
+    """APP_VERSION 또는 git short SHA"""
+    version = os.getenv('APP_VERSION')
+    if version:
+        return version[:64]
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=2
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _insert_event(process_name: str, event_type: str, started_at: datetime,
+                  boot_time: Optional[datetime], version: Optional[str]) -> None:
+    with db_cursor(dictionary=False, commit=True) as cursor:
+        cursor.execute("""
+            INSERT INTO process_lifecycle_events
+            (process_name, event_type, hostname, pid, started_at, boot_time, version)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, (process_name, event_type, socket.gethostname()[:100], os.getpid(), started_at, boot_time, version))
+
+
+def record_process_start(process_name: str = 'backend', record_stop: bool = True) -> bool:
+    """
+    현재 프로세스 시작 기록 (같은 프로세스에서 여러 번 호출해도 1회만 기록)
+
+    Args:
+        process_name: 'backend' / 'health_daemon' 등
+        record_stop: True면 정상 종료(atexit) 시 stop 이벤트도 기록
+
+    Returns:
+        bool: 기록했으면 True (이미 기록했거나 실패하면 False, 예외는 던지지 않음)
+    """
+    key = (process_name, os.getpid())
+    if key in _recorded:
+        return False
+    _recorded.add(key)
+
+    boot_time = get_boot_time()
+    started_at = get_process_start_time(boot_time=boot_time)
+    version = get_version()
+
+    try:
+        _insert_event(process_name, 'start', started_at, boot_time, version)
+    except Exception as e:
+        print(f"[ProcessLifecycle] Failed to record {process_name} start: {e}")
+        return False
+
+    if record_stop:
+        atexit.register(_record_stop, process_name, os.getpid(), started_at, boot_time, version)
+    return True
+
+
+def post_fork(server, worker) -> None:
+    """gunicorn post_fork 훅: 워커 프로세스 시작 기록 (gunicorn.conf.py에서 import)"""
+    record_process_start('backend')
+
+
+def install_start_hook(app, process_name: str = 'backend') -> None:
+    """
+    워커 프로세스마다 첫 요청에서 시작 기록 (fork 이후 실행이 보장되는 지점)
+
+    post_fork 훅을 설정하지 않은 실행 방식(개발 서버 등)에서도 기록되며,
+    post_fork로 이미 기록한 워커에서는 아무것도 하지 않습니다.
+    """
+    def record_start():
+        # before_request 함수가 값을 반환하면 응답으로 처리되므로 None 반환
+        record_process_start(process_name)
+
+    app.before_request(record_start)
+
+
+def _record_stop(process_name: str, pid: int, started_at: datetime,
+                 boot_time: Optional[datetime], version: Optional[str]) -> None:
+    """atexit: 정상 종료 기록 (fork된 자식 프로세스의 종료는 기록하지 않음)"""
+    if os.getpid() != pid:
+        return
+    try:
+        _insert_event(process_name, 'stop', started_at, boot_time, version)
+    except Exception as e:
+        print(f"[ProcessLifecycle] Failed to record {process_name} stop: {e}")
+
+
+def count_restart_events(starts: Iterable[Dict[str, Any]], window_seconds: Optional[int] = None) -> int:
+    """
+    start 행 → 재시작 이벤트 수
+
+    같은 호스트의 직전 start보다 window_seconds를 넘게 늦은 start(또는 호스트의 첫 start)만
+    새 이벤트로 셉니다. 배포로 워커 8개가 :59초와 :01초에 걸쳐 떠도 1건입니다.
+
+    Args:
+        starts: hostname / started_at 키를 가진 dict
+        window_seconds: 한 이벤트로 묶는 최대 간격 (기본 RESTART_EVENT_WINDOW_SECONDS)
+    """
+    window = timedelta(seconds=RESTART_EVENT_WINDOW_SECONDS if window_seconds is None else window_seconds)
+    previous: Dict[Any, datetime] = {}
+    events = 0
+    for row in sorted(starts, key=lambda r: (str(r['hostname']), r['started_at'])):
+        last = previous.get(row['hostname'])
+        if last is None or row['started_at'] - last > window:
+            events += 1
+        previous[row['hostname']] = row['started_at']
+    return events
+
+
+def count_restarts(cursor, hours: int, process_name: str = 'backend') -> int:
+    """
+    최근 hours시간 재시작 이벤트 수 (count_restart_events)
+
+    (process_name, event_type, created_at) 인덱스 범위의 start 행만 읽습니다
+    (일주일에 워커 수 × 재시작 수 정도).
+    """
+    cursor.execute("""
+        SELECT hostname, started_at
+        FROM process_lifecycle_events
+        WHERE process_name = %s
+        AND event_type = 'start'
+        AND created_at >= NOW() - INTERVAL %s HOUR
+    """, (process_name, hours))
+    return count_restart_events(cursor.fetchall())
+
+
+def get_last_start(cursor, process_name: str = 'backend') -> Optional[datetime]:
+    """마지막 start의 프로세스 시작 시각 (기록이 없으면 None)"""
+    cursor.execute("""
+        SELECT MAX(started_at) as last_started_at
+        FROM process_lifecycle_events
+        WHERE process_name = %s
+        AND event_type = 'start'
+    """, (process_name,))
+    row = cursor.fetchone()
+    return (row or {}).get('last_started_at')
+
+
+def get_restart_stats(cursor, hours: int, process_name: str = 'backend') -> Dict[str, Any]:
+    """
+    최근 hours시간 재시작 이벤트 수 + 마지막 시작 시각
+
+    Returns:
+        dict: {'restart_count': int, 'last_started_at': datetime or None}
+    """
+    return {
+        'restart_count': count_restarts(cursor, hours, process_name),
+        'last_started_at': get_last_start(cursor, process_name),
+    }
+
+
+def uptime_hours(last_started_at: Optional[datetime], now: Optional[datetime] = None) -> float:
+    """
+    마지막 시작 이후 경과 시간 (시간, 소수 1자리)
+
+    기록이 없으면 현재 프로세스 시작 시각 기준
+    """
+    now = now or datetime.now()
+    started = last_started_at or get_process_start_time()
+    return round(max(0.0, (now - started).total_seconds()) / 3600, 1)
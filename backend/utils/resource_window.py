@@ -0,0 +1,116 @@
+"""
+시스템 리소스 윈도우 평가
+
+system_health_aggregates의 최근 N분 1분 집계(utils/health_aggregates.py)를
+한 번의 쿼리로 읽어 CPU/RAM/Disk의 평균/p95/최대값을 계산합니다. 1분 집계는
+샘플링 주기와 무관하게 N행이라 원본 샘플을 훑지 않습니다. 평균은 샘플 수 가중,
+p95는 버킷별 p95 중 최대값(근사)입니다.
+
+집계가 아직 없으면 (마이그레이션 직후) system_health_logs 원본 샘플로 계산합니다.
+
+결과는 1분 동안 캐시되어 CPU/RAM/Disk Alert 체크(utils/alert_checker.py,
+routes/admin/alerts.py)와 system-health 카드(routes/admin/metrics.py)가 함께
+사용합니다. 새 집계는 1분마다 한 번만 들어오므로 그 사이에 다시 조회해도 결과가 같습니다.
+
+사용 예시:
+    >>> from utils.resource_window import get_resource_window
+    >>> window = get_resource_window()
+    >>> window['cpu']['avg'], window['cpu']['p95'], window['samples']
+    (42.1, 63.0, 5)
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+from utils.db_pool import db_cursor
+from utils.health_aggregates import merge_buckets
+from utils.result_cache import create_result_cache
+
+
+RESOURCE_WINDOW_MINUTES = 5
+RESOURCE_CACHE_TTL = 60
+
+RESOURCES = ('cpu', 'ram', 'disk')
+
+resource_cache = create_result_cache('resources')
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_samples(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    샘플 행 → 리소스별 avg/p95/max
+
+    Args:
+        rows: cpu_usage / ram_usage / disk_usage 키를 가진 행
+
+    Returns:
+        dict: {'cpu': {'avg', 'p95', 'max'}, 'ram': {...}, 'disk': {...}, 'samples': int}
+              샘플이 없으면 값은 None
+    """
+    summary: Dict[str, Any] = {'samples': len(rows)}
+    for resource in RESOURCES:
+        values = [float(r[f"{resource}_usage"]) for r in rows if r[f"{resource}_usage"] is not None]
+        summary[resource] = {
+            'avg': sum(values) / len(values) if values else None,
+            'p95': _percentile(values, 95),
+            'max': max(values) if values else None,
+        }
+    return summary
+
+
+def _fetch_window(cursor, minutes: int) -> Dict[str, Any]:
+    cursor.execute("""
+        SELECT samples, cpu_avg, cpu_max, cpu_p95, ram_avg, ram_max, ram_p95, disk_avg, disk_max, disk_p95
+        FROM system_health_aggregates
+        WHERE resolution = '1m'
+        AND bucket_start >= NOW() - INTERVAL %s MINUTE
+    """, (minutes,))
+    summary = merge_buckets(cursor.fetchall())
+
+    if not summary['samples']:
+        cursor.execute("""
+            SELECT cpu_usage, ram_usage, disk_usage
+            FROM system_health_logs
+            WHERE created_at >= NOW() - INTERVAL %s MINUTE
+        """, (minutes,))
+        summary = summarize_samples(cursor.fetchall())
+
+    summary['window_minutes'] = minutes
+    return summary
+
+
+def get_resource_window(cursor=None, minutes: int = RESOURCE_WINDOW_MINUTES, refresh: bool = False) -> Dict[str, Any]:
+    """
+    최근 minutes분 리소스 요약 (1분 캐시)
+
+    Args:
+        cursor: 이미 가진 dictionary 커서 (없으면 miss일 때만 풀에서 연결을 빌림)
+        minutes: 윈도우 길이 (분)
+        refresh: True면 캐시 무시
+
+    Returns:
+        dict: summarize_samples 결과 + window_minutes
+    """
+    def compute():
+        if cursor is not None:
+            return _fetch_window(cursor, minutes)
+        with db_cursor() as own_cursor:
+            return _fetch_window(own_cursor, minutes)
+
+    key = f"window:{minutes}m"
+    if refresh:
+        resource_cache.invalidate(key)
+    return resource_cache.get_or_compute(key, compute, ttl=RESOURCE_CACHE_TTL)
+
+
+def get_resource_average(resource: str) -> float:
+    """리소스 평균 사용률 (샘플이 없으면 0) - Alert 체크용"""
+    return get_resource_window()[resource]['avg'] or 0
@@ -0,0 +1,326 @@
+"""
+TTL 결과 캐시 (single-flight + stale-while-revalidate)
+
+느리게 변하는 집계 결과를 키별 TTL 동안 재사용합니다.
+
+- 같은 키의 동시 miss는 한 번만 계산하고 나머지는 결과를 기다림 (single-flight)
+- TTL이 지난 값도 stale_ttl 이내면 즉시 응답하고 백그라운드에서 갱신
+- 백엔드 교체 가능: 프로세스 메모리(기본) 또는 Redis (gunicorn 워커 간 공유)
+- 저장 시점에 값의 버전(utils.http_cache.payload_version)을 함께 저장 - 폴링 응답의 ETag로 사용
+
+사용 예시:
+    >>> from utils.result_cache import ResultCache
+    >>> cache = ResultCache(namespace='metrics')
+    >>> data = cache.get_or_compute('academy-status', compute_fn, ttl=300, stale_ttl=600)
+    >>> entry = cache.get_or_compute_entry('academy-status', compute_fn, ttl=300)
+    >>> entry['version'], entry['stored_at']
+    >>> cache.stats()
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from utils.http_cache import payload_version
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class MemoryCacheBackend:
+    """프로세스 메모리 백엔드 (워커별 독립)"""
+
+    def __init__(self):
+        self._data: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            entry, expires_at = item
+            if time.time() >= expires_at:
+                del self._data[key]
+                return None
+            return entry
+
+    def set(self, key: str, entry: Dict[str, Any], expire_seconds: float) -> None:
+        with self._lock:
+            self._data[key] = (entry, time.time() + expire_seconds)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def acquire_lock(self, key: str, expire_seconds: float) -> Optional[str]:
+        # 프로세스 내부 single-flight로 충분
+        return 'local'
+
+    def release_lock(self, key: str, token: str) -> None:
+        pass
+
+
+class RedisCacheBackend:
+    """Redis 백엔드 (여러 gunicorn 워커가 결과와 계산 락을 공유)"""
+
+    def __init__(self, url: Optional[str] = None):
+        if redis is None:
+            raise RuntimeError("redis 패키지 필요: pip3 install redis")
+        self.client = redis.Redis.from_url(url or os.getenv('REDIS_URL', 'redis://localhost:6379/0'))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, entry: Dict[str, Any], expire_seconds: float) -> None:
+        self.client.set(key, json.dumps(entry, default=str), ex=max(1, int(expire_seconds)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def acquire_lock(self, key: str, expire_seconds: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        if self.client.set(f"{key}:lock", token, nx=True, ex=max(1, int(expire_seconds))):
+            return token
+        return None
+
+    def release_lock(self, key: str, token: str) -> None:
+        lock_key = f"{key}:lock"
+        if self.client.get(lock_key) == token.encode():
+            self.client.delete(lock_key)
+
+
+class _Flight:
+    """진행 중인 계산 (같은 키의 동시 요청이 캐시 항목을 공유)"""
+
+    __slots__ = ('event', 'entry', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.entry: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class ResultCache:
+    """
+    TTL 결과 캐시
+
+    Args:
+        backend: MemoryCacheBackend 또는 RedisCacheBackend (기본 메모리)
+        namespace: 키 접두어
+        lock_timeout: 다른 워커가 계산 중일 때 결과를 기다리는 최대 시간 (초)
+        clock: 현재 시각 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        namespace: str = 'cache',
+        lock_timeout: float = 10.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self.backend = backend or MemoryCacheBackend()
+        self.namespace = namespace
+        self.lock_timeout = lock_timeout
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._refreshing: set = set()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _count(self, key: str, name: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(key, {
+                'hits': 0, 'stale_hits': 0, 'misses': 0,
+                'coalesced': 0, 'refreshes': 0, 'errors': 0,
+            })
+            counters[name] += 1
+
+    def _store(self, key: str, value: Any, ttl: float, stale_ttl: float) -> Dict[str, Any]:
+        entry = {'value': value, 'stored_at': self._clock(), 'version': payload_version(value)}
+        self.backend.set(self._key(key), entry, ttl + stale_ttl)
+        return entry
+
+    def peek(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 조회 (카운터 변경 없음). {'value', 'stored_at', 'version'} 또는 None"""
+        return self.backend.get(self._key(key))
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: float,
+        stale_ttl: float = 0,
+        refresh: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        """
+        캐시된 값 반환, 없으면 계산 후 저장
+
+        Args:
+            key: 캐시 키
+            compute: 값을 계산하는 함수 (miss 시 호출)
+            ttl: 신선한 값으로 간주하는 시간 (초)
+            stale_ttl: TTL 만료 후 이전 값을 응답하며 백그라운드 갱신하는 시간 (초)
+            refresh: 백그라운드 갱신용 함수 (기본 compute). compute가 요청 범위
+                     자원(커서 등)에 의존할 때 독립적으로 실행 가능한 함수를 전달
+
+        Returns:
+            계산 결과 (compute 예외는 그대로 전파)
+        """
+        return self.get_or_compute_entry(key, compute, ttl, stale_ttl, refresh)['value']
+
+    def get_or_compute_entry(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: float,
+        stale_ttl: float = 0,
+        refresh: Optional[Callable[[], Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        get_or_compute와 같지만 캐시 항목 {'value', 'stored_at', 'version'}을 반환
+
+        조건부 응답(ETag)과 남은 TTL(max-age)을 값 직렬화 없이 계산할 때 사용합니다.
+        """
+        entry = self.backend.get(self._key(key))
+        if entry is not None:
+            if 'version' not in entry:
+                # 버전 없이 저장된 항목 (이전 배포의 Redis 항목)
+                entry['version'] = payload_version(entry['value'])
+            age = self._clock() - entry['stored_at']
+            if age < ttl:
+                self._count(key, 'hits')
+                return entry
+            if age < ttl + stale_ttl:
+                self._count(key, 'stale_hits')
+                self._refresh_in_background(key, refresh or compute, ttl, stale_ttl)
+                return entry
+
+        self._count(key, 'misses')
+        return self._compute_once(key, compute, ttl, stale_ttl)
+
+    def _compute_once(self, key: str, compute: Callable[[], Any], ttl: float, stale_ttl: float) -> Dict[str, Any]:
+        """같은 키의 동시 계산을 하나로 합침"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            self._count(key, 'coalesced')
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.entry
+
+        try:
+            flight.entry = self._compute_shared(key, compute, ttl, stale_ttl)
+            return flight.entry
+        except BaseException as e:
+            flight.error = e
+            self._count(key, 'errors')
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def _compute_shared(self, key: str, compute: Callable[[], Any], ttl: float, stale_ttl: float) -> Dict[str, Any]:
+        """백엔드 락으로 워커 간 중복 계산 방지 후 계산/저장"""
+        full_key = self._key(key)
+        token = self.backend.acquire_lock(full_key, self.lock_timeout)
+
+        if token is None:
+            # 다른 워커가 계산 중 - 결과가 저장될 때까지 대기
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = self.backend.get(full_key)
+                if entry is not None and self._clock() - entry['stored_at'] < ttl:
+                    self._count(key, 'coalesced')
+                    entry.setdefault('version', payload_version(entry['value']))
+                    return entry
+            # 대기 초과 - 직접 계산
+
+        try:
+            return self._store(key, compute(), ttl, stale_ttl)
+        finally:
+            if token is not None:
+                self.backend.release_lock(full_key, token)
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Any], ttl: float, stale_ttl: float) -> None:
+        with self._lock:
+            if key in self._refreshing or key in self._flights:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._count(key, 'refreshes')
+                self._compute_once(key, compute, ttl, stale_ttl)
+            except Exception as e:
+                print(f"[ResultCache] Background refresh failed for {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"cache-refresh-{key}", daemon=True).start()
+
+    def invalidate(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        self.backend.delete(self._key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        """키별 hit/miss 카운터와 합계"""
+        with self._lock:
+            per_key = {k: dict(v) for k, v in self._counters.items()}
+
+        totals: Dict[str, int] = {}
+        for counters in per_key.values():
+            for name, value in counters.items():
+                totals[name] = totals.get(name, 0) + value
+
+        lookups = totals.get('hits', 0) + totals.get('stale_hits', 0) + totals.get('misses', 0)
+        served = totals.get('hits', 0) + totals.get('stale_hits', 0)
+
+        return {
+            'backend': type(self.backend).__name__,
+            'hit_rate': round(served / lookups * 100, 1) if lookups else 0,
+            'totals': totals,
+            'keys': per_key,
+        }
+
+
+def remaining_ttl(entry: Dict[str, Any], ttl: float) -> int:
+    """캐시 항목의 남은 TTL (초, stale 항목은 0) - 응답 Cache-Control max-age용"""
+    return max(0, int(ttl - (time.time() - entry['stored_at'])))
+
+
+def create_result_cache(namespace: str) -> ResultCache:
+    """
+    환경변수(METRICS_CACHE_BACKEND)에 맞는 백엔드로 캐시 생성
+
+    redis 백엔드를 요청했지만 사용할 수 없으면 메모리 백엔드로 대체합니다.
+    """
+    backend_name = os.getenv('METRICS_CACHE_BACKEND', 'memory').lower()
+    backend = None
+
+    if backend_name == 'redis':
+        try:
+            backend = RedisCacheBackend()
+        except Exception as e:
+            print(f"[ResultCache] Redis backend unavailable, using memory: {e}")
+
+    return ResultCache(backend=backend, namespace=namespace)
@@ -0,0 +1,248 @@
+"""
+텔레메트리 테이블 보관 기간 정리 (retention)
+
+system_health_logs / api_health_checks / api_usage_logs / report_views에서
+보관 기간이 지난 행을 압축 CSV로 내보낸 뒤 삭제합니다.
+(activity_logs는 월 파티션 단위로 utils/partition_manager.py가 처리)
+
+- 기준 시각(cutoff)은 실행 시작 시 한 번 정해 내보내기와 삭제가 같은 행을 대상으로 함
+- 만료 행의 id 범위를 batch_size씩 잘라 배치마다 SELECT → 파일 기록 → fsync → DELETE → COMMIT
+  (PRIMARY KEY 범위 DELETE라 잠금이 배치 범위로 한정되고, 배치 사이에 pause초 쉼)
+- 보관 파일: <archive_dir>/<table>/<table>_<cutoff>.csv.gz (헤더 포함, NULL은 \\N)
+  LOAD DATA ... FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' IGNORE 1 LINES로 다시 적재 가능
+  실행 중에는 .partial로 쓰고 끝나면 이름을 바꿈 (.partial이 남아 있으면 중단된 실행)
+- 결과로 삭제 행 수, 보관 파일 크기, 회수 용량 추정치(행 수 × 행당 평균 크기)를 반환
+  (InnoDB는 삭제된 페이지를 테이블 안에서 재사용하며, 파일 크기는 OPTIMIZE 전까지 그대로)
+
+환경변수:
+    RETENTION_<TABLE>_DAYS: 테이블별 보관 일수 (예: RETENTION_SYSTEM_HEALTH_LOGS_DAYS)
+    RETENTION_BATCH_SIZE: 배치당 id 범위 (기본 5000)
+    RETENTION_BATCH_PAUSE: 배치 사이 대기 초 (기본 0.1)
+    RETENTION_ARCHIVE_DIR: 보관 파일 디렉토리 (기본 backend/logs/archive)
+
+사용 예시:
+    >>> from utils.retention import run_retention
+    >>> run_retention()
+    {'system_health_logs': {'rows_deleted': 8640, 'archive_bytes': 183211, ...}, ...}
+"""
+
+import csv
+import gzip
+import io
+import os
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from utils.db_pool import db_cursor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _days(table: str, default: int) -> int:
+    return int(os.getenv(f"RETENTION_{table.upper()}_DAYS", str(default)))
+
+
+# 테이블 → 보관 일수, 삭제 전 보관 파일 작성 여부
+RETENTION_POLICIES: Dict[str, Dict[str, Any]] = {
+    'system_health_logs': {'days': _days('system_health_logs', 30), 'archive': True},
+    'api_health_checks': {'days': _days('api_health_checks', 30), 'archive': True},
+    'api_usage_logs': {'days': _days('api_usage_logs', 400), 'archive': True},
+    'report_views': {'days': _days('report_views', 400), 'archive': True},
+}
+
+RETENTION_BATCH_SIZE = int(os.getenv('RETENTION_BATCH_SIZE', '5000'))
+RETENTION_BATCH_PAUSE = float(os.getenv('RETENTION_BATCH_PAUSE', '0.1'))
+RETENTION_ARCHIVE_DIR = os.getenv('RETENTION_ARCHIVE_DIR', os.path.join(PROJECT_ROOT, 'logs', 'archive'))
+
+NULL_MARKER = '\\N'
+
+
+def _csv_value(value: Any) -> Any:
+    """DB 값 → CSV 칸 (LOAD DATA가 다시 읽을 수 있는 형태)"""
+    if value is None:
+        return NULL_MARKER
+    if isinstance(value, (datetime, date)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='replace')
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class ArchiveWriter:
+    """
+    gzip CSV 보관 파일 (배치마다 sync()로 디스크에 내린 뒤에만 삭제)
+
+    Args:
+        path: 최종 파일 경로 (작성 중에는 path + '.partial')
+        columns: 헤더 컬럼 이름
+    """
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.rows = 0
+        self._partial = path + '.partial'
+        self._file = open(self._partial, 'wb')
+        self._gzip = gzip.GzipFile(fileobj=self._file, mode='wb')
+        self._text = io.TextIOWrapper(self._gzip, encoding='utf-8', newline='')
+        self._csv = csv.writer(self._text)
+        self._csv.writerow(columns)
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self._csv.writerow([_csv_value(v) for v in row])
+            self.rows += 1
+
+    def sync(self) -> None:
+        """지금까지 쓴 행을 디스크에 기록 (이 지점까지는 중단돼도 압축 해제 가능)"""
+        self._text.flush()
+        self._gzip.flush()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> int:
+        """파일 마무리 후 최종 이름으로 변경. 반환: 파일 크기 (bytes)"""
+        self._text.close()  # gzip trailer 기록
+        self._file.close()
+        os.replace(self._partial, self.path)
+        return os.path.getsize(self.path)
+
+
+def archive_path(table: str, cutoff: datetime, archive_dir: Optional[str] = None) -> str:
+    return os.path.join(archive_dir or RETENTION_ARCHIVE_DIR, table, f"{table}_{cutoff:%Y%m%d_%H%M%S}.csv.gz")
+
+
+def find_expired_range(cursor, table: str, cutoff: datetime) -> Optional[Dict[str, int]]:
+    """cutoff 이전 행의 id 범위 (idx_created_at 범위 스캔, 없으면 None)"""
+    cursor.execute(f"""
+        SELECT MIN(id) as min_id, MAX(id) as max_id
+        FROM {table}
+        WHERE created_at < %s
+    """, (cutoff,))
+    row = cursor.fetchone()
+    if not row or row['min_id'] is None:
+        return None
+    return {'min_id': row['min_id'], 'max_id': row['max_id']}
+
+
+def estimate_row_bytes(cursor, table: str) -> int:
+    """행당 평균 크기 (데이터 + 인덱스, information_schema 통계 기준)"""
+    cursor.execute("""
+        SELECT DATA_LENGTH + INDEX_LENGTH as total_bytes, TABLE_ROWS as table_rows
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = %s
+    """, (table,))
+    row = cursor.fetchone()
+    if not row or not row['table_rows']:
+        return 0
+    return int(row['total_bytes'] or 0) // int(row['table_rows'])
+
+
+def _batches(min_id: int, max_id: int, batch_size: int) -> List[tuple]:
+    """[min_id, max_id] → (lo, hi) 반열린 구간 목록"""
+    return [(lo, min(lo + batch_size, max_id + 1)) for lo in range(min_id, max_id + 1, batch_size)]
+
+
+def apply_policy(
+    table: str,
+    days: int,
+    archive: bool = True,
+    now: Optional[datetime] = None,
+    batch_size: int = RETENTION_BATCH_SIZE,
+    pause: float = RETENTION_BATCH_PAUSE,
+    archive_dir: Optional[str] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    테이블 하나에 보관 기간 적용
+
+    Args:
+        table: 대상 테이블 (id PK, created_at 컬럼 필요)
+        days: 보관 일수
+        archive: True면 삭제 전 보관 파일 작성
+        now: 기준 시각 (테스트용)
+        batch_size: 배치당 id 범위
+        pause: 배치 사이 대기 초
+        archive_dir: 보관 파일 디렉토리
+        dry_run: True면 삭제 대상 범위와 추정치만 계산
+
+    Returns:
+        dict: cutoff, rows_deleted, batches, archive_path, archive_bytes, bytes_reclaimed(추정)
+    """
+    cutoff = (now or datetime.now()).replace(microsecond=0) - timedelta(days=days)
+    result: Dict[str, Any] = {
+        'cutoff': cutoff, 'rows_deleted': 0, 'batches': 0,
+        'archive_path': None, 'archive_bytes': 0, 'bytes_reclaimed': 0,
+    }
+
+    with db_cursor() as cursor:
+        expired = find_expired_range(cursor, table, cutoff)
+        row_bytes = estimate_row_bytes(cursor, table)
+    if expired is None:
+        return result
+
+    if dry_run:
+        with db_cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) as count FROM {table} WHERE created_at < %s", (cutoff,))
+            result['rows_deleted'] = cursor.fetchone()['count']
+        result['bytes_reclaimed'] = result['rows_deleted'] * row_bytes
+        return result
+
+    writer: Optional[ArchiveWriter] = None
+    try:
+        for lo, hi in _batches(expired['min_id'], expired['max_id'], batch_size):
+            with db_cursor(dictionary=False, commit=True) as cursor:
+                if archive:
+                    cursor.execute(
+                        f"SELECT * FROM {table} WHERE id >= %s AND id < %s AND created_at < %s ORDER BY id",
+                        (lo, hi, cutoff)
+                    )
+                    rows = cursor.fetchall()
+                    if writer is None:
+                        writer = ArchiveWriter(archive_path(table, cutoff, archive_dir),
+                                               [d[0] for d in cursor.description])
+                    writer.write_rows(rows)
+                    writer.sync()
+
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE id >= %s AND id < %s AND created_at < %s",
+                    (lo, hi, cutoff)
+                )
+                result['rows_deleted'] += cursor.rowcount
+            result['batches'] += 1
+            if pause > 0:
+                time.sleep(pause)
+    finally:
+        if writer is not None:
+            result['archive_path'] = writer.path
+            result['archive_bytes'] = writer.close()
+
+    result['bytes_reclaimed'] = result['rows_deleted'] * row_bytes
+    return result
+
+
+def run_retention(
+    tables: Optional[Sequence[str]] = None,
+    dry_run: bool = False,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    정책이 있는 테이블 전체에 보관 기간 적용 (테이블별 실패는 기록 후 다음 테이블 진행)
+
+    Returns:
+        dict: {테이블: apply_policy 결과 또는 {'error': str}}
+    """
+    results: Dict[str, Any] = {}
+    for table in tables or RETENTION_POLICIES:
+        policy = RETENTION_POLICIES[table]
+        try:
+            results[table] = apply_policy(table, policy['days'], policy['archive'], now=now, dry_run=dry_run)
+        except Exception as e:
+            print(f"[Retention] {table} failed: {e}")
+            results[table] = {'error': str(e)}
+    return results
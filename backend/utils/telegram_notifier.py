@@ -19,6 +19,13 @@ class TelegramNotifier:
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.api_url = f"https://api.telegram.org/bot{self.bot_token}" if self.bot_token else None
+        self._session: Optional[requests.Session] = None
+
+    def _get_session(self) -> requests.Session:
+        """HTTP 세션 (keep-alive 연결 재사용 - 헬스체크 데몬처럼 오래 도는 프로세스용)"""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
 
     def _is_configured(self) -> bool:
         """텔레그램 설정 확인"""
@@ -40,7 +47,7 @@ class TelegramNotifier:
             return False
 
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 f"{self.api_url}/sendMessage",
                 json={
                     'chat_id': self.chat_id,
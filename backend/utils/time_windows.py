@@ -0,0 +1,75 @@
+"""
+지표 쿼리용 기간 경계
+
+지표/목록 쿼리의 기간 조건(오늘, 이번 달, 전월, 최근 7일 등)을 요청마다 한 번
+Python에서 계산해 바인드 파라미터로 넘깁니다. SQL에는 created_at >= %(month_start)s
+같은 인덱스 범위 조건만 남고, 같은 요청의 카드들은 모두 같은 경계를 사용합니다.
+
+일 단위 경계(today, month_start 등)는 0시 datetime이며, DATE 컬럼(activity_date,
+report_date, billing_month, month_start)과 비교할 때는 같은 이름에 _date를 붙인
+date 파라미터를 사용합니다 (예: %(month_start_date)s).
+시각은 기존 NOW()와 같은 의미가 되도록 앱 서버의 로컬 시각을 사용합니다
+(DB 세션 time_zone이 서버와 같다고 가정, utils/process_lifecycle.py와 동일).
+
+사용 예시:
+    >>> windows = get_time_windows()
+    >>> cursor.execute("SELECT ... WHERE created_at >= %(month_start)s", windows.params())
+    >>> cursor.execute("SELECT ... WHERE created_at >= %s LIMIT %s", windows.values('week_ago') + [10])
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+
+# 0시 경계 (DATE 컬럼 비교용 <name>_date 파라미터를 함께 제공)
+DAY_BOUNDARIES = ('today', 'week_start', 'month_start', 'prev_month_start', 'next_month_start',
+                  'days_31_start', 'recent_start')
+
+
+def _month_start(d: datetime) -> datetime:
+    return d.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+class TimeWindows:
+    """
+    기준 시각 하나로 계산한 기간 경계
+
+    Attributes:
+        now: 기준 시각 (초 단위)
+        today: 오늘 0시
+        week_start: 6일 전 0시 - 오늘을 포함한 최근 7일(달력 기준) 활성의 하한
+        month_start / prev_month_start / next_month_start: 이번 달 / 전월 / 다음 달 1일 0시
+        hour_ago / week_ago / days_30_ago: 기준 시각에서 1시간 / 7일 / 30일 전
+        days_31_start: 31일 전 0시 (일별 롤업의 30일 퍼널 구간)
+        recent_start: min(week_start, month_start) - 7일 활성과 이번 달 지표를 함께 읽는 스캔의 하한
+    """
+
+    def __init__(self, now: datetime):
+        self.now = now.replace(microsecond=0)
+        self.today = self.now.replace(hour=0, minute=0, second=0)
+        self.week_start = self.today - timedelta(days=6)
+        self.month_start = _month_start(self.now)
+        self.prev_month_start = _month_start(self.month_start - timedelta(days=1))
+        self.next_month_start = _month_start(self.month_start + timedelta(days=31))
+        self.hour_ago = self.now - timedelta(hours=1)
+        self.week_ago = self.now - timedelta(days=7)
+        self.days_30_ago = self.now - timedelta(days=30)
+        self.days_31_start = self.today - timedelta(days=31)
+        self.recent_start = min(self.week_start, self.month_start)
+
+    def params(self) -> Dict[str, Any]:
+        """이름 있는 바인드 파라미터 (%(name)s, 일 단위 경계는 <name>_date도 포함)"""
+        params: Dict[str, Any] = dict(vars(self))
+        for name in DAY_BOUNDARIES:
+            params[f"{name}_date"] = getattr(self, name).date()
+        return params
+
+    def values(self, *names: str) -> List[Any]:
+        """위치 바인드 파라미터 (%s) - names 순서대로 (params()와 같은 이름 사용)"""
+        params = self.params()
+        return [params[name] for name in names]
+
+
+def get_time_windows(now: Optional[datetime] = None) -> TimeWindows:
+    """now(기본: 현재 시각) 기준 기간 경계"""
+    return TimeWindows(now or datetime.now())
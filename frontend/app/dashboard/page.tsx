@@ -83,47 +83,26 @@ export default function DashboardPage() {
 
   const fetchMetrics = async () => {
     try {
-      // 12개 지표 API 병렬 호출
-      const [
-        academyRes,
-        studentRes,
-        reportRes,
-        engagementRes,
-        contentRes,
-        parentRes,
-        aiRes,
-        funnelRes,
-        monetizationRes,
-        costRes,
-        healthRes,
-        apiRes,
-      ] = await Promise.all([
-        dashboardMetricsApi.getAcademyStatus(),
-        dashboardMetricsApi.getStudentStats(),
-        dashboardMetricsApi.getReportActivity(),
-        dashboardMetricsApi.getEngagement(),
-        dashboardMetricsApi.getContentGeneration(),
-        dashboardMetricsApi.getParentReach(),
-        dashboardMetricsApi.getAIEfficiency(),
-        dashboardMetricsApi.getOnboardingFunnel(),
-        dashboardMetricsApi.getMonetization(),
-        dashboardMetricsApi.getCostBreakdown(),
-        dashboardMetricsApi.getSystemHealth(),
-        dashboardMetricsApi.getApiStatus(),
-      ]);
+      // 12개 지표 일괄 조회 (snapshot 1회 요청)
+      const { data } = await dashboardMetricsApi.getSnapshot();
+      if (!data) return;
+
+      // 실패한 카드는 {error} 형태로 오므로 건너뜀
+      const card = <T,>(value: T): T | null =>
+        value && !(value as { error?: string }).error ? value : null;
 
-      if (academyRes.data) setAcademyStatus(academyRes.data);
-      if (studentRes.data) setStudentStats(studentRes.data);
-      if (reportRes.data) setReportActivity(reportRes.data);
-      if (engagementRes.data) setEngagement(engagementRes.data);
-      if (contentRes.data) setContentGeneration(contentRes.data);
-      if (parentRes.data) setParentReach(parentRes.data);
-      if (aiRes.data) setAIEfficiency(aiRes.data);
-      if (funnelRes.data) setOnboardingFunnel(funnelRes.data);
-      if (monetizationRes.data) setMonetization(monetizationRes.data);
-      if (costRes.data) setCostBreakdown(costRes.data);
-      if (healthRes.data) setSystemHealth(healthRes.data);
-      if (apiRes.data) setApiStatus(apiRes.data);
+      setAcademyStatus(card(data['academy-status']));
+      setStudentStats(card(data['student-stats']));
+      setReportActivity(card(data['report-activity']));
+      setEngagement(card(data.engagement));
+      setContentGeneration(card(data['content-generation']));
+      setParentReach(card(data['parent-reach']));
+      setAIEfficiency(card(data['ai-efficiency']));
+      setOnboardingFunnel(card(data['onboarding-funnel']));
+      setMonetization(card(data.monetization));
+      setCostBreakdown(card(data['cost-breakdown']));
+      setSystemHealth(card(data['system-health']));
+      setApiStatus(card(data['api-status']));
     } catch (error) {
       console.error('Failed to fetch metrics:', error);
     } finally {
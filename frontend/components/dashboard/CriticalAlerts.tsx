@@ -28,9 +28,17 @@ interface Alert {
   academy_id?: number;
 }
 
+interface AlertCheck {
+  name: string;
+  status: 'ok' | 'alert' | 'unknown' | 'error';
+  duration_ms: number;
+}
+
 interface AlertsResponse {
   alerts: Alert[];
   total_count: number;
+  checks?: AlertCheck[];
+  duration_ms?: number;
 }
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:3003';
@@ -126,6 +134,11 @@ export default function CriticalAlerts() {
     );
   }
 
+  // 제한 시간 초과/오류로 결과를 알 수 없는 체크
+  const unknownChecks = (data?.checks ?? []).filter(
+    (c) => c.status === 'unknown' || c.status === 'error'
+  );
+
   // No alerts - All systems normal
   if (!data || data.alerts.length === 0) {
     return (
@@ -133,7 +146,14 @@ export default function CriticalAlerts() {
         <CardContent className="flex items-center justify-between p-4">
           <div className="flex items-center gap-2 text-green-700 dark:text-green-300">
             <CheckCircle2 className="h-5 w-5" />
-            <span className="font-medium">모든 시스템 정상</span>
+            <span className="font-medium">
+              {unknownChecks.length > 0 ? '확인된 항목 정상' : '모든 시스템 정상'}
+            </span>
+            {unknownChecks.length > 0 && (
+              <span className="text-sm text-orange-600 dark:text-orange-400">
+                (확인 불가: {unknownChecks.map((c) => c.name).join(', ')})
+              </span>
+            )}
           </div>
           <div className="flex items-center gap-2 text-sm text-green-600 dark:text-green-400">
             {lastUpdated && (
@@ -189,6 +209,11 @@ export default function CriticalAlerts() {
           )}
         </button>
         <div className="flex items-center gap-2 text-sm text-gray-500 dark:text-gray-400">
+          {unknownChecks.length > 0 && (
+            <span className="text-orange-600 dark:text-orange-400">
+              확인 불가: {unknownChecks.map((c) => c.name).join(', ')}
+            </span>
+          )}
           {lastUpdated && (
             <span>{lastUpdated.toLocaleTimeString('ko-KR')}</span>
           )}
@@ -104,6 +104,12 @@ export const dashboardApi = {
         created_at: string;
       }>;
       total_count: number;
+      checks?: Array<{
+        name: string;
+        status: 'ok' | 'alert' | 'unknown' | 'error';
+        duration_ms: number;
+      }>;
+      duration_ms?: number;
     }>('/api/admin/dashboard/alerts'),
 };
 
@@ -767,6 +773,21 @@ export interface OnboardingFunnelAcademy {
   status: string;
 }
 
+export interface MetricsSnapshot {
+  'academy-status': AcademyStatusMetrics;
+  'student-stats': StudentStatsMetrics;
+  'report-activity': ReportActivityMetrics;
+  engagement: EngagementMetrics;
+  'content-generation': ContentGenerationMetrics;
+  'parent-reach': ParentReachMetrics;
+  'ai-efficiency': AIEfficiencyMetrics;
+  'onboarding-funnel': OnboardingFunnelMetrics;
+  monetization: MonetizationMetrics;
+  'cost-breakdown': CostBreakdownMetrics;
+  'system-health': SystemHealthMetrics;
+  'api-status': ApiStatusMetrics;
+}
+
 export const dashboardMetricsApi = {
   // 12개 핵심 지표 API
   getAcademyStatus: () =>
@@ -804,24 +825,48 @@ export const dashboardMetricsApi = {
 
   getApiStatus: () =>
     fetchApi<ApiStatusMetrics>('/api/admin/metrics/api-status'),
+
+  // 12개 지표 일괄 조회 (1회 요청)
+  getSnapshot: () =>
+    fetchApi<MetricsSnapshot>('/api/admin/metrics/snapshot'),
+};
+
+export interface TablePageParams {
+  limit?: number;
+  cursor?: string;
+  [filter: string]: string | number | undefined;
+}
+
+export interface TablePage<T> {
+  academies: T[];
+  total_count: number;
+  next_cursor: string | null;
+  has_more: boolean;
+}
+
+const tableQuery = (params: TablePageParams = {}) => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== '') query.append(key, String(value));
+  });
+  const qs = query.toString();
+  return qs ? `?${qs}` : '';
 };
 
 export const dashboardTablesApi = {
-  // 3개 테이블 API
-  getAtRiskAcademies: () =>
-    fetchApi<{ academies: AtRiskAcademy[]; total_count: number }>(
-      '/api/admin/tables/at-risk-academies'
+  // 3개 테이블 API (keyset 페이지네이션: next_cursor를 cursor로 전달)
+  getAtRiskAcademies: (params: TablePageParams = {}) =>
+    fetchApi<TablePage<AtRiskAcademy>>(
+      `/api/admin/tables/at-risk-academies${tableQuery(params)}`
     ),
 
-  getActiveAcademies: () =>
-    fetchApi<{ academies: ActiveAcademy[]; total_count: number }>(
-      '/api/admin/tables/active-academies'
+  getActiveAcademies: (params: TablePageParams = {}) =>
+    fetchApi<TablePage<ActiveAcademy>>(
+      `/api/admin/tables/active-academies${tableQuery(params)}`
     ),
 
-  getOnboardingFunnel: () =>
-    fetchApi<{
-      academies: OnboardingFunnelAcademy[];
-      total_count: number;
+  getOnboardingFunnel: (params: TablePageParams = {}) =>
+    fetchApi<TablePage<OnboardingFunnelAcademy> & {
       funnel_summary: {
         signup: number;
         student_added: number;
@@ -834,11 +879,11 @@ export const dashboardTablesApi = {
         report_to_share: number;
         overall: number;
       };
-    }>('/api/admin/tables/onboarding-funnel'),
+    }>(`/api/admin/tables/onboarding-funnel${tableQuery(params)}`),
 
-  getHeavyUsers: () =>
-    fetchApi<{ academies: ActiveAcademy[]; total_count: number }>(
-      '/api/admin/tables/heavy-users'
+  getHeavyUsers: (params: TablePageParams = {}) =>
+    fetchApi<TablePage<ActiveAcademy>>(
+      `/api/admin/tables/heavy-users${tableQuery(params)}`
     ),
 };
 